@@ -0,0 +1,66 @@
+"""Soft delete : is_active obligatoire et index partiels WHERE is_active
+
+Revision ID: 0001
+Revises: 
+Create Date: 2026-10-18 10:00:00.000000
+
+Cette première révision part du schéma créé par init.sql.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# Index partiels remplaçant les index complets sur les colonnes de recherche
+PARTIAL_INDEXES = [
+    ("idx_patients_email_active", "patients", "email", "idx_patients_email"),
+    ("idx_appointments_doctor_start_active", "appointments", "doctor_id, start_time", "idx_appointments_doctor_id"),
+    ("idx_appointments_patient_active", "appointments", "patient_id", "idx_appointments_patient_id"),
+]
+
+
+def upgrade() -> None:
+    # Les lignes sans statut sont considérées comme actives
+    for table_name in ("patients", "appointments"):
+        op.execute(f"UPDATE {table_name} SET is_active = TRUE WHERE is_active IS NULL")
+        op.alter_column(
+            table_name,
+            "is_active",
+            existing_type=sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("TRUE")
+        )
+    
+    # CREATE INDEX CONCURRENTLY ne peut pas s'exécuter dans une transaction
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, full_index_name in PARTIAL_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name} "
+                f"ON {table_name} ({columns}) WHERE is_active"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {full_index_name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for index_name, table_name, columns, full_index_name in PARTIAL_INDEXES:
+            full_columns = columns.split(",")[0]
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {full_index_name} "
+                f"ON {table_name} ({full_columns})"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}")
+    
+    for table_name in ("patients", "appointments"):
+        op.alter_column(
+            table_name,
+            "is_active",
+            existing_type=sa.Boolean(),
+            nullable=True,
+            server_default=sa.text("TRUE")
+        )
@@ -0,0 +1,126 @@
+"""Partitionnement mensuel de la table appointments sur start_time
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 11:00:00.000000
+
+La table est reconstruite : l'opération verrouille appointments le temps de la copie.
+Les partitions des mois suivants sont ensuite créées par manage_partitions.py.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002'
+down_revision = '0001'
+branch_labels = None
+depends_on = None
+
+# Nombre de mois préparés après le mois courant
+MONTHS_AHEAD = 3
+
+COLUMNS = (
+    "id, patient_id, doctor_id, start_time, end_time, status, reason, notes, "
+    "created_at, updated_at, is_active"
+)
+
+COLUMN_DEFINITIONS = """
+  id UUID NOT NULL DEFAULT gen_random_uuid(),
+  patient_id UUID NOT NULL REFERENCES patients(id) ON DELETE CASCADE,
+  doctor_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
+  start_time TIMESTAMP NOT NULL,
+  end_time TIMESTAMP NOT NULL,
+  status appointmentstatus DEFAULT 'scheduled',
+  reason VARCHAR(255),
+  notes TEXT,
+  created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+  is_active BOOLEAN NOT NULL DEFAULT TRUE,
+  CONSTRAINT check_appointment_times CHECK (end_time > start_time)
+"""
+
+INDEXES = (
+    "CREATE INDEX idx_appointments_doctor_start_active ON appointments (doctor_id, start_time) WHERE is_active",
+    "CREATE INDEX idx_appointments_patient_active ON appointments (patient_id) WHERE is_active",
+    "CREATE INDEX idx_appointments_start_time ON appointments (start_time)",
+    "CREATE INDEX idx_appointments_status ON appointments (status)",
+)
+
+INDEX_NAMES = (
+    "idx_appointments_doctor_start_active",
+    "idx_appointments_patient_active",
+    "idx_appointments_start_time",
+    "idx_appointments_status",
+)
+
+
+def _rename_legacy_table() -> None:
+    op.execute("ALTER TABLE appointments RENAME TO appointments_legacy")
+    op.execute("ALTER TABLE appointments_legacy DROP CONSTRAINT appointments_pkey")
+    for index_name in INDEX_NAMES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+    op.execute("DROP TRIGGER IF EXISTS update_appointments_updated_at ON appointments_legacy")
+
+
+def _finish_new_table() -> None:
+    op.execute(f"INSERT INTO appointments ({COLUMNS}) SELECT {COLUMNS} FROM appointments_legacy")
+    op.execute("DROP TABLE appointments_legacy")
+    for statement in INDEXES:
+        op.execute(statement)
+    op.execute(
+        "CREATE TRIGGER update_appointments_updated_at BEFORE UPDATE ON appointments "
+        "FOR EACH ROW EXECUTE FUNCTION update_updated_at()"
+    )
+
+
+def upgrade() -> None:
+    _rename_legacy_table()
+    
+    # check_appointment_duration borne la recherche par plage de dates : la copie
+    # échoue si des rendez-vous de plus de 24h existent, à corriger au préalable
+    op.execute(
+        f"CREATE TABLE appointments ({COLUMN_DEFINITIONS},"
+        "  CONSTRAINT check_appointment_duration CHECK (end_time - start_time <= interval '24 hours'),"
+        "  PRIMARY KEY (id, start_time)"
+        ") PARTITION BY RANGE (start_time)"
+    )
+    op.execute("CREATE TABLE appointments_default PARTITION OF appointments DEFAULT")
+    
+    # Une partition par mois, du plus ancien rendez-vous aux mois à venir
+    op.execute(f"""
+        DO $$
+        DECLARE
+          month_start DATE;
+          last_month DATE := date_trunc('month', CURRENT_DATE + interval '{MONTHS_AHEAD} months')::date;
+        BEGIN
+          SELECT date_trunc('month', COALESCE(MIN(start_time), CURRENT_DATE))::date
+            INTO month_start FROM appointments_legacy;
+          WHILE month_start <= last_month LOOP
+            EXECUTE format(
+              'CREATE TABLE %I PARTITION OF appointments FOR VALUES FROM (%L) TO (%L)',
+              'appointments_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM'),
+              month_start,
+              (month_start + interval '1 month')::date
+            );
+            month_start := (month_start + interval '1 month')::date;
+          END LOOP;
+        END $$;
+    """)
+    
+    _finish_new_table()
+    
+    op.execute("CREATE SCHEMA IF NOT EXISTS archive")
+
+
+def downgrade() -> None:
+    # Les partitions déjà archivées (schéma archive) ne sont pas réintégrées
+    _rename_legacy_table()
+    
+    op.execute(
+        f"CREATE TABLE appointments ({COLUMN_DEFINITIONS},"
+        "  PRIMARY KEY (id)"
+        ")"
+    )
+    
+    _finish_new_table()
@@ -0,0 +1,86 @@
+"""Index composites et couvrants alignés sur les requêtes des rendez-vous
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:00.000000
+
+Chaque index est créé sur la table parente (ON ONLY), puis sur chaque partition
+avec CREATE INDEX CONCURRENTLY avant d'être rattaché : les écritures ne sont pas
+bloquées pendant la construction. En mode --sql, un CREATE INDEX simple est émis.
+"""
+from alembic import op, context
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003'
+down_revision = '0002'
+branch_labels = None
+depends_on = None
+
+# (nom, suffixe des index de partition, définition)
+NEW_INDEXES = [
+    # doctor_id = ? ORDER BY start_time (agenda, contrôle de chevauchement)
+    ("idx_appointments_doctor_start", "doctor_start_idx",
+     "(doctor_id, start_time) INCLUDE (end_time, status) WHERE is_active"),
+    # patient_id = ? ORDER BY start_time (historique du patient)
+    ("idx_appointments_patient_start", "patient_start_idx",
+     "(patient_id, start_time) INCLUDE (end_time, status) WHERE is_active"),
+    # status = ? AND start_time BETWEEN ... (plages filtrées par statut)
+    ("idx_appointments_status_start", "status_start_idx",
+     "(status, start_time) WHERE is_active"),
+    # start_time BETWEEN ... ORDER BY start_time (calendrier, liste, comptage)
+    ("idx_appointments_start_active", "start_active_idx",
+     "(start_time) INCLUDE (end_time) WHERE is_active"),
+]
+
+# Index remplacés, recréés au downgrade
+OLD_INDEXES = [
+    ("idx_appointments_doctor_start_active", "doctor_start_active_idx",
+     "(doctor_id, start_time) WHERE is_active"),
+    ("idx_appointments_patient_active", "patient_active_idx",
+     "(patient_id) WHERE is_active"),
+    ("idx_appointments_start_time", "start_time_idx",
+     "(start_time)"),
+    ("idx_appointments_status", "status_idx",
+     "(status)"),
+]
+
+
+def _create_partitioned_index(index_name: str, suffix: str, definition: str) -> None:
+    if context.is_offline_mode():
+        op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON appointments {definition}")
+        return
+    
+    # Index parent invalide tant que toutes les partitions ne sont pas rattachées
+    op.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON ONLY appointments {definition}")
+    partitions = op.get_bind().execute(sa.text(
+        "SELECT inhrelid::regclass::text FROM pg_inherits "
+        "WHERE inhparent = 'appointments'::regclass"
+    )).scalars().all()
+    
+    with op.get_context().autocommit_block():
+        for partition in partitions:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {partition}_{suffix} "
+                f"ON {partition} {definition}"
+            )
+    
+    for partition in partitions:
+        op.execute(f"ALTER INDEX {index_name} ATTACH PARTITION {partition}_{suffix}")
+
+
+def upgrade() -> None:
+    for index_name, suffix, definition in NEW_INDEXES:
+        _create_partitioned_index(index_name, suffix, definition)
+    
+    for index_name, _, _ in OLD_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
+
+
+def downgrade() -> None:
+    for index_name, suffix, definition in OLD_INDEXES:
+        _create_partitioned_index(index_name, suffix, definition)
+    
+    for index_name, _, _ in NEW_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index_name}")
@@ -0,0 +1,70 @@
+# medisecure-backend/api/controllers/admin_controller.py
+from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+import logging
+
+from shared.domain.enums.roles import UserRole
+from shared.services.authenticator.extract_token import extract_token_payload
+from shared.infrastructure.observability.request_timing import TimedRoute
+from shared.infrastructure.observability.slow_queries import slow_query_log
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Créer un router pour les endpoints d'administration
+router = APIRouter(prefix="/admin", tags=["admin"], route_class=TimedRoute)
+
+def require_admin(token_payload: Dict[str, Any] = Depends(extract_token_payload)) -> Dict[str, Any]:
+    """
+    Vérifie que l'utilisateur connecté est administrateur.
+    
+    Args:
+        token_payload: Les informations du token JWT
+    
+    Returns:
+        Dict[str, Any]: Le payload du token
+    
+    Raises:
+        HTTPException: Si l'utilisateur n'est pas administrateur
+    """
+    if token_payload.get("role") != UserRole.ADMIN.value:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Accès réservé aux administrateurs"
+        )
+    return token_payload
+
+@router.get("/slow-queries")
+async def list_slow_queries(
+    limit: int = Query(20, ge=1, le=100, description="Nombre de requêtes retournées"),
+    order_by: str = Query("total_ms", regex="^(total_ms|max_ms|calls)$", description="Critère de tri"),
+    token_payload: Dict[str, Any] = Depends(require_admin)
+):
+    """
+    Liste les requêtes SQL lentes du processus, par empreinte.
+    
+    Les paramètres des requêtes ne sont jamais exposés, seulement leurs types.
+    
+    Args:
+        limit: Le nombre de requêtes retournées
+        order_by: Le critère de tri (total_ms, max_ms ou calls)
+        token_payload: Les informations du token JWT
+    
+    Returns:
+        Dict[str, Any]: Le seuil appliqué et les requêtes les plus coûteuses
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "statements": slow_query_log.top(limit, order_by)
+    }
+
+@router.delete("/slow-queries", status_code=status.HTTP_204_NO_CONTENT)
+async def reset_slow_queries(token_payload: Dict[str, Any] = Depends(require_admin)):
+    """
+    Vide le registre des requêtes lentes (par exemple après un déploiement).
+    
+    Args:
+        token_payload: Les informations du token JWT
+    """
+    logger.info("Registre des requêtes lentes vidé par %s", token_payload.get('user_id'))
+    slow_query_log.reset()
@@ -4,30 +4,35 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from datetime import timedelta, datetime
-import os
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import time
 import logging
-from dotenv import load_dotenv
 import bcrypt
-from jose import jwt
 
+from shared.config import get_settings
 from shared.container.container import get_container
 from shared.application.dtos.common_dtos import TokenResponseDTO
 from shared.infrastructure.database.models.user_model import UserModel
 from shared.infrastructure.database.connection import get_db
-
-# Charger les variables d'environnement
-load_dotenv()
+from shared.infrastructure.observability.metrics import PASSWORD_HASH_DURATION, PASSWORD_HASH_QUEUE
+from shared.infrastructure.observability.request_timing import TimedRoute
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
 # Créer un router pour les endpoints d'authentification
-router = APIRouter(prefix="/auth", tags=["auth"])
+router = APIRouter(prefix="/auth", tags=["auth"], route_class=TimedRoute)
+
+# Configuration JWT (même secret que extract_token_payload, qui vérifie les tokens émis ici)
+settings = get_settings()
 
-# Configuration JWT
-JWT_SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key-here-change-in-production")
-JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
-ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# Pool de threads dédié à bcrypt : une vérification coûte plusieurs centaines de millisecondes de CPU
+# et ne doit pas bloquer la boucle d'événements
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=settings.password_hash_workers,
+    thread_name_prefix="bcrypt"
+)
 
 def create_access_token(data: dict, expires_delta: timedelta = None):
     """Créer un token JWT"""
@@ -35,10 +40,14 @@ def create_access_token(data: dict, expires_delta: timedelta = None):
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
-        expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
     to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, JWT_SECRET_KEY, algorithm=JWT_ALGORITHM)
+    
+    # Import différé : jose n'est chargé qu'à la première connexion
+    from jose import jwt
+    
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -46,9 +55,30 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     try:
         return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
     except Exception as e:
-        logger.error(f"Erreur lors de la vérification du mot de passe: {e}")
+        logger.error("Erreur lors de la vérification du mot de passe: %s", e)
         return False
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Vérifie un mot de passe dans le pool de threads bcrypt.
+    
+    Args:
+        plain_password: Le mot de passe saisi
+        hashed_password: Le hash bcrypt enregistré
+        
+    Returns:
+        bool: True si le mot de passe correspond
+    """
+    # Les métriques sont mises à jour depuis la boucle d'événements, jamais depuis le thread bcrypt
+    PASSWORD_HASH_QUEUE.inc()
+    started = time.perf_counter()
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(password_hash_executor, verify_password, plain_password, hashed_password)
+    finally:
+        PASSWORD_HASH_QUEUE.dec()
+        PASSWORD_HASH_DURATION.observe(time.perf_counter() - started)
+
 def hash_password(password: str) -> str:
     """Hasher un mot de passe"""
     salt = bcrypt.gensalt()
@@ -75,7 +105,7 @@ async def login(
         HTTPException: En cas d'erreur
     """
     try:
-        logger.info(f"Tentative de connexion pour: {form_data.username}")
+        logger.debug("Tentative de connexion")
         
         # Rechercher l'utilisateur dans la base de données
         query = select(UserModel).where(UserModel.email == form_data.username)
@@ -83,18 +113,18 @@ async def login(
         user_model = result.scalar_one_or_none()
         
         if not user_model:
-            logger.warning(f"Utilisateur non trouvé: {form_data.username}")
+            logger.warning("Connexion refusée: utilisateur inconnu")
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
                 headers={"WWW-Authenticate": "Bearer"},
             )
         
-        logger.info(f"Utilisateur trouvé: {user_model.email}, rôle: {user_model.role}")
+        logger.debug("Utilisateur trouvé: %s, rôle: %s", user_model.id, user_model.role)
         
         # Vérifier si l'utilisateur est actif
         if not user_model.is_active:
-            logger.warning(f"Utilisateur inactif: {user_model.email}")
+            logger.warning("Utilisateur inactif: %s", user_model.id)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Compte utilisateur désactivé",
@@ -110,11 +140,11 @@ async def login(
             is_password_valid = True
         else:
             # Vérifier le mot de passe hashé
-            if user_model.password_hash:
-                is_password_valid = verify_password(form_data.password, user_model.password_hash)
+            if user_model.hashed_password:
+                is_password_valid = await verify_password_async(form_data.password, user_model.hashed_password)
         
         if not is_password_valid:
-            logger.warning(f"Mot de passe incorrect pour: {user_model.email}")
+            logger.warning("Mot de passe incorrect pour: %s", user_model.id)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Email ou mot de passe incorrect",
@@ -122,7 +152,7 @@ async def login(
             )
         
         # Créer le token d'accès
-        access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+        access_token_expires = timedelta(minutes=settings.access_token_expire_minutes)
         access_token_data = {
             "sub": user_model.email,
             "user_id": str(user_model.id),
@@ -135,13 +165,13 @@ async def login(
             data=access_token_data, expires_delta=access_token_expires
         )
         
-        logger.info(f"Connexion réussie pour: {user_model.email}")
+        logger.info("Connexion réussie pour: %s", user_model.id)
         
         # Retourner la réponse avec le token et les informations de l'utilisateur
         return TokenResponseDTO(
             access_token=access_token,
             token_type="bearer",
-            expires_in=ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # en secondes
+            expires_in=settings.access_token_expire_minutes * 60,  # en secondes
             user={
                 "id": str(user_model.id),
                 "email": user_model.email,
@@ -158,7 +188,7 @@ async def login(
         # Re-lever les HTTPException telles quelles
         raise
     except Exception as e:
-        logger.error(f"Erreur inattendue lors de la connexion: {str(e)}")
+        logger.error("Erreur inattendue lors de la connexion: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur interne du serveur"
@@ -171,7 +201,7 @@ async def logout(request: Request):
         logger.info("Demande de déconnexion")
         return {"message": "Déconnexion réussie"}
     except Exception as e:
-        logger.error(f"Erreur lors de la déconnexion: {str(e)}")
+        logger.error("Erreur lors de la déconnexion: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Erreur lors de la déconnexion"
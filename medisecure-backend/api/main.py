@@ -1,10 +1,22 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
-import os
 import logging
 from dotenv import load_dotenv
+from sqlalchemy.engine import make_url
+
+from shared.config import get_settings
+from shared.infrastructure.observability.structured_logging import configure_logging
+
+# Charger les variables d'environnement (une seule fois, avant la lecture des paramètres)
+load_dotenv()
+settings = get_settings()
+
+# Configuration du logging (LOG_LEVEL, LOG_FORMAT=json|text, LOG_ASYNC), avant l'import des
+# modules de l'application qui journalisent dès leur chargement
+configure_logging()
+logger = logging.getLogger(__name__)
 
 from api.handlers.exception_handlers import (
     AppException, 
@@ -12,28 +24,28 @@ from api.handlers.exception_handlers import (
     http_exception_handler, 
     validation_exception_handler
 )
+from api.middlewares.admission_control_middleware import AdmissionControlMiddleware
 from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from api.middlewares.metrics_middleware import MetricsMiddleware
+from api.middlewares.server_timing_middleware import ServerTimingMiddleware
+from appointment_management.infrastructure.adapters.secondary.calendar_cache import INVALIDATION_NAMESPACE
+from shared.infrastructure.database.deadline import install_statement_timeout
+from shared.infrastructure.database.single_flight import install_single_flight
+from shared.infrastructure.observability import metrics
+from shared.infrastructure.observability.request_timing import install_sql_timing
+from shared.infrastructure.observability.slow_queries import install_slow_query_log
 
 # Importer les routers
 from patient_management.infrastructure.adapters.primary.controllers.patient_controller import router as patient_router
 from api.controllers.auth_controller import router as auth_router
+from api.controllers.admin_controller import router as admin_router
 from appointment_management.infrastructure.adapters.primary.controllers.appointment_controller import router as appointment_router
 
 # Importer et configurer le container
-from shared.container.container import Container
-
-# Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-logger = logging.getLogger(__name__)
-
-# Charger les variables d'environnement
-load_dotenv()
+from shared.container.container import get_container
 
-# Initialiser le container
-container = Container()
+# Initialiser le container (instance partagée avec les controllers : un seul moteur et pool de connexions)
+container = get_container()
 
 # Informations de version pour l'API
 API_VERSION = "1.0.0"
@@ -65,8 +77,30 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Middleware d'authentification
-app.middleware("http")(AuthenticationMiddleware())
+# Middleware d'authentification (ASGI pur : ni tâche ni flux mémoire supplémentaires par requête)
+app.add_middleware(AuthenticationMiddleware)
+
+# Contrôle d'admission : file par priorité et 503 rapides lorsque le pool de connexions est saturé
+if settings.admission_enabled:
+    app.add_middleware(AdmissionControlMiddleware)
+
+# Mesure d'un échantillon de requêtes (en-tête Server-Timing) : englobe l'authentification et le
+# contrôle d'admission, mais pas MetricsMiddleware, ajouté après lui et donc plus externe
+install_sql_timing()
+app.add_middleware(ServerTimingMiddleware)
+
+# Capture des requêtes SQL lentes (consultables sur /api/admin/slow-queries)
+install_slow_query_log()
+
+# Échéance des requêtes appliquée à chaque transaction (SET LOCAL statement_timeout)
+install_statement_timeout()
+
+# Une seule requête SQL pour les lectures identiques simultanées (calendrier, dossiers patients)
+if settings.single_flight_enabled:
+    install_single_flight()
+
+# Métriques Prometheus de toutes les requêtes (middleware le plus externe)
+app.add_middleware(MetricsMiddleware)
 
 # Enregistrement des gestionnaires d'exceptions
 app.add_exception_handler(AppException, app_exception_handler)
@@ -77,6 +111,7 @@ app.add_exception_handler(RequestValidationError, validation_exception_handler)
 app.include_router(patient_router, prefix=API_PREFIX)
 app.include_router(auth_router, prefix=API_PREFIX)
 app.include_router(appointment_router, prefix=API_PREFIX)
+app.include_router(admin_router, prefix=API_PREFIX)
 
 @app.get(f"{API_PREFIX}/health")
 async def health_check():
@@ -84,34 +119,51 @@ async def health_check():
     return {
         "status": "healthy",
         "version": API_VERSION,
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "environment": settings.environment
     }
 
+@app.get(f"{API_PREFIX}/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Endpoint d'exposition des métriques au format Prometheus"""
+    return Response(content=metrics.registry.render(), headers={"Content-Type": metrics.CONTENT_TYPE})
+
 # Événement de démarrage de l'application
 @app.on_event("startup")
 async def startup_event():
-    logger.info("=== MediSecure API démarrée ===")
-    logger.info(f"Version: {API_VERSION}")
-    logger.info(f"Environnement: {os.getenv('ENVIRONMENT', 'development')}")
-    logger.info(f"Préfixe API: {API_PREFIX}")
-    logger.info(f"CORS Origins: {origins}")
-    
-    # Afficher toutes les routes pour débogage
-    for route in app.routes:
-        logger.info(f"Route: {route.path}, methods: {route.methods}")
+    logger.info(
+        "=== MediSecure API %s démarrée (environnement: %s, base: %s) ===",
+        API_VERSION, settings.environment,
+        make_url(container.config.database_url()).render_as_string(hide_password=True)
+    )
+    logger.debug("CORS Origins: %s", origins)
+    # Invalidations du cache partagé publiées par les autres workers (calendrier compris)
+    record_cache = container.record_cache()
+    if record_cache is not None:
+        record_cache.subscribe(INVALIDATION_NAMESPACE, container.calendar_cache().apply_invalidations)
+        record_cache.start()
+    # Mesure du retard des réplicas en lecture : ils ne sont utilisés qu'une fois mesurés
+    replica_router = container.replica_router()
+    if replica_router is not None:
+        replica_router.start()
 
 # Événement d'arrêt de l'application
 @app.on_event("shutdown")
 async def shutdown_event():
+    # Appelé après la fin des requêtes en cours : les connexions du pool sont fermées proprement
+    await container.engine().dispose()
+    replica_router = container.replica_router()
+    if replica_router is not None:
+        await replica_router.close()
+    record_cache = container.record_cache()
+    if record_cache is not None:
+        await record_cache.close()
     logger.info("=== MediSecure API arrêtée ===")
 
 if __name__ == "__main__":
     import uvicorn
     
-    # Configurer le serveur Uvicorn
-    host = os.getenv("HOST", "0.0.0.0")
-    port = int(os.getenv("PORT", "8000"))
-    reload = os.getenv("ENVIRONMENT", "development") == "development"
+    # Configurer le serveur Uvicorn (le mode production passe par gunicorn, voir start.sh)
+    reload = settings.app_mode == "development"
     
-    logger.info(f"Démarrage du serveur sur {host}:{port} (reload: {reload})")
-    uvicorn.run("api.main:app", host=host, port=port, reload=reload)
\ No newline at end of file
+    logger.info("Démarrage du serveur sur %s:%s (reload: %s)", settings.host, settings.port, reload)
+    uvicorn.run("api.main:app", host=settings.host, port=settings.port, reload=reload)
\ No newline at end of file
@@ -0,0 +1,258 @@
+# medisecure-backend/api/middlewares/admission_control_middleware.py
+"""
+Contrôle d'admission : borne le nombre de requêtes traitées simultanément par le processus.
+
+Chaque requête emprunte au plus une connexion (unité de travail), mais ne la garde qu'une
+partie de sa durée (authentification, sérialisation) : en limitant les requêtes admises à
+deux fois la capacité du pool, l'attente se fait ici, en file par priorité, plutôt que dans
+SQLAlchemy jusqu'à `pool_timeout`. Une requête dont l'attente estimée (demandeurs devant elle
+x durée moyenne d'une requête / places) dépasse le budget de sa classe reçoit aussitôt un 503
+avec `Retry-After`, sans entrer en file ; une requête en file au-delà du budget aussi. Sous
+surcharge, l'API reste réactive pour les requêtes admises au lieu de ralentir pour toutes.
+
+Classes, de la plus prioritaire à la moins prioritaire :
+  - booking : écritures (prise de rendez-vous, dossiers patients) et connexion ;
+  - search : lectures et recherches ;
+  - export : listes volumineuses (limit > 100) et administration.
+Les classes moins prioritaires n'ont droit qu'à une part des places, pour en laisser aux
+écritures même lorsque les lectures affluent.
+"""
+from collections import deque
+from typing import Deque, List, Optional
+import asyncio
+import logging
+import time
+
+from shared.config import get_settings
+from shared.infrastructure.observability.metrics import (
+    ADMISSION_IN_FLIGHT, ADMISSION_QUEUE_DEPTH, ADMISSION_QUEUE_WAIT, ADMISSION_REJECTED
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Chemins sans accès à la base, jamais mis en file
+EXEMPT_PATHS = frozenset({"/api/health", "/api/metrics", "/api/docs", "/api/redoc", "/api/openapi.json"})
+
+# Au-delà de cette taille de page, une liste est traitée comme un export
+EXPORT_LIMIT = 100
+
+# Poids des nouvelles mesures dans la durée moyenne d'une requête (moyenne mobile exponentielle)
+SERVICE_TIME_SMOOTHING = 0.1
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+class TrafficClass:
+    """Classe de trafic : priorité, part maximale des places et attente maximale en file"""
+    
+    def __init__(self, name: str, priority: int, share: float, max_wait_ms: float):
+        self.name = name
+        self.priority = priority
+        self.share = share
+        self.max_wait = max_wait_ms / 1000
+        self.limit = 0
+        self.in_flight = 0
+        self.waiters: Deque[asyncio.Future] = deque()
+
+class AdmissionController:
+    """
+    Sémaphore à priorités : une place libérée va au plus ancien demandeur de la classe la
+    plus prioritaire qui n'a pas atteint sa part.
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(self, capacity: int, classes: List[TrafficClass]):
+        """
+        Initialise le contrôleur.
+        
+        Args:
+            capacity: Le nombre maximal de requêtes traitées simultanément
+            classes: Les classes de trafic
+        """
+        self.capacity = capacity
+        self.in_flight = 0
+        # Durée moyenne d'une requête admise (secondes), pour estimer l'attente en file
+        self.service_time = 0.0
+        self.classes = sorted(classes, key=lambda traffic_class: traffic_class.priority)
+        for traffic_class in self.classes:
+            traffic_class.limit = max(1, int(capacity * traffic_class.share))
+    
+    def _can_admit(self, traffic_class: TrafficClass) -> bool:
+        return self.in_flight < self.capacity and traffic_class.in_flight < traffic_class.limit
+    
+    def _admit(self, traffic_class: TrafficClass) -> None:
+        self.in_flight += 1
+        traffic_class.in_flight += 1
+        ADMISSION_IN_FLIGHT.inc(traffic_class.name)
+    
+    async def acquire(self, traffic_class: TrafficClass) -> bool:
+        """
+        Attend une place pour une requête.
+        
+        Args:
+            traffic_class: La classe de la requête
+        
+        Returns:
+            bool: True si la requête est admise, False si l'attente a dépassé le budget
+        """
+        # Pas de dépassement : une requête n'est admise directement que si personne
+        # d'au moins aussi prioritaire n'attend
+        waiting_ahead = any(
+            other.waiters for other in self.classes if other.priority <= traffic_class.priority
+        )
+        if not waiting_ahead and self._can_admit(traffic_class):
+            self._admit(traffic_class)
+            return True
+        
+        # Rejet immédiat si l'attente estimée dépasse déjà le budget de la classe
+        if self.estimated_wait(traffic_class) > traffic_class.max_wait:
+            return False
+        
+        waiter = asyncio.get_running_loop().create_future()
+        traffic_class.waiters.append(waiter)
+        ADMISSION_QUEUE_DEPTH.inc(traffic_class.name)
+        started = time.perf_counter()
+        try:
+            # La place est transmise par release() : elle est déjà comptée à l'admission
+            await asyncio.wait_for(asyncio.shield(waiter), traffic_class.max_wait)
+            return True
+        except asyncio.TimeoutError:
+            # La place a pu être transmise juste avant l'expiration du délai
+            return waiter.done() and not waiter.cancelled()
+        except asyncio.CancelledError:
+            # Client parti pendant l'attente : une place déjà transmise est rendue
+            if waiter.done() and not waiter.cancelled():
+                self.release(traffic_class)
+            raise
+        finally:
+            if not waiter.done():
+                waiter.cancel()
+                traffic_class.waiters.remove(waiter)
+            ADMISSION_QUEUE_DEPTH.dec(traffic_class.name)
+            ADMISSION_QUEUE_WAIT.observe(time.perf_counter() - started, traffic_class.name)
+    
+    def estimated_wait(self, traffic_class: TrafficClass) -> float:
+        """
+        Estime l'attente d'un nouveau demandeur de la classe donnée.
+        
+        Args:
+            traffic_class: La classe du demandeur
+        
+        Returns:
+            float: L'attente estimée (secondes)
+        """
+        ahead = sum(len(other.waiters) for other in self.classes if other.priority <= traffic_class.priority)
+        return (ahead + 1) * self.service_time / self.capacity
+    
+    def release(self, traffic_class: TrafficClass, service_time: Optional[float] = None) -> None:
+        """
+        Libère la place d'une requête terminée et la transmet au prochain demandeur.
+        
+        Args:
+            traffic_class: La classe de la requête terminée
+            service_time: La durée de traitement de la requête (secondes), si elle a été mesurée
+        """
+        if service_time is not None:
+            self.service_time += SERVICE_TIME_SMOOTHING * (service_time - self.service_time)
+        self.in_flight -= 1
+        traffic_class.in_flight -= 1
+        ADMISSION_IN_FLIGHT.dec(traffic_class.name)
+        for candidate in self.classes:
+            if candidate.waiters and self._can_admit(candidate):
+                self._admit(candidate)
+                candidate.waiters.popleft().set_result(True)
+                return
+
+class AdmissionControlMiddleware:
+    """
+    Middleware ASGI appliquant le contrôle d'admission à chaque requête HTTP.
+    """
+    
+    def __init__(self, app, capacity: Optional[int] = None, retry_after: Optional[int] = None):
+        """
+        Initialise le middleware.
+        
+        Args:
+            app: L'application ASGI suivante
+            capacity: Le nombre de requêtes simultanées (défaut: ADMISSION_MAX_CONCURRENCY,
+                ou deux fois la capacité du pool DB_POOL_SIZE + DB_MAX_OVERFLOW)
+            retry_after: La valeur de l'en-tête Retry-After des 503 (défaut: ADMISSION_RETRY_AFTER)
+        """
+        self.app = app
+        settings = get_settings()
+        if capacity is None:
+            capacity = settings.admission_max_concurrency or 2 * (settings.db_pool_size + settings.db_max_overflow)
+        if retry_after is None:
+            retry_after = settings.admission_retry_after
+        self.booking = TrafficClass("booking", 0, 1.0, settings.admission_booking_max_wait_ms)
+        self.search = TrafficClass("search", 1, 0.8, settings.admission_search_max_wait_ms)
+        self.export = TrafficClass("export", 2, 0.25, settings.admission_export_max_wait_ms)
+        self.controller = AdmissionController(capacity, [self.booking, self.search, self.export])
+        self.retry_after = str(retry_after).encode("latin-1")
+        logger.debug("Contrôle d'admission: %s requêtes simultanées", capacity)
+    
+    def classify(self, scope) -> Optional[TrafficClass]:
+        """
+        Détermine la classe de trafic d'une requête.
+        
+        Args:
+            scope: Le scope ASGI de la requête
+        
+        Returns:
+            Optional[TrafficClass]: La classe, ou None si la requête n'est pas contrôlée
+        """
+        method = scope["method"]
+        path = scope["path"]
+        if method == "OPTIONS" or path in EXEMPT_PATHS or not path.startswith("/api/"):
+            return None
+        if path.startswith("/api/admin/"):
+            return self.export
+        if method in WRITE_METHODS:
+            return self.search if path.endswith("/search") else self.booking
+        if _page_size(scope["query_string"]) > EXPORT_LIMIT:
+            return self.export
+        return self.search
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        traffic_class = self.classify(scope)
+        if traffic_class is None:
+            await self.app(scope, receive, send)
+            return
+        
+        if not await self.controller.acquire(traffic_class):
+            ADMISSION_REJECTED.inc(traffic_class.name)
+            logger.warning("Requête rejetée (surcharge, classe %s): %s %s", traffic_class.name, scope["method"], scope["path"])
+            await self._reject(send)
+            return
+        
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(traffic_class, time.perf_counter() - started)
+    
+    async def _reject(self, send) -> None:
+        body = b'{"detail":"Service temporairement surcharg\xc3\xa9, r\xc3\xa9essayez plus tard"}'
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                (b"retry-after", self.retry_after),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+def _page_size(query_string: bytes) -> int:
+    # Lecture directe du paramètre limit, sans analyser toute la chaîne de requête
+    for parameter in query_string.split(b"&"):
+        if parameter.startswith(b"limit="):
+            value = parameter[6:]
+            return int(value) if value.isdigit() else 0
+    return 0
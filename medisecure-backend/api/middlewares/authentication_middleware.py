@@ -1,91 +1,123 @@
 # medisecure-backend/api/middlewares/authentication_middleware.py
 
-from fastapi import Request, Response
-from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
-from typing import Optional, Dict, Any
-import os
-from datetime import datetime
+from typing import Optional
 import logging
 
+from shared.config import get_settings
+from shared.infrastructure.observability.request_timing import timed
+
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
-security = HTTPBearer()
+# Chemins exemptés d'authentification (correspondance exacte)
+EXEMPT_PATHS = frozenset({
+    "/",
+    "/api/health",
+    "/api/docs",
+    "/api/redoc",
+    "/api/openapi.json",
+    "/api/auth/login",
+    "/api/auth/logout",
+    "/docs",
+    "/redoc",
+    "/openapi.json",
+})
+
+# Préfixes exemptés (ressources de la documentation interactive)
+EXEMPT_PREFIXES = ("/api/docs/", "/docs/")
+
+# Réponse aux requêtes CORS preflight : toutes les méthodes des routes (PATCH compris) et
+# tous les en-têtes lus par l'API, dont l'échéance demandée par le client (X-Request-Timeout)
+PREFLIGHT_HEADERS = [
+    (b"content-length", b"0"),
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-methods", b"GET, POST, PUT, PATCH, DELETE, OPTIONS"),
+    (b"access-control-allow-headers", b"Authorization, Content-Type, X-Request-Timeout"),
+]
 
 class AuthenticationMiddleware:
-    """Middleware pour vérifier l'authentification JWT"""
+    """
+    Middleware ASGI pour vérifier l'authentification JWT.
+    
+    Un token valide est décodé une seule fois : son payload est placé dans l'état de la
+    requête (`request.state.user`), où `extract_token_payload` le réutilise. Le middleware
+    ne rejette aucune requête, ce sont les dépendances des routes qui exigent un token.
+    """
     
-    def __init__(self):
-        self.jwt_secret = os.getenv("JWT_SECRET_KEY", "default_secret_key")
-        self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
+    def __init__(self, app):
+        """
+        Initialise le middleware.
         
-    async def __call__(self, request: Request, call_next):
+        Args:
+            app: L'application ASGI suivante
+        """
+        self.app = app
+        settings = get_settings()
+        self.jwt_secret = settings.jwt_secret_key
+        self.algorithm = settings.jwt_algorithm
+    
+    async def __call__(self, scope, receive, send):
         """Vérifie le token JWT et ajoute l'utilisateur à la requête"""
-        
-        # Chemins exemptés d'authentification
-        exempt_paths = [
-            "/api/health", 
-            "/api/docs", 
-            "/api/redoc", 
-            "/api/openapi.json", 
-            "/api/auth/login", 
-            "/api/auth/logout",
-            "/docs",
-            "/redoc",
-            "/openapi.json",
-            "/"
-        ]
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
         # Méthode OPTIONS pour les requêtes CORS preflight - TOUJOURS autoriser
-        if request.method == "OPTIONS":
-            response = Response()
-            response.headers["Access-Control-Allow-Origin"] = "*"
-            response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-            response.headers["Access-Control-Allow-Headers"] = "Authorization, Content-Type"
-            return response
-            
+        if scope["method"] == "OPTIONS":
+            await send({"type": "http.response.start", "status": 200, "headers": PREFLIGHT_HEADERS})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
         # Vérifier si le chemin est exempté
-        request_path = str(request.url.path)
-        if any(request_path.startswith(path) for path in exempt_paths):
-            logger.debug(f"Chemin exempté: {request_path}")
-            return await call_next(request)
+        path = scope["path"]
+        if path in EXEMPT_PATHS or path.startswith(EXEMPT_PREFIXES):
+            await self.app(scope, receive, send)
+            return
         
-        # Récupérer le token d'autorisation
-        auth_header = request.headers.get("Authorization")
-        if not auth_header:
-            logger.info(f"Pas de token d'autorisation pour: {request_path}")
-            # Pour les autres endpoints, continuer sans authentification pour le moment
-            return await call_next(request)
+        auth_header = _authorization_header(scope)
+        if auth_header is None:
+            logger.debug("Pas de token d'autorisation pour: %s", path)
+        else:
+            payload = self._decode(auth_header, path)
+            if payload is not None:
+                # Même emplacement que request.state.user côté Starlette
+                scope.setdefault("state", {})["user"] = payload
+                logger.debug("Utilisateur authentifié: %s accède à %s", payload.get("user_id"), path)
+        
+        await self.app(scope, receive, send)
+    
+    def _decode(self, auth_header: bytes, path: str) -> Optional[dict]:
+        """
+        Valide le token Bearer de l'en-tête Authorization.
+        
+        Args:
+            auth_header: La valeur brute de l'en-tête
+            path: Le chemin de la requête (journalisation)
+        
+        Returns:
+            Optional[dict]: Le payload du token, ou None s'il est absent, invalide ou expiré
+        """
+        # Import différé : jose n'est chargé qu'à la première requête authentifiée
+        from jose import JWTError, jwt
+        
+        scheme, _, token = auth_header.partition(b" ")
+        if scheme.lower() != b"bearer" or not token:
+            logger.warning("Schéma d'autorisation invalide pour: %s", path)
+            return None
         
         try:
-            # Extraction du token
-            scheme, token = auth_header.split(" ", 1)
-            if scheme.lower() != "bearer":
-                logger.warning(f"Schéma d'autorisation invalide: {scheme}")
-                return await call_next(request)
-                
-            # Validation du token
-            payload = jwt.decode(token, self.jwt_secret, algorithms=[self.algorithm])
-            
-            # Vérification de l'expiration
-            exp = payload.get("exp")
-            if exp and datetime.utcnow() > datetime.fromtimestamp(exp):
-                logger.warning(f"Token expiré pour: {request_path}")
-                return await call_next(request)
-            
-            # Ajout de l'utilisateur à la requête
-            request.state.user = payload
-            logger.debug(f"Utilisateur authentifié: {payload.get('email')} accède à {request_path}")
-            
-            return await call_next(request)
-            
+            # Validation du token (signature et expiration)
+            with timed("auth"):
+                return jwt.decode(token.decode("latin-1"), self.jwt_secret, algorithms=[self.algorithm])
         except JWTError as e:
-            logger.warning(f"Erreur JWT pour {request_path}: {str(e)}")
-            return await call_next(request)
-        except ValueError as e:
-            logger.warning(f"Erreur de format du token pour {request_path}: {str(e)}")
-            return await call_next(request)
+            logger.warning("Erreur JWT pour %s: %s", path, e)
         except Exception as e:
-            logger.error(f"Erreur d'authentification pour {request_path}: {str(e)}")
-            return await call_next(request)
\ No newline at end of file
+            logger.error("Erreur d'authentification pour %s: %s", path, e)
+        return None
+
+def _authorization_header(scope) -> Optional[bytes]:
+    # Parcours des en-têtes bruts de l'ASGI, sans construire d'objet Headers
+    for name, value in scope["headers"]:
+        if name == b"authorization":
+            return value
+    return None
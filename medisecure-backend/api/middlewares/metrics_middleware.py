@@ -0,0 +1,47 @@
+# medisecure-backend/api/middlewares/metrics_middleware.py
+
+import time
+
+from shared.infrastructure.observability.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+# Label des requêtes qui ne correspondent à aucune route (404), pour borner la cardinalité
+UNMATCHED_ROUTE = "<unmatched>"
+
+class MetricsMiddleware:
+    """
+    Middleware ASGI qui alimente l'histogramme de latence des requêtes HTTP.
+    
+    Chaque requête est mesurée ; le label `route` est le gabarit de la route FastAPI
+    (ex: /api/patients/{patient_id}) et non le chemin, dont les identifiants rendraient
+    le nombre de séries illimité.
+    """
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        HTTP_REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code)
+            )
+            HTTP_REQUESTS_IN_PROGRESS.dec()
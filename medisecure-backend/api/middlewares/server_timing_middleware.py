@@ -0,0 +1,68 @@
+# medisecure-backend/api/middlewares/server_timing_middleware.py
+
+import logging
+import random
+from typing import Optional
+
+from shared.config import get_settings
+from shared.infrastructure.observability.request_timing import RequestTimings, current_timings
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class ServerTimingMiddleware:
+    """
+    Middleware ASGI qui mesure une fraction des requêtes.
+    
+    Pour une requête échantillonnée, les mesures (phases, repositories, requêtes SQL)
+    sont renvoyées dans l'en-tête `Server-Timing` et journalisées sur une ligne.
+    Les autres requêtes ne paient qu'un tirage aléatoire.
+    """
+    
+    def __init__(self, app, sample_rate: Optional[float] = None, expose_header: Optional[bool] = None):
+        """
+        Initialise le middleware.
+        
+        Args:
+            app: L'application ASGI suivante
+            sample_rate: La fraction des requêtes mesurées (défaut: SERVER_TIMING_SAMPLE_RATE ou 0.1)
+            expose_header: Si False, les mesures sont seulement journalisées (défaut: SERVER_TIMING_HEADER)
+        """
+        self.app = app
+        settings = get_settings()
+        if sample_rate is None:
+            sample_rate = settings.server_timing_sample_rate
+        if expose_header is None:
+            expose_header = settings.server_timing_header
+        self.sample_rate = sample_rate
+        self.expose_header = expose_header
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+        
+        timings = RequestTimings()
+        token = current_timings.set(timings)
+        status_code = 500
+        
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if self.expose_header:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", timings.server_timing(timings.elapsed_ms()).encode("utf-8")))
+                    message = {**message, "headers": headers}
+            await send(message)
+        
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_timings.reset(token)
+            total_ms = timings.elapsed_ms()
+            logger.info(
+                "%s %s %s %.1fms (sql: %s en %.1fms)",
+                scope["method"], scope["path"], status_code, total_ms, timings.sql_count, timings.sql_ms,
+                extra={"timing": {"method": scope["method"], "path": scope["path"], "status": status_code, **timings.to_dict(total_ms)}}
+            )
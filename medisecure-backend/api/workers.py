@@ -0,0 +1,42 @@
+# medisecure-backend/api/workers.py
+"""
+Worker gunicorn du mode production (APP_MODE=production, voir gunicorn.conf.py).
+
+Chaque worker est un serveur uvicorn avec la boucle uvloop et l'analyseur HTTP httptools ;
+le keep-alive et le backlog sont ceux de la configuration gunicorn.
+"""
+import logging
+
+from uvicorn.workers import UvicornWorker
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+class MediSecureUvicornWorker(UvicornWorker):
+    """Worker uvicorn avec uvloop et httptools imposés (pas de repli silencieux sur asyncio)"""
+    
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "server_header": False}
+
+def reinitialize_after_fork() -> None:
+    """
+    Réinitialise dans un worker ce qui a été créé par le processus maître.
+    
+    Sans préchargement de l'application (défaut), chaque worker importe l'application et
+    crée ses propres moteurs : il n'y a rien à faire. Avec GUNICORN_PRELOAD, les moteurs
+    et le thread d'écriture des logs créés par le maître sont hérités : les pools sont
+    recréés sans fermer les connexions du maître, et le logging est reconfiguré (un thread
+    ne survit pas à un fork).
+    """
+    import sys
+    
+    if "api.main" not in sys.modules:
+        return
+    
+    from shared.container.container import get_container
+    from shared.infrastructure.database import connection
+    from shared.infrastructure.observability.structured_logging import configure_logging
+    
+    configure_logging()
+    connection.get_engine().sync_engine.dispose(close=False)
+    get_container().engine().sync_engine.dispose(close=False)
+    logger.info("Pools de connexions recréés après le fork du worker")
@@ -147,6 +147,8 @@ class AppointmentListResponseDTO(BaseModel):
     total: int
     skip: int
     limit: int
+    # Calendrier : le mois compte plus de rendez-vous que la page n'en contient
+    truncated: bool = False
     
     class Config:
         # Permettre les conversions arbitraires de types
@@ -57,8 +57,8 @@ class ScheduleAppointmentUseCase:
         """
         try:
             # Ajouter des logs pour les données reçues
-            logger.info(f"Données de rendez-vous reçues: patient_id={data.patient_id}, doctor_id={data.doctor_id}")
-            logger.info(f"Dates: start_time={data.start_time}, end_time={data.end_time}")
+            logger.info("Données de rendez-vous reçues: patient_id=%s, doctor_id=%s", data.patient_id, data.doctor_id)
+            logger.info("Dates: start_time=%s, end_time=%s", data.start_time, data.end_time)
             
             # Validation des données
             if not data.patient_id:
@@ -79,18 +79,18 @@ class ScheduleAppointmentUseCase:
             self.appointment_service.validate_appointment_times(data.start_time, data.end_time)
             
             # Vérifier si le patient existe
-            logger.debug(f"Vérification de l'existence du patient {patient_id}")
+            logger.debug("Vérification de l'existence du patient %s", patient_id)
             patient = await self.patient_repository.get_by_id(patient_id)
             if not patient:
-                logger.error(f"Patient avec ID {patient_id} non trouvé")
+                logger.error("Patient avec ID %s non trouvé", patient_id)
                 raise PatientNotFoundException(patient_id)
           
             # Vérifier si le créneau est disponible (aucun chevauchement)
-            logger.debug(f"Vérification de la disponibilité du créneau pour le médecin {doctor_id}")
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                doctor_id, 
-                skip=0, 
-                limit=1000
+            logger.debug("Vérification de la disponibilité du créneau pour le médecin %s", doctor_id)
+            existing_appointments = await self.appointment_repository.get_by_doctor_between(
+                doctor_id,
+                data.start_time,
+                data.end_time
             )
             
             if self.appointment_service.check_appointment_overlap(
@@ -106,7 +106,7 @@ class ScheduleAppointmentUseCase:
             appointment_id = self.id_generator.generate_id()
             
             # Créer l'entité Appointment
-            logger.debug(f"Création de l'entité Appointment avec ID {appointment_id}")
+            logger.debug("Création de l'entité Appointment avec ID %s", appointment_id)
             appointment = Appointment(
                 id=appointment_id,
                 patient_id=patient_id,
@@ -119,18 +119,18 @@ class ScheduleAppointmentUseCase:
             )
             
             # Sauvegarder le rendez-vous
-            logger.info(f"Sauvegarde du rendez-vous {appointment_id}")
+            logger.info("Sauvegarde du rendez-vous %s", appointment_id)
             try:
                 created_appointment = await self.appointment_repository.create(appointment)
-                logger.info(f"Rendez-vous {appointment_id} créé avec succès")
+                logger.info("Rendez-vous %s créé avec succès", appointment_id)
             except Exception as e:
-                logger.error(f"Erreur lors de la sauvegarde du rendez-vous: {str(e)}")
+                logger.error("Erreur lors de la sauvegarde du rendez-vous: %s", e)
                 if "violates foreign key constraint" in str(e).lower():
                     raise ValueError("Les identifiants de médecin ou de patient sont invalides. Veuillez vérifier que le médecin et le patient existent.")
                 raise
             
             # Convertir l'entité en DTO de réponse
-            logger.debug(f"Conversion du rendez-vous {appointment_id} en DTO de réponse")
+            logger.debug("Conversion du rendez-vous %s en DTO de réponse", appointment_id)
             response = AppointmentResponseDTO(
                 id=created_appointment.id,
                 patient_id=created_appointment.patient_id,
@@ -145,9 +145,9 @@ class ScheduleAppointmentUseCase:
                 is_active=created_appointment.is_active
             )
             
-            logger.info(f"Rendez-vous {response.id} créé avec succès")
+            logger.info("Rendez-vous %s créé avec succès", response.id)
             return response
             
         except Exception as e:
-            logger.exception(f"Erreur lors de la création du rendez-vous: {str(e)}")
+            logger.exception("Erreur lors de la création du rendez-vous: %s", e)
             raise
\ No newline at end of file
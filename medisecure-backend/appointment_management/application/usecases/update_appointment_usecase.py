@@ -57,10 +57,10 @@ class UpdateAppointmentUseCase:
             self.appointment_service.validate_appointment_times(data.start_time, data.end_time)
             
             # Vérifier si le nouveau créneau est disponible
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                appointment.doctor_id, 
-                skip=0, 
-                limit=1000
+            existing_appointments = await self.appointment_repository.get_by_doctor_between(
+                appointment.doctor_id,
+                data.start_time,
+                data.end_time
             )
             
             if self.appointment_service.check_appointment_overlap(
@@ -83,10 +83,10 @@ class UpdateAppointmentUseCase:
             self.appointment_service.validate_appointment_times(start_time, end_time)
             
             # Vérifier si le nouveau créneau est disponible
-            existing_appointments = await self.appointment_repository.get_by_doctor(
-                appointment.doctor_id, 
-                skip=0, 
-                limit=1000
+            existing_appointments = await self.appointment_repository.get_by_doctor_between(
+                appointment.doctor_id,
+                start_time,
+                end_time
             )
             
             if self.appointment_service.check_appointment_overlap(
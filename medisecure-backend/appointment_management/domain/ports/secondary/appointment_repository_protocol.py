@@ -63,6 +63,19 @@ class AppointmentRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def delete_by_patient(self, patient_id: UUID) -> int:
+        """
+        Supprime tous les rendez-vous d'un patient (suppression du dossier patient).
+        
+        Args:
+            patient_id: L'ID du patient
+            
+        Returns:
+            int: Le nombre de rendez-vous supprimés
+        """
+        pass
+    
     @abstractmethod
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
@@ -107,6 +120,21 @@ class AppointmentRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def get_by_doctor_between(self, doctor_id: UUID, start_time: datetime, end_time: datetime) -> List[Appointment]:
+        """
+        Récupère les rendez-vous d'un médecin qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: Le début de la plage horaire
+            end_time: La fin de la plage horaire
+            
+        Returns:
+            List[Appointment]: La liste des rendez-vous du médecin chevauchant la plage
+        """
+        pass
+    
     @abstractmethod
     async def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
@@ -9,6 +9,10 @@ from appointment_management.domain.entities.appointment import Appointment, Appo
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Durée maximale d'un rendez-vous. Les requêtes par plage de dates s'appuient sur
+# cette borne pour ne parcourir que les partitions mensuelles utiles.
+MAX_APPOINTMENT_DURATION = timedelta(hours=24)
+
 class AppointmentService:
     """
     Service du domaine pour les opérations liées aux rendez-vous.
@@ -24,24 +28,25 @@ class AppointmentService:
             end_time: L'heure de fin du rendez-vous
             
         Raises:
-            ValueError: Si l'heure de fin est avant ou égale à l'heure de début
+            ValueError: Si l'heure de fin est avant ou égale à l'heure de début,
+                       si la durée dépasse MAX_APPOINTMENT_DURATION
                        ou si les heures ne sont pas valides
         """
         # Vérifier que les dates sont bien des objets datetime
         if not isinstance(start_time, datetime) or not isinstance(end_time, datetime):
-            logger.error(f"Types de dates invalides: start_time={type(start_time)}, end_time={type(end_time)}")
+            logger.error("Types de dates invalides: start_time=%s, end_time=%s", type(start_time), type(end_time))
             raise ValueError("Les heures de début et de fin doivent être des objets datetime")
         
         # Vérifier que l'heure de début est avant l'heure de fin
         if end_time <= start_time:
-            logger.error(f"Heure de fin ({end_time}) avant ou égale à l'heure de début ({start_time})")
+            logger.error("Heure de fin (%s) avant ou égale à l'heure de début (%s)", end_time, start_time)
             raise ValueError("L'heure de fin doit être après l'heure de début")
         
-        # Vérifier que la durée du rendez-vous est raisonnable (par exemple, pas plus de 24h)
+        # Vérifier que la durée du rendez-vous est raisonnable (pas plus de 24h)
         duration = end_time - start_time
-        if duration > timedelta(hours=24):
-            logger.warning(f"Durée de rendez-vous très longue détectée: {duration}")
-            # Ce n'est qu'un avertissement, pas une erreur
+        if duration > MAX_APPOINTMENT_DURATION:
+            logger.error("Durée de rendez-vous trop longue: %s", duration)
+            raise ValueError("Un rendez-vous ne peut pas durer plus de 24 heures")
     
     def check_appointment_overlap(
         self, 
@@ -63,7 +68,7 @@ class AppointmentService:
             bool: True si le rendez-vous chevauche un autre, False sinon
         """
         # Journaliser le nombre de rendez-vous à vérifier
-        logger.debug(f"Vérification de chevauchement parmi {len(existing_appointments)} rendez-vous existants")
+        logger.debug("Vérification de chevauchement parmi %s rendez-vous existants", len(existing_appointments))
         
         for appointment in existing_appointments:
             # Ignorer le rendez-vous lui-même pour les mises à jour
@@ -82,8 +87,8 @@ class AppointmentService:
             # Un chevauchement existe si l'une des plages commence avant que l'autre ne se termine
             # et se termine après que l'autre n'ait commencé
             if (start_time < appointment.end_time and end_time > appointment.start_time):
-                logger.info(f"Chevauchement détecté avec le rendez-vous {appointment.id}")
-                logger.debug(f"Nouveau: {start_time} - {end_time}, Existant: {appointment.start_time} - {appointment.end_time}")
+                logger.info("Chevauchement détecté avec le rendez-vous %s", appointment.id)
+                logger.debug("Nouveau: %s - %s, Existant: %s - %s", start_time, end_time, appointment.start_time, appointment.end_time)
                 return True
                 
         # Aucun chevauchement trouvé
@@ -1,12 +1,14 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/primary/controllers/appointment_controller.py
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, Query, Path, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Path, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from datetime import date, timedelta, datetime
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
-from shared.container.container import Container
+from shared.container.container import Container, get_container
 from appointment_management.application.dtos.appointment_dtos import (
     AppointmentCreateDTO,
     AppointmentUpdateDTO,
@@ -18,12 +20,19 @@ from appointment_management.application.usecases.update_appointment_usecase impo
 from appointment_management.application.usecases.get_patient_appointments_usecase import GetPatientAppointmentsUseCase
 from appointment_management.domain.entities.appointment import AppointmentStatus
 from patient_management.domain.exceptions.patient_exceptions import PatientNotFoundException
+from shared.config import get_settings
+from shared.infrastructure.database.deadline import request_timeout
+from shared.infrastructure.database.unit_of_work import UnitOfWorkRoute
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Périmètre du calendrier visible par rôle (clé du cache de calendrier) : tous les rôles
+# autorisés voient aujourd'hui l'ensemble des rendez-vous
+CALENDAR_SCOPES = {"admin": "all", "doctor": "all", "nurse": "all", "receptionist": "all"}
+
 # Créer un router pour les endpoints des rendez-vous
-router = APIRouter(prefix="/appointments", tags=["appointments"])
+router = APIRouter(prefix="/appointments", tags=["appointments"], route_class=UnitOfWorkRoute)
 
 def check_role_permission(role: str, allowed_roles: list) -> bool:
     """
@@ -45,12 +54,6 @@ def check_role_permission(role: str, allowed_roles: list) -> bool:
     
     return role_lower in allowed_roles_lower
 
-def get_container():
-    """
-    Fournit le container d'injection de dépendances.
-    """
-    return Container()
-
 @router.post("/", response_model=AppointmentResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_appointment(
     data: AppointmentCreateDTO,
@@ -62,7 +65,7 @@ async def create_appointment(
     """
     try:
         # Journaliser les données reçues
-        logger.info(f"Données reçues pour la création d'un rendez-vous: {data}")
+        logger.info("Création d'un rendez-vous: patient_id=%s, doctor_id=%s", data.patient_id, data.doctor_id)
         
         # Vérifier si l'utilisateur a le droit de créer un rendez-vous
         user_role = token_payload.get("role", "")
@@ -90,9 +93,9 @@ async def create_appointment(
             if isinstance(data.end_time, str):
                 data.end_time = datetime.fromisoformat(data.end_time.replace('Z', '+00:00'))
                 
-            logger.info(f"Dates après conversion: start_time={data.start_time}, end_time={data.end_time}")
+            logger.info("Dates après conversion: start_time=%s, end_time=%s", data.start_time, data.end_time)
         except ValueError as e:
-            logger.error(f"Erreur lors de la conversion des dates: {str(e)}")
+            logger.error("Erreur lors de la conversion des dates: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Invalid date format: {str(e)}"
@@ -102,28 +105,28 @@ async def create_appointment(
         try:
             logger.info("Tentative d'exécution du cas d'utilisation ScheduleAppointmentUseCase")
             result = await use_case.execute(data)
-            logger.info(f"Rendez-vous créé avec succès: {result.id}")
+            logger.info("Rendez-vous créé avec succès: %s", result.id)
             return result
         except Exception as e:
-            logger.exception(f"Erreur pendant l'exécution du cas d'utilisation: {str(e)}")
+            logger.exception("Erreur pendant l'exécution du cas d'utilisation: %s", e)
             raise
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la création du rendez-vous: {str(e)}")
+        logger.exception("Erreur inattendue lors de la création du rendez-vous: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -170,7 +173,7 @@ async def get_appointment(
         return response
     
     except Exception as e:
-        logger.exception(f"Erreur lors de la récupération du rendez-vous {appointment_id}: {str(e)}")
+        logger.exception("Erreur lors de la récupération du rendez-vous %s: %s", appointment_id, e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -209,14 +212,14 @@ async def update_appointment(
         return result
         
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la mise à jour du rendez-vous: {str(e)}")
+        logger.exception("Erreur inattendue lors de la mise à jour du rendez-vous: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -246,14 +249,14 @@ async def get_patient_appointments(
         return result
         
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la récupération des rendez-vous: {str(e)}")
+        logger.exception("Erreur inattendue lors de la récupération des rendez-vous: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -314,21 +317,26 @@ async def list_appointments(
         )
         
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la récupération des rendez-vous: {str(e)}")
+        logger.exception("Erreur inattendue lors de la récupération des rendez-vous: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
 @router.get("/calendar/", response_model=AppointmentListResponseDTO)
+@request_timeout(get_settings().search_request_timeout_ms)
 async def get_calendar(
     year: int = Query(..., description="Year to fetch the calendar for"),
     month: int = Query(..., description="Month to fetch the calendar for"),
+    doctor_id: Optional[UUID] = Query(None, description="Only the appointments of this doctor"),
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
     container: Container = Depends(get_container)
 ):
     """
     Récupère les rendez-vous pour un mois spécifique (pour l'affichage calendrier).
+    
+    Les pages sont servies depuis le cache de calendrier, déjà sérialisées, tant
+    qu'aucun rendez-vous du mois n'a été créé, modifié ou supprimé.
     """
     try:
         # Vérifier les permissions
@@ -341,6 +349,14 @@ async def get_calendar(
                 detail="You don't have permission to view the calendar"
             )
         
+        # Page déjà sérialisée : ni base ni conversion en DTOs
+        calendar_cache = container.calendar_cache()
+        cache_key = (year, month, doctor_id, CALENDAR_SCOPES[user_role.lower()])
+        cached_body = calendar_cache.get(cache_key)
+        if cached_body is not None:
+            return Response(content=cached_body, media_type="application/json")
+        generation = calendar_cache.generation(cache_key)
+        
         # Déterminer les dates de début et de fin du mois
         start_date = date(year, month, 1)
         if month == 12:
@@ -351,8 +367,22 @@ async def get_calendar(
         # Récupérer le repository
         appointment_repository = container.appointment_repository()
         
-        # Récupérer les rendez-vous dans cette plage de dates
-        appointments = await appointment_repository.get_by_date_range(start_date, end_date)
+        # Récupérer les rendez-vous dans cette plage de dates ; un de plus que la page pour
+        # détecter un mois tronqué
+        page_limit = get_settings().calendar_page_limit
+        if doctor_id is None:
+            appointments = await appointment_repository.get_by_date_range(start_date, end_date, 0, page_limit + 1)
+        else:
+            appointments = await appointment_repository.get_by_doctor_between(
+                doctor_id,
+                datetime.combine(start_date, datetime.min.time()),
+                datetime.combine(end_date, datetime.max.time())
+            )
+        
+        truncated = len(appointments) > page_limit
+        if truncated:
+            logger.warning("Calendrier %04d-%02d tronqué à %s rendez-vous", year, month, page_limit)
+            appointments = appointments[:page_limit]
         
         # Convertir en DTOs
         appointment_dtos = [
@@ -372,16 +402,24 @@ async def get_calendar(
             for appointment in appointments
         ]
         
-        # Construire la réponse
-        return AppointmentListResponseDTO(
+        # Construire et sérialiser la réponse, conservée dans le cache de calendrier si elle
+        # contient tout le mois
+        response = JSONResponse(content=jsonable_encoder(AppointmentListResponseDTO(
             appointments=appointment_dtos,
             total=len(appointments),
             skip=0,
-            limit=len(appointments)
-        )
-        
+            limit=page_limit if truncated else len(appointments),
+            truncated=truncated
+        )))
+        if not truncated:
+            calendar_cache.put(cache_key, response.body, generation)
+        return response
+    
+    except HTTPException:
+        raise
+    
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la récupération du calendrier: {str(e)}")
+        logger.exception("Erreur inattendue lors de la récupération du calendrier: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -0,0 +1,84 @@
+# medisecure-backend/appointment_management/infrastructure/adapters/secondary/asyncpg_appointment_repository.py
+from typing import List, Optional
+from uuid import UUID
+import logging
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import (
+    APPOINTMENT_CODEC, SELECT_BY_DOCTOR, SELECT_BY_ID, PostgresAppointmentRepository
+)
+from shared.infrastructure.cache.repository_cache import cached_read
+from shared.infrastructure.database.raw_queries import fetch, fetchrow
+from shared.infrastructure.database.read_replicas import replica_read
+from shared.infrastructure.database.single_flight import single_flight
+from shared.infrastructure.database.unit_of_work import repository_session
+from shared.infrastructure.observability.request_timing import timed_repository
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Colonnes dans l'ordre des champs de l'entité Appointment
+APPOINTMENT_COLUMNS = (
+    "id, patient_id, doctor_id, start_time, end_time, status, reason, notes, created_at, updated_at, is_active"
+)
+RAW_SELECT_BY_ID = f"SELECT {APPOINTMENT_COLUMNS} FROM appointments WHERE id = $1 AND is_active"
+RAW_SELECT_BY_DOCTOR = (
+    f"SELECT {APPOINTMENT_COLUMNS} FROM appointments WHERE doctor_id = $1 AND is_active "
+    "ORDER BY start_time DESC OFFSET $2 LIMIT $3"
+)
+
+def _to_appointment(record) -> Appointment:
+    # asyncpg retourne la valeur de l'enum PostgreSQL (appointmentstatus) sous forme de texte
+    return Appointment(*record[:5], AppointmentStatus(record[5]), *record[6:])
+
+@timed_repository
+class AsyncpgAppointmentRepository(PostgresAppointmentRepository):
+    """
+    Adaptateur secondaire pour le repository des rendez-vous avec PostgreSQL, dont les
+    lectures par identifiant et par médecin sont exécutées directement par asyncpg, sans l'ORM.
+    Les autres opérations sont celles de PostgresAppointmentRepository.
+    """
+    
+    @cached_read(APPOINTMENT_CODEC)
+    @single_flight
+    async def get_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
+        """
+        Récupère un rendez-vous actif par son identifiant.
+        
+        Args:
+            appointment_id: L'identifiant du rendez-vous
+        
+        Returns:
+            Optional[Appointment]: Le rendez-vous, ou None s'il n'existe pas ou est désactivé
+        """
+        try:
+            async with repository_session(self.session_factory) as session:
+                record = await fetchrow(session, SELECT_BY_ID, RAW_SELECT_BY_ID, appointment_id)
+            return _to_appointment(record) if record is not None else None
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération du rendez-vous %s: %s", appointment_id, e)
+            raise
+    
+    @replica_read
+    async def get_by_doctor(self, doctor_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
+        """
+        Récupère les rendez-vous actifs d'un médecin, du plus récent au plus ancien.
+        
+        Args:
+            doctor_id: L'identifiant du médecin
+            skip: Le nombre de rendez-vous à ignorer
+            limit: Le nombre maximum de rendez-vous à retourner
+        
+        Returns:
+            List[Appointment]: Les rendez-vous du médecin
+        """
+        try:
+            # S'assurer que l'ID est de type UUID
+            doctor_id = doctor_id if isinstance(doctor_id, UUID) else UUID(str(doctor_id))
+            
+            async with repository_session(self.session_factory) as session:
+                records = await fetch(session, SELECT_BY_DOCTOR, RAW_SELECT_BY_DOCTOR, doctor_id, skip, limit)
+            return [_to_appointment(record) for record in records]
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération des rendez-vous du médecin %s: %s", doctor_id, e)
+            raise
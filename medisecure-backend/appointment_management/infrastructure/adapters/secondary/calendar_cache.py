@@ -0,0 +1,192 @@
+# medisecure-backend/appointment_management/infrastructure/adapters/secondary/calendar_cache.py
+"""
+Cache des pages de calendrier mensuel, déjà sérialisées en JSON.
+
+Une page est identifiée par (année, mois, filtre médecin, périmètre du rôle). Les écritures
+de rendez-vous invalident, après validation de leur transaction, les seuls mois qu'elles
+touchent (voir PostgresAppointmentRepository). Une page lue pendant qu'une écriture est
+validée n'est pas conservée : chaque mois porte une génération, incrémentée à chaque
+invalidation, et une page n'est stockée que si la génération n'a pas changé depuis le
+début de sa lecture.
+
+Le cache est propre au processus. Avec un cache partagé (CACHE_BACKEND=redis), les
+invalidations sont diffusées aux autres workers (`apply_invalidations`) ; sans lui, le
+cache n'est activé que pour un seul worker (voir Settings.calendar_cache_entries). La durée
+de vie (`ttl`) borne l'écart avec les écritures faites hors des repositories et avec celles
+dont l'invalidation diffusée est perdue.
+
+Les pages peuvent être lues sur un réplica en retard : pendant `settle` secondes après
+l'invalidation d'un mois (le retard maximal des réplicas), ses pages ne sont pas conservées.
+"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+import logging
+import time
+
+from shared.infrastructure.observability.metrics import record_cache_lookup
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# (année, mois)
+Month = Tuple[int, int]
+
+# (année, mois, filtre médecin, périmètre du rôle)
+CalendarKey = Tuple[int, int, Optional[UUID], Hashable]
+
+# Espace des clés d'invalidation diffusées aux autres workers ("calendar:2024-03")
+INVALIDATION_NAMESPACE = "calendar"
+
+class CalendarCache:
+    """
+    Cache LRU borné des pages de calendrier, invalidé par mois.
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(self, max_entries: int = 512, ttl: float = 15.0, settle: float = 0.0):
+        """
+        Initialise le cache.
+        
+        Args:
+            max_entries: Le nombre maximal de pages conservées (0 : cache désactivé)
+            ttl: La durée de vie d'une page (secondes)
+            settle: La durée après l'invalidation d'un mois pendant laquelle ses pages ne
+                sont pas conservées (secondes, 0 sans réplica en lecture)
+        """
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.settle = settle
+        self._invalidated_at: Dict[Month, float] = {}
+        self._pages: "OrderedDict[CalendarKey, Tuple[float, bytes]]" = OrderedDict()
+        self._keys_by_month: Dict[Month, Set[CalendarKey]] = {}
+        self._generations: Dict[Month, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._pages)
+    
+    def get(self, key: CalendarKey) -> Optional[bytes]:
+        """
+        Retourne la page en cache.
+        
+        Args:
+            key: La clé de la page
+        
+        Returns:
+            Optional[bytes]: Le corps JSON de la page, ou None si elle est absente ou expirée
+        """
+        if self.max_entries <= 0:
+            return None
+        entry = self._pages.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._remove(key)
+            entry = None
+        record_cache_lookup("calendar", entry is not None)
+        if entry is None:
+            return None
+        self._pages.move_to_end(key)
+        return entry[1]
+    
+    def generation(self, key: CalendarKey) -> int:
+        """
+        Retourne la génération du mois de la page, à relever avant de la lire en base.
+        
+        Args:
+            key: La clé de la page
+        
+        Returns:
+            int: La génération courante du mois
+        """
+        return self._generations.get(key[:2], 0)
+    
+    def put(self, key: CalendarKey, body: bytes, generation: int) -> None:
+        """
+        Conserve une page, sauf si son mois a été invalidé depuis le début de sa lecture.
+        
+        Args:
+            key: La clé de la page
+            body: Le corps JSON de la page
+            generation: La génération relevée avant la lecture
+        """
+        if self.max_entries <= 0 or self.generation(key) != generation:
+            return
+        invalidated_at = self._invalidated_at.get(key[:2])
+        if invalidated_at is not None and time.monotonic() - invalidated_at < self.settle:
+            return
+        self._pages[key] = (time.monotonic() + self.ttl, body)
+        self._pages.move_to_end(key)
+        self._keys_by_month.setdefault(key[:2], set()).add(key)
+        while len(self._pages) > self.max_entries:
+            self._remove(next(iter(self._pages)))
+    
+    def invalidate_months(self, months: Iterable[Month]) -> None:
+        """
+        Retire les pages des mois donnés.
+        
+        Args:
+            months: Les mois modifiés
+        """
+        for month in months:
+            self._generations[month] = self._generations.get(month, 0) + 1
+            if self.settle > 0:
+                self._invalidated_at[month] = time.monotonic()
+            for key in self._keys_by_month.pop(month, ()):
+                self._pages.pop(key, None)
+            logger.debug("Calendrier invalidé pour %04d-%02d", *month)
+    
+    def apply_invalidations(self, keys: Optional[List[str]]) -> None:
+        """
+        Applique les invalidations de calendrier reçues des autres workers.
+        
+        Args:
+            keys: Les clés d'invalidation (voir invalidation_key), ou None si des
+                invalidations ont pu être perdues : toutes les pages sont alors retirées
+        """
+        if keys is None:
+            months = list(self._keys_by_month)
+        else:
+            months = []
+            for key in keys:
+                year, month = key.split(":", 1)[1].split("-")
+                months.append((int(year), int(month)))
+        self.invalidate_months(months)
+    
+    def _remove(self, key: CalendarKey) -> None:
+        self._pages.pop(key, None)
+        keys = self._keys_by_month.get(key[:2])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_month[key[:2]]
+
+def invalidation_key(month: Month) -> str:
+    """
+    Retourne la clé diffusée aux autres workers pour invalider un mois.
+    
+    Args:
+        month: Le mois (année, mois)
+    
+    Returns:
+        str: La clé, par exemple "calendar:2024-03"
+    """
+    return f"{INVALIDATION_NAMESPACE}:{month[0]:04d}-{month[1]:02d}"
+
+def months_between(start: datetime, end: datetime) -> Set[Month]:
+    """
+    Retourne les mois couverts par un rendez-vous (un ou deux en pratique).
+    
+    Args:
+        start: Le début du rendez-vous
+        end: La fin du rendez-vous
+    
+    Returns:
+        Set[Month]: Les mois (année, mois) de start à end inclus
+    """
+    months = set()
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.add((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
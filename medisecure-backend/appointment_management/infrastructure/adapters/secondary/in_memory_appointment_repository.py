@@ -12,11 +12,15 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
     Implémente le port AppointmentRepositoryProtocol.
     """
     
-    def __init__(self):
+    def __init__(self, soft_delete: bool = True):
         """
         Initialise le repository avec une liste vide de rendez-vous.
+        
+        Args:
+            soft_delete: Si True, la suppression désactive le rendez-vous au lieu de le retirer
         """
         self.appointments: Dict[UUID, Appointment] = {}
+        self.soft_delete = soft_delete
     
     async def get_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         """
@@ -29,7 +33,7 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
             Optional[Appointment]: Le rendez-vous trouvé ou None si non trouvé
         """
         appointment = self.appointments.get(appointment_id)
-        if appointment:
+        if appointment and appointment.is_active:
             return deepcopy(appointment)
         return None
     
@@ -69,12 +73,37 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         Returns:
             bool: True si le rendez-vous a été supprimé, False sinon
         """
-        if appointment_id not in self.appointments:
+        appointment = self.appointments.get(appointment_id)
+        if not appointment or not appointment.is_active:
             return False
         
+        if self.soft_delete:
+            # Désactiver le rendez-vous sans le retirer du stockage
+            appointment.is_active = False
+            appointment.updated_at = datetime.utcnow()
+            return True
+        
         del self.appointments[appointment_id]
         return True
     
+    async def delete_by_patient(self, patient_id: UUID) -> int:
+        """
+        Supprime tous les rendez-vous d'un patient (suppression du dossier patient).
+        
+        Args:
+            patient_id: L'ID du patient
+            
+        Returns:
+            int: Le nombre de rendez-vous supprimés
+        """
+        appointment_ids = [
+            appointment.id for appointment in self._active_appointments()
+            if appointment.patient_id == patient_id
+        ]
+        for appointment_id in appointment_ids:
+            await self.delete(appointment_id)
+        return len(appointment_ids)
+    
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
         Liste tous les rendez-vous avec pagination.
@@ -86,7 +115,7 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         Returns:
             List[Appointment]: La liste des rendez-vous
         """
-        appointments = list(self.appointments.values())
+        appointments = self._active_appointments()
         return [deepcopy(appointment) for appointment in appointments[skip:skip + limit]]
     
     async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
@@ -102,7 +131,7 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
             List[Appointment]: La liste des rendez-vous du patient
         """
         patient_appointments = [
-            appointment for appointment in self.appointments.values()
+            appointment for appointment in self._active_appointments()
             if appointment.patient_id == patient_id
         ]
         return [deepcopy(appointment) for appointment in patient_appointments[skip:skip + limit]]
@@ -120,11 +149,31 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
             List[Appointment]: La liste des rendez-vous du médecin
         """
         doctor_appointments = [
-            appointment for appointment in self.appointments.values()
+            appointment for appointment in self._active_appointments()
             if appointment.doctor_id == doctor_id
         ]
         return [deepcopy(appointment) for appointment in doctor_appointments[skip:skip + limit]]
     
+    async def get_by_doctor_between(self, doctor_id: UUID, start_time: datetime, end_time: datetime) -> List[Appointment]:
+        """
+        Récupère les rendez-vous d'un médecin qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: Le début de la plage horaire
+            end_time: La fin de la plage horaire
+            
+        Returns:
+            List[Appointment]: La liste des rendez-vous du médecin chevauchant la plage
+        """
+        doctor_appointments = [
+            appointment for appointment in self._active_appointments()
+            if appointment.doctor_id == doctor_id
+            and appointment.start_time < end_time
+            and appointment.end_time > start_time
+        ]
+        return [deepcopy(appointment) for appointment in doctor_appointments]
+    
     async def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Appointment]:
         """
         Récupère les rendez-vous dans une plage de dates.
@@ -142,11 +191,8 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         end_datetime = datetime.combine(end_date, datetime.max.time())
         
         date_range_appointments = [
-            appointment for appointment in self.appointments.values()
-            if (
-                (appointment.start_time >= start_datetime and appointment.start_time <= end_datetime) or
-                (appointment.end_time >= start_datetime and appointment.end_time <= end_datetime)
-            )
+            appointment for appointment in self._active_appointments()
+            if appointment.start_time <= end_datetime and appointment.end_time >= start_datetime
         ]
         return [deepcopy(appointment) for appointment in date_range_appointments[skip:skip + limit]]
     
@@ -157,4 +203,13 @@ class InMemoryAppointmentRepository(AppointmentRepositoryProtocol):
         Returns:
             int: Le nombre total de rendez-vous
         """
-        return len(self.appointments)
\ No newline at end of file
+        return len(self._active_appointments())
+    
+    def _active_appointments(self) -> List[Appointment]:
+        """
+        Retourne les rendez-vous actifs (non supprimés).
+        
+        Returns:
+            List[Appointment]: La liste des rendez-vous actifs
+        """
+        return [appointment for appointment in self.appointments.values() if appointment.is_active]
\ No newline at end of file
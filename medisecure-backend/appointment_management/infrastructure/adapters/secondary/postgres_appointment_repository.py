@@ -1,63 +1,147 @@
 # medisecure-backend/appointment_management/infrastructure/adapters/secondary/postgres_appointment_repository.py
-from typing import Optional, List
+from typing import Optional, List, Sequence, Set
 from uuid import UUID
 from datetime import datetime, date
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, and_, or_, func, text
+from sqlalchemy import update, delete, and_, or_, func, text, bindparam
+import functools
 import logging
 
 from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from appointment_management.domain.services.appointment_service import MAX_APPOINTMENT_DURATION
 from appointment_management.domain.ports.secondary.appointment_repository_protocol import AppointmentRepositoryProtocol
+from appointment_management.infrastructure.adapters.secondary.calendar_cache import (
+    CalendarCache, Month, invalidation_key, months_between
+)
+from shared.infrastructure.cache.repository_cache import RepositoryCache, cached_read, invalidate_after_commit
+from shared.infrastructure.cache.serialization import EntityCodec
 from shared.infrastructure.database.models.appointment_model import AppointmentModel
+from shared.infrastructure.database.read_replicas import replica_read
+from shared.infrastructure.database.single_flight import single_flight
+from shared.infrastructure.database.unit_of_work import after_commit, repository_session
+from shared.infrastructure.observability.request_timing import timed_repository
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Forme des rendez-vous dans le cache des lectures par identifiant
+APPOINTMENT_CODEC = EntityCodec(Appointment)
+
+# Lectures fréquentes, construites une seule fois : chaque appel ne fournit que ses paramètres
+# et SQLAlchemy retrouve directement la requête compilée (voir connection.engine_options).
+# La table est partitionnée par mois sur `start_time` : les plages portent toujours une borne
+# basse sur `start_time` (earliest_start, déduite de la durée maximale d'un rendez-vous), seule
+# à permettre au planificateur d'ignorer les partitions hors plage.
+SELECT_BY_ID = select(AppointmentModel).where(AppointmentModel.id == bindparam("appointment_id"), AppointmentModel.is_active)
+SELECT_PAGE = (
+    select(AppointmentModel)
+    .where(AppointmentModel.is_active)
+    .order_by(AppointmentModel.start_time.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_BY_PATIENT = (
+    select(AppointmentModel)
+    .where(AppointmentModel.patient_id == bindparam("patient_id"), AppointmentModel.is_active)
+    .order_by(AppointmentModel.start_time.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_BY_DOCTOR = (
+    select(AppointmentModel)
+    .where(AppointmentModel.doctor_id == bindparam("doctor_id"), AppointmentModel.is_active)
+    .order_by(AppointmentModel.start_time.desc())
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_BY_DOCTOR_BETWEEN = (
+    select(AppointmentModel)
+    .where(
+        AppointmentModel.doctor_id == bindparam("doctor_id"),
+        AppointmentModel.is_active,
+        AppointmentModel.start_time < bindparam("end_time"),
+        AppointmentModel.end_time > bindparam("start_time"),
+        AppointmentModel.start_time > bindparam("earliest_start")
+    )
+    .order_by(AppointmentModel.start_time)
+)
+SELECT_BY_DATE_RANGE = (
+    select(AppointmentModel)
+    .where(
+        AppointmentModel.is_active,
+        AppointmentModel.start_time <= bindparam("range_end"),
+        AppointmentModel.start_time >= bindparam("earliest_start"),
+        AppointmentModel.end_time >= bindparam("range_start")
+    )
+    .order_by(AppointmentModel.start_time)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_COUNT = select(func.count()).select_from(AppointmentModel).where(AppointmentModel.is_active)
+
+@timed_repository
 class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des rendez-vous avec PostgreSQL.
     Implémente le port AppointmentRepositoryProtocol.
     """
     
-    def __init__(self, session_factory):
+    def __init__(
+        self,
+        session_factory,
+        soft_delete: bool = True,
+        calendar_cache: Optional[CalendarCache] = None,
+        record_cache: Optional[RepositoryCache] = None
+    ):
         """
         Initialise le repository avec une factory de session SQLAlchemy.
         
+        Les lectures ne portent que sur les rendez-vous actifs (`is_active`), ce qui
+        leur permet d'utiliser les index partiels `WHERE is_active`.
+        
         Args:
             session_factory: La factory de session SQLAlchemy à utiliser
+            soft_delete: Si True, la suppression désactive le rendez-vous au lieu de supprimer la ligne
+            calendar_cache: Le cache des pages de calendrier, invalidé par les écritures
+            record_cache: Le cache des rendez-vous lus par identifiant, invalidé par les
+                écritures, qui diffuse aussi les invalidations de calendrier aux autres workers
         """
         self.session_factory = session_factory
+        self.soft_delete = soft_delete
+        self.calendar_cache = calendar_cache
+        self.record_cache = record_cache
     
+    @cached_read(APPOINTMENT_CODEC)
+    @single_flight
     async def get_by_id(self, appointment_id: UUID) -> Optional[Appointment]:
         try:
-            logger.debug(f"Récupération du rendez-vous avec ID: {appointment_id}")
-            async with self.session_factory() as session:
-                query = select(AppointmentModel).where(AppointmentModel.id == appointment_id)
-                result = await session.execute(query)
+            logger.debug("Récupération du rendez-vous avec ID: %s", appointment_id)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_BY_ID, {"appointment_id": appointment_id})
                 appointment_model = result.scalar_one_or_none()
                 
                 if not appointment_model:
-                    logger.debug(f"Rendez-vous avec ID {appointment_id} non trouvé")
+                    logger.debug("Rendez-vous avec ID %s non trouvé", appointment_id)
                     return None
                 
-                logger.debug(f"Rendez-vous trouvé: {appointment_model.id}")
+                logger.debug("Rendez-vous trouvé: %s", appointment_model.id)
                 return self._map_to_entity(appointment_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération du rendez-vous {appointment_id}: {str(e)}")
+            logger.exception("Erreur lors de la récupération du rendez-vous %s: %s", appointment_id, e)
             raise
     
     async def create(self, appointment: Appointment) -> Appointment:
         try:
-            logger.info(f"Création d'un nouveau rendez-vous: {appointment.id}")
-            logger.debug(f"Données du rendez-vous: patient_id={appointment.patient_id}, doctor_id={appointment.doctor_id}")
-            logger.debug(f"Dates: start_time={appointment.start_time}, end_time={appointment.end_time}")
+            logger.info("Création d'un nouveau rendez-vous: %s", appointment.id)
+            logger.debug("Données du rendez-vous: patient_id=%s, doctor_id=%s", appointment.patient_id, appointment.doctor_id)
+            logger.debug("Dates: start_time=%s, end_time=%s", appointment.start_time, appointment.end_time)
             
             # S'assurer que les ID sont de type UUID
             patient_id = appointment.patient_id if isinstance(appointment.patient_id, UUID) else UUID(str(appointment.patient_id))
             doctor_id = appointment.doctor_id if isinstance(appointment.doctor_id, UUID) else UUID(str(appointment.doctor_id))
             
-            async with self.session_factory() as session:
+            async with repository_session(self.session_factory) as session:
                 # Créer le modèle avec les bonnes conversions de types
                 appointment_model = AppointmentModel(
                     id=appointment.id,
@@ -74,14 +158,15 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 )
                 
                 session.add(appointment_model)
-                await session.commit()
-                await session.refresh(appointment_model)
+                # Validation à la fin de l'unité de travail ; flush fait remonter ici les violations de contraintes
+                await session.flush()
+                self._invalidate_caches(session, months_between(appointment.start_time, appointment.end_time))
                 
-                logger.info(f"Rendez-vous créé avec succès: {appointment_model.id}")
+                logger.info("Rendez-vous créé avec succès: %s", appointment_model.id)
                 return self._map_to_entity(appointment_model)
                 
         except Exception as e:
-            logger.exception(f"Erreur lors de la création du rendez-vous: {str(e)}")
+            logger.exception("Erreur lors de la création du rendez-vous: %s", e)
             raise
         
     async def update(self, appointment: Appointment) -> Appointment:
@@ -95,7 +180,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             Appointment: Le rendez-vous mis à jour
         """
         try:
-            logger.info(f"Mise à jour du rendez-vous: {appointment.id}")
+            logger.info("Mise à jour du rendez-vous: %s", appointment.id)
             
             # S'assurer que les ID sont de type UUID
             patient_id = appointment.patient_id if isinstance(appointment.patient_id, UUID) else UUID(str(appointment.patient_id))
@@ -104,7 +189,7 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             # Vérifier d'abord si le rendez-vous existe
             existing_appointment = await self.get_by_id(appointment.id)
             if not existing_appointment:
-                logger.error(f"Tentative de mise à jour d'un rendez-vous inexistant: {appointment.id}")
+                logger.error("Tentative de mise à jour d'un rendez-vous inexistant: %s", appointment.id)
                 raise ValueError(f"Le rendez-vous avec l'ID {appointment.id} n'existe pas")
             
             # Préparer la requête de mise à jour
@@ -116,36 +201,42 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                     doctor_id=doctor_id,
                     start_time=appointment.start_time,
                     end_time=appointment.end_time,
-                    status=AppointmentStatusModel(appointment.status.value),
+                    status=appointment.status.value,
                     reason=appointment.reason,
                     notes=appointment.notes,
                     updated_at=datetime.utcnow(),
                     is_active=appointment.is_active
                 )
+                .returning(AppointmentModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
             
-            # Exécuter la mise à jour
-            try:
-                await self.session.execute(query)
-                await self.session.commit()
-                
-                # Récupérer le rendez-vous mis à jour
-                updated_appointment = await self.get_by_id(appointment.id)
-                logger.info(f"Rendez-vous {appointment.id} mis à jour avec succès")
-                return updated_appointment
-            except Exception as e:
-                await self.session.rollback()
-                logger.error(f"Erreur lors de la mise à jour en base de données: {str(e)}")
-                raise
-                
+            # Exécuter la mise à jour ; RETURNING renvoie le rendez-vous mis à jour sans relecture
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(query)
+                appointment_model = result.scalar_one()
+                # Mois de l'ancien et du nouveau créneau
+                self._invalidate_caches(
+                    session,
+                    months_between(existing_appointment.start_time, existing_appointment.end_time)
+                    | months_between(appointment_model.start_time, appointment_model.end_time),
+                    [appointment.id]
+                )
+            
+            logger.info("Rendez-vous %s mis à jour avec succès", appointment.id)
+            return self._map_to_entity(appointment_model)
+            
         except Exception as e:
-            logger.exception(f"Erreur lors de la mise à jour du rendez-vous {appointment.id}: {str(e)}")
+            logger.exception("Erreur lors de la mise à jour du rendez-vous %s: %s", appointment.id, e)
             raise
     
     async def delete(self, appointment_id: UUID) -> bool:
         """
         Supprime un rendez-vous.
         
+        En mode soft delete, le rendez-vous est seulement désactivé (`is_active = false`)
+        et disparaît des lectures sans que la ligne soit supprimée.
+        
         Args:
             appointment_id: L'ID du rendez-vous à supprimer
             
@@ -153,165 +244,225 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
             bool: True si le rendez-vous a été supprimé, False sinon
         """
         try:
-            logger.info(f"Suppression du rendez-vous: {appointment_id}")
+            logger.info("Suppression du rendez-vous: %s (soft_delete=%s)", appointment_id, self.soft_delete)
             
-            # Vérifier d'abord si le rendez-vous existe
-            existing_appointment = await self.get_by_id(appointment_id)
-            if not existing_appointment:
-                logger.warning(f"Tentative de suppression d'un rendez-vous inexistant: {appointment_id}")
+            if self.soft_delete:
+                query = (
+                    update(AppointmentModel)
+                    .where(AppointmentModel.id == appointment_id, AppointmentModel.is_active)
+                    .values(is_active=False, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                query = delete(AppointmentModel).where(AppointmentModel.id == appointment_id)
+            query = query.returning(AppointmentModel.start_time, AppointmentModel.end_time)
+            
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(query)
+                deleted = result.first()
+                if deleted is not None:
+                    self._invalidate_caches(session, months_between(*deleted), [appointment_id])
+            
+            if deleted is None:
+                logger.warning("Tentative de suppression d'un rendez-vous inexistant: %s", appointment_id)
                 return False
             
-            # Préparer la requête de suppression
-            query = delete(AppointmentModel).where(AppointmentModel.id == appointment_id)
+            logger.info("Rendez-vous %s supprimé avec succès", appointment_id)
+            return True
+        except Exception as e:
+            logger.exception("Erreur lors de la suppression du rendez-vous %s: %s", appointment_id, e)
+            raise
+    
+    async def delete_by_patient(self, patient_id: UUID) -> int:
+        """
+        Supprime tous les rendez-vous actifs d'un patient (suppression du dossier patient).
+        
+        Les rendez-vous sont désactivés en mode soft delete, supprimés sinon, dans la
+        transaction de la suppression du patient : ils ne restent ni dans le calendrier ni
+        sur les créneaux du médecin.
+        
+        Args:
+            patient_id: L'ID du patient
             
-            # Exécuter la suppression
-            try:
-                result = await self.session.execute(query)
-                await self.session.commit()
-                
-                if result.rowcount == 0:
-                    logger.warning(f"Aucune ligne affectée lors de la suppression du rendez-vous {appointment_id}")
-                    return False
-                
-                logger.info(f"Rendez-vous {appointment_id} supprimé avec succès")
-                return True
-            except Exception as e:
-                await self.session.rollback()
-                logger.error(f"Erreur lors de la suppression en base de données: {str(e)}")
-                raise
-                
+        Returns:
+            int: Le nombre de rendez-vous supprimés
+        """
+        try:
+            logger.info("Suppression des rendez-vous du patient %s (soft_delete=%s)", patient_id, self.soft_delete)
+            
+            if self.soft_delete:
+                query = (
+                    update(AppointmentModel)
+                    .where(AppointmentModel.patient_id == patient_id, AppointmentModel.is_active)
+                    .values(is_active=False, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                query = delete(AppointmentModel).where(AppointmentModel.patient_id == patient_id)
+            query = query.returning(AppointmentModel.id, AppointmentModel.start_time, AppointmentModel.end_time)
+            
+            async with repository_session(self.session_factory) as session:
+                deleted = (await session.execute(query)).all()
+                if deleted:
+                    months: Set[Month] = set()
+                    for _, start_time, end_time in deleted:
+                        months |= months_between(start_time, end_time)
+                    self._invalidate_caches(session, months, [appointment_id for appointment_id, _, _ in deleted])
+            
+            logger.info("%s rendez-vous du patient %s supprimés", len(deleted), patient_id)
+            return len(deleted)
         except Exception as e:
-            logger.exception(f"Erreur lors de la suppression du rendez-vous {appointment_id}: {str(e)}")
+            logger.exception("Erreur lors de la suppression des rendez-vous du patient %s: %s", patient_id, e)
             raise
     
+    @single_flight
+    @replica_read
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Appointment]:
         try:
-            logger.debug(f"Liste de tous les rendez-vous (skip={skip}, limit={limit})")
+            logger.debug("Liste de tous les rendez-vous (skip=%s, limit=%s)", skip, limit)
             
-            # Construire la requête avec pagination
-            query = select(AppointmentModel).order_by(AppointmentModel.start_time.desc()).offset(skip).limit(limit)
-            
-            # Exécuter la requête
-            async with self.session_factory() as session:
-                result = await session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_PAGE, {"skip": skip, "limit": limit})
                 appointment_models = result.scalars().all()
             
-            logger.debug(f"Nombre de rendez-vous récupérés: {len(appointment_models)}")
+            logger.debug("Nombre de rendez-vous récupérés: %s", len(appointment_models))
             return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération de la liste des rendez-vous: {str(e)}")
+            logger.exception("Erreur lors de la récupération de la liste des rendez-vous: %s", e)
             raise
     
+    @single_flight
+    @replica_read
     async def get_by_patient(self, patient_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         try:
-            logger.debug(f"Récupération des rendez-vous du patient {patient_id}")
+            logger.debug("Récupération des rendez-vous du patient %s", patient_id)
             
             # S'assurer que l'ID est de type UUID
             patient_id = patient_id if isinstance(patient_id, UUID) else UUID(str(patient_id))
             
-            # Construire la requête
-            query = (
-                select(AppointmentModel)
-                .where(AppointmentModel.patient_id == patient_id)
-                .order_by(AppointmentModel.start_time.desc())
-                .offset(skip)
-                .limit(limit)
-            )
-            
-            # Exécuter la requête
-            async with self.session_factory() as session:
-                result = await session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(
+                    SELECT_BY_PATIENT, {"patient_id": patient_id, "skip": skip, "limit": limit}
+                )
                 appointment_models = result.scalars().all()
             
-            logger.debug(f"Nombre de rendez-vous récupérés pour le patient {patient_id}: {len(appointment_models)}")
+            logger.debug("Nombre de rendez-vous récupérés pour le patient %s: %s", patient_id, len(appointment_models))
             return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération des rendez-vous du patient {patient_id}: {str(e)}")
+            logger.exception("Erreur lors de la récupération des rendez-vous du patient %s: %s", patient_id, e)
             raise
     
+    @replica_read
     async def get_by_doctor(self, doctor_id: UUID, skip: int = 0, limit: int = 100) -> List[Appointment]:
         try:
-            logger.debug(f"Récupération des rendez-vous du médecin {doctor_id}")
+            logger.debug("Récupération des rendez-vous du médecin %s", doctor_id)
             
             # S'assurer que l'ID est de type UUID
             doctor_id = doctor_id if isinstance(doctor_id, UUID) else UUID(str(doctor_id))
             
-            # Construire la requête
-            query = (
-                select(AppointmentModel)
-                .where(AppointmentModel.doctor_id == doctor_id)
-                .order_by(AppointmentModel.start_time.desc())
-                .offset(skip)
-                .limit(limit)
-            )
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(
+                    SELECT_BY_DOCTOR, {"doctor_id": doctor_id, "skip": skip, "limit": limit}
+                )
+                appointment_models = result.scalars().all()
             
-            # Exécuter la requête
-            async with self.session_factory() as session:
-                result = await session.execute(query)
+            logger.debug("Nombre de rendez-vous récupérés pour le médecin %s: %s", doctor_id, len(appointment_models))
+            return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération des rendez-vous du médecin %s: %s", doctor_id, e)
+            raise
+    
+    async def get_by_doctor_between(self, doctor_id: UUID, start_time: datetime, end_time: datetime) -> List[Appointment]:
+        """
+        Récupère les rendez-vous d'un médecin qui chevauchent une plage horaire.
+        
+        Args:
+            doctor_id: L'ID du médecin
+            start_time: Le début de la plage horaire
+            end_time: La fin de la plage horaire
+            
+        Returns:
+            List[Appointment]: La liste des rendez-vous du médecin chevauchant la plage
+        """
+        try:
+            logger.debug("Récupération des rendez-vous du médecin %s entre %s et %s", doctor_id, start_time, end_time)
+            
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_BY_DOCTOR_BETWEEN, {
+                    "doctor_id": doctor_id,
+                    "start_time": start_time,
+                    "end_time": end_time,
+                    "earliest_start": start_time - MAX_APPOINTMENT_DURATION,
+                })
                 appointment_models = result.scalars().all()
             
-            logger.debug(f"Nombre de rendez-vous récupérés pour le médecin {doctor_id}: {len(appointment_models)}")
             return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération des rendez-vous du médecin {doctor_id}: {str(e)}")
+            logger.exception("Erreur lors de la récupération des rendez-vous du médecin %s: %s", doctor_id, e)
             raise
     
+    @single_flight
+    @replica_read
     async def get_by_date_range(self, start_date: date, end_date: date, skip: int = 0, limit: int = 100) -> List[Appointment]:
         try:
-            logger.debug(f"Récupération des rendez-vous entre {start_date} et {end_date}")
+            logger.debug("Récupération des rendez-vous entre %s et %s", start_date, end_date)
             
             # Convertir les dates en datetime pour la requête
             start_datetime = datetime.combine(start_date, datetime.min.time())
             end_datetime = datetime.combine(end_date, datetime.max.time())
             
-            # Construire la requête
-            query = (
-                select(AppointmentModel)
-                .where(
-                    or_(
-                        and_(
-                            AppointmentModel.start_time >= start_datetime,
-                            AppointmentModel.start_time <= end_datetime
-                        ),
-                        and_(
-                            AppointmentModel.end_time >= start_datetime,
-                            AppointmentModel.end_time <= end_datetime
-                        ),
-                        and_(
-                            AppointmentModel.start_time <= start_datetime,
-                            AppointmentModel.end_time >= end_datetime
-                        )
-                    )
-                )
-                .order_by(AppointmentModel.start_time)
-                .offset(skip)
-                .limit(limit)
-            )
-            
-            # Exécuter la requête
-            async with self.session_factory() as session:
-                result = await session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_BY_DATE_RANGE, {
+                    "range_start": start_datetime,
+                    "range_end": end_datetime,
+                    "earliest_start": start_datetime - MAX_APPOINTMENT_DURATION,
+                    "skip": skip,
+                    "limit": limit,
+                })
                 appointment_models = result.scalars().all()
             
-            logger.debug(f"Nombre de rendez-vous récupérés entre {start_date} et {end_date}: {len(appointment_models)}")
+            logger.debug("Nombre de rendez-vous récupérés entre %s et %s: %s", start_date, end_date, len(appointment_models))
             return [self._map_to_entity(appointment_model) for appointment_model in appointment_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération des rendez-vous par plage de dates: {str(e)}")
+            logger.exception("Erreur lors de la récupération des rendez-vous par plage de dates: %s", e)
             raise
     
+    @single_flight
+    @replica_read
     async def count(self) -> int:
         try:
             logger.debug("Comptage du nombre total de rendez-vous")
-            async with self.session_factory() as session:
-                query = select(func.count()).select_from(AppointmentModel)
-                result = await session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_COUNT)
                 count = result.scalar_one_or_none() or 0
-                logger.debug(f"Nombre total de rendez-vous: {count}")
+                logger.debug("Nombre total de rendez-vous: %s", count)
                 return count
         except Exception as e:
-            logger.exception(f"Erreur lors du comptage des rendez-vous: {str(e)}")
+            logger.exception("Erreur lors du comptage des rendez-vous: %s", e)
             raise
     
+    def _invalidate_caches(
+        self,
+        session: AsyncSession,
+        months: Set[Month],
+        appointment_ids: Sequence[UUID] = ()
+    ) -> None:
+        """
+        Invalide, après validation de la transaction, les mois modifiés du cache de calendrier
+        et les rendez-vous modifiés du cache des lectures par identifiant.
+        
+        Args:
+            session: La session de l'écriture
+            months: Les mois (année, mois) touchés par l'écriture
+            appointment_ids: Les IDs des rendez-vous modifiés (aucun pour une création)
+        """
+        if self.calendar_cache is not None:
+            after_commit(session, functools.partial(self.calendar_cache.invalidate_months, months))
+        if self.record_cache is not None:
+            keys = [invalidation_key(month) for month in sorted(months)]
+            keys.extend(self.record_cache.key(APPOINTMENT_CODEC, appointment_id) for appointment_id in appointment_ids)
+            invalidate_after_commit(session, self.record_cache, keys)
+    
     def _map_to_entity(self, appointment_model: AppointmentModel) -> Appointment:
         try:
             # S'assurer que le statut est valide
@@ -332,6 +483,6 @@ class PostgresAppointmentRepository(AppointmentRepositoryProtocol):
                 is_active=appointment_model.is_active
             )
         except Exception as e:
-            logger.exception(f"Erreur lors de la conversion du modèle en entité: {str(e)}")
-            logger.error(f"Détails du modèle: id={appointment_model.id}, status={getattr(appointment_model, 'status', 'N/A')}")
+            logger.exception("Erreur lors de la conversion du modèle en entité: %s", e)
+            logger.error("Détails du modèle: id=%s, status=%s", appointment_model.id, getattr(appointment_model, 'status', 'N/A'))
             raise ValueError(f"Erreur lors de la conversion du modèle de rendez-vous en entité: {str(e)}")
\ No newline at end of file
@@ -0,0 +1,86 @@
+# medisecure-backend/benchmarks/compare.py
+"""
+Compare deux rapports de benchmark (par exemple main et une branche, mesurés sur le même poste).
+
+    python -m benchmarks.compare results/main.json results/branche.json --max-regression 0.10
+
+Le code de sortie est 1 si le p95 d'un endpoint régresse au-delà du seuil.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+import argparse
+import sys
+
+from benchmarks.report import load_report
+
+METRICS = ("p50", "p95", "p99")
+
+def _relative_change(base: float, head: float) -> Optional[float]:
+    if not base:
+        return None
+    return (head - base) / base
+
+def compare_reports(
+    base: Dict[str, Any],
+    head: Dict[str, Any],
+    max_regression: float
+) -> Tuple[List[Dict[str, Any]], List[str]]:
+    """
+    Compare les endpoints communs à deux rapports.
+    
+    Args:
+        base: Le rapport de référence
+        head: Le rapport comparé
+        max_regression: La hausse relative du p95 tolérée (0.10 = +10%)
+    
+    Returns:
+        Tuple[List[Dict[str, Any]], List[str]]: Les lignes de comparaison et les endpoints en régression
+    """
+    rows = []
+    regressions = []
+    for endpoint in sorted(set(base["endpoints"]) & set(head["endpoints"])):
+        base_stats = base["endpoints"][endpoint]
+        head_stats = head["endpoints"][endpoint]
+        row = {"endpoint": endpoint, "rps": (base_stats["rps"], head_stats["rps"])}
+        for metric in METRICS:
+            row[metric] = (base_stats["latency_ms"][metric], head_stats["latency_ms"][metric])
+        rows.append(row)
+        
+        change = _relative_change(*row["p95"])
+        if change is not None and change > max_regression:
+            regressions.append(endpoint)
+    return rows, regressions
+
+def _format_pair(pair: Tuple[float, float]) -> str:
+    change = _relative_change(*pair)
+    delta = f"{change:+.0%}" if change is not None else "n/a"
+    return f"{pair[0]:>9.2f} -> {pair[1]:>9.2f} ({delta:>5})"
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare deux rapports de benchmark")
+    parser.add_argument("base", help="Rapport de référence")
+    parser.add_argument("head", help="Rapport comparé")
+    parser.add_argument("--max-regression", type=float, default=0.10, help="Hausse relative du p95 tolérée")
+    args = parser.parse_args(argv)
+    
+    base = load_report(args.base)
+    head = load_report(args.head)
+    for label, report in (("base", base), ("head", head)):
+        environment = report["environment"]
+        print(f"{label}: {environment['git_branch']}@{(environment['git_commit'] or '')[:10]} sur {environment['host']}")
+    if base["environment"]["host"] != head["environment"]["host"]:
+        print("Attention : rapports produits sur des machines différentes")
+    
+    rows, regressions = compare_reports(base, head, args.max_regression)
+    for row in rows:
+        print(row["endpoint"])
+        for metric in METRICS:
+            print(f"  {metric} ms  {_format_pair(row[metric])}")
+        print(f"  req/s   {_format_pair(row['rps'])}")
+    
+    if regressions:
+        print(f"Régression du p95 au-delà de {args.max_regression:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+# medisecure-backend/benchmarks/import_time.py
+"""
+Temps d'import de l'application (`python -X importtime -c "import api.main"`).
+
+Un worker démarré par l'autoscaling doit servir en moins d'une seconde : l'import de
+api.main en est l'essentiel. Le script mesure plusieurs imports à froid (processus neufs),
+affiche la médiane et les modules les plus coûteux, et échoue au-delà du budget :
+    
+    python -m benchmarks.import_time --runs 5 --budget-ms 1000
+
+Les modules chargés seulement à la première utilisation (DEFERRED_MODULES) ne doivent pas
+apparaître à l'import.
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dépendances lourdes chargées à la première utilisation, jamais au démarrage
+DEFERRED_MODULES = ("jose", "passlib", "asyncpg", "smtplib")
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Analyse la sortie de `-X importtime`.
+    
+    Args:
+        output: La sortie d'erreur du processus
+    
+    Returns:
+        Dict[str, Tuple[int, int]]: Pour chaque module, son temps propre et cumulé (µs)
+    """
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if self_us.strip().isdigit():
+            modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+def measure_import(module: str = "api.main") -> Dict[str, Tuple[int, int]]:
+    """
+    Importe un module dans un processus neuf et retourne les temps d'import.
+    
+    Args:
+        module: Le module importé
+    
+    Returns:
+        Dict[str, Tuple[int, int]]: Les temps propre et cumulé (µs) de chaque module chargé
+    
+    Raises:
+        RuntimeError: Si l'import échoue
+    """
+    env = dict(os.environ)
+    env.setdefault("JWT_SECRET_KEY", "import-time-benchmark")
+    env["PYTHONPATH"] = BACKEND_DIR
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"Import de {module} impossible:\n{process.stderr[-2000:]}")
+    return parse_importtime(process.stderr)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Temps d'import de l'application")
+    parser.add_argument("--module", default="api.main", help="Module importé")
+    parser.add_argument("--runs", type=int, default=5, help="Nombre d'imports à froid")
+    parser.add_argument("--budget-ms", type=float, default=1000.0, help="Budget de la médiane (ms)")
+    parser.add_argument("--top", type=int, default=15, help="Nombre de modules les plus coûteux affichés")
+    args = parser.parse_args(argv)
+    
+    runs = [measure_import(args.module) for _ in range(args.runs)]
+    totals = [run[args.module][1] / 1000 for run in runs]
+    median = statistics.median(totals)
+    
+    slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+    print(f"{'module':<70} {'propre ms':>10} {'cumulé ms':>10}")
+    for name, (self_us, cumulative_us) in slowest:
+        print(f"{name:<70} {self_us / 1000:>10.1f} {cumulative_us / 1000:>10.1f}")
+    print(f"\nimport {args.module}: médiane {median:.0f} ms sur {args.runs} imports (min {min(totals):.0f}, max {max(totals):.0f})")
+    
+    loaded = [name for name in DEFERRED_MODULES if name in runs[-1]]
+    if loaded:
+        print(f"Modules chargés au démarrage alors qu'ils devraient être différés: {', '.join(loaded)}")
+        return 1
+    if median > args.budget_ms:
+        print(f"Budget dépassé: {median:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
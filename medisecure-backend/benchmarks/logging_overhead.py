@@ -0,0 +1,104 @@
+# medisecure-backend/benchmarks/logging_overhead.py
+"""
+Coût du logging par requête, vu de la boucle d'événements.
+
+Rejoue les appels de logging d'une création puis d'une lecture de patient (controller,
+cas d'utilisation, repository, middleware d'authentification), au niveau INFO :
+
+- `fstring-sync` : les appels d'origine (f-strings, DTO complet formaté) et un
+  StreamHandler synchrone, comme avec l'ancien logging.basicConfig ;
+- `lazy-sync` : les appels actuels (formatage paresseux) avec un StreamHandler synchrone ;
+- `lazy-async` : les appels actuels avec configure_logging (file + thread d'écriture).
+
+Les logs sont écrits dans /dev/null. Le temps CPU du thread appelant (celui que perd la
+boucle d'événements) est mesuré séparément du temps écoulé, qui inclut en mode
+asynchrone le thread d'écriture lorsqu'il partage le même cœur.
+
+    python -m benchmarks.logging_overhead --requests 20000
+"""
+import argparse
+import logging
+import os
+import time
+import uuid
+from datetime import date
+from typing import Tuple
+
+from patient_management.application.dtos.patient_dtos import PatientCreateDTO
+from shared.infrastructure.observability.structured_logging import TEXT_FORMAT, configure_logging, stop_logging
+
+logger = logging.getLogger("benchmarks.logging_overhead.app")
+
+def sample_patient() -> PatientCreateDTO:
+    return PatientCreateDTO(
+        first_name="Jeanne", last_name="Dupont", date_of_birth=date(1978, 4, 12), gender="female",
+        address="12 rue de la République", city="Lyon", postal_code="69003", country="France",
+        phone_number="0612345678", email="jeanne.dupont@example.com", blood_type="A+",
+        allergies={"pénicilline": "urticaire"}, chronic_diseases={"asthme": "depuis 2001"},
+        current_medications={"salbutamol 100 µg": "2 bouffées si besoin"},
+        insurance_provider="MGEN", insurance_id="1780469123456", notes="Suivi annuel",
+    )
+
+def fstring_request(data: PatientCreateDTO, patient_id: uuid.UUID, path: str) -> None:
+    """Appels de logging d'origine (f-strings évaluées même pour DEBUG)"""
+    logger.info(f"Création d'un nouveau patient avec les données: {data}")
+    logger.info(f"Création d'un nouveau patient: {data.first_name} {data.last_name}")
+    logger.info(f"Patient créé avec succès: {patient_id}")
+    logger.info(f"Patient créé avec succès: {patient_id}")
+    logger.debug(f"Utilisateur authentifié: {data.email} accède à {path}")
+    logger.debug(f"Récupération du patient avec ID: {patient_id}")
+    logger.debug(f"Patient trouvé: {patient_id}")
+
+def lazy_request(data: PatientCreateDTO, patient_id: uuid.UUID, path: str) -> None:
+    """Appels de logging actuels"""
+    logger.info("Création d'un nouveau patient")
+    logger.info("Création d'un nouveau patient: %s", patient_id)
+    logger.info("Patient créé avec succès: %s", patient_id)
+    logger.info("Patient créé avec succès: %s", patient_id)
+    logger.debug("Utilisateur authentifié: %s accède à %s", patient_id, path)
+    logger.debug("Récupération du patient avec ID: %s", patient_id)
+    logger.debug("Patient trouvé: %s", patient_id)
+
+def configure_sync(stream) -> None:
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+
+def measure(request, requests: int) -> Tuple[float, float]:
+    """Retourne le temps CPU du thread appelant et le temps écoulé moyens (µs) par requête"""
+    data = sample_patient()
+    patient_id = uuid.uuid4()
+    path = f"/api/patients/{patient_id}"
+    started = time.perf_counter()
+    cpu_started = time.thread_time()
+    for _ in range(requests):
+        request(data, patient_id, path)
+    cpu = time.thread_time() - cpu_started
+    return cpu / requests * 1e6, (time.perf_counter() - started) / requests * 1e6
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Coût du logging par requête")
+    parser.add_argument("--requests", type=int, default=20000, help="Nombre de requêtes simulées par mode")
+    args = parser.parse_args()
+    
+    results = {}
+    with open(os.devnull, "w") as devnull:
+        configure_sync(devnull)
+        results["fstring-sync"] = measure(fstring_request, args.requests)
+        results["lazy-sync"] = measure(lazy_request, args.requests)
+        configure_logging(level="INFO", log_format="text", asynchronous=True, stream=devnull)
+        results["lazy-async"] = measure(lazy_request, args.requests)
+        stop_logging()
+    
+    print(f"{'mode':<14} {'CPU appelant':>14} {'écoulé':>10}   (µs/requête)")
+    for mode, (cpu, elapsed) in results.items():
+        print(f"{mode:<14} {cpu:14.1f} {elapsed:10.1f}")
+    return 0
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,141 @@
+# medisecure-backend/benchmarks/middleware_overhead.py
+"""
+Coût par requête du middleware d'authentification.
+
+Compare, sur une application minimale appelée directement en ASGI (sans réseau ni base) :
+  - aucun middleware d'authentification ;
+  - l'ancien enregistrement `app.middleware("http")`, qui passe par BaseHTTPMiddleware
+    (tâche et flux mémoire supplémentaires à chaque requête) ;
+  - le middleware ASGI pur (api.middlewares.authentication_middleware).
+
+Deux routes sont mesurées : /api/health (exemptée) et une route authentifiée qui dépend
+de `extract_token_payload` :
+    
+    python -m benchmarks.middleware_overhead --requests 5000
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("JWT_SECRET_KEY", "middleware-overhead-benchmark")
+
+from fastapi import Depends, FastAPI, Request
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from shared.services.authenticator.basic_authenticator import BasicAuthenticator
+from shared.services.authenticator.extract_token import extract_token_payload
+
+# Liste de l'ancien middleware, parcourue à chaque requête ("/" exemptait en fait tout chemin)
+LEGACY_EXEMPT_PATHS = [
+    "/api/health", "/api/docs", "/api/redoc", "/api/openapi.json", "/api/auth/login",
+    "/api/auth/logout", "/docs", "/redoc", "/openapi.json", "/"
+]
+
+async def legacy_dispatch(request: Request, call_next):
+    if any(str(request.url.path).startswith(path) for path in LEGACY_EXEMPT_PATHS):
+        return await call_next(request)
+    return await call_next(request)
+
+def build_app(variant: str) -> FastAPI:
+    app = FastAPI()
+    
+    @app.get("/api/health")
+    async def health():
+        return {"status": "healthy"}
+    
+    @app.get("/api/patients/")
+    async def patients(token_payload: dict = Depends(extract_token_payload)):
+        return {"user": token_payload.get("sub")}
+    
+    if variant == "http":
+        app.add_middleware(BaseHTTPMiddleware, dispatch=legacy_dispatch)
+    elif variant == "asgi":
+        app.add_middleware(AuthenticationMiddleware)
+    return app
+
+def request_scope(path: str, token: str) -> Dict:
+    return {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "server": ("127.0.0.1", 8000), "client": ("127.0.0.1", 50000),
+        "headers": [
+            (b"host", b"127.0.0.1:8000"),
+            (b"accept", b"application/json"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+    }
+
+async def measure(app: Callable, path: str, token: str, requests: int) -> float:
+    """
+    Appelle l'application `requests` fois et retourne la durée moyenne d'une requête.
+    
+    Args:
+        app: L'application ASGI
+        path: Le chemin appelé
+        token: Le token envoyé dans l'en-tête Authorization
+        requests: Le nombre de requêtes
+    
+    Returns:
+        float: La durée moyenne d'une requête (µs)
+    """
+    status = []
+    disconnected = asyncio.Event()
+    
+    def receiver():
+        # Comme un serveur : le corps (vide) au premier appel, puis attente de la déconnexion
+        messages = [{"type": "http.request", "body": b"", "more_body": False}]
+        
+        async def receive():
+            if messages:
+                return messages.pop()
+            await disconnected.wait()
+            return {"type": "http.disconnect"}
+        return receive
+    
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+    
+    started = time.perf_counter()
+    for _ in range(requests):
+        await app(request_scope(path, token), receiver(), send)
+    elapsed = time.perf_counter() - started
+    if set(status) != {200}:
+        raise RuntimeError(f"Réponses inattendues sur {path}: {sorted(set(status))}")
+    return elapsed / requests * 1_000_000
+
+async def run(requests: int, repeats: int) -> Dict[str, Dict[str, float]]:
+    token = BasicAuthenticator().create_access_token({"sub": "bench@medisecure.com", "role": "admin"})
+    results: Dict[str, Dict[str, float]] = {}
+    for variant in ("aucun", "http", "asgi"):
+        app = build_app(variant)
+        results[variant] = {}
+        for path in ("/api/health", "/api/patients/"):
+            await measure(app, path, token, 200)
+            runs = [await measure(app, path, token, requests) for _ in range(repeats)]
+            results[variant][path] = statistics.median(runs)
+    return results
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Coût par requête du middleware d'authentification")
+    parser.add_argument("--requests", type=int, default=5000, help="Requêtes par mesure")
+    parser.add_argument("--repeats", type=int, default=5, help="Mesures par variante (médiane retenue)")
+    args = parser.parse_args(argv)
+    
+    results = asyncio.run(run(args.requests, args.repeats))
+    
+    print(f"{'middleware':<12} {'/api/health µs':>15} {'authentifiée µs':>16}")
+    for variant, timings in results.items():
+        print(f"{variant:<12} {timings['/api/health']:>15.1f} {timings['/api/patients/']:>16.1f}")
+    for path in ("/api/health", "/api/patients/"):
+        saved = results["http"][path] - results["asgi"][path]
+        print(f"{path}: {saved:.1f} µs économisées par requête (http -> asgi)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
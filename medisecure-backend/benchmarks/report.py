@@ -0,0 +1,143 @@
+# medisecure-backend/benchmarks/report.py
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+import json
+import os
+import platform
+import socket
+import subprocess
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """
+    Calcule un percentile par interpolation linéaire.
+    
+    Args:
+        sorted_values: Les valeurs triées par ordre croissant
+        q: Le percentile recherché, entre 0 et 100
+    
+    Returns:
+        float: La valeur du percentile (0.0 si la liste est vide)
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+class EndpointStats:
+    """Mesures collectées pour un endpoint (identifié par sa route, pas par son URL)"""
+    
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.status_codes: Dict[str, int] = {}
+        self.errors = 0
+    
+    def record(self, latency: float, status_code: Optional[int]) -> None:
+        """
+        Enregistre une requête.
+        
+        Args:
+            latency: La durée de la requête en secondes
+            status_code: Le code HTTP, ou None si la requête n'a pas abouti
+        """
+        self.latencies.append(latency)
+        key = str(status_code) if status_code is not None else "error"
+        self.status_codes[key] = self.status_codes.get(key, 0) + 1
+        if status_code is None or status_code >= 500:
+            self.errors += 1
+    
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        """
+        Résume les mesures de l'endpoint.
+        
+        Args:
+            elapsed: La durée de la mesure en secondes
+        
+        Returns:
+            Dict[str, Any]: Nombre de requêtes, débit, erreurs et latences en millisecondes
+        """
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "rps": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            "errors": self.errors,
+            "status_codes": dict(sorted(self.status_codes.items())),
+            "latency_ms": {
+                "p50": round(percentile(latencies, 50) * 1000, 2),
+                "p95": round(percentile(latencies, 95) * 1000, 2),
+                "p99": round(percentile(latencies, 99) * 1000, 2),
+                "mean": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+                "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            },
+        }
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def environment_metadata() -> Dict[str, Any]:
+    """
+    Décrit la machine et la révision mesurées, pour comparer des branches sur le même poste.
+    
+    Returns:
+        Dict[str, Any]: Branche, commit, hôte, Python et nombre de CPU
+    """
+    return {
+        "git_branch": _git("rev-parse", "--abbrev-ref", "HEAD"),
+        "git_commit": _git("rev-parse", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "host": socket.gethostname(),
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count(),
+    }
+
+def build_report(
+    stats: Dict[str, EndpointStats],
+    elapsed: float,
+    parameters: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Construit le rapport JSON d'une exécution.
+    
+    Args:
+        stats: Les mesures par endpoint
+        elapsed: La durée de la mesure en secondes
+        parameters: Les paramètres de l'exécution (scénario, utilisateurs, durée...)
+    
+    Returns:
+        Dict[str, Any]: Le rapport
+    """
+    total = EndpointStats()
+    for endpoint_stats in stats.values():
+        total.latencies.extend(endpoint_stats.latencies)
+        total.errors += endpoint_stats.errors
+        for code, count in endpoint_stats.status_codes.items():
+            total.status_codes[code] = total.status_codes.get(code, 0) + count
+    
+    return {
+        "generated_at": datetime.utcnow().isoformat(timespec="seconds") + "Z",
+        "environment": environment_metadata(),
+        "parameters": parameters,
+        "elapsed_s": round(elapsed, 3),
+        "total": total.summary(elapsed),
+        "endpoints": {name: stats[name].summary(elapsed) for name in sorted(stats)},
+    }
+
+def write_report(report: Dict[str, Any], path: str) -> None:
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as report_file:
+        json.dump(report, report_file, indent=2, ensure_ascii=False)
+        report_file.write("\n")
+
+def load_report(path: str) -> Dict[str, Any]:
+    with open(path, encoding="utf-8") as report_file:
+        return json.load(report_file)
@@ -0,0 +1,198 @@
+# medisecure-backend/benchmarks/scenarios.py
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+from datetime import date, datetime, timedelta
+import asyncio
+
+from benchmarks.report import EndpointStats
+
+API_PREFIX = "/api"
+
+# Motif des rendez-vous créés par le benchmark, supprimés avant chaque exécution sur base dédiée
+BOOKING_REASON = "Benchmark"
+
+class BenchmarkData:
+    """Identifiants réels découverts via l'API avant la mesure"""
+    
+    def __init__(
+        self,
+        email: str,
+        password: str,
+        patients: List[Dict[str, Any]],
+        doctor_ids: List[str],
+        months: List[Tuple[int, int]]
+    ):
+        """
+        Initialise les données de référence.
+        
+        Args:
+            email: L'email du compte utilisé par les utilisateurs virtuels
+            password: Le mot de passe de ce compte
+            patients: Des patients existants (id, last_name, email)
+            doctor_ids: Des identifiants de médecins ayant des rendez-vous
+            months: Les mois (année, mois) contenant des rendez-vous
+        """
+        self.email = email
+        self.password = password
+        self.patients = patients
+        self.doctor_ids = doctor_ids
+        self.months = months
+
+class VirtualUser:
+    """
+    Utilisateur virtuel : exécute les actions d'un scénario et chronomètre ses requêtes.
+    
+    Les requêtes sont regroupées par endpoint (route avec ses paramètres de chemin),
+    afin que `GET /api/patients/{patient_id}` soit mesuré comme un seul endpoint.
+    """
+    
+    def __init__(self, client, data: BenchmarkData, token: str, rng, stats: Dict[str, EndpointStats], clock):
+        self.client = client
+        self.data = data
+        self.token = token
+        self.rng = rng
+        self.stats = stats
+        self.clock = clock
+    
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+    
+    async def request(self, method: str, endpoint: str, url: str, authenticated: bool = True, **kwargs):
+        """
+        Envoie une requête et enregistre sa latence pour l'endpoint donné.
+        
+        Args:
+            method: La méthode HTTP
+            endpoint: La route mesurée (ex: "/patients/{patient_id}")
+            url: L'URL effective, relative au préfixe de l'API
+            authenticated: Si True, le token de l'utilisateur est envoyé
+        
+        Returns:
+            La réponse, ou None si la requête n'a pas abouti
+        """
+        name = f"{method} {API_PREFIX}{endpoint}"
+        headers = self.headers if authenticated else {}
+        started = self.clock()
+        try:
+            response = await self.client.request(method, f"{API_PREFIX}{url}", headers=headers, **kwargs)
+        except Exception:
+            self.stats.setdefault(name, EndpointStats()).record(self.clock() - started, None)
+            return None
+        self.stats.setdefault(name, EndpointStats()).record(self.clock() - started, response.status_code)
+        retry_after = response.headers.get("retry-after")
+        if response.status_code == 503 and retry_after and retry_after.isdigit():
+            # Comme un client correct : pas de nouvel essai avant le délai demandé par l'API délestée
+            await asyncio.sleep(int(retry_after))
+        return response
+    
+    def random_patient(self) -> Dict[str, Any]:
+        return self.rng.choice(self.data.patients)
+
+async def login(user: VirtualUser) -> None:
+    await user.request(
+        "POST", "/auth/login", "/auth/login", authenticated=False,
+        data={"username": user.data.email, "password": user.data.password}
+    )
+
+async def poll_calendar(user: VirtualUser) -> None:
+    year, month = user.rng.choice(user.data.months)
+    await user.request("GET", "/appointments/calendar/", f"/appointments/calendar/?year={year}&month={month}")
+
+async def search_patients_by_name(user: VirtualUser) -> None:
+    await user.request("POST", "/patients/search", "/patients/search", json={
+        "name": user.random_patient()["last_name"], "limit": 20
+    })
+
+async def search_patients_by_email(user: VirtualUser) -> None:
+    email = user.random_patient().get("email")
+    if email:
+        await user.request("POST", "/patients/search", "/patients/search", json={"email": email, "limit": 20})
+
+async def book_appointment(user: VirtualUser) -> None:
+    # Créneau d'une demi-heure en journée dans les 90 prochains jours ; les conflits répondent 400
+    day = date.today() + timedelta(days=user.rng.randint(1, 90))
+    start_time = datetime.combine(day, datetime.min.time()) + timedelta(minutes=30 * user.rng.randint(16, 35))
+    await user.request("POST", "/appointments/", "/appointments/", json={
+        "patient_id": user.random_patient()["id"],
+        "doctor_id": user.rng.choice(user.data.doctor_ids),
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(minutes=30)).isoformat(),
+        "reason": BOOKING_REASON
+    })
+
+async def get_patient(user: VirtualUser) -> None:
+    patient_id = user.random_patient()["id"]
+    await user.request("GET", "/patients/{patient_id}", f"/patients/{patient_id}")
+
+async def list_patients(user: VirtualUser) -> None:
+    await user.request("GET", "/patients/", f"/patients/?skip={user.rng.randint(0, 10) * 20}&limit=20")
+
+async def get_patient_appointments(user: VirtualUser) -> None:
+    patient_id = user.random_patient()["id"]
+    await user.request("GET", "/appointments/patient/{patient_id}", f"/appointments/patient/{patient_id}")
+
+Action = Callable[[VirtualUser], Awaitable[None]]
+
+class Scenario:
+    """Mélange pondéré d'actions exécutées en boucle par chaque utilisateur virtuel"""
+    
+    def __init__(self, description: str, actions: List[Tuple[int, Action]], think_time: float = 0.0, ramp_up: float = 0.0):
+        """
+        Initialise le scénario.
+        
+        Args:
+            description: La description du trafic simulé
+            actions: Les actions et leur poids relatif
+            think_time: La pause par défaut entre deux actions d'un utilisateur (secondes)
+            ramp_up: La durée par défaut de démarrage progressif des utilisateurs (secondes)
+        """
+        self.description = description
+        self.actions = [action for _, action in actions]
+        self.weights = [weight for weight, _ in actions]
+        self.think_time = think_time
+        self.ramp_up = ramp_up
+    
+    def pick(self, rng) -> Action:
+        return rng.choices(self.actions, weights=self.weights)[0]
+
+SCENARIOS: Dict[str, Scenario] = {
+    "login_spike": Scenario(
+        "Pic de connexions : tous les utilisateurs se connectent en même temps (début de journée)",
+        [(1, login)]
+    ),
+    "calendar_polling": Scenario(
+        "Rafraîchissement périodique du calendrier mensuel par les secrétariats",
+        [(1, poll_calendar)],
+        think_time=1.0,
+        ramp_up=5.0
+    ),
+    "patient_search": Scenario(
+        "Recherche de patients à l'accueil, par nom ou par email",
+        [(3, search_patients_by_name), (1, search_patients_by_email)],
+        ramp_up=5.0
+    ),
+    "booking_burst": Scenario(
+        "Rafale de prises de rendez-vous (ouverture des agendas)",
+        [(1, book_appointment)]
+    ),
+    "patient_hot_paths": Scenario(
+        "Consultation des dossiers : fiche patient, liste et rendez-vous du patient",
+        [(4, get_patient), (2, list_patients), (3, get_patient_appointments)],
+        ramp_up=5.0
+    ),
+    "mixed": Scenario(
+        "Journée type : consultation majoritaire, recherches, calendrier, réservations et connexions",
+        [
+            (30, get_patient),
+            (10, list_patients),
+            (20, get_patient_appointments),
+            (15, search_patients_by_name),
+            (5, search_patients_by_email),
+            (10, poll_calendar),
+            (7, book_appointment),
+            (3, login),
+        ],
+        think_time=0.1,
+        ramp_up=5.0
+    ),
+}
@@ -0,0 +1,165 @@
+# medisecure-backend/benchmarks/server.py
+from typing import Dict, Optional
+import os
+import subprocess
+import sys
+import time
+import uuid
+import logging
+
+import bcrypt
+import httpx
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from shared.infrastructure.database.seeding import DatasetSeeder, DatasetSpec
+from benchmarks.scenarios import BOOKING_REASON
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def to_asyncpg_url(database_url: str) -> str:
+    if "postgresql://" in database_url and "asyncpg" not in database_url:
+        return database_url.replace("postgresql://", "postgresql+asyncpg://")
+    return database_url
+
+async def prepare_database(
+    database_url: str,
+    email: str,
+    password: str,
+    patients: int,
+    appointments: int,
+    doctors: int,
+    reseed: bool = False
+) -> None:
+    """
+    Génère le jeu de données synthétique et crée le compte utilisé par le benchmark.
+    
+    La base est entièrement réécrite si elle ne contient pas déjà le volume demandé.
+    Les rendez-vous pris par les exécutions précédentes sont supprimés : à graine égale,
+    le scénario de réservation rejoue les mêmes créneaux sans rencontrer de conflits.
+    
+    Args:
+        database_url: L'URL de la base dédiée au benchmark
+        email: L'email du compte administrateur du benchmark
+        password: Son mot de passe
+        patients: Le nombre de patients
+        appointments: Le nombre de rendez-vous
+        doctors: Le nombre de médecins
+        reseed: Si True, les données sont régénérées même si le volume correspond
+    """
+    database_url = to_asyncpg_url(database_url)
+    seeder = DatasetSeeder(database_url, DatasetSpec(patients=patients, appointments=appointments, doctors=doctors))
+    if await seeder.load(force=reseed):
+        logger.info("Jeu de données généré: %s", seeder.scale)
+    
+    engine = create_async_engine(database_url)
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("DELETE FROM appointments WHERE reason = :reason"), {"reason": BOOKING_REASON})
+            await conn.execute(
+                text(
+                    "INSERT INTO users (id, email, hashed_password, first_name, last_name, role, is_active, created_at, updated_at) "
+                    "VALUES (:id, :email, :hashed_password, 'Bench', 'Admin', 'ADMIN', TRUE, now(), now()) "
+                    "ON CONFLICT (email) DO NOTHING"
+                ),
+                {
+                    "id": uuid.uuid4(),
+                    "email": email,
+                    "hashed_password": bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8"),
+                }
+            )
+    finally:
+        await engine.dispose()
+
+class LocalServer:
+    """
+    Lance l'API dans un sous-processus, le temps d'un benchmark : avec uvicorn, ou avec
+    gunicorn et la configuration de production (gunicorn.conf.py).
+    
+    S'utilise comme gestionnaire de contexte ; l'URL de base est disponible via `base_url`.
+    """
+    
+    def __init__(
+        self,
+        database_url: str,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int = 1,
+        server: str = "uvicorn",
+        env: Optional[Dict[str, str]] = None,
+        startup_timeout: float = 30.0
+    ):
+        """
+        Initialise le serveur.
+        
+        Args:
+            database_url: L'URL de la base utilisée par l'API
+            host: L'adresse d'écoute
+            port: Le port d'écoute
+            workers: Le nombre de processus de l'API
+            server: "uvicorn" ou "gunicorn" (mode production)
+            env: Des variables d'environnement supplémentaires pour l'API
+            startup_timeout: Le délai maximal d'attente de /api/health (secondes)
+        """
+        self.database_url = database_url
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.server = server
+        self.env = env or {}
+        self.startup_timeout = startup_timeout
+        self.process: Optional[subprocess.Popen] = None
+    
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+    
+    def __enter__(self) -> "LocalServer":
+        env = dict(os.environ)
+        env.update({
+            "DATABASE_URL": self.database_url,
+            "ENVIRONMENT": "benchmark",
+            "PYTHONPATH": BACKEND_DIR,
+            # Le même secret doit signer (login) et vérifier (extract_token_payload) les tokens
+            "JWT_SECRET_KEY": env.get("JWT_SECRET_KEY", "benchmark-secret-key"),
+        })
+        if self.server == "gunicorn":
+            command = [sys.executable, "-m", "gunicorn", "api.main:app", "-c", "gunicorn.conf.py"]
+            env.update({"HOST": self.host, "PORT": str(self.port), "WEB_CONCURRENCY": str(self.workers)})
+        else:
+            command = [
+                sys.executable, "-m", "uvicorn", "api.main:app",
+                "--host", self.host, "--port", str(self.port), "--workers", str(self.workers)
+            ]
+        env.update(self.env)
+        logger.info("Démarrage de l'API: %s", ' '.join(command))
+        self.process = subprocess.Popen(
+            command, cwd=BACKEND_DIR, env=env,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+        )
+        
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise RuntimeError(f"L'API s'est arrêtée au démarrage (code {self.process.returncode})")
+            try:
+                if httpx.get(f"{self.base_url}/api/health", timeout=1.0).status_code == 200:
+                    return self
+            except httpx.HTTPError:
+                pass
+            time.sleep(0.2)
+        
+        self.__exit__(None, None, None)
+        raise RuntimeError(f"L'API n'a pas répondu sur {self.base_url} en {self.startup_timeout}s")
+    
+    def __exit__(self, *exc_info):
+        if self.process and self.process.poll() is None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        self.process = None
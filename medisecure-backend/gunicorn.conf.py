@@ -0,0 +1,59 @@
+# medisecure-backend/gunicorn.conf.py
+"""
+Configuration gunicorn du mode production : `gunicorn api.main:app -c gunicorn.conf.py`
+(lancé par start.sh lorsque APP_MODE=production).
+
+Toutes les valeurs viennent des paramètres de l'application (shared.config.Settings),
+réglables par variables d'environnement.
+"""
+import multiprocessing
+import os
+import sys
+
+from dotenv import load_dotenv
+
+# Ce fichier est chargé avant que gunicorn n'ajoute le répertoire de l'application au sys.path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from shared.config import get_settings
+
+load_dotenv()
+settings = get_settings()
+
+# Adresse d'écoute
+bind = f"{settings.host}:{settings.port}"
+
+# File d'attente des connexions TCP pas encore acceptées (bornée par net.core.somaxconn)
+backlog = settings.backlog
+
+# Un worker asynchrone par cœur : chacun dispose de sa boucle et de son pool de connexions,
+# la taille totale des pools (workers x (DB_POOL_SIZE + DB_MAX_OVERFLOW)) doit rester sous max_connections
+workers = settings.web_concurrency or multiprocessing.cpu_count()
+worker_class = "api.workers.MediSecureUvicornWorker"
+
+# Keep-alive supérieur au délai d'inactivité du proxy en amont, pour que ce soit lui qui ferme
+keepalive = settings.keepalive
+
+# Un worker qui ne répond plus au maître pendant `timeout` secondes est redémarré
+timeout = settings.worker_timeout
+
+# SIGTERM : les workers cessent d'accepter, terminent les requêtes en cours puis s'arrêtent ;
+# au-delà de ce délai, ils sont tués
+graceful_timeout = settings.graceful_timeout
+
+# Recyclage périodique des workers (0 : désactivé), décalé pour ne pas les redémarrer ensemble
+max_requests = settings.max_requests
+max_requests_jitter = settings.max_requests_jitter
+
+# Préchargement de l'application dans le maître (démarrage plus rapide, mémoire partagée)
+preload_app = settings.gunicorn_preload
+
+# Les logs de l'application sont configurés par api.main ; gunicorn ne journalise que ses erreurs
+accesslog = None
+errorlog = "-"
+loglevel = settings.log_level.lower()
+
+def post_fork(server, worker):
+    from api.workers import reinitialize_after_fork
+    
+    reinitialize_after_fork()
@@ -3,6 +3,7 @@
 
 -- Suppression des types et tables existants pour une réinitialisation propre
 DROP TABLE IF EXISTS appointments CASCADE;
+DROP SCHEMA IF EXISTS archive CASCADE;
 DROP TABLE IF EXISTS patients CASCADE;
 DROP TABLE IF EXISTS users CASCADE;
 DROP TYPE IF EXISTS appointmentstatus CASCADE;
@@ -51,12 +52,12 @@ CREATE TABLE patients (
   notes TEXT,
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  is_active BOOLEAN DEFAULT TRUE
+  is_active BOOLEAN NOT NULL DEFAULT TRUE
 );
 
--- Création de la table appointments
+-- Création de la table appointments, partitionnée par mois sur start_time
 CREATE TABLE appointments (
-  id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
+  id UUID NOT NULL DEFAULT gen_random_uuid(),
   patient_id UUID NOT NULL REFERENCES patients(id) ON DELETE CASCADE,
   doctor_id UUID NOT NULL REFERENCES users(id) ON DELETE CASCADE,
   start_time TIMESTAMP NOT NULL,
@@ -66,18 +67,51 @@ CREATE TABLE appointments (
   notes TEXT,
   created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
   updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-  is_active BOOLEAN DEFAULT TRUE,
-  CONSTRAINT check_appointment_times CHECK (end_time > start_time)
-);
+  is_active BOOLEAN NOT NULL DEFAULT TRUE,
+  CONSTRAINT check_appointment_times CHECK (end_time > start_time),
+  CONSTRAINT check_appointment_duration CHECK (end_time - start_time <= interval '24 hours'),
+  PRIMARY KEY (id, start_time)
+) PARTITION BY RANGE (start_time);
+
+-- Partition par défaut et partitions mensuelles (données de test comprises, puis 3 mois à venir)
+CREATE TABLE appointments_default PARTITION OF appointments DEFAULT;
+
+DO $$
+DECLARE
+  month_start DATE := DATE '2025-01-01';
+  last_month DATE := date_trunc('month', CURRENT_DATE + interval '3 months')::date;
+  partition_name TEXT;
+BEGIN
+  WHILE month_start <= last_month LOOP
+    partition_name := 'appointments_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+    -- Une partition détachée (manage_partitions.py archive --detach-only) reste dans le schéma public
+    EXECUTE format('DROP TABLE IF EXISTS %I', partition_name);
+    EXECUTE format(
+      'CREATE TABLE %I PARTITION OF appointments FOR VALUES FROM (%L) TO (%L)',
+      partition_name,
+      month_start,
+      (month_start + interval '1 month')::date
+    );
+    month_start := (month_start + interval '1 month')::date;
+  END LOOP;
+END $$;
+
+-- Schéma recevant les partitions archivées
+CREATE SCHEMA archive;
 
 -- Création des index pour améliorer les performances
 CREATE INDEX idx_users_email ON users(email);
-CREATE INDEX idx_patients_email ON patients(email);
 CREATE INDEX idx_patients_user_id ON patients(user_id);
-CREATE INDEX idx_appointments_patient_id ON appointments(patient_id);
-CREATE INDEX idx_appointments_doctor_id ON appointments(doctor_id);
-CREATE INDEX idx_appointments_start_time ON appointments(start_time);
-CREATE INDEX idx_appointments_status ON appointments(status);
+
+-- Index partiels : les lignes supprimées logiquement (is_active = FALSE) n'y figurent pas
+CREATE INDEX idx_patients_email_active ON patients(email) WHERE is_active;
+
+-- Index composites des rendez-vous : filtre d'égalité puis start_time (ORDER BY sans tri),
+-- INCLUDE pour les contrôles de chevauchement en index-only scan
+CREATE INDEX idx_appointments_doctor_start ON appointments(doctor_id, start_time) INCLUDE (end_time, status) WHERE is_active;
+CREATE INDEX idx_appointments_patient_start ON appointments(patient_id, start_time) INCLUDE (end_time, status) WHERE is_active;
+CREATE INDEX idx_appointments_status_start ON appointments(status, start_time) WHERE is_active;
+CREATE INDEX idx_appointments_start_active ON appointments(start_time) INCLUDE (end_time) WHERE is_active;
 
 -- Création des triggers pour mettre à jour updated_at
 CREATE OR REPLACE FUNCTION update_updated_at()
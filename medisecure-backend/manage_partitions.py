@@ -0,0 +1,55 @@
+import argparse
+import asyncio
+from dotenv import load_dotenv
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from shared.config import get_settings
+from shared.infrastructure.database.connection import engine_options
+from shared.infrastructure.database.partition_manager import PartitionManager
+
+# Charger les variables d'environnement
+load_dotenv()
+
+async def run(args):
+    # Configuration de la base de données (DATABASE_URL validée, mode PgBouncer compris)
+    settings = get_settings()
+    engine = create_async_engine(settings.database_url, **engine_options(settings))
+    session_factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    manager = PartitionManager(session_factory, table_name=args.table, archive_schema=args.archive_schema)
+    
+    try:
+        if args.command == "ensure":
+            created = await manager.ensure_future_partitions(months_ahead=args.months_ahead)
+            print(f'Partitions créées: {", ".join(created) if created else "aucune"}')
+        elif args.command == "archive":
+            archived = await manager.archive_partitions(
+                retention_months=args.retention_months,
+                detach_only=args.detach_only
+            )
+            print(f'Partitions archivées: {", ".join(archived) if archived else "aucune"}')
+        else:
+            for month in await manager.list_partitions():
+                print(manager.partition_name(month))
+    finally:
+        await engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintenance des partitions mensuelles des rendez-vous")
+    parser.add_argument("--table", default="appointments", help="Table partitionnée")
+    parser.add_argument("--archive-schema", default="archive", help="Schéma recevant les partitions archivées")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    ensure_parser = subparsers.add_parser("ensure", help="Créer les partitions du mois courant et des mois à venir")
+    ensure_parser.add_argument("--months-ahead", type=int, default=3, help="Nombre de mois à préparer")
+    
+    archive_parser = subparsers.add_parser("archive", help="Détacher les partitions hors de la période de rétention")
+    archive_parser.add_argument("--retention-months", type=int, default=24, help="Nombre de mois conservés")
+    archive_parser.add_argument("--detach-only", action="store_true", help="Détacher sans déplacer dans le schéma d'archive")
+    
+    subparsers.add_parser("list", help="Lister les partitions attachées")
+    
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == '__main__':
+    main()
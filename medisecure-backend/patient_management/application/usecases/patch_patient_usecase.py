@@ -0,0 +1,186 @@
+from typing import Dict, Any, Tuple
+from uuid import UUID
+from datetime import datetime
+import logging
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from patient_management.domain.exceptions.patient_exceptions import (
+    PatientNotFoundException,
+    MissingRequiredFieldException
+)
+from patient_management.application.dtos.patient_dtos import PatientUpdateDTO, PatientResponseDTO
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Documents JSONB dont les sous-clés sont fusionnées plutôt que réécrites
+MEDICAL_DOCUMENT_FIELDS = ("allergies", "chronic_diseases", "current_medications")
+
+# Champs qui ne peuvent pas être remis à null par un PATCH
+NON_NULLABLE_FIELDS = (
+    "first_name",
+    "last_name",
+    "date_of_birth",
+    "gender",
+    "has_consent",
+    "gdpr_consent",
+    "is_active"
+)
+
+class PatchPatientUseCase:
+    """
+    Cas d'utilisation pour la mise à jour partielle d'un patient.
+    Calcule le différentiel entre les champs envoyés et l'état actuel du patient
+    afin de n'écrire en base que les colonnes réellement modifiées.
+    """
+    
+    def __init__(
+        self,
+        patient_repository: PatientRepositoryProtocol,
+        patient_service: PatientService
+    ):
+        """
+        Initialise le cas d'utilisation avec les dépendances nécessaires.
+        
+        Args:
+            patient_repository: Le repository des patients
+            patient_service: Le service du domaine pour les patients
+        """
+        self.patient_repository = patient_repository
+        self.patient_service = patient_service
+    
+    async def execute(self, patient_id: UUID, data: PatientUpdateDTO) -> PatientResponseDTO:
+        """
+        Exécute le cas d'utilisation.
+        
+        Args:
+            patient_id: L'ID du patient à mettre à jour
+            data: Les champs envoyés par le client (seuls les champs renseignés sont pris en compte)
+        
+        Returns:
+            PatientResponseDTO: Le patient mis à jour
+        
+        Raises:
+            PatientNotFoundException: Si le patient n'est pas trouvé
+            MissingRequiredFieldException: Si un champ obligatoire est remis à null
+        """
+        # Récupérer le patient existant
+        patient = await self.patient_repository.get_by_id(patient_id)
+        
+        if not patient:
+            raise PatientNotFoundException(patient_id)
+        
+        changes, medical_changes = self.compute_changes(patient, data)
+        
+        # Rien à écrire : éviter un aller-retour inutile vers la base
+        if not changes and not medical_changes:
+            logger.debug("Aucune modification pour le patient %s", patient_id)
+            return self._to_response(patient)
+        
+        updated_patient = await self.patient_repository.patch(patient_id, changes, medical_changes)
+        
+        if not updated_patient:
+            raise PatientNotFoundException(patient_id)
+        
+        return self._to_response(updated_patient)
+    
+    def compute_changes(
+        self,
+        patient: Patient,
+        data: PatientUpdateDTO
+    ) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+        """
+        Calcule les colonnes modifiées par rapport à l'état actuel du patient.
+        
+        Args:
+            patient: Le patient actuel
+            data: Les champs envoyés par le client
+        
+        Returns:
+            Tuple: Les colonnes modifiées et les sous-clés modifiées des documents médicaux
+        
+        Raises:
+            MissingRequiredFieldException: Si un champ obligatoire est remis à null
+        """
+        submitted = data.dict(exclude_unset=True)
+        changes: Dict[str, Any] = {}
+        medical_changes: Dict[str, Dict[str, Any]] = {}
+        
+        for field_name, value in submitted.items():
+            if value is None and field_name in NON_NULLABLE_FIELDS:
+                raise MissingRequiredFieldException(field_name)
+            
+            if field_name in MEDICAL_DOCUMENT_FIELDS:
+                current_document = getattr(patient, field_name) or {}
+                
+                # Un document à null est vidé entièrement
+                if value is None:
+                    if current_document:
+                        changes[field_name] = {}
+                    continue
+                
+                dirty_keys = {
+                    key: sub_value
+                    for key, sub_value in value.items()
+                    if key not in current_document or current_document[key] != sub_value
+                }
+                if dirty_keys:
+                    medical_changes[field_name] = dirty_keys
+                continue
+            
+            if getattr(patient, field_name) != value:
+                changes[field_name] = value
+        
+        if "date_of_birth" in changes:
+            # Valider que la date de naissance n'est pas dans le futur
+            self.patient_service.validate_patient_data(
+                changes.get("first_name", patient.first_name),
+                changes.get("last_name", patient.last_name),
+                changes["date_of_birth"],
+                changes.get("gender", patient.gender)
+            )
+        
+        # Même règle que Patient.update_consent : dater le consentement donné
+        if changes.get("has_consent") is True:
+            changes["consent_date"] = datetime.utcnow()
+        
+        return changes, medical_changes
+    
+    def _to_response(self, patient: Patient) -> PatientResponseDTO:
+        """
+        Convertit l'entité en DTO de réponse.
+        
+        Args:
+            patient: Le patient à convertir
+        
+        Returns:
+            PatientResponseDTO: Le DTO de réponse
+        """
+        return PatientResponseDTO(
+            id=patient.id,
+            first_name=patient.first_name,
+            last_name=patient.last_name,
+            date_of_birth=patient.date_of_birth,
+            gender=patient.gender,
+            address=patient.address,
+            city=patient.city,
+            postal_code=patient.postal_code,
+            country=patient.country,
+            phone_number=patient.phone_number,
+            email=patient.email,
+            blood_type=patient.blood_type,
+            allergies=patient.allergies,
+            chronic_diseases=patient.chronic_diseases,
+            current_medications=patient.current_medications,
+            has_consent=patient.has_consent,
+            gdpr_consent=patient.gdpr_consent,
+            consent_date=patient.consent_date,
+            insurance_provider=patient.insurance_provider,
+            insurance_id=patient.insurance_id,
+            notes=patient.notes,
+            created_at=patient.created_at,
+            updated_at=patient.updated_at,
+            is_active=patient.is_active
+        )
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List 
+from typing import Optional, List, Dict, Any
 from uuid import UUID
 from datetime import date
 
@@ -63,6 +63,28 @@ class PatientRepositoryProtocol(ABC):
         """
         pass
     
+    @abstractmethod
+    async def patch(
+        self,
+        patient_id: UUID,
+        changes: Dict[str, Any],
+        medical_changes: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Optional[Patient]:
+        """
+        Met à jour partiellement un patient en n'écrivant que les champs modifiés.
+        
+        Args:
+            patient_id: L'ID du patient à mettre à jour
+            changes: Les colonnes modifiées et leurs nouvelles valeurs
+            medical_changes: Les sous-clés modifiées des documents médicaux
+                (allergies, chronic_diseases, current_medications), fusionnées
+                dans le document existant
+            
+        Returns:
+            Optional[Patient]: Le patient mis à jour ou None si non trouvé
+        """
+        pass
+    
     @abstractmethod
     async def delete(self, patient_id: UUID) -> bool:
         """
@@ -6,7 +6,10 @@ from datetime import date
 import logging
 
 from shared.services.authenticator.extract_token import extract_token_payload
-from shared.container.container import Container
+from shared.container.container import Container, get_container
+from shared.config import get_settings
+from shared.infrastructure.database.deadline import request_timeout
+from shared.infrastructure.database.unit_of_work import UnitOfWorkRoute
 from patient_management.application.dtos.patient_dtos import (
     PatientCreateDTO,
     PatientUpdateDTO,
@@ -17,6 +20,7 @@ from patient_management.application.dtos.patient_dtos import (
 from patient_management.application.usecases.create_patient_folder_usercase import CreatePatientFolderUseCase
 from patient_management.application.usecases.update_patient_usecase import UpdatePatientUseCase
 from patient_management.application.usecases.get_patient_usecase import GetPatientUseCase
+from patient_management.application.usecases.patch_patient_usecase import PatchPatientUseCase
 from patient_management.domain.exceptions.patient_exceptions import (
     PatientNotFoundException,
     PatientAlreadyExistsException,
@@ -30,7 +34,7 @@ logger = logging.getLogger(__name__)
 
 # Créer un router pour les endpoints des patients
 # IMPORTANT: Ne pas inclure /api dans le préfixe, il sera ajouté dans main.py
-router = APIRouter(prefix="/patients", tags=["patients"])
+router = APIRouter(prefix="/patients", tags=["patients"], route_class=UnitOfWorkRoute)
 
 def check_role_permission(role: str, allowed_roles: list) -> bool:
     """
@@ -52,13 +56,6 @@ def check_role_permission(role: str, allowed_roles: list) -> bool:
     
     return role_lower in allowed_roles_lower
 
-
-def get_container():
-    """
-    Fournit le container d'injection de dépendances.
-    """
-    return Container()
-
 @router.post("/", response_model=PatientResponseDTO, status_code=status.HTTP_201_CREATED)
 async def create_patient(
     data: PatientCreateDTO,
@@ -91,7 +88,7 @@ async def create_patient(
             )
         
         # Log des données reçues
-        logger.info(f"Création d'un nouveau patient avec les données: {data}")
+        logger.info("Création d'un nouveau patient")
         
         # Créer le cas d'utilisation avec les dépendances nécessaires
         use_case = CreatePatientFolderUseCase(
@@ -103,42 +100,42 @@ async def create_patient(
         # Exécuter le cas d'utilisation
         try:
             result = await use_case.execute(data)
-            logger.info(f"Patient créé avec succès: {result.id}")
+            logger.info("Patient créé avec succès: %s", result.id)
             return result
         except Exception as e:
-            logger.error(f"Erreur pendant l'exécution du cas d'utilisation: {str(e)}")
+            logger.error("Erreur pendant l'exécution du cas d'utilisation: %s", e)
             raise
     
     except PatientAlreadyExistsException as e:
-        logger.error(f"Patient déjà existant: {str(e)}")
+        logger.error("Patient déjà existant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail=str(e)
         )
     
     except MissingRequiredFieldException as e:
-        logger.error(f"Champ requis manquant: {str(e)}")
+        logger.error("Champ requis manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except MissingGuardianConsentException as e:
-        logger.error(f"Consentement du tuteur manquant: {str(e)}")
+        logger.error("Consentement du tuteur manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la création du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la création du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -166,7 +163,7 @@ async def get_patient(
     """
     try:
         # Récupérer l'ID de l'utilisateur à partir du token
-        user_id_str = token_payload.get("sub")
+        user_id_str = token_payload.get("user_id")
         if not user_id_str:
             raise HTTPException(status_code=401, detail="Token invalide - ID utilisateur manquant")
         try:
@@ -186,21 +183,21 @@ async def get_patient(
         return result
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except MissingPatientConsentException as e:
-        logger.error(f"Consentement du patient manquant: {str(e)}")
+        logger.error("Consentement du patient manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la récupération du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la récupération du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -240,7 +237,7 @@ async def update_patient(
             )
         
         # Log des données reçues
-        logger.info(f"Mise à jour du patient {patient_id} avec les données: {data}")
+        logger.info("Mise à jour du patient %s", patient_id)
         
         # Créer le cas d'utilisation avec les dépendances nécessaires
         use_case = UpdatePatientUseCase(
@@ -251,32 +248,112 @@ async def update_patient(
         # Exécuter le cas d'utilisation
         result = await use_case.execute(patient_id, data or PatientUpdateDTO())
         
-        logger.info(f"Patient {patient_id} mis à jour avec succès")
+        logger.info("Patient %s mis à jour avec succès", patient_id)
+        return result
+    
+    except PatientNotFoundException as e:
+        logger.error("Patient non trouvé: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+    
+    except MissingRequiredFieldException as e:
+        logger.error("Champ requis manquant: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except ValueError as e:
+        logger.error("Erreur de validation: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    except Exception as e:
+        logger.exception("Erreur inattendue lors de la mise à jour du patient: %s", e)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An unexpected error occurred: {str(e)}"
+        )
+
+@router.patch("/{patient_id}", response_model=PatientResponseDTO)
+async def patch_patient(
+    patient_id: UUID = Path(..., description="The ID of the patient to update"),
+    data: PatientUpdateDTO = None,
+    token_payload: Dict[str, Any] = Depends(extract_token_payload),
+    container: Container = Depends(get_container)
+):
+    """
+    Met à jour partiellement un patient existant.
+    Seuls les champs envoyés et réellement modifiés sont écrits en base.
+    
+    Args:
+        patient_id: L'ID du patient à mettre à jour
+        data: Les champs à modifier
+        token_payload: Les informations du token JWT
+        container: Le container d'injection de dépendances
+    
+    Returns:
+        PatientResponseDTO: Le patient mis à jour
+    
+    Raises:
+        HTTPException: En cas d'erreur
+    """
+    try:
+        # Vérifier si l'utilisateur a le droit de mettre à jour un patient
+        user_role = token_payload.get("role", "").lower()
+        allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
+        
+        if not check_role_permission(user_role, allowed_roles):
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="You don't have permission to update patient folders"
+            )
+        
+        data = data or PatientUpdateDTO()
+        logger.info("Mise à jour partielle du patient %s, champs: %s", patient_id, sorted(data.__fields_set__))
+        
+        # Créer le cas d'utilisation avec les dépendances nécessaires
+        use_case = PatchPatientUseCase(
+            patient_repository=container.patient_repository(),
+            patient_service=container.patient_service()
+        )
+        
+        # Exécuter le cas d'utilisation
+        result = await use_case.execute(patient_id, data)
+        
+        logger.info("Patient %s mis à jour partiellement avec succès", patient_id)
         return result
     
+    except HTTPException:
+        raise
+    
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except MissingRequiredFieldException as e:
-        logger.error(f"Champ requis manquant: {str(e)}")
+        logger.error("Champ requis manquant: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except ValueError as e:
-        logger.error(f"Erreur de validation: {str(e)}")
+        logger.error("Erreur de validation: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la mise à jour du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la mise à jour partielle du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -312,27 +389,31 @@ async def delete_patient(
                 detail="Only administrators can delete patient folders"
             )
         
-        logger.info(f"Suppression du patient {patient_id}")
+        logger.info("Suppression du patient %s", patient_id)
         
-        # Exécuter la suppression directement (pas besoin d'un cas d'utilisation dédié)
+        # Exécuter la suppression directement (pas besoin d'un cas d'utilisation dédié) ;
+        # les rendez-vous du patient sont supprimés dans la même unité de travail, annulée
+        # avec eux si le patient n'existe pas
         patient_repository = container.patient_repository()
+        appointment_repository = container.appointment_repository()
+        await appointment_repository.delete_by_patient(patient_id)
         success = await patient_repository.delete(patient_id)
         
         if not success:
             raise PatientNotFoundException(patient_id)
         
-        logger.info(f"Patient {patient_id} supprimé avec succès")
+        logger.info("Patient %s supprimé avec succès", patient_id)
         return None
     
     except PatientNotFoundException as e:
-        logger.error(f"Patient non trouvé: {str(e)}")
+        logger.error("Patient non trouvé: %s", e)
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la suppression du patient: {str(e)}")
+        logger.exception("Erreur inattendue lors de la suppression du patient: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -351,10 +432,10 @@ async def list_patients(
         user_role = token_payload.get("role", "").lower()  # Get role and convert to lowercase
         allowed_roles = ["admin", "doctor", "nurse", "receptionist"]
         
-        logger.debug(f"User role: {user_role}")  # Add debug logging
+        logger.debug("User role: %s", user_role)  # Add debug logging
         
         if not check_role_permission(user_role, allowed_roles):
-            logger.warning(f"Unauthorized access attempt with role: {user_role}")
+            logger.warning("Unauthorized access attempt with role: %s", user_role)
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="You don't have permission to list patients"
@@ -366,7 +447,7 @@ async def list_patients(
             patients = await patient_repository.list_all(skip, limit)
             total = await patient_repository.count()
         except Exception as e:
-            logger.error(f"Database error: {str(e)}")
+            logger.error("Database error: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Database error occurred"
@@ -412,13 +493,14 @@ async def list_patients(
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la liste des patients: {str(e)}")
+        logger.exception("Erreur inattendue lors de la liste des patients: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
         )
 
 @router.post("/search", response_model=PatientListResponseDTO)
+@request_timeout(get_settings().search_request_timeout_ms)
 async def search_patients(
     search_criteria: PatientSearchDTO,
     token_payload: Dict[str, Any] = Depends(extract_token_payload),
@@ -490,7 +572,7 @@ async def search_patients(
         )
     
     except Exception as e:
-        logger.exception(f"Erreur inattendue lors de la recherche de patients: {str(e)}")
+        logger.exception("Erreur inattendue lors de la recherche de patients: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"An unexpected error occurred: {str(e)}"
@@ -0,0 +1,78 @@
+# medisecure-backend/patient_management/infrastructure/adapters/secondary/asyncpg_patient_repository.py
+from typing import Optional
+from uuid import UUID
+import logging
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import (
+    PATIENT_CODEC, SELECT_BY_EMAIL, SELECT_BY_ID, PostgresPatientRepository
+)
+from shared.infrastructure.cache.repository_cache import cached_read
+from shared.infrastructure.database.raw_queries import fetchrow
+from shared.infrastructure.database.single_flight import single_flight
+from shared.infrastructure.database.unit_of_work import repository_session
+from shared.infrastructure.observability.request_timing import timed_repository
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Colonnes dans l'ordre des champs de l'entité Patient
+PATIENT_COLUMNS = (
+    "id, first_name, last_name, date_of_birth, gender, address, city, postal_code, country, "
+    "phone_number, email, blood_type, allergies, chronic_diseases, current_medications, "
+    "has_consent, consent_date, gdpr_consent, insurance_provider, insurance_id, notes, "
+    "created_at, updated_at, is_active"
+)
+RAW_SELECT_BY_ID = f"SELECT {PATIENT_COLUMNS} FROM patients WHERE id = $1 AND is_active"
+RAW_SELECT_BY_EMAIL = f"SELECT {PATIENT_COLUMNS} FROM patients WHERE email = $1 AND is_active"
+
+def _to_patient(record) -> Patient:
+    # Les champs JSONB absents (NULL) deviennent des dictionnaires vides, comme dans _map_to_entity
+    allergies, chronic_diseases, current_medications = record[12:15]
+    return Patient(*record[:12], allergies or {}, chronic_diseases or {}, current_medications or {}, *record[15:])
+
+@timed_repository
+class AsyncpgPatientRepository(PostgresPatientRepository):
+    """
+    Adaptateur secondaire pour le repository des patients avec PostgreSQL, dont les lectures
+    par identifiant et par email sont exécutées directement par asyncpg, sans l'ORM.
+    Les autres opérations sont celles de PostgresPatientRepository.
+    """
+    
+    @cached_read(PATIENT_CODEC)
+    @single_flight
+    async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
+        """
+        Récupère un patient actif par son identifiant.
+        
+        Args:
+            patient_id: L'identifiant du patient
+        
+        Returns:
+            Optional[Patient]: Le patient, ou None s'il n'existe pas ou est désactivé
+        """
+        try:
+            async with repository_session(self.session_factory) as session:
+                record = await fetchrow(session, SELECT_BY_ID, RAW_SELECT_BY_ID, patient_id)
+            return _to_patient(record) if record is not None else None
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération du patient %s: %s", patient_id, e)
+            raise
+    
+    async def get_by_email(self, email: str) -> Optional[Patient]:
+        """
+        Récupère un patient actif par son email.
+        
+        Args:
+            email: L'email du patient
+        
+        Returns:
+            Optional[Patient]: Le patient, ou None s'il n'existe pas ou est désactivé
+        """
+        try:
+            async with repository_session(self.session_factory) as session:
+                record = await fetchrow(session, SELECT_BY_EMAIL, RAW_SELECT_BY_EMAIL, email)
+            return _to_patient(record) if record is not None else None
+        except Exception as e:
+            logger.exception("Erreur lors de la récupération du patient par email: %s", e)
+            raise
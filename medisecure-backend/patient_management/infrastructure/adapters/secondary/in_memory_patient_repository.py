@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict, Any
 from uuid import UUID
-from datetime import date
+from datetime import date, datetime
 from copy import deepcopy
 
 from patient_management.domain.entities.patient import Patient
@@ -12,12 +12,16 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
     Implémente le port PatientRepositoryProtocol.
     """
     
-    def __init__(self):
+    def __init__(self, soft_delete: bool = True):
         """
         Initialise le repository avec une liste vide de patients.
+        
+        Args:
+            soft_delete: Si True, la suppression désactive le patient au lieu de le retirer
         """
         self.patients: Dict[UUID, Patient] = {}
         self.email_index: Dict[str, UUID] = {}
+        self.soft_delete = soft_delete
     
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """
@@ -31,7 +35,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         """
         # Retourner une copie du patient pour éviter les modifications non contrôlées
         patient = self.patients.get(patient_id)
-        if patient:
+        if patient and patient.is_active:
             return deepcopy(patient)
         return None
     
@@ -51,7 +55,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         
         # Retourner une copie du patient pour éviter les modifications non contrôlées
         patient = self.patients.get(patient_id)
-        if patient:
+        if patient and patient.is_active:
             return deepcopy(patient)
         return None
     
@@ -101,6 +105,47 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         
         return deepcopy(patient)
     
+    async def patch(
+        self,
+        patient_id: UUID,
+        changes: Dict[str, Any],
+        medical_changes: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Optional[Patient]:
+        """
+        Met à jour partiellement un patient.
+        
+        Args:
+            patient_id: L'ID du patient à mettre à jour
+            changes: Les colonnes modifiées et leurs nouvelles valeurs
+            medical_changes: Les sous-clés modifiées des documents médicaux
+        
+        Returns:
+            Optional[Patient]: Le patient mis à jour ou None si non trouvé
+        """
+        patient = self.patients.get(patient_id)
+        if not patient or not patient.is_active:
+            return None
+        
+        # Mettre à jour l'index d'emails si l'email change
+        if "email" in changes and changes["email"] != patient.email:
+            if patient.email:
+                self.email_index.pop(patient.email, None)
+            if changes["email"]:
+                self.email_index[changes["email"]] = patient_id
+        
+        for field_name, value in changes.items():
+            setattr(patient, field_name, deepcopy(value))
+        
+        # Fusionner les sous-clés des documents médicaux
+        for field_name, sub_values in (medical_changes or {}).items():
+            document = dict(getattr(patient, field_name) or {})
+            document.update(deepcopy(sub_values))
+            setattr(patient, field_name, document)
+        
+        patient.updated_at = datetime.utcnow()
+        
+        return deepcopy(patient)
+    
     async def delete(self, patient_id: UUID) -> bool:
         """
         Supprime un patient.
@@ -111,10 +156,15 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Returns:
             bool: True si le patient a été supprimé, False sinon
         """
-        if patient_id not in self.patients:
+        patient = self.patients.get(patient_id)
+        if not patient or not patient.is_active:
             return False
         
-        patient = self.patients[patient_id]
+        if self.soft_delete:
+            # Désactiver le patient sans le retirer du stockage
+            patient.is_active = False
+            patient.updated_at = datetime.utcnow()
+            return True
         
         # Supprimer l'index d'email si présent
         if patient.email:
@@ -136,7 +186,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Returns:
             List[Patient]: La liste des patients
         """
-        patients = list(self.patients.values())
+        patients = [patient for patient in self.patients.values() if patient.is_active]
         
         # Appliquer la pagination
         paginated_patients = patients[skip:skip + limit]
@@ -168,7 +218,7 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
             List[Patient]: La liste des patients correspondant aux critères
         """
         # Filtrer les patients selon les critères fournis
-        filtered_patients = list(self.patients.values())
+        filtered_patients = [patient for patient in self.patients.values() if patient.is_active]
         
         if name:
             filtered_patients = [
@@ -207,4 +257,4 @@ class InMemoryPatientRepository(PatientRepositoryProtocol):
         Returns:
             int: Le nombre total de patients
         """
-        return len(self.patients)
\ No newline at end of file
+        return sum(1 for patient in self.patients.values() if patient.is_active)
\ No newline at end of file
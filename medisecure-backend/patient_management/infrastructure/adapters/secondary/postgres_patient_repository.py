@@ -4,74 +4,99 @@ from uuid import UUID
 from datetime import date, datetime
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import update, delete, or_, and_, func
+from sqlalchemy import update, delete, or_, and_, func, cast, literal, Text, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 import logging
 
 from patient_management.domain.entities.patient import Patient
 from patient_management.domain.ports.secondary.patient_repository_protocol import PatientRepositoryProtocol
+from shared.infrastructure.cache.repository_cache import RepositoryCache, cached_read, invalidate_after_commit
+from shared.infrastructure.cache.serialization import EntityCodec
 from shared.infrastructure.database.models.patient_model import PatientModel
+from shared.infrastructure.database.read_replicas import replica_read
+from shared.infrastructure.database.single_flight import single_flight
+from shared.infrastructure.database.unit_of_work import repository_session
+from shared.infrastructure.observability.request_timing import timed_repository
 
 # Configuration du logging
 logger = logging.getLogger(__name__)
 
+# Forme des patients dans le cache des lectures par identifiant
+PATIENT_CODEC = EntityCodec(Patient)
+
+# Lectures fréquentes, construites une seule fois : chaque appel ne fournit que ses paramètres
+# et SQLAlchemy retrouve directement la requête compilée (voir connection.engine_options)
+SELECT_BY_ID = select(PatientModel).where(PatientModel.id == bindparam("patient_id"), PatientModel.is_active)
+SELECT_BY_EMAIL = select(PatientModel).where(PatientModel.email == bindparam("email"), PatientModel.is_active)
+SELECT_PAGE = select(PatientModel).where(PatientModel.is_active).offset(bindparam("skip")).limit(bindparam("limit"))
+SELECT_COUNT = select(func.count()).select_from(PatientModel).where(PatientModel.is_active)
+
+@timed_repository
 class PostgresPatientRepository(PatientRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des patients avec PostgreSQL.
     Implémente le port PatientRepositoryProtocol.
     """
     
-    def __init__(self, session_factory):
+    def __init__(self, session_factory, soft_delete: bool = True, record_cache: Optional[RepositoryCache] = None):
         """
         Initialise le repository avec une factory de session SQLAlchemy.
         
+        Les lectures ne portent que sur les patients actifs (`is_active`), ce qui
+        leur permet d'utiliser les index partiels `WHERE is_active`.
+        
         Args:
             session_factory: La factory de session SQLAlchemy à utiliser
+            soft_delete: Si True, la suppression désactive le patient au lieu de supprimer la ligne
+            record_cache: Le cache des patients lus par identifiant, invalidé par les écritures
         """
         self.session_factory = session_factory
+        self.soft_delete = soft_delete
+        self.record_cache = record_cache
     
+    @cached_read(PATIENT_CODEC)
+    @single_flight
     async def get_by_id(self, patient_id: UUID) -> Optional[Patient]:
         """..."""
         try:
-            logger.debug(f"Récupération du patient avec ID: {patient_id}")
-            async with self.session_factory() as session:
-                query = select(PatientModel).where(PatientModel.id == patient_id)
-                result = await session.execute(query)
+            logger.debug("Récupération du patient avec ID: %s", patient_id)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_BY_ID, {"patient_id": patient_id})
                 patient_model = result.scalar_one_or_none()
                 
                 if not patient_model:
-                    logger.debug(f"Patient avec ID {patient_id} non trouvé")
+                    logger.debug("Patient avec ID %s non trouvé", patient_id)
                     return None
                 
-                logger.debug(f"Patient trouvé: {patient_model.id}")
+                logger.debug("Patient trouvé: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération du patient {patient_id}: {str(e)}")
+            logger.exception("Erreur lors de la récupération du patient %s: %s", patient_id, e)
             raise
     
     async def get_by_email(self, email: str) -> Optional[Patient]:
         try:
-            logger.debug(f"Récupération du patient avec email: {email}")
-            async with self.session_factory() as session:
-                query = select(PatientModel).where(PatientModel.email == email)
-                result = await session.execute(query)
+            logger.debug("Récupération d'un patient par email")
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_BY_EMAIL, {"email": email})
                 patient_model = result.scalar_one_or_none()
                 
                 if not patient_model:
-                    logger.debug(f"Patient avec email {email} non trouvé")
+                    logger.debug("Aucun patient avec cet email")
                     return None
                 
-                logger.debug(f"Patient trouvé: {patient_model.id}")
+                logger.debug("Patient trouvé: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération du patient par email {email}: {str(e)}")
+            logger.exception("Erreur lors de la récupération du patient par email: %s", e)
             raise
     
     async def create(self, patient: Patient) -> Patient:
         """..."""
         try:
-            logger.info(f"Création d'un nouveau patient: {patient.first_name} {patient.last_name}")
+            logger.info("Création d'un nouveau patient: %s", patient.id)
             
-            async with self.session_factory() as session:
+            async with repository_session(self.session_factory) as session:
                 patient_model = PatientModel(
                     id=patient.id,
                     first_name=patient.first_name,
@@ -100,13 +125,13 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                 )
                 
                 session.add(patient_model)
-                await session.commit()
-                await session.refresh(patient_model)
+                # Validation à la fin de l'unité de travail ; flush fait remonter ici les violations de contraintes
+                await session.flush()
                 
-                logger.info(f"Patient créé avec succès: {patient_model.id}")
+                logger.info("Patient créé avec succès: %s", patient_model.id)
                 return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la création du patient: {str(e)}")
+            logger.exception("Erreur lors de la création du patient: %s", e)
             raise
     
     async def update(self, patient: Patient) -> Patient:
@@ -120,7 +145,7 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             Patient: Le patient mis à jour
         """
         try:
-            logger.info(f"Mise à jour du patient: {patient.id}")
+            logger.info("Mise à jour du patient: %s", patient.id)
             
             query = (
                 update(PatientModel)
@@ -149,24 +174,110 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
                     updated_at=datetime.utcnow(),
                     is_active=patient.is_active
                 )
+                .returning(PatientModel)
+                .execution_options(synchronize_session=False, populate_existing=True)
             )
             
-            await self.session.execute(query)
-            await self.session.commit()
+            # RETURNING renvoie le patient mis à jour sans relecture
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(query)
+                patient_model = result.scalar_one_or_none()
+                if patient_model:
+                    self._invalidate_record(session, patient.id)
             
-            # Récupérer le patient mis à jour pour le retourner
-            updated_patient = await self.get_by_id(patient.id)
-            logger.info(f"Patient {patient.id} mis à jour avec succès")
-            return updated_patient
+            # Un patient désactivé par cette mise à jour est tout de même retourné
+            if not patient_model:
+                logger.warning("Tentative de mise à jour d'un patient inexistant: %s", patient.id)
+                return None
+            
+            logger.info("Patient %s mis à jour avec succès", patient.id)
+            return self._map_to_entity(patient_model)
         except Exception as e:
-            logger.exception(f"Erreur lors de la mise à jour du patient {patient.id}: {str(e)}")
-            await self.session.rollback()
+            logger.exception("Erreur lors de la mise à jour du patient %s: %s", patient.id, e)
             raise
     
+    async def patch(
+        self,
+        patient_id: UUID,
+        changes: Dict[str, Any],
+        medical_changes: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Optional[Patient]:
+        """
+        Met à jour partiellement un patient.
+        
+        Seules les colonnes présentes dans `changes` sont écrites. Les sous-clés
+        des documents JSONB sont fusionnées avec `jsonb_set` côté serveur, sans
+        réécrire le document complet depuis l'application.
+        
+        Args:
+            patient_id: L'ID du patient à mettre à jour
+            changes: Les colonnes modifiées et leurs nouvelles valeurs
+            medical_changes: Les sous-clés modifiées des documents médicaux
+        
+        Returns:
+            Optional[Patient]: Le patient mis à jour ou None si non trouvé
+        """
+        try:
+            values: Dict[str, Any] = dict(changes)
+            
+            for column_name, sub_values in (medical_changes or {}).items():
+                values[column_name] = self._build_jsonb_merge(column_name, sub_values)
+            
+            logger.info("Mise à jour partielle du patient %s: %s", patient_id, sorted(values))
+            values["updated_at"] = datetime.utcnow()
+            
+            query = (
+                update(PatientModel)
+                .where(PatientModel.id == patient_id, PatientModel.is_active)
+                .values(**values)
+                .returning(PatientModel)
+                # Le patient a pu être chargé plus tôt dans la même session : ses attributs sont rafraîchis
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(query)
+                patient_model = result.scalar_one_or_none()
+                if patient_model:
+                    self._invalidate_record(session, patient_id)
+            
+            if not patient_model:
+                logger.warning("Tentative de mise à jour partielle d'un patient inexistant: %s", patient_id)
+                return None
+            
+            return self._map_to_entity(patient_model)
+        except Exception as e:
+            logger.exception("Erreur lors de la mise à jour partielle du patient %s: %s", patient_id, e)
+            raise
+    
+    def _build_jsonb_merge(self, column_name: str, sub_values: Dict[str, Any]):
+        """
+        Construit l'expression SQL fusionnant des sous-clés dans un document JSONB.
+        
+        Args:
+            column_name: Le nom de la colonne JSONB
+            sub_values: Les sous-clés à écrire et leurs valeurs
+        
+        Returns:
+            L'expression `jsonb_set(...)` imbriquée pour chaque sous-clé
+        """
+        expression = func.coalesce(getattr(PatientModel, column_name), cast({}, JSONB))
+        for key, value in sub_values.items():
+            expression = func.jsonb_set(
+                expression,
+                cast(literal([key], ARRAY(Text)), ARRAY(Text)),
+                cast(literal(value, JSONB), JSONB),
+                True
+            )
+        return expression
+    
     async def delete(self, patient_id: UUID) -> bool:
         """
         Supprime un patient.
         
+        En mode soft delete, le patient est seulement désactivé (`is_active = false`)
+        et disparaît des lectures sans que la ligne soit supprimée.
+        
         Args:
             patient_id: L'ID du patient à supprimer
             
@@ -174,45 +285,50 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             bool: True si le patient a été supprimé, False sinon
         """
         try:
-            logger.info(f"Suppression du patient {patient_id}")
+            logger.info("Suppression du patient %s (soft_delete=%s)", patient_id, self.soft_delete)
             
-            # Vérifier si le patient existe
-            patient = await self.get_by_id(patient_id)
-            if not patient:
-                logger.warning(f"Tentative de suppression d'un patient inexistant: {patient_id}")
-                return False
+            if self.soft_delete:
+                query = (
+                    update(PatientModel)
+                    .where(PatientModel.id == patient_id, PatientModel.is_active)
+                    .values(is_active=False, updated_at=datetime.utcnow())
+                    .execution_options(synchronize_session=False)
+                )
+            else:
+                query = delete(PatientModel).where(PatientModel.id == patient_id)
             
-            # Supprimer le patient
-            query = delete(PatientModel).where(PatientModel.id == patient_id)
-            result = await self.session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(query)
+                if result.rowcount:
+                    self._invalidate_record(session, patient_id)
             
             if result.rowcount == 0:
-                logger.warning(f"Aucune ligne affectée lors de la suppression du patient {patient_id}")
+                logger.warning("Tentative de suppression d'un patient inexistant: %s", patient_id)
                 return False
             
-            await self.session.commit()
-            logger.info(f"Patient {patient_id} supprimé avec succès")
+            logger.info("Patient %s supprimé avec succès", patient_id)
             return True
         except Exception as e:
-            logger.exception(f"Erreur lors de la suppression du patient {patient_id}: {str(e)}")
-            await self.session.rollback()
+            logger.exception("Erreur lors de la suppression du patient %s: %s", patient_id, e)
             raise
     
+    @single_flight
+    @replica_read
     async def list_all(self, skip: int = 0, limit: int = 100) -> List[Patient]:
         """..."""
         try:
-            logger.debug(f"Récupération de la liste des patients (skip={skip}, limit={limit})")
-            async with self.session_factory() as session:
-                query = select(PatientModel).offset(skip).limit(limit)
-                result = await session.execute(query)
+            logger.debug("Récupération de la liste des patients (skip=%s, limit=%s)", skip, limit)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_PAGE, {"skip": skip, "limit": limit})
                 patient_models = result.scalars().all()
                 
-                logger.debug(f"Nombre de patients récupérés: {len(patient_models)}")
+                logger.debug("Nombre de patients récupérés: %s", len(patient_models))
                 return [self._map_to_entity(patient_model) for patient_model in patient_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la récupération de la liste des patients: {str(e)}")
+            logger.exception("Erreur lors de la récupération de la liste des patients: %s", e)
             raise
     
+    @replica_read
     async def search(
         self,
         name: Optional[str] = None,
@@ -223,10 +339,14 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
         limit: int = 100
     ) -> List[Patient]:
         try:
-            logger.debug(f"Recherche de patients avec critères: name={name}, date_of_birth={date_of_birth}, email={email}, phone={phone}")
+            # Seuls les noms des critères sont journalisés, jamais leurs valeurs
+            logger.debug(
+                "Recherche de patients avec critères: %s",
+                [criterion for criterion, value in (("name", name), ("date_of_birth", date_of_birth), ("email", email), ("phone", phone)) if value]
+            )
             
-            # Construire la requête de base
-            query = select(PatientModel)
+            # Construire la requête de base (patients actifs uniquement)
+            query = select(PatientModel).where(PatientModel.is_active)
             
             # Ajouter les filtres si fournis
             filters = []
@@ -256,29 +376,41 @@ class PostgresPatientRepository(PatientRepositoryProtocol):
             query = query.offset(skip).limit(limit)
             
             # Exécuter la requête
-            async with self.session_factory() as session:
+            async with repository_session(self.session_factory) as session:
                 result = await session.execute(query)
                 patient_models = result.scalars().all()
             
-            logger.debug(f"Nombre de patients trouvés: {len(patient_models)}")
+            logger.debug("Nombre de patients trouvés: %s", len(patient_models))
             return [self._map_to_entity(patient_model) for patient_model in patient_models]
         except Exception as e:
-            logger.exception(f"Erreur lors de la recherche de patients: {str(e)}")
+            logger.exception("Erreur lors de la recherche de patients: %s", e)
             raise
         
+    @single_flight
+    @replica_read
     async def count(self) -> int:
         try:
             logger.debug("Comptage du nombre total de patients")
-            async with self.session_factory() as session:
-                query = select(func.count()).select_from(PatientModel)
-                result = await session.execute(query)
+            async with repository_session(self.session_factory) as session:
+                result = await session.execute(SELECT_COUNT)
                 count = result.scalar_one()
-                logger.debug(f"Nombre total de patients: {count}")
+                logger.debug("Nombre total de patients: %s", count)
                 return count
         except Exception as e:
-            logger.exception(f"Erreur lors du comptage des patients: {str(e)}")
+            logger.exception("Erreur lors du comptage des patients: %s", e)
             raise
     
+    def _invalidate_record(self, session: AsyncSession, patient_id: UUID) -> None:
+        """
+        Retire le patient du cache des lectures par identifiant, après validation de la transaction.
+        
+        Args:
+            session: La session de l'écriture
+            patient_id: L'ID du patient modifié
+        """
+        if self.record_cache is not None:
+            invalidate_after_commit(session, self.record_cache, [self.record_cache.key(PATIENT_CODEC, patient_id)])
+    
     def _map_to_entity(self, patient_model: PatientModel) -> Patient:
         """
         Convertit un modèle SQLAlchemy en entité du domaine.
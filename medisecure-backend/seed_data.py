@@ -0,0 +1,66 @@
+import argparse
+import asyncio
+import logging
+import os
+from datetime import date
+from dotenv import load_dotenv
+
+from shared.infrastructure.database.seeding import DatasetSeeder, DatasetSpec
+
+# Charger les variables d'environnement
+load_dotenv()
+
+# Configuration du logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+def parse_month(value: str) -> date:
+    return date.fromisoformat(f"{value}-01")
+
+async def run(args):
+    database_url = args.database_url
+    if "postgresql://" in database_url and "asyncpg" not in database_url:
+        database_url = database_url.replace("postgresql://", "postgresql+asyncpg://")
+    
+    spec = DatasetSpec(
+        patients=args.patients,
+        appointments=args.appointments,
+        doctors=args.doctors,
+        seed=args.seed,
+        first_month=args.first_month,
+        months=args.months,
+        reference_date=args.reference_date,
+        email_domain=args.email_domain
+    )
+    seeder = DatasetSeeder(database_url, spec, workers=args.workers)
+    if await seeder.load(force=args.force):
+        print(f"Jeu de données généré: {spec.to_dict()}")
+    else:
+        print("La base contient déjà ce jeu de données (--force pour le régénérer)")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Génère un jeu de données synthétique (patients, médecins, rendez-vous) dans une base dédiée"
+    )
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"), help="Base à remplir (défaut: DATABASE_URL)")
+    parser.add_argument("--patients", type=int, default=100000, help="Nombre de patients")
+    parser.add_argument("--appointments", type=int, default=1000000, help="Nombre de rendez-vous")
+    parser.add_argument("--doctors", type=int, default=500, help="Nombre de médecins")
+    parser.add_argument("--seed", type=int, default=42, help="Graine des tirages aléatoires")
+    parser.add_argument("--first-month", type=parse_month, default=date(2024, 1, 1), help="Premier mois couvert (AAAA-MM)")
+    parser.add_argument("--months", type=int, default=24, help="Nombre de mois couverts")
+    parser.add_argument("--reference-date", type=date.fromisoformat, help="Date séparant rendez-vous passés et à venir (AAAA-MM-JJ)")
+    parser.add_argument("--email-domain", default="example.com", help="Domaine des adresses email générées")
+    parser.add_argument("--workers", type=int, help="Nombre de processus de chargement (défaut: un par CPU)")
+    parser.add_argument("--force", action="store_true", help="Régénérer même si la base contient déjà ce jeu de données")
+    parser.add_argument("--yes", action="store_true", help="Confirmer que la base peut être entièrement réécrite")
+    args = parser.parse_args()
+    
+    if not args.database_url:
+        parser.error("--database-url ou DATABASE_URL est requis")
+    if not args.yes:
+        parser.error("la base est entièrement réécrite : relancer avec --yes pour confirmer")
+    
+    asyncio.run(run(args))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+import os
+import threading
+import time
+import uuid
+from typing import List, Tuple
+
+from shared.ports.primary.id_generator_protocol import IdGeneratorProtocol
+
+# Compteur de 42 bits (rand_a sur 12 bits + 30 premiers bits de rand_b), suivi de 32 bits aléatoires
+_COUNTER_BITS = 42
+_RANDOM_BITS = 32
+_COUNTER_MAX = (1 << _COUNTER_BITS) - 1
+
+class Uuid7Generator(IdGeneratorProtocol):
+    """
+    Adaptateur primaire pour la génération d'identifiants UUID v7 (RFC 9562).
+    Implémente le port IdGeneratorProtocol.
+    
+    Les 48 premiers bits portent l'horodatage en millisecondes : les identifiants
+    successifs sont croissants et les insertions se font en fin d'index B-tree au lieu
+    d'une page aléatoire. Dans une même milliseconde, un compteur initialisé au hasard
+    garantit la croissance stricte (méthode 1 de la RFC). L'instance doit être partagée
+    (singleton) pour que la garantie tienne dans tout le processus.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._counter = 0
+    
+    def generate_id(self) -> uuid.UUID:
+        """
+        Génère un nouvel identifiant UUID v7.
+        
+        Returns:
+            uuid.UUID: Un identifiant UUID v7, supérieur à tous ceux générés avant lui
+        """
+        return self.generate_ids(1)[0]
+    
+    def generate_ids(self, count: int) -> List[uuid.UUID]:
+        """
+        Génère plusieurs identifiants UUID v7 croissants.
+        
+        Args:
+            count: Le nombre d'identifiants à générer
+        
+        Returns:
+            List[uuid.UUID]: Les identifiants, dans l'ordre croissant
+        """
+        random_bytes = os.urandom(count * 4)
+        ids = []
+        with self._lock:
+            for index in range(count):
+                timestamp_ms, counter = self._next()
+                random_bits = int.from_bytes(random_bytes[index * 4:index * 4 + 4], "big")
+                ids.append(uuid.UUID(int=_pack(timestamp_ms, counter, random_bits)))
+        return ids
+    
+    def _next(self) -> Tuple[int, int]:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > self._last_ms:
+            self._last_ms = now_ms
+            # Bit de poids fort à zéro : au moins 2^41 incréments avant débordement
+            self._counter = int.from_bytes(os.urandom(6), "big") >> (48 - _COUNTER_BITS + 1)
+        elif self._counter < _COUNTER_MAX:
+            # Même milliseconde, ou horloge revenue en arrière : l'horodatage précédent est conservé
+            self._counter += 1
+        else:
+            # Compteur épuisé : on emprunte la milliseconde suivante
+            self._last_ms += 1
+            self._counter = 0
+        return self._last_ms, self._counter
+
+def _pack(timestamp_ms: int, counter: int, random_bits: int) -> int:
+    rand_a = counter >> 30
+    rand_b = ((counter & ((1 << 30) - 1)) << _RANDOM_BITS) | random_bits
+    return (
+        (timestamp_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
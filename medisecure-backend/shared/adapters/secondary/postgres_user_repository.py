@@ -7,8 +7,11 @@ from sqlalchemy import update, delete
 from shared.domain.entities.user import User
 from shared.domain.enums.roles import UserRole
 from shared.infrastructure.database.models.user_model import UserModel
+from shared.infrastructure.database.unit_of_work import repository_session
+from shared.infrastructure.observability.request_timing import timed_repository
 from shared.ports.secondary.user_repository_protocol import UserRepositoryProtocol
 
+@timed_repository
 class PostgresUserRepository(UserRepositoryProtocol):
     """
     Adaptateur secondaire pour le repository des utilisateurs avec PostgreSQL.
@@ -25,7 +28,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         self.session_factory = session_factory
     
     async def get_by_id(self, user_id: UUID) -> Optional[User]:
-        async with self.session_factory() as session:
+        async with repository_session(self.session_factory) as session:
             query = select(UserModel).where(UserModel.id == user_id)
             result = await session.execute(query)
             user_model = result.scalar_one_or_none()
@@ -45,7 +48,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         Returns:
             Optional[User]: L'utilisateur trouvé ou None si non trouvé
         """
-        async with self.session_factory() as session:
+        async with repository_session(self.session_factory) as session:
             query = select(UserModel).where(UserModel.email == email)
             result = await session.execute(query)
             user_model = result.scalar_one_or_none()
@@ -65,7 +68,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
         Returns:
             User: L'utilisateur créé avec son ID généré
         """
-        async with self.session_factory() as session:
+        async with repository_session(self.session_factory) as session:
             user_model = UserModel(
                 id=user.id,
                 email=user.email,
@@ -78,8 +81,7 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
             
             session.add(user_model)
-            await session.commit()
-            await session.refresh(user_model)
+            await session.flush()
             
             return self._map_to_entity(user_model)
     
@@ -106,8 +108,8 @@ class PostgresUserRepository(UserRepositoryProtocol):
             )
         )
         
-        await self.session.execute(query)
-        await self.session.commit()
+        async with repository_session(self.session_factory) as session:
+            await session.execute(query)
         
         return user
     
@@ -122,13 +124,10 @@ class PostgresUserRepository(UserRepositoryProtocol):
             bool: True si l'utilisateur a été supprimé, False sinon
         """
         query = delete(UserModel).where(UserModel.id == user_id)
-        result = await self.session.execute(query)
-        
-        if result.rowcount == 0:
-            return False
+        async with repository_session(self.session_factory) as session:
+            result = await session.execute(query)
         
-        await self.session.commit()
-        return True
+        return result.rowcount > 0
     
     async def list_all(self) -> List[User]:
         """
@@ -138,8 +137,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste de tous les utilisateurs
         """
         query = select(UserModel)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with repository_session(self.session_factory) as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -154,8 +154,9 @@ class PostgresUserRepository(UserRepositoryProtocol):
             List[User]: La liste des utilisateurs ayant le rôle spécifié
         """
         query = select(UserModel).where(UserModel.role == role)
-        result = await self.session.execute(query)
-        user_models = result.scalars().all()
+        async with repository_session(self.session_factory) as session:
+            result = await session.execute(query)
+            user_models = result.scalars().all()
         
         return [self._map_to_entity(user_model) for user_model in user_models]
     
@@ -191,31 +192,6 @@ class PostgresUserRepository(UserRepositoryProtocol):
             str: Le mot de passe hashé de l'utilisateur
         """
         query = select(UserModel.hashed_password).where(UserModel.id == user.id)
-        result = await self.session.execute(query)
-        hashed_password = result.scalar_one_or_none()
-        
-        return hashed_password
-    
-    def get_hashed_password(self, user):
-        """
-        Récupère le mot de passe hashé d'un utilisateur.
-        
-        Args:
-            user: L'utilisateur dont on veut récupérer le mot de passe hashé
-            
-        Returns:
-            str: Le mot de passe hashé de l'utilisateur
-        """
-        # Exécuter une requête pour récupérer le mot de passe hashé
-        async def get_password():
-            query = select(UserModel.hashed_password).where(UserModel.id == user.id)
-            result = await self.session.execute(query)
-            hashed_password = result.scalar_one_or_none()
-            return hashed_password
-        
-        # Exécuter la tâche asynchrone de manière synchrone pour simplifier l'interface
-        import asyncio
-        loop = asyncio.get_event_loop()
-        hashed_password = loop.run_until_complete(get_password())
-        
-        return hashed_password
\ No newline at end of file
+        async with repository_session(self.session_factory) as session:
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
\ No newline at end of file
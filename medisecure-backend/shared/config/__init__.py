@@ -0,0 +1,2 @@
+# shared/config/__init__.py
+from shared.config.settings import Settings, get_settings
@@ -0,0 +1,66 @@
+# shared/infrastructure/cache/memory_cache.py
+"""
+Cache LRU propre au processus : niveau proche (near) du cache à deux niveaux, ou cache
+unique d'un déploiement à un seul worker.
+"""
+import time
+from collections import OrderedDict
+from typing import Optional, Sequence, Tuple
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+
+class InMemoryCache(CacheProtocol):
+    """
+    Adaptateur secondaire : cache LRU borné en mémoire du processus.
+    Implémente le port CacheProtocol.
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialise le cache.
+        
+        Args:
+            max_entries: Le nombre maximal de valeurs conservées
+        """
+        self.max_entries = max_entries
+        self._values: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+    
+    def __len__(self) -> int:
+        return len(self._values)
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._values.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._values[key]
+            return None
+        self._values.move_to_end(key)
+        return entry[1]
+    
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if self.max_entries <= 0:
+            return
+        self._values[key] = (time.monotonic() + ttl, value)
+        self._values.move_to_end(key)
+        while len(self._values) > self.max_entries:
+            self._values.popitem(last=False)
+    
+    async def delete(self, keys: Sequence[str]) -> None:
+        self.discard(keys)
+    
+    def discard(self, keys: Sequence[str]) -> None:
+        """
+        Supprime des valeurs (version synchrone de delete).
+        
+        Args:
+            keys: Les clés des valeurs à supprimer
+        """
+        for key in keys:
+            self._values.pop(key, None)
+    
+    def clear(self) -> None:
+        """Vide le cache"""
+        self._values.clear()
@@ -0,0 +1,100 @@
+# shared/infrastructure/cache/redis_cache.py
+"""
+Cache partagé par tous les workers et toutes les machines, sur un serveur Redis (ou
+compatible : Valkey, KeyDB, Dragonfly).
+
+Les invalidations sont aussi publiées sur un canal pub/sub : chaque worker y retire les
+valeurs de son niveau proche (voir TieredCache). Un message porte l'identifiant du
+processus qui l'a publié, qui ignore ses propres messages (déjà appliqués localement).
+"""
+import asyncio
+import logging
+import uuid
+from typing import Optional, Sequence
+
+from shared.ports.secondary.cache_protocol import CacheProtocol, InvalidationCallback
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Attente avant de se réabonner au canal après une erreur (secondes)
+RESUBSCRIBE_DELAY = 1.0
+
+# Attente maximale d'un message avant de vérifier la connexion (secondes)
+LISTEN_TIMEOUT = 1.0
+
+class RedisCache(CacheProtocol):
+    """
+    Adaptateur secondaire : cache sur un serveur Redis, avec invalidations par pub/sub.
+    Implémente le port CacheProtocol.
+    """
+    
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "medisecure:",
+        channel: str = "medisecure:invalidations",
+        socket_timeout: float = 0.25,
+        client=None
+    ):
+        """
+        Initialise le client ; la connexion n'est ouverte qu'au premier appel.
+        
+        Args:
+            url: L'URL du serveur Redis
+            prefix: Le préfixe des clés (plusieurs applications par serveur)
+            channel: Le canal des invalidations
+            socket_timeout: Le délai maximal d'une commande (secondes) : un serveur lent
+                se traduit par un défaut de cache, pas par une requête bloquée
+            client: Un client redis.asyncio déjà construit (tests : fakeredis)
+        """
+        if client is None:
+            # Import différé : redis n'est requis que si ce cache est configuré
+            import redis.asyncio as redis
+            
+            client = redis.Redis.from_url(
+                url, socket_timeout=socket_timeout, socket_connect_timeout=socket_timeout
+            )
+        self.client = client
+        self.prefix = prefix
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self.client.get(self.prefix + key)
+    
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.client.set(self.prefix + key, value, px=max(1, int(ttl * 1000)))
+    
+    async def delete(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self.client.delete(*(self.prefix + key for key in keys))
+    
+    async def publish_invalidation(self, keys: Sequence[str]) -> None:
+        if keys:
+            await self.client.publish(self.channel, "\n".join((self.origin, *keys)))
+    
+    async def listen_invalidations(self, callback: InvalidationCallback) -> None:
+        while True:
+            pubsub = self.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                # Invalidations éventuellement perdues avant l'abonnement (démarrage, coupure)
+                callback(None)
+                while True:
+                    message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=LISTEN_TIMEOUT)
+                    if message is None or message["type"] != "message":
+                        continue
+                    origin, *keys = message["data"].decode().split("\n")
+                    if origin != self.origin:
+                        callback(keys)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Abonnement aux invalidations du cache interrompu: %s", e)
+                await asyncio.sleep(RESUBSCRIBE_DELAY)
+            finally:
+                await pubsub.reset()
+    
+    async def close(self) -> None:
+        await self.client.close()
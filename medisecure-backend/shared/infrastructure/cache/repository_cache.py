@@ -0,0 +1,229 @@
+# shared/infrastructure/cache/repository_cache.py
+"""
+Cache des lectures par identifiant des repositories (dossier patient, rendez-vous).
+
+Le décorateur `cached_read` s'applique à une méthode `get_by_id` ; le cache est injecté
+par le Container dans l'attribut `record_cache` du repository (None : pas de cache). Le
+support (processus, mémoire partagée, Redis avec niveau proche) est choisi par CACHE_BACKEND.
+
+Les écritures invalident leurs clés après validation de la transaction (`invalidate_after_commit`),
+dans le cache partagé puis, par pub/sub, dans les niveaux proches des autres workers. Une
+valeur lue en base pendant une invalidation n'est pas stockée : chaque clé est associée à
+une génération (par tranches de clés, pour une mémoire bornée), incrémentée à chaque
+invalidation reçue. La durée de vie (CACHE_TTL) borne l'écart restant : invalidation
+perdue (Redis indisponible) ou écriture validée dans un autre worker pendant une lecture.
+
+Une session qui a déjà écrit lit toujours en base : elle doit voir ses propres modifications.
+Le cache est une optimisation : ses erreurs sont journalisées et traitées comme des défauts.
+"""
+import asyncio
+import functools
+import logging
+from typing import Any, Callable, Dict, List, Optional, Sequence, TypeVar
+
+from shared.infrastructure.cache.serialization import EntityCodec
+from shared.infrastructure.database.single_flight import WRITES_KEY, install_write_tracking
+from shared.infrastructure.database.unit_of_work import after_commit, current_session
+from shared.infrastructure.observability.metrics import record_cache_lookup
+from shared.ports.secondary.cache_protocol import CacheProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Nombre de tranches de générations
+GENERATION_STRIPES = 4096
+
+class RepositoryCache:
+    """
+    Cache d'entités sérialisées sur un support CacheProtocol.
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(self, backend: CacheProtocol, serializer: Any, ttl: float = 30.0):
+        """
+        Initialise le cache.
+        
+        Args:
+            backend: Le support du cache
+            serializer: Le sérialiseur des valeurs (OrjsonSerializer, MsgpackSerializer)
+            ttl: La durée de vie d'une entité (secondes)
+        """
+        self.backend = backend
+        self.serializer = serializer
+        self.ttl = ttl
+        self._generations = [0] * GENERATION_STRIPES
+        self._handlers: Dict[str, Callable[[Optional[List[str]]], None]] = {}
+        self._listener: Optional[asyncio.Task] = None
+        # Lecture en base des sessions qui ont écrit
+        install_write_tracking()
+    
+    def key(self, codec: EntityCodec, entity_id: Any) -> str:
+        """
+        Construit la clé d'une entité.
+        
+        Args:
+            codec: Le codec de l'entité (nom et version de sa forme)
+            entity_id: L'identifiant de l'entité
+        
+        Returns:
+            str: La clé, par exemple "patient:1a2b3c4d.orjson:<id>"
+        """
+        return f"{codec.name}:{codec.version}.{self.serializer.name}:{entity_id}"
+    
+    def generation(self, key: str) -> int:
+        """
+        Retourne la génération de la clé, à relever avant de lire en base.
+        
+        Args:
+            key: La clé de l'entité
+        
+        Returns:
+            int: La génération courante de la tranche de la clé
+        """
+        return self._generations[hash(key) % GENERATION_STRIPES]
+    
+    async def get(self, key: str, codec: EntityCodec[T]) -> Optional[T]:
+        """
+        Récupère une entité.
+        
+        Args:
+            key: La clé de l'entité
+            codec: Le codec de l'entité
+        
+        Returns:
+            Optional[T]: L'entité, ou None si elle est absente (ou illisible)
+        """
+        try:
+            data = await self.backend.get(key)
+        except Exception as e:
+            logger.warning("Lecture du cache impossible: %s", e)
+            data = None
+        record_cache_lookup(codec.name, data is not None)
+        if data is None:
+            return None
+        try:
+            return codec.decode(self.serializer.loads(data))
+        except Exception as e:
+            logger.warning("Valeur du cache illisible (%s): %s", key, e)
+            return None
+    
+    async def put(self, key: str, entity: T, codec: EntityCodec[T], generation: int) -> None:
+        """
+        Enregistre une entité, sauf si sa clé a été invalidée depuis le début de sa lecture.
+        
+        Args:
+            key: La clé de l'entité
+            entity: L'entité lue en base
+            codec: Le codec de l'entité
+            generation: La génération relevée avant la lecture
+        """
+        if self.generation(key) != generation:
+            return
+        try:
+            await self.backend.set(key, self.serializer.dumps(codec.encode(entity)), self.ttl)
+        except Exception as e:
+            logger.warning("Écriture du cache impossible: %s", e)
+    
+    async def invalidate(self, keys: Sequence[str]) -> None:
+        """
+        Supprime des clés du cache et le signale aux autres workers.
+        
+        Args:
+            keys: Les clés modifiées
+        """
+        self._advance(keys)
+        try:
+            await self.backend.delete(keys)
+            await self.backend.publish_invalidation(keys)
+        except Exception as e:
+            logger.error("Invalidation du cache impossible, valeurs périmées jusqu'à leur expiration: %s", e)
+    
+    def subscribe(self, namespace: str, handler: Callable[[Optional[List[str]]], None]) -> None:
+        """
+        Transmet à un cache local les invalidations d'un espace de clés reçues des autres workers.
+        
+        Args:
+            namespace: Le préfixe des clés (avant le premier ":"), par exemple "calendar"
+            handler: La fonction recevant les clés invalidées, ou None pour tout invalider
+        """
+        self._handlers[namespace] = handler
+    
+    def start(self) -> None:
+        """Lance l'écoute des invalidations des autres workers (démarrage de l'application)"""
+        if self._listener is None:
+            self._listener = asyncio.ensure_future(self.backend.listen_invalidations(self._on_invalidation))
+    
+    async def close(self) -> None:
+        """Arrête l'écoute des invalidations et ferme le support"""
+        if self._listener is not None:
+            # Une annulation reçue pendant la lecture d'un message peut être convertie en
+            # délai dépassé par le client Redis, puis traitée comme une coupure : elle est répétée
+            while not self._listener.done():
+                self._listener.cancel()
+                await asyncio.wait((self._listener,), timeout=0.1)
+            if not self._listener.cancelled():
+                self._listener.exception()
+            self._listener = None
+        await self.backend.close()
+    
+    def _advance(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            self._generations[hash(key) % GENERATION_STRIPES] += 1
+    
+    def _on_invalidation(self, keys: Optional[List[str]]) -> None:
+        if keys is None:
+            self._generations = [generation + 1 for generation in self._generations]
+            for handler in self._handlers.values():
+                handler(None)
+            return
+        self._advance(keys)
+        by_namespace: Dict[str, List[str]] = {}
+        for key in keys:
+            by_namespace.setdefault(key.split(":", 1)[0], []).append(key)
+        for namespace, namespace_keys in by_namespace.items():
+            handler = self._handlers.get(namespace)
+            if handler is not None:
+                handler(namespace_keys)
+
+def cached_read(codec: EntityCodec) -> Callable:
+    """
+    Décorateur de méthode de repository `get_by_id(entity_id)` : lecture à travers le cache
+    `self.record_cache`.
+    
+    Args:
+        codec: Le codec de l'entité retournée, partagé avec les invalidations du repository
+    """
+    def decorator(method: Callable) -> Callable:
+        @functools.wraps(method)
+        async def wrapper(self, entity_id):
+            cache: Optional[RepositoryCache] = self.record_cache
+            session = current_session.get()
+            if cache is None or (session is not None and session.info.get(WRITES_KEY)):
+                return await method(self, entity_id)
+            key = cache.key(codec, entity_id)
+            entity = await cache.get(key, codec)
+            if entity is not None:
+                return entity
+            generation = cache.generation(key)
+            entity = await method(self, entity_id)
+            if entity is not None:
+                await cache.put(key, entity, codec, generation)
+            return entity
+        
+        return wrapper
+    return decorator
+
+def invalidate_after_commit(session, cache: RepositoryCache, keys: Sequence[str]) -> None:
+    """
+    Invalide des clés du cache après la validation de la transaction de la session.
+    
+    Args:
+        session: La session de l'écriture
+        cache: Le cache du repository
+        keys: Les clés modifiées
+    """
+    if keys:
+        after_commit(session, functools.partial(cache.invalidate, list(keys)))
@@ -0,0 +1,125 @@
+# shared/infrastructure/cache/serialization.py
+"""
+Sérialisation des entités du domaine pour les caches partagés.
+
+Une entité (dataclass) est convertie en liste de valeurs simples, dans l'ordre de ses
+champs (UUID, dates et énumérations en texte), puis encodée par orjson ou msgpack. La
+version du codec, dérivée des noms et types des champs, fait partie des clés : après un
+déploiement qui modifie une entité, les valeurs de l'ancienne forme ne sont jamais relues.
+"""
+import dataclasses
+import typing
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Generic, List, Tuple, Type, TypeVar
+from uuid import UUID
+
+T = TypeVar("T")
+
+def _identity(value: Any) -> Any:
+    return value
+
+def _converters(field_type: Any) -> Tuple[Callable[[Any], Any], Callable[[Any], Any]]:
+    # Optional[X] : conversion de X, None conservé
+    if typing.get_origin(field_type) is typing.Union:
+        arguments = [argument for argument in typing.get_args(field_type) if argument is not type(None)]
+        if len(arguments) == 1:
+            encode, decode = _converters(arguments[0])
+            return (
+                lambda value: None if value is None else encode(value),
+                lambda value: None if value is None else decode(value),
+            )
+        return _identity, _identity
+    if field_type is UUID:
+        return str, UUID
+    if field_type is datetime:
+        return datetime.isoformat, datetime.fromisoformat
+    if field_type is date:
+        return date.isoformat, date.fromisoformat
+    if isinstance(field_type, type) and issubclass(field_type, Enum):
+        return (lambda value: value.value), field_type
+    return _identity, _identity
+
+class EntityCodec(Generic[T]):
+    """Conversion d'une entité (dataclass) en valeurs simples et inversement"""
+    
+    def __init__(self, entity_class: Type[T]):
+        """
+        Initialise le codec.
+        
+        Args:
+            entity_class: La classe de l'entité (dataclass)
+        """
+        hints = typing.get_type_hints(entity_class)
+        fields = [field for field in dataclasses.fields(entity_class) if field.init]
+        self.entity_class = entity_class
+        self.name = entity_class.__name__.lower()
+        self._names = [field.name for field in fields]
+        converters = [_converters(hints[field.name]) for field in fields]
+        self._encoders = [encode for encode, _ in converters]
+        self._decoders = [decode for _, decode in converters]
+        signature = ",".join(f"{field.name}:{hints[field.name]}" for field in fields)
+        self.version = format(zlib.crc32(signature.encode()), "08x")
+    
+    def encode(self, entity: T) -> List[Any]:
+        """
+        Convertit une entité en liste de valeurs simples.
+        
+        Args:
+            entity: L'entité à convertir
+        
+        Returns:
+            List[Any]: Les valeurs des champs, dans l'ordre de la dataclass
+        """
+        return [encode(getattr(entity, name)) for name, encode in zip(self._names, self._encoders)]
+    
+    def decode(self, values: List[Any]) -> T:
+        """
+        Reconstruit une entité.
+        
+        Args:
+            values: Les valeurs produites par encode()
+        
+        Returns:
+            T: L'entité
+        """
+        return self.entity_class(**{
+            name: decode(value) for name, decode, value in zip(self._names, self._decoders, values)
+        })
+
+class OrjsonSerializer:
+    """Encodage JSON (orjson) des valeurs simples"""
+    
+    name = "orjson"
+    
+    def __init__(self):
+        # Import différé : orjson n'est requis que si ce sérialiseur est configuré
+        import orjson
+        
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+    
+    def dumps(self, value: Any) -> bytes:
+        return self._dumps(value)
+    
+    def loads(self, data: bytes) -> Any:
+        return self._loads(data)
+
+class MsgpackSerializer:
+    """Encodage binaire (msgpack) des valeurs simples, plus compact que JSON"""
+    
+    name = "msgpack"
+    
+    def __init__(self):
+        # Import différé : msgpack n'est requis que si ce sérialiseur est configuré
+        import msgpack
+        
+        self._packb = msgpack.packb
+        self._unpackb = msgpack.unpackb
+    
+    def dumps(self, value: Any) -> bytes:
+        return self._packb(value, use_bin_type=True)
+    
+    def loads(self, data: bytes) -> Any:
+        return self._unpackb(data, raw=False)
@@ -0,0 +1,117 @@
+# shared/infrastructure/cache/shared_memory_cache.py
+"""
+Cache partagé par les workers d'une même machine, dans un fichier projeté en mémoire
+(/dev/shm par défaut : pas d'écriture sur disque).
+
+Le fichier est une table à adressage direct : chaque clé correspond à un emplacement de
+taille fixe (empreinte blake2b de la clé, échéance, longueur, valeur) ; une clé qui tombe
+sur un emplacement occupé remplace la précédente. Les valeurs plus grandes qu'un
+emplacement ne sont pas mises en cache. Chaque emplacement est protégé par un verrou POSIX
+(fcntl.lockf, propre à chaque processus, donc valable après un fork) : lecture partagée,
+écriture exclusive, quelques microsecondes.
+
+Une suppression est immédiatement visible de tous les workers : aucun canal
+d'invalidation n'est nécessaire.
+"""
+import fcntl
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import time
+from typing import Optional, Sequence
+
+from shared.ports.secondary.cache_protocol import CacheProtocol
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# En-tête du fichier : signature, nombre et taille des emplacements
+FILE_HEADER = struct.Struct("<4sII4x")
+MAGIC = b"MSC1"
+
+# En-tête d'un emplacement : empreinte de la clé, échéance (horloge système), longueur
+SLOT_HEADER = struct.Struct("<16sdI4x")
+EMPTY_DIGEST = bytes(16)
+
+class SharedMemoryCache(CacheProtocol):
+    """
+    Adaptateur secondaire : cache en mémoire partagée entre les processus de la machine.
+    Implémente le port CacheProtocol.
+    """
+    
+    def __init__(self, path: str = "/dev/shm/medisecure-cache", slots: int = 4096, slot_size: int = 4096):
+        """
+        Ouvre (ou crée) le fichier du cache.
+        
+        Un fichier existant d'une autre géométrie est recréé vide : la géométrie ne se
+        modifie qu'après l'arrêt de tous les workers qui l'utilisent.
+        
+        Args:
+            path: Le chemin du fichier partagé
+            slots: Le nombre d'emplacements
+            slot_size: La taille d'un emplacement (octets, en-tête de 32 octets compris)
+        """
+        self.path = path
+        self.slots = slots
+        self.slot_size = slot_size
+        self.max_value_size = slot_size - SLOT_HEADER.size
+        size = FILE_HEADER.size + slots * slot_size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        # Initialisation sous verrou : plusieurs workers démarrent en même temps
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, FILE_HEADER.size, 0)
+        try:
+            expected = FILE_HEADER.pack(MAGIC, slots, slot_size)
+            if os.fstat(self._fd).st_size != size or os.pread(self._fd, FILE_HEADER.size, 0) != expected:
+                logger.info("Initialisation du cache partagé %s (%d emplacements de %d octets)", path, slots, slot_size)
+                os.ftruncate(self._fd, 0)
+                os.ftruncate(self._fd, size)
+                os.pwrite(self._fd, expected, 0)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, FILE_HEADER.size, 0)
+        self._map = mmap.mmap(self._fd, size)
+    
+    def _slot(self, key: str):
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        offset = FILE_HEADER.size + (int.from_bytes(digest[:8], "little") % self.slots) * self.slot_size
+        return digest, offset
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        digest, offset = self._slot(key)
+        fcntl.lockf(self._fd, fcntl.LOCK_SH, self.slot_size, offset)
+        try:
+            stored_digest, expires, length = SLOT_HEADER.unpack_from(self._map, offset)
+            if stored_digest != digest or expires <= time.time():
+                return None
+            start = offset + SLOT_HEADER.size
+            return self._map[start:start + length]
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)
+    
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        if len(value) > self.max_value_size:
+            logger.debug("Valeur trop grande pour le cache partagé (%d octets)", len(value))
+            return
+        digest, offset = self._slot(key)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_size, offset)
+        try:
+            SLOT_HEADER.pack_into(self._map, offset, digest, time.time() + ttl, len(value))
+            start = offset + SLOT_HEADER.size
+            self._map[start:start + len(value)] = value
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)
+    
+    async def delete(self, keys: Sequence[str]) -> None:
+        for key in keys:
+            digest, offset = self._slot(key)
+            fcntl.lockf(self._fd, fcntl.LOCK_EX, self.slot_size, offset)
+            try:
+                if SLOT_HEADER.unpack_from(self._map, offset)[0] == digest:
+                    SLOT_HEADER.pack_into(self._map, offset, EMPTY_DIGEST, 0.0, 0)
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN, self.slot_size, offset)
+    
+    async def close(self) -> None:
+        self._map.close()
+        os.close(self._fd)
@@ -0,0 +1,71 @@
+# shared/infrastructure/cache/tiered_cache.py
+"""
+Cache à deux niveaux : un niveau proche dans le processus (sans aller-retour réseau) devant
+un niveau lointain partagé par les workers.
+
+Le niveau proche est tenu à jour par les invalidations du niveau lointain (pub/sub) ; sa
+durée de vie, courte, borne l'écart si un message est perdu.
+"""
+from typing import List, Optional, Sequence
+
+from shared.infrastructure.cache.memory_cache import InMemoryCache
+from shared.ports.secondary.cache_protocol import CacheProtocol, InvalidationCallback
+
+class TieredCache(CacheProtocol):
+    """
+    Adaptateur secondaire : composition d'un cache proche et d'un cache lointain.
+    Implémente le port CacheProtocol.
+    """
+    
+    def __init__(self, near: InMemoryCache, far: CacheProtocol, near_ttl: float = 5.0):
+        """
+        Initialise le cache.
+        
+        Args:
+            near: Le cache du processus (InMemoryCache)
+            far: Le cache partagé (RedisCache)
+            near_ttl: La durée de vie maximale d'une valeur dans le niveau proche (secondes)
+        """
+        self.near = near
+        self.far = far
+        self.near_ttl = near_ttl
+        # Invalidations reçues : une valeur lue au loin pendant une invalidation n'est pas recopiée
+        self._invalidations = 0
+    
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.near.get(key)
+        if value is not None:
+            return value
+        invalidations = self._invalidations
+        value = await self.far.get(key)
+        if value is not None and invalidations == self._invalidations:
+            await self.near.set(key, value, self.near_ttl)
+        return value
+    
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self.far.set(key, value, ttl)
+        await self.near.set(key, value, min(ttl, self.near_ttl))
+    
+    async def delete(self, keys: Sequence[str]) -> None:
+        # Niveau proche d'abord : une lecture concurrente ne peut pas y retrouver la valeur
+        self._invalidations += 1
+        self.near.discard(keys)
+        await self.far.delete(keys)
+    
+    async def publish_invalidation(self, keys: Sequence[str]) -> None:
+        await self.far.publish_invalidation(keys)
+    
+    async def listen_invalidations(self, callback: InvalidationCallback) -> None:
+        def on_invalidation(keys: Optional[List[str]]) -> None:
+            self._invalidations += 1
+            if keys is None:
+                self.near.clear()
+            else:
+                self.near.discard(keys)
+            callback(keys)
+        
+        await self.far.listen_invalidations(on_invalidation)
+    
+    async def close(self) -> None:
+        await self.near.close()
+        await self.far.close()
@@ -0,0 +1,166 @@
+# shared/infrastructure/database/deadline.py
+"""
+Échéance de la requête en cours, propagée jusqu'à PostgreSQL.
+
+L'échéance est une ContextVar (comme la session de l'unité de travail) : les cas
+d'utilisation et les repositories n'ont rien à transmettre. À chaque ouverture de
+transaction, `install_statement_timeout()` exécute `SET LOCAL statement_timeout` avec le
+temps restant ; une requête SQL qui dépasse l'échéance est annulée par le serveur et
+rend sa connexion au pool au lieu de l'occuper jusqu'à la fin.
+
+Pour un client déconnecté, `RunningStatement` retient le processus serveur de la requête
+SQL en cours, que `cancel_statement()` annule (pg_cancel_backend). Annuler seulement la
+tâche ne suffit pas : SQLAlchemy ferme alors la connexion sans prévenir le serveur, qui
+poursuit la requête jusqu'à son terme.
+"""
+import logging
+import math
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import URL, Engine, make_url
+from sqlalchemy.orm import Session
+
+from shared.config import get_settings
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Délai de connexion pour envoyer une annulation (secondes)
+CANCEL_CONNECT_TIMEOUT = 2.0
+
+# Échéance de la requête en cours (horloge monotone, secondes), None si elle n'est pas bornée
+current_deadline: ContextVar[Optional[float]] = ContextVar("current_deadline", default=None)
+
+@contextmanager
+def deadline(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Borne la durée du bloc ; une échéance déjà plus proche est conservée.
+    
+    Args:
+        timeout: La durée maximale (secondes), ou None pour ne pas borner
+    """
+    if timeout is None:
+        yield
+        return
+    expires = time.monotonic() + timeout
+    enclosing = current_deadline.get()
+    if enclosing is not None:
+        expires = min(expires, enclosing)
+    token = current_deadline.set(expires)
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+def remaining() -> Optional[float]:
+    """
+    Retourne le temps restant avant l'échéance de la requête en cours.
+    
+    Returns:
+        Optional[float]: Le temps restant (secondes, négatif si dépassé), ou None sans échéance
+    """
+    expires = current_deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+def deadline_exceeded() -> bool:
+    """Indique si l'échéance de la requête en cours est dépassée"""
+    left = remaining()
+    return left is not None and left <= 0
+
+def request_timeout(timeout_ms: float) -> Callable:
+    """
+    Décorateur d'endpoint : durée maximale par défaut de la route (voir UnitOfWorkRoute).
+    
+    À placer sous le décorateur du router.
+    
+    Args:
+        timeout_ms: La durée maximale (millisecondes)
+    """
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.request_timeout_ms = timeout_ms
+        return endpoint
+    return decorator
+
+class RunningStatement:
+    """
+    Processus serveur (pid) exécutant la requête SQL en cours, None entre deux requêtes, et
+    URL du serveur (primaire ou réplica) qui l'exécute
+    """
+    
+    def __init__(self):
+        self.backend_pid: Optional[int] = None
+        self.url: Optional[URL] = None
+
+# Suivi des requêtes SQL de la requête HTTP en cours (None si elle n'est pas suivie)
+current_statement: ContextVar[Optional[RunningStatement]] = ContextVar("current_statement", default=None)
+
+async def cancel_statement(statement: RunningStatement) -> bool:
+    """
+    Annule côté serveur la requête SQL en cours, par une connexion hors du pool.
+    
+    La requête échoue (QueryCanceledError) : la transaction est annulée normalement et
+    la connexion retourne au pool.
+    
+    Args:
+        statement: Le suivi de la requête SQL
+    
+    Returns:
+        bool: True si une annulation a été envoyée
+    """
+    backend_pid = statement.backend_pid
+    if backend_pid is None:
+        return False
+    # Import différé : asyncpg n'est chargé qu'à la première annulation
+    import asyncpg
+    
+    url = (statement.url or make_url(get_settings().database_url)).set(drivername="postgresql")
+    try:
+        connection = await asyncpg.connect(
+            url.render_as_string(hide_password=False), timeout=CANCEL_CONNECT_TIMEOUT
+        )
+        try:
+            await connection.execute("SELECT pg_cancel_backend($1)", backend_pid)
+        finally:
+            await connection.close()
+    except Exception as e:
+        logger.warning("Annulation de la requête SQL impossible (pid %s): %s", backend_pid, e)
+        return False
+    return True
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    running = current_statement.get()
+    if running is not None:
+        driver_connection = conn.connection.driver_connection
+        get_server_pid = getattr(driver_connection, "get_server_pid", None)
+        running.backend_pid = get_server_pid() if get_server_pid is not None else None
+        running.url = conn.engine.url
+
+def _statement_done(conn, *args) -> None:
+    running = current_statement.get()
+    if running is not None:
+        running.backend_pid = None
+
+def _after_begin(session, transaction, connection) -> None:
+    left = remaining()
+    if left is None:
+        return
+    # Arrondi supérieur et minimum 1 ms : 0 désactiverait le délai
+    timeout_ms = max(1, math.ceil(left * 1000))
+    connection.exec_driver_sql(f"SET LOCAL statement_timeout = {timeout_ms}")
+
+def install_statement_timeout() -> None:
+    """
+    Enregistre (une seule fois) les événements qui appliquent l'échéance à chaque transaction
+    et suivent la requête SQL en cours
+    """
+    if not event.contains(Session, "after_begin", _after_begin):
+        event.listen(Session, "after_begin", _after_begin)
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _statement_done)
+        event.listen(Engine, "handle_error", _statement_done)
@@ -1,5 +1,5 @@
 # shared/infrastructure/database/models/appointment_model.py
-from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum
+from sqlalchemy import Column, String, DateTime, ForeignKey, Boolean, Text, Enum, Index, CheckConstraint, DDL, event, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 import uuid
@@ -19,26 +19,62 @@ class AppointmentStatus(str, enum.Enum):
 class AppointmentModel(Base):
     """Modèle SQLAlchemy pour la table des rendez-vous"""
     __tablename__ = "appointments"
+    __table_args__ = (
+        CheckConstraint("end_time > start_time", name="check_appointment_times"),
+        CheckConstraint("end_time - start_time <= interval '24 hours'", name="check_appointment_duration"),
+        # Index partiels (rendez-vous actifs) alignés sur les requêtes du repository :
+        # filtre d'égalité puis start_time pour servir l'ORDER BY sans tri
+        Index(
+            "idx_appointments_doctor_start", "doctor_id", "start_time",
+            postgresql_include=["end_time", "status"], postgresql_where=text("is_active")
+        ),
+        Index(
+            "idx_appointments_patient_start", "patient_id", "start_time",
+            postgresql_include=["end_time", "status"], postgresql_where=text("is_active")
+        ),
+        Index("idx_appointments_status_start", "status", "start_time", postgresql_where=text("is_active")),
+        Index(
+            "idx_appointments_start_active", "start_time",
+            postgresql_include=["end_time"], postgresql_where=text("is_active")
+        ),
+        # Partitionnement mensuel sur start_time (voir PartitionManager)
+        {"postgresql_partition_by": "RANGE (start_time)"},
+    )
     
+    # La clé de partitionnement (start_time) fait partie de la clé primaire
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     patient_id = Column(UUID(as_uuid=True), ForeignKey("patients.id"), nullable=False)
     doctor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
     
     # Informations sur le rendez-vous
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, primary_key=True, nullable=False)
     end_time = Column(DateTime, nullable=False)
-    status = Column(Enum(AppointmentStatus), default=AppointmentStatus.SCHEDULED)
+    status = Column(
+        Enum(
+            AppointmentStatus,
+            name="appointmentstatus",
+            values_callable=lambda statuses: [status.value for status in statuses]
+        ),
+        default=AppointmentStatus.SCHEDULED
+    )
     reason = Column(String, nullable=True)
     notes = Column(Text, nullable=True)
     
     # Métadonnées
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     
     # Relations
     patient = relationship("PatientModel", back_populates="appointments")
     doctor = relationship("UserModel", foreign_keys=[doctor_id])
     
     def __repr__(self):
-        return f"<Appointment {self.id} for patient {self.patient_id}>"
\ No newline at end of file
+        return f"<Appointment {self.id} for patient {self.patient_id}>"
+
+# Partition par défaut : accueille les rendez-vous hors des partitions mensuelles
+event.listen(
+    AppointmentModel.__table__,
+    "after_create",
+    DDL("CREATE TABLE IF NOT EXISTS appointments_default PARTITION OF appointments DEFAULT")
+)
\ No newline at end of file
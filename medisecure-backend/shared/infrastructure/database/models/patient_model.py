@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text
+from sqlalchemy import Column, String, Date, ForeignKey, DateTime, Boolean, Text, Index, text
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 import uuid
@@ -9,6 +9,10 @@ from shared.infrastructure.database.connection import Base
 class PatientModel(Base):
     """Modèle SQLAlchemy pour la table des patients"""
     __tablename__ = "patients"
+    __table_args__ = (
+        # Index partiel : seuls les patients actifs sont indexés
+        Index("idx_patients_email_active", "email", postgresql_where=text("is_active")),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
@@ -44,7 +48,7 @@ class PatientModel(Base):
     notes = Column(Text, nullable=True)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, nullable=False)
     
     # Relations
     user = relationship("UserModel", foreign_keys=[user_id])
@@ -0,0 +1,205 @@
+# medisecure-backend/shared/infrastructure/database/partition_manager.py
+from typing import List, Optional
+from datetime import date
+import re
+import logging
+
+from sqlalchemy import text
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+def month_start(day: date) -> date:
+    """
+    Retourne le premier jour du mois d'une date.
+    
+    Args:
+        day: La date de référence
+    
+    Returns:
+        date: Le premier jour du mois
+    """
+    return day.replace(day=1)
+
+def add_months(day: date, months: int) -> date:
+    """
+    Décale le premier jour du mois d'une date d'un nombre de mois.
+    
+    Args:
+        day: La date de référence
+        months: Le nombre de mois à ajouter (peut être négatif)
+    
+    Returns:
+        date: Le premier jour du mois obtenu
+    """
+    month_index = day.year * 12 + day.month - 1 + months
+    return date(month_index // 12, month_index % 12 + 1, 1)
+
+class PartitionManager:
+    """
+    Gère les partitions mensuelles d'une table partitionnée par plage sur une colonne date.
+    
+    Les partitions sont nommées `<table>_yYYYYmMM` et couvrent un mois calendaire.
+    Une partition par défaut (`<table>_default`) recueille les lignes hors des
+    partitions existantes ; elles sont déplacées lors de la création du mois concerné.
+    """
+    
+    def __init__(
+        self,
+        session_factory,
+        table_name: str = "appointments",
+        partition_column: str = "start_time",
+        archive_schema: str = "archive"
+    ):
+        """
+        Initialise le gestionnaire de partitions.
+        
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+            table_name: Le nom de la table partitionnée
+            partition_column: La colonne de partitionnement
+            archive_schema: Le schéma recevant les partitions archivées
+        """
+        self.session_factory = session_factory
+        self.table_name = table_name
+        self.partition_column = partition_column
+        self.archive_schema = archive_schema
+        self.default_partition = f"{table_name}_default"
+        self._partition_pattern = re.compile(rf"^{re.escape(table_name)}_y(\d{{4}})m(\d{{2}})$")
+    
+    def partition_name(self, month: date) -> str:
+        """
+        Retourne le nom de la partition d'un mois.
+        
+        Args:
+            month: Une date du mois concerné
+        
+        Returns:
+            str: Le nom de la partition
+        """
+        return f"{self.table_name}_y{month.year:04d}m{month.month:02d}"
+    
+    async def list_partitions(self) -> List[date]:
+        """
+        Liste les mois couverts par les partitions attachées à la table.
+        
+        Returns:
+            List[date]: Le premier jour de chaque mois partitionné, trié
+        """
+        query = text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE parent.relname = :table_name"
+        )
+        async with self.session_factory() as session:
+            result = await session.execute(query, {"table_name": self.table_name})
+            names = result.scalars().all()
+        
+        months = []
+        for name in names:
+            match = self._partition_pattern.match(name)
+            if match:
+                months.append(date(int(match.group(1)), int(match.group(2)), 1))
+        return sorted(months)
+    
+    async def create_partition(self, month: date) -> bool:
+        """
+        Crée la partition d'un mois si elle n'existe pas.
+        
+        Les lignes du mois déjà présentes dans la partition par défaut y sont
+        déplacées dans la même transaction, sans quoi l'attachement échouerait.
+        
+        Args:
+            month: Une date du mois à partitionner
+        
+        Returns:
+            bool: True si la partition a été créée, False si elle existait déjà
+        """
+        lower = month_start(month)
+        upper = add_months(lower, 1)
+        partition = self.partition_name(lower)
+        
+        if lower in await self.list_partitions():
+            return False
+        
+        logger.info("Création de la partition %s (%s -> %s)", partition, lower, upper)
+        async with self.session_factory() as session:
+            await session.execute(text(
+                f'CREATE TABLE "{partition}" '
+                f'(LIKE "{self.table_name}" INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+            ))
+            await session.execute(
+                text(
+                    f'WITH moved AS ('
+                    f'DELETE FROM "{self.default_partition}" '
+                    f'WHERE "{self.partition_column}" >= :lower AND "{self.partition_column}" < :upper RETURNING *) '
+                    f'INSERT INTO "{partition}" SELECT * FROM moved'
+                ),
+                {"lower": lower, "upper": upper}
+            )
+            await session.execute(text(
+                f'ALTER TABLE "{self.table_name}" ATTACH PARTITION "{partition}" '
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            ))
+            await session.commit()
+        return True
+    
+    async def ensure_future_partitions(self, months_ahead: int = 3, today: Optional[date] = None) -> List[str]:
+        """
+        Crée les partitions du mois courant et des mois à venir.
+        
+        Args:
+            months_ahead: Le nombre de mois à préparer après le mois courant
+            today: La date de référence (aujourd'hui par défaut)
+        
+        Returns:
+            List[str]: Les noms des partitions créées
+        """
+        current = month_start(today or date.today())
+        created = []
+        for offset in range(months_ahead + 1):
+            month = add_months(current, offset)
+            if await self.create_partition(month):
+                created.append(self.partition_name(month))
+        return created
+    
+    async def archive_partitions(
+        self,
+        retention_months: int,
+        detach_only: bool = False,
+        today: Optional[date] = None
+    ) -> List[str]:
+        """
+        Détache les partitions plus anciennes que la période de rétention.
+        
+        Une partition détachée n'est plus parcourue par les requêtes de l'application
+        mais conserve ses données. Sauf `detach_only`, elle est déplacée dans le
+        schéma d'archive.
+        
+        Args:
+            retention_months: Le nombre de mois conservés avant le mois courant
+            detach_only: Si True, la partition est détachée sans changer de schéma
+            today: La date de référence (aujourd'hui par défaut)
+        
+        Returns:
+            List[str]: Les noms des partitions archivées
+        """
+        cutoff = add_months(month_start(today or date.today()), -retention_months)
+        archived = []
+        
+        for month in await self.list_partitions():
+            if month >= cutoff:
+                continue
+            
+            partition = self.partition_name(month)
+            logger.info("Archivage de la partition %s (detach_only=%s)", partition, detach_only)
+            async with self.session_factory() as session:
+                await session.execute(text(f'ALTER TABLE "{self.table_name}" DETACH PARTITION "{partition}"'))
+                if not detach_only:
+                    await session.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{self.archive_schema}"'))
+                    await session.execute(text(f'ALTER TABLE "{partition}" SET SCHEMA "{self.archive_schema}"'))
+                await session.commit()
+            archived.append(partition)
+        
+        return archived
@@ -0,0 +1,72 @@
+# shared/infrastructure/database/raw_queries.py
+"""
+Requêtes SQL écrites à la main, exécutées directement par asyncpg sur la connexion de la
+session SQLAlchemy.
+
+Les adaptateurs « asyncpg » des repositories s'en servent pour leurs lectures simples les
+plus fréquentes : ni compilation SQLAlchemy, ni curseur adapté du dialecte, ni ORM (carte
+d'identité, instrumentation des attributs). asyncpg prépare chaque requête une fois par
+connexion et la conserve dans son cache de requêtes préparées (désactivé en mode PgBouncer
+transaction, voir connection.engine_options) ; ses lignes (Record) sont converties en
+entités par dépaquetage.
+
+La connexion est demandée à la session avec la requête SQLAlchemy équivalente comme clause :
+unité de travail, routage vers les réplicas et échéance (statement_timeout) s'appliquent
+comme pour les autres lectures. Les événements `before_cursor_execute` et
+`after_cursor_execute` du moteur sont émis : comptage et durée des requêtes SQL, journal
+des requêtes lentes et annulation des requêtes d'un client déconnecté sont inchangés.
+
+Le dialecte asyncpg ne démarre la transaction (BEGIN) qu'à la première requête qu'il
+exécute : une lecture faite avant toute autre requête s'exécute seule, en lecture validée,
+ce qui ne change rien pour une lecture isolée et économise BEGIN et COMMIT. Après une
+écriture de la session, elle s'exécute dans la transaction et voit ses modifications.
+Les erreurs sont celles d'asyncpg (asyncpg.PostgresError), non converties par SQLAlchemy.
+"""
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Executable
+
+async def fetch(session: AsyncSession, route: Executable, statement: str, *args: Any) -> List[Any]:
+    """
+    Exécute une requête et retourne toutes ses lignes.
+    
+    Args:
+        session: La session de l'appel (repository_session)
+        route: La requête SQLAlchemy équivalente, qui choisit la connexion (primaire ou réplica)
+        statement: La requête SQL, paramètres $1, $2...
+        *args: Les valeurs des paramètres
+    
+    Returns:
+        List[Any]: Les lignes asyncpg (Record)
+    """
+    return await _execute(session, route, statement, args, "fetch")
+
+async def fetchrow(session: AsyncSession, route: Executable, statement: str, *args: Any) -> Optional[Any]:
+    """
+    Exécute une requête et retourne sa première ligne.
+    
+    Args:
+        session: La session de l'appel (repository_session)
+        route: La requête SQLAlchemy équivalente, qui choisit la connexion (primaire ou réplica)
+        statement: La requête SQL, paramètres $1, $2...
+        *args: Les valeurs des paramètres
+    
+    Returns:
+        Optional[Any]: La ligne asyncpg (Record), ou None si la requête n'en retourne aucune
+    """
+    return await _execute(session, route, statement, args, "fetchrow")
+
+async def _execute(session: AsyncSession, route: Executable, statement: str, args: tuple, method: str) -> Any:
+    connection = (await session.connection(bind_arguments={"clause": route})).sync_connection
+    driver_connection = connection.connection.driver_connection
+    dispatch = connection.dispatch
+    # Contexte d'exécution des événements : les écouteurs y posent leurs propres attributs
+    context = SimpleNamespace()
+    dispatch.before_cursor_execute(connection, None, statement, args, context, False)
+    try:
+        return await getattr(driver_connection, method)(statement, *args)
+    finally:
+        # Émis aussi en cas d'erreur : les mesures et la requête en cours sont refermées
+        dispatch.after_cursor_execute(connection, None, statement, args, context, False)
@@ -0,0 +1,326 @@
+# shared/infrastructure/database/read_replicas.py
+"""
+Lectures sur des réplicas PostgreSQL (réplication en flux).
+
+Les méthodes de repository décorées par `replica_read` (listes, recherches, comptages)
+lisent sur un réplica ; toutes les autres requêtes SQL, y compris les lectures qui préparent
+une écriture (conflit de créneau, lecture par identifiant), restent sur le primaire. Le
+choix est fait à chaque requête SQL par `RoutingSession.get_bind` : une même unité de
+travail peut tenir une connexion au primaire et une connexion à un réplica.
+
+Une lecture routable retourne au primaire :
+- si la session a déjà écrit dans sa transaction (elle doit relire ses écritures) ;
+- si l'utilisateur a validé une écriture depuis moins de DB_REPLICA_STICKY_SECONDS (suivi
+  propre au worker : une requête servie par un autre worker peut lire un réplica) ;
+- si aucun réplica n'est à jour.
+
+`ReplicaRouter` mesure le retard de chaque réplica toutes les DB_REPLICA_CHECK_INTERVAL
+secondes : il relève la position du journal (WAL) du primaire, puis le temps mis par le
+réplica pour la rejouer. Cette mesure ne dépend ni des horloges des serveurs ni de
+l'activité du primaire (un réplica déconnecté d'un primaire inactif ne manque rien). Un
+réplica en retard de plus de DB_REPLICA_MAX_LAG secondes, injoignable ou non mesuré
+récemment n'est pas utilisé.
+"""
+import asyncio
+import functools
+import itertools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional, Sequence
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.orm import Session
+
+from shared.infrastructure.database.unit_of_work import current_user_id
+from shared.infrastructure.observability.metrics import DB_REPLICA_LAG, DB_REPLICA_READS
+from shared.infrastructure.observability.pool_metrics import InstrumentedAsyncPool
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Clés de session.info : écriture dans la transaction en cours, réplica de la transaction
+WRITES_KEY = "replica_routing_writes"
+REPLICA_KEY = "replica_routing_engine"
+
+# Lectures routables de la transaction pas encore routées
+_UNROUTED = object()
+
+# Intervalle entre deux lectures de la position d'un réplica pendant une mesure (secondes)
+LAG_POLL_INTERVAL = 0.01
+
+# Nombre d'intervalles sans mesure après lequel un réplica n'est plus utilisé
+STALE_CHECKS = 3
+
+# Position du journal (octets) : écrite sur le primaire, rejouée sur le réplica (NULL hors réplication)
+PRIMARY_LSN = text("SELECT pg_current_wal_lsn() - '0/0'::pg_lsn")
+REPLAY_LSN = text("SELECT pg_last_wal_replay_lsn() - '0/0'::pg_lsn")
+
+# Méthode de repository routable vers un réplica en cours d'exécution
+_replica_read: ContextVar[bool] = ContextVar("replica_read", default=False)
+
+def replica_read(method: Callable) -> Callable:
+    """
+    Décorateur de méthode de repository : ses requêtes SQL peuvent être servies par un réplica.
+    
+    À réserver aux lectures qui tolèrent un léger retard et ne préparent aucune écriture.
+    """
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        token = _replica_read.set(True)
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            _replica_read.reset(token)
+    return wrapper
+
+class Replica:
+    """Moteur d'un réplica et dernière mesure de son retard"""
+    
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.name = f"{engine.url.host}:{engine.url.port or 5432}/{engine.url.database}"
+        # Retard mesuré (secondes), None tant qu'il n'est pas connu
+        self.lag: Optional[float] = None
+        self.checked_at = 0.0
+
+class ReplicaRouter:
+    """
+    Choix du moteur des lectures routables : un réplica à jour (tour à tour), sinon le primaire.
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine],
+        max_lag: float = 1.0,
+        sticky_seconds: float = 5.0,
+        check_interval: float = 1.0
+    ):
+        """
+        Initialise le routeur ; les réplicas ne sont utilisés qu'après leur première mesure.
+        
+        Args:
+            primary: Le moteur du primaire (position de référence du journal)
+            replicas: Les moteurs des réplicas
+            max_lag: Le retard maximal d'un réplica utilisé (secondes)
+            sticky_seconds: La durée pendant laquelle un utilisateur qui a écrit lit le primaire
+            check_interval: L'intervalle entre deux mesures du retard (secondes)
+        """
+        self.primary = primary
+        self.replicas = [Replica(engine) for engine in replicas]
+        self.max_lag = max_lag
+        self.sticky_seconds = sticky_seconds
+        self.check_interval = check_interval
+        self._turn = itertools.count()
+        # Utilisateur -> fin de la lecture sur le primaire (horloge monotone)
+        self._writers: Dict[str, float] = {}
+        self._monitor: Optional[asyncio.Task] = None
+    
+    def route(self, session_wrote: bool, user_id: Optional[str]) -> Optional[AsyncEngine]:
+        """
+        Choisit le moteur d'une lecture routable.
+        
+        Args:
+            session_wrote: True si la transaction de la lecture a déjà écrit
+            user_id: L'utilisateur de la requête en cours, s'il est connu
+        
+        Returns:
+            Optional[AsyncEngine]: Le réplica à utiliser, ou None pour le primaire
+        """
+        if session_wrote:
+            DB_REPLICA_READS.inc("primary", "session_write")
+            return None
+        if self.is_sticky(user_id):
+            DB_REPLICA_READS.inc("primary", "user_write")
+            return None
+        healthy = self.healthy()
+        if not healthy:
+            DB_REPLICA_READS.inc("primary", "replica_lag")
+            return None
+        DB_REPLICA_READS.inc("replica", "ok")
+        return healthy[next(self._turn) % len(healthy)].engine
+    
+    def healthy(self) -> List[Replica]:
+        """
+        Retourne les réplicas utilisables.
+        
+        Returns:
+            List[Replica]: Les réplicas mesurés récemment dont le retard est acceptable
+        """
+        oldest = time.monotonic() - STALE_CHECKS * self.check_interval - self.max_lag
+        return [
+            replica for replica in self.replicas
+            if replica.lag is not None and replica.lag <= self.max_lag and replica.checked_at >= oldest
+        ]
+    
+    def note_write(self, user_id: Optional[str]) -> None:
+        """
+        Enregistre une écriture validée : les lectures de l'utilisateur vont au primaire
+        pendant sticky_seconds.
+        
+        Args:
+            user_id: L'utilisateur de l'écriture (None : écriture hors requête authentifiée)
+        """
+        if user_id is None or self.sticky_seconds <= 0:
+            return
+        now = time.monotonic()
+        if len(self._writers) >= 1024:
+            self._writers = {user: until for user, until in self._writers.items() if until > now}
+        self._writers[user_id] = now + self.sticky_seconds
+    
+    def is_sticky(self, user_id: Optional[str]) -> bool:
+        """
+        Indique si les lectures de l'utilisateur doivent aller au primaire.
+        
+        Args:
+            user_id: L'utilisateur de la requête en cours
+        
+        Returns:
+            bool: True si l'utilisateur a validé une écriture récemment
+        """
+        if user_id is None:
+            return False
+        until = self._writers.get(user_id)
+        return until is not None and until > time.monotonic()
+    
+    async def check(self) -> None:
+        """Mesure le retard de tous les réplicas (une fois)"""
+        try:
+            async with self.primary.connect() as connection:
+                target = (await connection.execute(PRIMARY_LSN)).scalar_one()
+        except Exception as e:
+            logger.warning("Position du journal du primaire illisible: %s", e)
+            return
+        await asyncio.gather(*(self._check_replica(replica, target) for replica in self.replicas))
+    
+    def start(self) -> None:
+        """Lance la mesure périodique du retard des réplicas (démarrage de l'application)"""
+        if self._monitor is None:
+            self._monitor = asyncio.ensure_future(self._run())
+    
+    async def close(self) -> None:
+        """Arrête la mesure du retard et ferme les connexions aux réplicas"""
+        if self._monitor is not None:
+            self._monitor.cancel()
+            await asyncio.wait((self._monitor,))
+            self._monitor = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+    
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.check()
+            except Exception as e:
+                logger.exception("Erreur de la mesure du retard des réplicas: %s", e)
+            await asyncio.sleep(self.check_interval)
+    
+    async def _check_replica(self, replica: Replica, target: int) -> None:
+        # Temps mis par le réplica pour rejouer la position du primaire relevée au début de
+        # la mesure ; au-delà de max_lag, le réplica est écarté sans attendre davantage
+        started = time.monotonic()
+        lag: Optional[float] = None
+        try:
+            async with replica.engine.connect() as connection:
+                while True:
+                    replayed = (await connection.execute(REPLAY_LSN)).scalar_one()
+                    elapsed = time.monotonic() - started
+                    if replayed is None:
+                        logger.warning("Le réplica %s n'est pas en réplication: ignoré", replica.name)
+                        break
+                    if replayed >= target or elapsed > self.max_lag:
+                        lag = elapsed
+                        break
+                    await asyncio.sleep(LAG_POLL_INTERVAL)
+        except Exception as e:
+            logger.warning("Retard du réplica %s inconnu: %s", replica.name, e)
+        if lag is not None and lag > self.max_lag and (replica.lag is None or replica.lag <= self.max_lag):
+            logger.warning("Réplica %s en retard (plus de %.3f s): lectures sur le primaire", replica.name, self.max_lag)
+        replica.lag = lag
+        replica.checked_at = time.monotonic()
+        DB_REPLICA_LAG.set(float("inf") if lag is None else lag, replica.name)
+
+class RoutingSession(Session):
+    """
+    Session synchrone (sous-jacente à AsyncSession) qui envoie les lectures routables au
+    réplica choisi par le routeur.
+    
+    Le serveur choisi est conservé jusqu'à la fin de la transaction : les lectures d'une
+    requête voient le même état.
+    """
+    
+    def __init__(self, *args, replica_router: Optional[ReplicaRouter] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.replica_router = replica_router
+    
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        router = self.replica_router
+        if router is not None:
+            if self._flushing or (clause is not None and not getattr(clause, "is_select", False)):
+                # Écriture (ou SQL textuel) : la suite de la transaction lit le primaire
+                self.info[WRITES_KEY] = True
+            elif clause is not None and _replica_read.get():
+                # Choix conservé pour la transaction (None : primaire), sauf écriture depuis
+                wrote = bool(self.info.get(WRITES_KEY))
+                replica = self.info.get(REPLICA_KEY, _UNROUTED)
+                if replica is _UNROUTED or (wrote and replica is not None):
+                    replica = router.route(wrote, current_user_id.get())
+                    self.info[REPLICA_KEY] = replica
+                if replica is not None:
+                    return replica.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kwargs)
+
+def _remember_writes(session) -> None:
+    session.info.pop(REPLICA_KEY, None)
+    if session.info.pop(WRITES_KEY, None) and session.replica_router is not None:
+        session.replica_router.note_write(current_user_id.get())
+
+def _forget_transaction(session) -> None:
+    session.info.pop(REPLICA_KEY, None)
+    session.info.pop(WRITES_KEY, None)
+
+event.listen(RoutingSession, "after_commit", _remember_writes)
+event.listen(RoutingSession, "after_rollback", _forget_transaction)
+
+def create_replica_router(
+    primary: AsyncEngine,
+    replica_urls: str,
+    engine_options: Dict,
+    max_lag: float = 1.0,
+    sticky_seconds: float = 5.0,
+    check_interval: float = 1.0
+) -> Optional[ReplicaRouter]:
+    """
+    Crée le routeur des réplicas configurés.
+    
+    Args:
+        primary: Le moteur du primaire
+        replica_urls: Les URLs des réplicas, séparées par des virgules
+        engine_options: Les options de moteur du primaire (pool, pre-ping...), reprises
+            pour chaque réplica
+        max_lag: Le retard maximal d'un réplica utilisé (secondes)
+        sticky_seconds: La durée pendant laquelle un utilisateur qui a écrit lit le primaire
+        check_interval: L'intervalle entre deux mesures du retard (secondes)
+    
+    Returns:
+        Optional[ReplicaRouter]: Le routeur, ou None sans réplica configuré
+    """
+    urls = [url.strip() for url in replica_urls.split(",") if url.strip()]
+    if not urls:
+        return None
+    engines = []
+    for url in urls:
+        # L'application n'utilise que le driver asynchrone
+        url = make_url(url)
+        if url.drivername == "postgresql":
+            url = url.set(drivername="postgresql+asyncpg")
+        engines.append(create_async_engine(url, poolclass=InstrumentedAsyncPool, **engine_options))
+    logger.info("Lectures routables vers %d réplica(s)", len(engines))
+    return ReplicaRouter(
+        primary, engines, max_lag=max_lag, sticky_seconds=sticky_seconds, check_interval=check_interval
+    )
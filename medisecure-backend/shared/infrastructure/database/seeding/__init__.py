@@ -0,0 +1,3 @@
+# shared/infrastructure/database/seeding/__init__.py
+from shared.infrastructure.database.seeding.generators import DatasetSpec, synthetic_id
+from shared.infrastructure.database.seeding.seeder import DatasetSeeder
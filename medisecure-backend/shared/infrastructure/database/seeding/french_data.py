@@ -0,0 +1,141 @@
+# shared/infrastructure/database/seeding/french_data.py
+"""
+Données de référence pondérées utilisées par le générateur de jeux de données.
+
+Les poids sont relatifs : ils reproduisent grossièrement les fréquences observées en
+France (prénoms, noms, villes, groupes sanguins, pyramide des âges), sans prétention
+statistique.
+"""
+
+# Prénoms par genre, pondérés pour mêler plusieurs générations
+FEMALE_FIRST_NAMES = [
+    ("Marie", 30), ("Nathalie", 14), ("Isabelle", 14), ("Sylvie", 13), ("Catherine", 13),
+    ("Françoise", 12), ("Martine", 12), ("Christine", 11), ("Monique", 10), ("Sandrine", 10),
+    ("Valérie", 10), ("Nicole", 9), ("Stéphanie", 9), ("Céline", 9), ("Julie", 9),
+    ("Aurélie", 8), ("Camille", 8), ("Sophie", 8), ("Émilie", 8), ("Anne", 8),
+    ("Chantal", 7), ("Brigitte", 7), ("Laura", 7), ("Léa", 7), ("Manon", 7),
+    ("Chloé", 6), ("Emma", 6), ("Sarah", 6), ("Pauline", 6), ("Jeanne", 6),
+    ("Louise", 5), ("Inès", 5), ("Alice", 5), ("Jade", 5), ("Lina", 4),
+    ("Mathilde", 4), ("Claire", 4), ("Hélène", 4), ("Agnès", 3), ("Océane", 3),
+]
+
+MALE_FIRST_NAMES = [
+    ("Jean", 30), ("Pierre", 16), ("Michel", 15), ("Philippe", 14), ("Alain", 13),
+    ("Nicolas", 13), ("Christophe", 12), ("Patrick", 12), ("Daniel", 11), ("Laurent", 11),
+    ("Frédéric", 10), ("Stéphane", 10), ("Éric", 10), ("David", 10), ("Thomas", 9),
+    ("Julien", 9), ("Sébastien", 9), ("Olivier", 9), ("Bernard", 8), ("Jacques", 8),
+    ("François", 8), ("Alexandre", 8), ("Maxime", 7), ("Antoine", 7), ("Kevin", 6),
+    ("Lucas", 7), ("Hugo", 6), ("Louis", 6), ("Gabriel", 6), ("Léo", 6),
+    ("Arthur", 5), ("Raphaël", 5), ("Jules", 5), ("Mathis", 4), ("Nathan", 4),
+    ("Paul", 5), ("Romain", 5), ("Guillaume", 5), ("Mohamed", 4), ("Yanis", 3),
+]
+
+LAST_NAMES = [
+    ("Martin", 235), ("Bernard", 105), ("Thomas", 100), ("Petit", 95), ("Robert", 92),
+    ("Richard", 90), ("Durand", 85), ("Dubois", 84), ("Moreau", 82), ("Laurent", 80),
+    ("Simon", 78), ("Michel", 77), ("Lefebvre", 75), ("Leroy", 72), ("Roux", 70),
+    ("David", 68), ("Bertrand", 67), ("Morel", 66), ("Fournier", 65), ("Girard", 64),
+    ("Bonnet", 62), ("Dupont", 62), ("Lambert", 61), ("Fontaine", 60), ("Rousseau", 60),
+    ("Vincent", 59), ("Muller", 58), ("Lefèvre", 57), ("Faure", 56), ("André", 56),
+    ("Mercier", 55), ("Blanc", 55), ("Guérin", 54), ("Boyer", 53), ("Garnier", 52),
+    ("Chevalier", 52), ("François", 51), ("Legrand", 50), ("Gauthier", 50), ("Garcia", 50),
+    ("Perrin", 49), ("Robin", 48), ("Clément", 48), ("Morin", 47), ("Nicolas", 47),
+    ("Henry", 46), ("Roussel", 46), ("Mathieu", 45), ("Gautier", 45), ("Masson", 44),
+    ("Marchand", 44), ("Duval", 43), ("Denis", 43), ("Dumont", 42), ("Marie", 42),
+    ("Lemaire", 41), ("Noël", 41), ("Meyer", 40), ("Dufour", 40), ("Meunier", 39),
+    ("Brun", 39), ("Blanchard", 38), ("Giraud", 38), ("Joly", 37), ("Rivière", 37),
+    ("Lucas", 36), ("Brunet", 36), ("Gaillard", 35), ("Barbier", 35), ("Arnaud", 34),
+    ("Martinez", 34), ("Gérard", 33), ("Roche", 33), ("Renard", 32), ("Schmitt", 32),
+    ("Roy", 31), ("Leroux", 31), ("Colin", 30), ("Vidal", 30), ("Caron", 30),
+    ("Picard", 29), ("Roger", 29), ("Fabre", 28), ("Aubert", 28), ("Lemoine", 28),
+    ("Renaud", 27), ("Dumas", 27), ("Lacroix", 26), ("Olivier", 26), ("Philippe", 26),
+    ("Bourgeois", 25), ("Pierre", 25), ("Benoît", 24), ("Rey", 24), ("Leclerc", 24),
+    ("Payet", 23), ("Rolland", 23), ("Leclercq", 22), ("Guillaume", 22), ("Lecomte", 22),
+]
+
+# (ville, code postal, poids) : le poids suit approximativement la population
+CITIES = [
+    ("Paris", "75015", 210), ("Marseille", "13008", 87), ("Lyon", "69003", 52), ("Toulouse", "31000", 49),
+    ("Nice", "06000", 34), ("Nantes", "44000", 32), ("Montpellier", "34000", 30), ("Strasbourg", "67000", 29),
+    ("Bordeaux", "33000", 26), ("Lille", "59000", 24), ("Rennes", "35000", 22), ("Reims", "51100", 18),
+    ("Toulon", "83000", 18), ("Saint-Étienne", "42000", 17), ("Le Havre", "76600", 17), ("Grenoble", "38000", 16),
+    ("Dijon", "21000", 16), ("Angers", "49000", 15), ("Villeurbanne", "69100", 15), ("Nîmes", "30000", 15),
+    ("Clermont-Ferrand", "63000", 15), ("Aix-en-Provence", "13090", 14), ("Le Mans", "72000", 14),
+    ("Brest", "29200", 14), ("Tours", "37000", 14), ("Amiens", "80000", 13), ("Limoges", "87000", 13),
+    ("Annecy", "74000", 13), ("Perpignan", "66000", 12), ("Boulogne-Billancourt", "92100", 12),
+    ("Metz", "57000", 12), ("Besançon", "25000", 12), ("Orléans", "45000", 11), ("Rouen", "76000", 11),
+    ("Caen", "14000", 11), ("Nancy", "54000", 10), ("Argenteuil", "95100", 10), ("Montreuil", "93100", 10),
+    ("Roubaix", "59100", 10), ("Avignon", "84000", 9), ("Poitiers", "86000", 9), ("La Rochelle", "17000", 8),
+    ("Pau", "64000", 8), ("Ajaccio", "20000", 7), ("Saint-Denis", "97400", 15),
+]
+
+STREET_TYPES = [("rue", 60), ("avenue", 15), ("boulevard", 8), ("place", 5), ("allée", 5), ("chemin", 4), ("impasse", 3)]
+
+STREET_NAMES = [
+    "de la République", "Victor Hugo", "Jean Jaurès", "de la Paix", "Pasteur", "du Général de Gaulle",
+    "de la Gare", "Gambetta", "Jules Ferry", "de l'Église", "des Écoles", "du Moulin", "Voltaire",
+    "de la Mairie", "Anatole France", "Carnot", "de la Liberté", "Émile Zola", "des Lilas", "du Château",
+    "Saint-Michel", "Foch", "Jean Moulin", "de Verdun", "des Tilleuls", "du Stade", "de Bretagne",
+    "Marcel Pagnol", "des Acacias", "de la Fontaine",
+]
+
+# Pyramide des âges par tranche de 5 ans (borne basse, poids en % de la population)
+AGE_BANDS = [
+    (0, 5.2), (5, 5.9), (10, 6.2), (15, 6.1), (20, 5.7), (25, 5.7), (30, 6.1), (35, 6.3),
+    (40, 6.1), (45, 6.5), (50, 6.5), (55, 6.6), (60, 6.2), (65, 5.7), (70, 5.4), (75, 3.8),
+    (80, 2.9), (85, 2.1), (90, 1.0), (95, 0.3),
+]
+
+BLOOD_TYPES = [
+    ("A+", 37), ("O+", 36), ("B+", 9), ("A-", 7), ("O-", 6), ("AB+", 3), ("B-", 1), ("AB-", 1),
+]
+
+INSURANCE_PROVIDERS = [
+    ("MGEN", 18), ("Harmonie Mutuelle", 16), ("Malakoff Humanis", 12), ("AG2R La Mondiale", 11),
+    ("MAAF Santé", 8), ("Groupama", 8), ("AXA", 8), ("Allianz", 6), ("MACIF", 7), ("Swiss Life", 4),
+    ("Complémentaire santé solidaire", 6),
+]
+
+# (nom, réaction) ; la prévalence globale est fixée par le générateur
+ALLERGIES = [
+    ("pollens", "rhinite saisonnière"), ("acariens", "rhinite"), ("pénicilline", "urticaire"),
+    ("arachide", "œdème de Quincke"), ("lactose", "troubles digestifs"), ("gluten", "troubles digestifs"),
+    ("latex", "eczéma de contact"), ("aspirine", "bronchospasme"), ("piqûres d'hyménoptères", "choc anaphylactique"),
+    ("fruits à coque", "urticaire"), ("poils de chat", "conjonctivite"), ("sulfamides", "éruption cutanée"),
+]
+
+# (maladie, âge minimal, prévalence relative)
+CHRONIC_DISEASES = [
+    ("hypertension artérielle", 35, 30), ("diabète de type 2", 40, 15), ("asthme", 0, 12),
+    ("hypercholestérolémie", 35, 18), ("BPCO", 45, 6), ("insuffisance cardiaque", 60, 5),
+    ("arthrose", 50, 14), ("hypothyroïdie", 25, 8), ("dépression", 18, 9), ("diabète de type 1", 0, 2),
+    ("fibrillation auriculaire", 60, 5), ("polyarthrite rhumatoïde", 30, 2),
+]
+
+# Traitement associé à chaque maladie chronique : (médicament, posologie)
+MEDICATIONS = {
+    "hypertension artérielle": ("amlodipine 5 mg", "1 cp le matin"),
+    "diabète de type 2": ("metformine 1000 mg", "1 cp matin et soir"),
+    "asthme": ("salbutamol 100 µg", "2 bouffées si besoin"),
+    "hypercholestérolémie": ("atorvastatine 20 mg", "1 cp le soir"),
+    "BPCO": ("tiotropium 18 µg", "1 inhalation par jour"),
+    "insuffisance cardiaque": ("bisoprolol 2,5 mg", "1 cp le matin"),
+    "arthrose": ("paracétamol 1 g", "jusqu'à 3 fois par jour"),
+    "hypothyroïdie": ("lévothyroxine 75 µg", "1 cp à jeun"),
+    "dépression": ("sertraline 50 mg", "1 cp le matin"),
+    "diabète de type 1": ("insuline glargine", "20 UI le soir"),
+    "fibrillation auriculaire": ("apixaban 5 mg", "1 cp matin et soir"),
+    "polyarthrite rhumatoïde": ("méthotrexate 15 mg", "1 fois par semaine"),
+}
+
+APPOINTMENT_REASONS = [
+    ("Consultation de suivi", 30), ("Renouvellement d'ordonnance", 20), ("Consultation", 15),
+    ("Bilan annuel", 8), ("Vaccination", 6), ("Syndrome grippal", 6), ("Douleurs lombaires", 4),
+    ("Certificat médical", 4), ("Résultats d'analyses", 4), ("Suivi de grossesse", 2), ("Bilan pédiatrique", 1),
+]
+
+# Activité relative par mois (janvier = 1) : pic hivernal, creux estival
+MONTHLY_ACTIVITY = {
+    1: 1.20, 2: 1.15, 3: 1.05, 4: 1.00, 5: 0.90, 6: 0.90,
+    7: 0.75, 8: 0.60, 9: 1.00, 10: 1.05, 11: 1.10, 12: 1.00,
+}
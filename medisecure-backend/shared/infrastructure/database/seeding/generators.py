@@ -0,0 +1,445 @@
+# shared/infrastructure/database/seeding/generators.py
+import bisect
+import hashlib
+import json
+import random
+import unicodedata
+import uuid
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from shared.infrastructure.database.partition_manager import add_months, month_start
+from shared.infrastructure.database.seeding import french_data
+
+# Taille des lots de patients : chaque lot a sa propre graine, le résultat ne dépend pas du nombre de workers
+PATIENT_CHUNK_SIZE = 10000
+
+# Mot de passe inutilisable : les médecins générés ne peuvent pas se connecter
+UNUSABLE_PASSWORD = "!"
+
+USER_COLUMNS = (
+    "id", "email", "hashed_password", "first_name", "last_name", "role", "is_active", "created_at", "updated_at",
+)
+
+PATIENT_COLUMNS = (
+    "id", "first_name", "last_name", "date_of_birth", "gender", "address", "city", "postal_code", "country",
+    "phone_number", "email", "blood_type", "allergies", "chronic_diseases", "current_medications",
+    "has_consent", "consent_date", "gdpr_consent", "insurance_provider", "insurance_id",
+    "created_at", "updated_at", "is_active",
+)
+
+APPOINTMENT_COLUMNS = (
+    "id", "patient_id", "doctor_id", "start_time", "end_time", "status", "reason",
+    "created_at", "updated_at", "is_active",
+)
+
+# Jours fériés fixes (mois, jour) : aucun rendez-vous n'y est planifié
+PUBLIC_HOLIDAYS = {(1, 1), (5, 1), (5, 8), (7, 14), (8, 15), (11, 1), (11, 11), (12, 25)}
+
+# Plages de consultation (début, fin) en minutes depuis minuit
+OPENING_HOURS = ((8 * 60 + 30, 12 * 60 + 30), (14 * 60, 18 * 60 + 30))
+
+# Répartition des statuts selon que le rendez-vous est passé ou à venir à la date de référence
+PAST_STATUSES = [("completed", 82), ("cancelled", 10), ("missed", 5), ("confirmed", 2), ("scheduled", 1)]
+FUTURE_STATUSES = [("scheduled", 65), ("confirmed", 28), ("cancelled", 7)]
+
+class WeightedChoice:
+    """Tirage pondéré à partir de poids relatifs (cumuls précalculés)"""
+    
+    def __init__(self, items: Sequence[Tuple[Any, float]]):
+        self.values = [value for value, _ in items]
+        self.cumulative = []
+        total = 0.0
+        for _, weight in items:
+            total += weight
+            self.cumulative.append(total)
+        self.total = total
+    
+    def pick(self, rng: random.Random) -> Any:
+        return self.values[bisect.bisect_right(self.cumulative, rng.random() * self.total)]
+
+FEMALE_FIRST_NAMES = WeightedChoice(french_data.FEMALE_FIRST_NAMES)
+MALE_FIRST_NAMES = WeightedChoice(french_data.MALE_FIRST_NAMES)
+LAST_NAMES = WeightedChoice(french_data.LAST_NAMES)
+CITIES = WeightedChoice([((city, postal_code), weight) for city, postal_code, weight in french_data.CITIES])
+STREET_TYPES = WeightedChoice(french_data.STREET_TYPES)
+AGE_BANDS = WeightedChoice(french_data.AGE_BANDS)
+BLOOD_TYPES = WeightedChoice(french_data.BLOOD_TYPES)
+INSURANCE_PROVIDERS = WeightedChoice(french_data.INSURANCE_PROVIDERS)
+APPOINTMENT_REASONS = WeightedChoice(french_data.APPOINTMENT_REASONS)
+PAST_STATUS_CHOICE = WeightedChoice(PAST_STATUSES)
+FUTURE_STATUS_CHOICE = WeightedChoice(FUTURE_STATUSES)
+SLOT_MINUTES = WeightedChoice([(15, 3), (20, 4), (30, 3)])
+WORKING_DAYS_PER_WEEK = WeightedChoice([(5, 70), (4, 25), (3, 5)])
+MAX_MONTHLY_ACTIVITY = max(french_data.MONTHLY_ACTIVITY.values())
+
+class DatasetSpec:
+    """
+    Paramètres d'un jeu de données synthétique.
+    
+    Deux jeux générés avec les mêmes paramètres sont identiques, quel que soit le
+    nombre de workers utilisés pour les charger.
+    """
+    
+    def __init__(
+        self,
+        patients: int,
+        appointments: int,
+        doctors: int,
+        seed: int = 42,
+        first_month: date = date(2024, 1, 1),
+        months: int = 24,
+        reference_date: Optional[date] = None,
+        email_domain: str = "example.com"
+    ):
+        """
+        Initialise les paramètres.
+        
+        Args:
+            patients: Le nombre de patients
+            appointments: Le nombre de rendez-vous
+            doctors: Le nombre de médecins
+            seed: La graine de tous les tirages aléatoires
+            first_month: Le premier mois couvert par les rendez-vous
+            months: Le nombre de mois couverts par les rendez-vous
+            reference_date: La date "du jour" séparant rendez-vous passés et à venir
+                (par défaut aux deux tiers de la période)
+            email_domain: Le domaine des adresses email générées
+        """
+        self.patients = patients
+        self.appointments = appointments
+        self.doctors = doctors
+        self.seed = seed
+        self.first_month = month_start(first_month)
+        self.months = months
+        self.reference_date = reference_date or add_months(self.first_month, months * 2 // 3)
+        self.email_domain = email_domain
+    
+    @property
+    def period_end(self) -> date:
+        return add_months(self.first_month, self.months)
+    
+    @property
+    def scale(self) -> Dict[str, int]:
+        return {"patients": self.patients, "appointments": self.appointments, "doctors": self.doctors}
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            **self.scale,
+            "seed": self.seed,
+            "first_month": self.first_month.isoformat(),
+            "months": self.months,
+            "reference_date": self.reference_date.isoformat(),
+            "email_domain": self.email_domain,
+        }
+
+@dataclass
+class DoctorProfile:
+    """Rythme de travail d'un médecin généré"""
+    slot_minutes: int
+    weekdays: Tuple[int, ...]
+    activity: float
+    
+    def daily_slots(self) -> List[int]:
+        """Retourne les débuts de créneaux d'une journée, en minutes depuis minuit"""
+        return [
+            start
+            for opening, closing in OPENING_HOURS
+            for start in range(opening, closing - self.slot_minutes + 1, self.slot_minutes)
+        ]
+    
+    def working_days(self, spec: DatasetSpec) -> List[date]:
+        """Retourne les jours travaillés de la période, hors jours fériés"""
+        days = []
+        day = spec.first_month
+        while day < spec.period_end:
+            if day.weekday() in self.weekdays and (day.month, day.day) not in PUBLIC_HOLIDAYS:
+                days.append(day)
+            day += timedelta(days=1)
+        return days
+
+def synthetic_id(kind: str, number: int) -> uuid.UUID:
+    """
+    Retourne l'identifiant déterministe d'une ligne générée.
+    
+    Il ne dépend pas de la graine : les mêmes numéros désignent les mêmes lignes d'un jeu à l'autre.
+    
+    Args:
+        kind: Le type de ligne ("doctor", "patient" ou "appointment")
+        number: Le numéro de la ligne, à partir de 1
+    
+    Returns:
+        uuid.UUID: L'identifiant de la ligne
+    """
+    return uuid.UUID(hashlib.md5(f"{kind}-{number}".encode()).hexdigest())
+
+def _rng(spec: DatasetSpec, kind: str, number: int) -> random.Random:
+    return random.Random(f"{spec.seed}:{kind}:{number}")
+
+def _email_part(value: str) -> str:
+    ascii_value = unicodedata.normalize("NFKD", value).encode("ascii", "ignore").decode("ascii").lower()
+    return "".join(character for character in ascii_value if character.isalnum() or character == "-")
+
+def _pick_name(rng: random.Random, gender: str) -> str:
+    if gender == "female" or (gender == "other" and rng.random() < 0.5):
+        return FEMALE_FIRST_NAMES.pick(rng)
+    return MALE_FIRST_NAMES.pick(rng)
+
+def _random_datetime(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    return start + timedelta(seconds=rng.randrange(max(int((end - start).total_seconds()), 1)))
+
+def doctor_profile(spec: DatasetSpec, number: int) -> DoctorProfile:
+    rng = _rng(spec, "doctor-profile", number)
+    weekdays = tuple(sorted(rng.sample(range(5), WORKING_DAYS_PER_WEEK.pick(rng))))
+    # Activité log-normale : quelques médecins très sollicités, la plupart dans la moyenne
+    return DoctorProfile(slot_minutes=SLOT_MINUTES.pick(rng), weekdays=weekdays, activity=rng.lognormvariate(0, 0.5))
+
+def generate_doctors(spec: DatasetSpec) -> List[tuple]:
+    """
+    Génère les comptes des médecins (colonnes USER_COLUMNS).
+    
+    Args:
+        spec: Les paramètres du jeu de données
+    
+    Returns:
+        List[tuple]: Une ligne par médecin
+    """
+    rows = []
+    for number in range(1, spec.doctors + 1):
+        rng = _rng(spec, "doctor", number)
+        first_name = _pick_name(rng, rng.choice(("female", "male")))
+        last_name = LAST_NAMES.pick(rng)
+        created_at = _random_datetime(
+            rng,
+            datetime.combine(add_months(spec.first_month, -36), time()),
+            datetime.combine(spec.first_month, time())
+        )
+        rows.append((
+            synthetic_id("doctor", number),
+            f"dr.{_email_part(first_name)}.{_email_part(last_name)}{number}@{spec.email_domain}",
+            UNUSABLE_PASSWORD,
+            first_name,
+            last_name,
+            "DOCTOR",
+            True,
+            created_at,
+            created_at,
+        ))
+    return rows
+
+def patient_chunks(spec: DatasetSpec) -> int:
+    return (spec.patients + PATIENT_CHUNK_SIZE - 1) // PATIENT_CHUNK_SIZE
+
+def _insurance_number(rng: random.Random, gender: str, date_of_birth: date, postal_code: str) -> str:
+    # Numéro de sécurité sociale fictif : sexe, année et mois de naissance, département, clé
+    department = postal_code[:2] if not postal_code.startswith("97") else "97"
+    number = (
+        f"{2 if gender == 'female' else 1}{date_of_birth:%y%m}{department}"
+        f"{rng.randint(1, 999):03d}{rng.randint(1, 999):03d}"
+    )
+    return f"{number}{97 - int(number) % 97:02d}"
+
+def _medical_record(rng: random.Random, age: int, reference_year: int) -> Tuple[Dict, Dict, Dict]:
+    allergies = {}
+    if rng.random() < 0.25:
+        for name, reaction in rng.sample(french_data.ALLERGIES, rng.choice((1, 1, 1, 2))):
+            allergies[name] = reaction
+    
+    chronic_diseases = {}
+    medications = {}
+    # La probabilité d'une maladie chronique croît avec l'âge
+    if rng.random() < min(0.85, age / 90):
+        eligible = WeightedChoice([
+            (name, weight) for name, minimal_age, weight in french_data.CHRONIC_DISEASES if age >= minimal_age
+        ])
+        for _ in range(rng.choice((1, 1, 2, 2, 3))):
+            name = eligible.pick(rng)
+            if name in chronic_diseases:
+                continue
+            chronic_diseases[name] = {"depuis": reference_year - rng.randint(0, max(age // 3, 1))}
+            if rng.random() < 0.85:
+                medication, dosage = french_data.MEDICATIONS[name]
+                medications[medication] = dosage
+    return allergies, chronic_diseases, medications
+
+def generate_patients(spec: DatasetSpec, chunk: int) -> List[tuple]:
+    """
+    Génère un lot de patients (colonnes PATIENT_COLUMNS).
+    
+    Les champs JSONB sont sérialisés en texte, prêts pour un COPY.
+    
+    Args:
+        spec: Les paramètres du jeu de données
+        chunk: L'indice du lot, de 0 à patient_chunks(spec) - 1
+    
+    Returns:
+        List[tuple]: Les patients numérotés chunk * PATIENT_CHUNK_SIZE + 1 et suivants
+    """
+    rng = _rng(spec, "patients", chunk)
+    reference = datetime.combine(spec.reference_date, time())
+    registration_start = datetime.combine(add_months(spec.first_month, -60), time())
+    first = chunk * PATIENT_CHUNK_SIZE + 1
+    rows = []
+    for number in range(first, min(first + PATIENT_CHUNK_SIZE, spec.patients + 1)):
+        roll = rng.random()
+        gender = "female" if roll < 0.515 else "male" if roll < 0.995 else "other"
+        first_name = _pick_name(rng, gender)
+        last_name = LAST_NAMES.pick(rng)
+        age = AGE_BANDS.pick(rng) + rng.randrange(5)
+        date_of_birth = spec.reference_date - timedelta(days=age * 365 + rng.randrange(365))
+        city, postal_code = CITIES.pick(rng)
+        
+        email = None
+        if rng.random() < (0.85 if age >= 16 else 0.3):
+            email = f"{_email_part(first_name)}.{_email_part(last_name)}{number}@{spec.email_domain}"
+        phone_number = None
+        if rng.random() < 0.9:
+            phone_number = f"0{rng.choice('67')}{rng.randrange(10 ** 8):08d}"
+        
+        allergies, chronic_diseases, medications = _medical_record(rng, age, spec.reference_date.year)
+        created_at = _random_datetime(rng, registration_start, reference)
+        updated_at = _random_datetime(rng, created_at, reference) if rng.random() < 0.3 else created_at
+        has_consent = rng.random() < 0.97
+        insured = rng.random() < 0.9
+        rows.append((
+            synthetic_id("patient", number),
+            first_name,
+            last_name,
+            date_of_birth,
+            gender,
+            f"{rng.randint(1, 150)} {STREET_TYPES.pick(rng)} {rng.choice(french_data.STREET_NAMES)}" if rng.random() < 0.85 else None,
+            city,
+            postal_code,
+            "France",
+            phone_number,
+            email,
+            BLOOD_TYPES.pick(rng) if rng.random() < 0.7 else None,
+            json.dumps(allergies, ensure_ascii=False),
+            json.dumps(chronic_diseases, ensure_ascii=False),
+            json.dumps(medications, ensure_ascii=False),
+            has_consent,
+            created_at if has_consent else None,
+            rng.random() < 0.95,
+            INSURANCE_PROVIDERS.pick(rng) if insured else None,
+            _insurance_number(rng, gender, date_of_birth, postal_code) if insured else None,
+            created_at,
+            updated_at,
+            rng.random() >= 0.02,
+        ))
+    return rows
+
+def allocate_appointments(spec: DatasetSpec) -> List[int]:
+    """
+    Répartit les rendez-vous entre les médecins selon leur activité et leur temps de travail.
+    
+    Args:
+        spec: Les paramètres du jeu de données
+    
+    Returns:
+        List[int]: Le nombre de rendez-vous de chaque médecin (indice 0 = médecin 1)
+    
+    Raises:
+        ValueError: Si les agendas de la période ne peuvent pas contenir tous les rendez-vous
+    """
+    profiles = [doctor_profile(spec, number) for number in range(1, spec.doctors + 1)]
+    capacities = [len(profile.working_days(spec)) * len(profile.daily_slots()) for profile in profiles]
+    if spec.appointments > sum(capacities):
+        raise ValueError(
+            f"{spec.appointments} rendez-vous dépassent la capacité des agendas "
+            f"({sum(capacities)} créneaux pour {spec.doctors} médecins sur {spec.months} mois)"
+        )
+    
+    counts = [0] * spec.doctors
+    remaining = spec.appointments
+    available = [index for index in range(spec.doctors) if capacities[index]]
+    while remaining:
+        # Répartition au plus fort reste ; les agendas pleins cèdent leur part aux autres
+        weights = {index: profiles[index].activity * len(profiles[index].weekdays) for index in available}
+        total = sum(weights.values())
+        shares = {index: remaining * weight / total for index, weight in weights.items()}
+        allotted = {index: int(share) for index, share in shares.items()}
+        leftover = remaining - sum(allotted.values())
+        for index in sorted(available, key=lambda index: (allotted[index] - shares[index], index))[:leftover]:
+            allotted[index] += 1
+        for index, count in allotted.items():
+            count = min(count, capacities[index] - counts[index])
+            counts[index] += count
+            remaining -= count
+        available = [index for index in available if counts[index] < capacities[index]]
+    return counts
+
+def _pick_patient(rng: random.Random, spec: DatasetSpec, doctor_number: int) -> int:
+    # 80% des rendez-vous concernent la patientèle du médecin (patients n ≡ médecin modulo le nombre de médecins),
+    # les autres un patient quelconque ; dans les deux cas, quelques patients consultent beaucoup plus que les autres
+    if doctor_number <= spec.patients and rng.random() < 0.8:
+        panel_size = (spec.patients - doctor_number) // spec.doctors + 1
+        return doctor_number + spec.doctors * int(panel_size * rng.random() ** 2)
+    return 1 + int(spec.patients * rng.random() ** 1.5)
+
+def generate_appointments(spec: DatasetSpec, doctor_number: int, count: int, first_number: int) -> List[tuple]:
+    """
+    Génère l'agenda d'un médecin (colonnes APPOINTMENT_COLUMNS).
+    
+    Les créneaux ne se chevauchent pas, suivent l'activité saisonnière et sont numérotés
+    dans l'ordre chronologique à partir de first_number.
+    
+    Args:
+        spec: Les paramètres du jeu de données
+        doctor_number: Le numéro du médecin
+        count: Le nombre de rendez-vous (voir allocate_appointments)
+        first_number: Le numéro du premier rendez-vous
+    
+    Returns:
+        List[tuple]: Les rendez-vous du médecin
+    """
+    profile = doctor_profile(spec, doctor_number)
+    days = profile.working_days(spec)
+    slots = profile.daily_slots()
+    capacity = len(days) * len(slots)
+    rng = _rng(spec, "appointments", doctor_number)
+    
+    if count >= capacity * 0.8:
+        chosen = set(rng.sample(range(capacity), count))
+    else:
+        # Tirage par rejet pondéré par l'activité du mois (pic hivernal, creux estival)
+        chosen = set()
+        while len(chosen) < count:
+            slot = rng.randrange(capacity)
+            if slot in chosen:
+                continue
+            if rng.random() * MAX_MONTHLY_ACTIVITY <= french_data.MONTHLY_ACTIVITY[days[slot // len(slots)].month]:
+                chosen.add(slot)
+    
+    doctor_id = synthetic_id("doctor", doctor_number)
+    reference = datetime.combine(spec.reference_date, time())
+    duration = timedelta(minutes=profile.slot_minutes)
+    rows = []
+    for offset, slot in enumerate(sorted(chosen)):
+        start_time = datetime.combine(days[slot // len(slots)], time()) + timedelta(minutes=slots[slot % len(slots)])
+        end_time = start_time + duration
+        # Délai de prise de rendez-vous d'environ deux semaines en moyenne
+        created_at = min(start_time - timedelta(minutes=int(rng.expovariate(1 / (14 * 24 * 60))) + 30), reference)
+        if start_time < reference:
+            status = PAST_STATUS_CHOICE.pick(rng)
+        else:
+            status = FUTURE_STATUS_CHOICE.pick(rng)
+        if status in ("completed", "missed"):
+            updated_at = end_time
+        elif status == "cancelled":
+            updated_at = _random_datetime(rng, created_at, min(start_time, max(reference, created_at)))
+        else:
+            updated_at = created_at
+        rows.append((
+            synthetic_id("appointment", first_number + offset),
+            synthetic_id("patient", _pick_patient(rng, spec, doctor_number)),
+            doctor_id,
+            start_time,
+            end_time,
+            status,
+            APPOINTMENT_REASONS.pick(rng),
+            created_at,
+            updated_at,
+            rng.random() >= 0.03,
+        ))
+    return rows
@@ -0,0 +1,244 @@
+# shared/infrastructure/database/seeding/seeder.py
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from shared.infrastructure.database.connection import Base
+# Importer les modèles pour enregistrer leurs tables dans Base.metadata
+from shared.infrastructure.database.models import UserModel, PatientModel, AppointmentModel
+from shared.infrastructure.database.partition_manager import PartitionManager, add_months
+from shared.infrastructure.database.seeding.generators import (
+    APPOINTMENT_COLUMNS, PATIENT_COLUMNS, PATIENT_CHUNK_SIZE, USER_COLUMNS, DatasetSpec,
+    allocate_appointments, generate_appointments, generate_doctors, generate_patients, patient_chunks,
+    synthetic_id
+)
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Table décrivant le jeu de données chargé, pour réutiliser une base déjà remplie
+METADATA_TABLE = "seed_metadata"
+
+# Nombre indicatif de rendez-vous par tâche de chargement (les agendas ne sont pas découpés)
+APPOINTMENT_BATCH_SIZE = 50000
+
+# Tables chargées sans index secondaires ni clés étrangères, reconstruits en une passe après le COPY
+BULK_LOADED_TABLES = ("patients", "appointments")
+
+def _asyncpg_dsn(database_url: str) -> str:
+    return database_url.replace("postgresql+asyncpg://", "postgresql://")
+
+async def _copy_rows(dsn: str, table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    connection = await asyncpg.connect(dsn)
+    try:
+        await connection.copy_records_to_table(table, records=rows, columns=columns)
+    finally:
+        await connection.close()
+
+async def _drop_secondary_structures(conn) -> List[Tuple[str, str, str]]:
+    """Supprime index secondaires et clés étrangères des tables chargées ; retourne les clés à recréer"""
+    foreign_keys = []
+    for table_name in BULK_LOADED_TABLES:
+        result = await conn.execute(text(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = CAST(:table_name AS regclass) AND contype = 'f'"
+        ), {"table_name": table_name})
+        for name, definition in result:
+            await conn.execute(text(f"ALTER TABLE {table_name} DROP CONSTRAINT {name}"))
+            foreign_keys.append((table_name, name, definition))
+        await conn.run_sync(lambda sync_conn: [index.drop(sync_conn) for index in Base.metadata.tables[table_name].indexes])
+    return foreign_keys
+
+async def _create_secondary_structures(conn, foreign_keys: List[Tuple[str, str, str]]) -> None:
+    for table_name in BULK_LOADED_TABLES:
+        await conn.run_sync(lambda sync_conn: [index.create(sync_conn) for index in Base.metadata.tables[table_name].indexes])
+    for table_name, name, definition in foreign_keys:
+        await conn.execute(text(f"ALTER TABLE {table_name} ADD CONSTRAINT {name} {definition}"))
+
+def _load_patients(dsn: str, spec: DatasetSpec, chunk: int) -> int:
+    rows = generate_patients(spec, chunk)
+    asyncio.run(_copy_rows(dsn, "patients", PATIENT_COLUMNS, rows))
+    return len(rows)
+
+def _load_appointments(dsn: str, spec: DatasetSpec, agendas: List[Tuple[int, int, int]]) -> int:
+    rows = []
+    for doctor_number, count, first_number in agendas:
+        rows.extend(generate_appointments(spec, doctor_number, count, first_number))
+    asyncio.run(_copy_rows(dsn, "appointments", APPOINTMENT_COLUMNS, rows))
+    return len(rows)
+
+class DatasetSeeder:
+    """
+    Charge un jeu de données synthétique réaliste dans une base PostgreSQL dédiée.
+    
+    Les lignes sont générées en Python (voir generators) et chargées par COPY, en
+    parallèle dans plusieurs processus. Le schéma est recréé : la base est entièrement
+    réécrite, sauf si elle contient déjà un jeu généré avec les mêmes paramètres.
+    """
+    
+    def __init__(self, database_url: str, spec: DatasetSpec, workers: Optional[int] = None):
+        """
+        Initialise le chargeur.
+        
+        Args:
+            database_url: L'URL SQLAlchemy (asyncpg) de la base à remplir
+            spec: Les paramètres du jeu de données
+            workers: Le nombre de processus de génération et de chargement (par défaut, un par CPU)
+        """
+        self.database_url = database_url
+        self.spec = spec
+        self.workers = workers or os.cpu_count() or 1
+    
+    @property
+    def scale(self) -> Dict[str, int]:
+        return self.spec.scale
+    
+    async def _is_loaded(self, conn) -> bool:
+        exists = await conn.scalar(text(f"SELECT to_regclass('{METADATA_TABLE}') IS NOT NULL"))
+        if not exists:
+            return False
+        spec = await conn.scalar(text(f"SELECT spec FROM {METADATA_TABLE}"))
+        return spec == self.spec.to_dict()
+    
+    async def load(self, force: bool = False) -> bool:
+        """
+        Crée le schéma et charge les données si la base ne les contient pas déjà.
+        
+        Args:
+            force: Si True, la base est régénérée même si les paramètres correspondent
+        
+        Returns:
+            bool: True si les données ont été générées
+        
+        Raises:
+            ValueError: Si les agendas ne peuvent pas contenir tous les rendez-vous
+        """
+        engine = create_async_engine(self.database_url)
+        try:
+            async with engine.begin() as conn:
+                if not force and await self._is_loaded(conn):
+                    return False
+            
+            # Vérifier la capacité des agendas avant de détruire quoi que ce soit
+            counts = allocate_appointments(self.spec)
+            
+            async with engine.begin() as conn:
+                await conn.execute(text(f"DROP TABLE IF EXISTS {METADATA_TABLE}"))
+                await conn.run_sync(Base.metadata.drop_all)
+                await conn.run_sync(Base.metadata.create_all)
+                foreign_keys = await _drop_secondary_structures(conn)
+            
+            # Une partition par mois : les rendez-vous n'atterrissent pas dans la partition par défaut
+            manager = PartitionManager(sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False))
+            for offset in range(self.spec.months):
+                await manager.create_partition(add_months(self.spec.first_month, offset))
+            
+            started = time.monotonic()
+            await self._load_rows(counts)
+            logger.info("Données chargées en %.1fs: %s", time.monotonic() - started, self.scale)
+            
+            started = time.monotonic()
+            async with engine.begin() as conn:
+                await _create_secondary_structures(conn, foreign_keys)
+            logger.info("Index et clés étrangères reconstruits en %.1fs", time.monotonic() - started)
+            
+            async with engine.begin() as conn:
+                await conn.execute(text(f"CREATE TABLE {METADATA_TABLE} (spec JSONB NOT NULL, loaded_at TIMESTAMP NOT NULL)"))
+                await conn.execute(
+                    text(f"INSERT INTO {METADATA_TABLE} VALUES (CAST(:spec AS jsonb), now())"),
+                    {"spec": json.dumps(self.spec.to_dict())}
+                )
+            
+            async with engine.connect() as conn:
+                autocommit_conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                await autocommit_conn.execute(text("VACUUM ANALYZE"))
+            return True
+        finally:
+            await engine.dispose()
+    
+    def _appointment_tasks(self, counts: List[int]) -> List[List[Tuple[int, int, int]]]:
+        tasks = []
+        batch = []
+        batch_size = 0
+        next_number = 1
+        for index, count in enumerate(counts):
+            if count:
+                batch.append((index + 1, count, next_number))
+                batch_size += count
+                next_number += count
+            if batch_size >= APPOINTMENT_BATCH_SIZE:
+                tasks.append(batch)
+                batch = []
+                batch_size = 0
+        if batch:
+            tasks.append(batch)
+        return tasks
+    
+    async def _load_rows(self, counts: List[int]) -> None:
+        dsn = _asyncpg_dsn(self.database_url)
+        # Ordre imposé par les clés étrangères : médecins, patients, puis rendez-vous
+        await _copy_rows(dsn, "users", USER_COLUMNS, generate_doctors(self.spec))
+        
+        patient_tasks = [(_load_patients, dsn, self.spec, chunk) for chunk in range(patient_chunks(self.spec))]
+        appointment_tasks = [(_load_appointments, dsn, self.spec, agendas) for agendas in self._appointment_tasks(counts)]
+        
+        if self.workers == 1:
+            for function, *args in patient_tasks + appointment_tasks:
+                await asyncio.to_thread(function, *args)
+            return
+        
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            for label, tasks in (("patients", patient_tasks), ("rendez-vous", appointment_tasks)):
+                loaded = 0
+                for future in asyncio.as_completed([loop.run_in_executor(executor, *task) for task in tasks]):
+                    loaded += await future
+                logger.info("%s %s chargés", loaded, label)
+    
+    def sample_patient(self) -> Dict[str, Any]:
+        """Retourne un patient actif avec email, situé au milieu du jeu de données"""
+        number = max(self.spec.patients // 2, 1)
+        chunk = (number - 1) // PATIENT_CHUNK_SIZE
+        rows = generate_patients(self.spec, chunk)
+        for row in rows[(number - 1) % PATIENT_CHUNK_SIZE:] + rows:
+            patient = dict(zip(PATIENT_COLUMNS, row))
+            if patient["is_active"] and patient["email"]:
+                return patient
+        raise ValueError("Aucun patient actif avec email dans le lot échantillonné")
+    
+    def sample_patient_id(self) -> uuid.UUID:
+        return self.sample_patient()["id"]
+    
+    def sample_patient_email(self) -> str:
+        return self.sample_patient()["email"]
+    
+    def sample_doctor(self) -> Dict[str, Any]:
+        return dict(zip(USER_COLUMNS, generate_doctors(self.spec)[max(self.spec.doctors // 2, 1) - 1]))
+    
+    def sample_doctor_id(self) -> uuid.UUID:
+        return self.sample_doctor()["id"]
+    
+    def sample_doctor_email(self) -> str:
+        return self.sample_doctor()["email"]
+    
+    def sample_appointment_id(self) -> uuid.UUID:
+        return synthetic_id("appointment", max(self.spec.appointments // 2, 1))
+    
+    def sample_day(self) -> date:
+        # Un mardi proche de la date de référence : jour ouvré, rendez-vous passés et à venir
+        reference = self.spec.reference_date
+        return reference + timedelta(days=(1 - reference.weekday()) % 7)
+    
+    def sample_slot(self) -> datetime:
+        return datetime.combine(self.sample_day(), datetime.min.time()).replace(hour=10)
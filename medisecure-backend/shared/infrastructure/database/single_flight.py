@@ -0,0 +1,160 @@
+# shared/infrastructure/database/single_flight.py
+"""
+Regroupement (single-flight) des lectures identiques simultanées.
+
+Quand plusieurs requêtes lisent la même chose au même moment (le calendrier du mois à
+l'ouverture du cabinet, le dossier d'un patient), seule la première exécute la requête SQL ;
+les suivantes attendent son résultat. Le regroupement est local au processus (un worker)
+et ne dure que le temps de la requête : ce n'est pas un cache.
+
+Chaque appelant reçoit ses propres copies des entités (copie superficielle : les
+valeurs imbriquées, dictionnaires médicaux compris, sont partagées et ne doivent pas être
+modifiées en place).
+
+Une session qui a déjà écrit ne participe à aucun regroupement : elle doit relire ses
+propres modifications, que les autres requêtes ne doivent pas voir avant validation.
+"""
+import asyncio
+import copy
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from shared.infrastructure.database.deadline import deadline_exceeded
+from shared.infrastructure.database.unit_of_work import current_session
+from shared.infrastructure.observability.metrics import SINGLE_FLIGHT_CALLS
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Clé de session.info signalant une écriture dans la transaction en cours
+WRITES_KEY = "single_flight_writes"
+
+# Regroupement actif (install_single_flight), le suivi des écritures étant alors en place
+_installed = False
+
+class _LeaderAbandoned(Exception):
+    """L'appel partagé a été interrompu pour une raison propre à la requête qui le portait"""
+
+class SingleFlight:
+    """
+    Appels en cours, indexés par (méthode, arguments).
+    
+    Toutes les opérations s'exécutent dans la boucle d'événements, sans verrou.
+    """
+    
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Future] = {}
+    
+    def __len__(self) -> int:
+        return len(self._flights)
+    
+    async def do(self, name: str, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Exécute l'appel, ou attend celui déjà en cours pour la même clé.
+        
+        Args:
+            name: Le nom de l'appel (métriques)
+            key: La clé de l'appel (méthode et arguments)
+            call: La fonction lançant l'appel
+        
+        Returns:
+            Any: Le résultat de l'appel, copié pour les appelants qui l'ont attendu
+        """
+        while True:
+            flight = self._flights.get(key)
+            if flight is None:
+                break
+            SINGLE_FLIGHT_CALLS.inc(name, "coalesced")
+            try:
+                # shield : un appelant annulé n'interrompt pas l'appel partagé
+                return _share(await asyncio.shield(flight))
+            except _LeaderAbandoned:
+                # Appel interrompu (client parti, échéance) : un des appelants le relance
+                continue
+        
+        flight = asyncio.get_running_loop().create_future()
+        self._flights[key] = flight
+        SINGLE_FLIGHT_CALLS.inc(name, "executed")
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            flight.set_exception(_LeaderAbandoned())
+            raise
+        except Exception as e:
+            flight.set_exception(_LeaderAbandoned() if deadline_exceeded() else e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            del self._flights[key]
+            # Exception marquée comme consultée : pas d'avertissement asyncio sans appelant en attente
+            flight.exception()
+
+# Appels en cours du processus
+_single_flight = SingleFlight()
+
+def single_flight(method: Callable) -> Callable:
+    """
+    Décorateur de méthode de repository : regroupe les appels simultanés de mêmes arguments.
+    
+    À réserver aux lectures sans verrou (pas de SELECT ... FOR UPDATE) : les appelants
+    regroupés ne partagent que le résultat, pas la transaction.
+    """
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        session = current_session.get()
+        if not _installed or (session is not None and session.info.get(WRITES_KEY)):
+            return await method(self, *args, **kwargs)
+        name = f"{type(self).__name__}.{method.__name__}"
+        key = _key(name, args, kwargs)
+        if key is None:
+            return await method(self, *args, **kwargs)
+        return await _single_flight.do(name, key, lambda: method(self, *args, **kwargs))
+    return wrapper
+
+def _key(name: str, args: Tuple, kwargs: Dict[str, Any]):
+    key = (name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+def _share(result: Any) -> Any:
+    if isinstance(result, list):
+        return [copy.copy(item) for item in result]
+    if result is None or isinstance(result, (int, str)):
+        return result
+    return copy.copy(result)
+
+def _mark_orm_write(orm_execute_state) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[WRITES_KEY] = True
+
+def _mark_flush(session, flush_context) -> None:
+    session.info[WRITES_KEY] = True
+
+def _clear_writes(session) -> None:
+    session.info.pop(WRITES_KEY, None)
+
+def install_write_tracking() -> None:
+    """
+    Enregistre (une seule fois) le suivi des écritures par session (WRITES_KEY), utilisé
+    aussi par le cache des repositories
+    """
+    if not event.contains(Session, "do_orm_execute", _mark_orm_write):
+        event.listen(Session, "do_orm_execute", _mark_orm_write)
+        event.listen(Session, "after_flush", _mark_flush)
+        event.listen(Session, "after_commit", _clear_writes)
+        event.listen(Session, "after_rollback", _clear_writes)
+
+def install_single_flight() -> None:
+    """Active le regroupement et le suivi des écritures par session"""
+    global _installed
+    install_write_tracking()
+    _installed = True
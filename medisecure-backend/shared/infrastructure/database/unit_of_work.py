@@ -0,0 +1,300 @@
+# shared/infrastructure/database/unit_of_work.py
+"""
+Unité de travail : une session et une transaction par requête (ou par cas d'utilisation).
+
+`UnitOfWork` lie une AsyncSession au contexte courant (ContextVar). Les repositories
+l'obtiennent via `repository_session()` et ne valident rien eux-mêmes : la transaction est
+validée une seule fois à la sortie de l'unité de travail, ou annulée en cas d'erreur. Une
+requête n'emprunte ainsi qu'une connexion au pool, et les opérations en plusieurs étapes
+(vérification puis insertion) sont atomiques.
+
+Hors unité de travail (scripts, tests), `repository_session()` ouvre une session courte,
+validée à la fin de l'appel.
+
+`after_commit()` diffère une action (invalidation de cache) jusqu'à la validation de la
+transaction : elle est abandonnée si la transaction est annulée. Une action asynchrone
+(invalidation d'un cache partagé) est attendue juste après la validation, avant la réponse.
+
+La session n'étant pas utilisable par plusieurs tâches à la fois, les appels de repository
+d'une même unité de travail doivent rester séquentiels (pas d'asyncio.gather).
+
+`UnitOfWorkRoute` borne aussi la durée de la requête (voir deadline.py) et l'annule si le
+client se déconnecte : la requête SQL en cours est interrompue et sa connexion libérée.
+"""
+import asyncio
+import functools
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar, Token
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Request, Response, status
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from shared.config import get_settings
+from shared.infrastructure.database.deadline import (
+    RunningStatement, cancel_statement, current_statement, deadline, deadline_exceeded, remaining
+)
+from shared.infrastructure.observability.metrics import REQUESTS_ABANDONED
+from shared.infrastructure.observability.request_timing import TimedRoute
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# En-tête par lequel le client réduit la durée maximale de la requête (millisecondes)
+TIMEOUT_HEADER = "x-request-timeout"
+
+# Statut journalisé pour une requête abandonnée par le client (convention nginx)
+CLIENT_CLOSED_REQUEST = 499
+
+# Temps laissé au traitement pour se terminer après l'annulation de sa requête SQL, ou
+# après l'échéance avant d'être interrompu (secondes)
+CANCEL_GRACE = 1.0
+
+# Clés de session.info des actions à exécuter après validation, et des actions asynchrones
+# lancées par la validation qui restent à attendre
+AFTER_COMMIT_KEY = "after_commit"
+PENDING_AFTER_COMMIT_KEY = "after_commit_pending"
+
+# Session de l'unité de travail en cours (None hors unité de travail)
+current_session: ContextVar[Optional[AsyncSession]] = ContextVar("current_session", default=None)
+
+# Utilisateur authentifié de la requête en cours (None hors requête authentifiée)
+current_user_id: ContextVar[Optional[str]] = ContextVar("current_user_id", default=None)
+
+class UnitOfWork:
+    """
+    Gestionnaire de contexte asynchrone liant une session au contexte courant.
+    
+    Une unité de travail ouverte dans une autre réutilise sa session : seule la plus
+    externe valide ou annule la transaction.
+    """
+    
+    def __init__(self, session_factory):
+        """
+        Initialise l'unité de travail.
+        
+        Args:
+            session_factory: La factory de session SQLAlchemy à utiliser
+        """
+        self.session_factory = session_factory
+        self.session: Optional[AsyncSession] = None
+        self._token: Optional[Token] = None
+    
+    async def __aenter__(self) -> "UnitOfWork":
+        self.session = current_session.get()
+        if self.session is None:
+            # La connexion n'est empruntée au pool qu'à la première requête SQL
+            self.session = self.session_factory()
+            self._token = current_session.set(self.session)
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        if self._token is None:
+            return
+        try:
+            if exc_type is None:
+                await self.session.commit()
+                await _await_after_commit(self.session)
+            else:
+                logger.debug("Annulation de l'unité de travail: %s", exc_type.__name__)
+                await self.session.rollback()
+        finally:
+            current_session.reset(self._token)
+            self._token = None
+            await self.session.close()
+    
+    async def commit(self) -> None:
+        """Valide la transaction en cours ; la suite de l'unité de travail en ouvre une nouvelle"""
+        await self.session.commit()
+        await _await_after_commit(self.session)
+    
+    async def rollback(self) -> None:
+        """Annule la transaction en cours"""
+        await self.session.rollback()
+
+@asynccontextmanager
+async def repository_session(session_factory) -> AsyncIterator[AsyncSession]:
+    """
+    Fournit la session d'un appel de repository.
+    
+    Args:
+        session_factory: La factory utilisée hors unité de travail
+    
+    Returns:
+        AsyncIterator[AsyncSession]: La session de l'unité de travail en cours, ou une
+        session courte validée à la sortie du bloc
+    """
+    session = current_session.get()
+    if session is not None:
+        yield session
+        return
+    async with session_factory() as session:
+        async with session.begin():
+            yield session
+        await _await_after_commit(session)
+
+def after_commit(session: AsyncSession, callback: Callable[[], Optional[Awaitable[None]]]) -> None:
+    """
+    Exécute une action après la validation de la transaction en cours de la session.
+    
+    Args:
+        session: La session de la transaction
+        callback: L'action à exécuter ; si elle retourne une coroutine, celle-ci est
+            attendue par l'unité de travail (ou repository_session) après la validation
+    """
+    session.info.setdefault(AFTER_COMMIT_KEY, []).append(callback)
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session) -> None:
+    for callback in session.info.pop(AFTER_COMMIT_KEY, ()):
+        try:
+            result = callback()
+        except Exception as e:
+            logger.exception("Erreur d'une action après validation: %s", e)
+            continue
+        if inspect.isawaitable(result):
+            session.info.setdefault(PENDING_AFTER_COMMIT_KEY, []).append(result)
+
+async def _await_after_commit(session: AsyncSession) -> None:
+    for pending in session.info.pop(PENDING_AFTER_COMMIT_KEY, ()):
+        try:
+            await pending
+        except Exception as e:
+            logger.exception("Erreur d'une action après validation: %s", e)
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session) -> None:
+    session.info.pop(AFTER_COMMIT_KEY, None)
+
+class UnitOfWorkRoute(TimedRoute):
+    """
+    Route FastAPI exécutant l'endpoint dans une unité de travail.
+    
+    La transaction est validée avant la sérialisation de la réponse : le client ne reçoit
+    jamais de succès pour une écriture qui n'a pas été validée. Les dépendances
+    (authentification...) sont résolues hors de la transaction.
+    
+    La durée de la requête est bornée par le décorateur `request_timeout` de l'endpoint, ou
+    REQUEST_TIMEOUT_MS ; l'en-tête X-Request-Timeout peut seulement la réduire. Une requête
+    qui échoue après son échéance reçoit un 504 ; une requête dont le client s'est
+    déconnecté est annulée.
+    """
+    
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        timeout_ms = getattr(endpoint, "request_timeout_ms", None) or get_settings().request_timeout_ms
+        self.timeout = timeout_ms / 1000 if timeout_ms else None
+        super().__init__(path, _unit_of_work_endpoint(endpoint), **kwargs)
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def deadline_handler(request: Request) -> Response:
+            # Corps lu (et conservé par la requête) avant de surveiller la déconnexion
+            await request.body()
+            # Utilisateur posé par le middleware d'authentification (lecture de ses écritures)
+            user = request.scope.get("state", {}).get("user") or {}
+            user_id = user.get("user_id")
+            token = current_user_id.set(str(user_id) if user_id is not None else None)
+            try:
+                with deadline(_request_timeout(request, self.timeout)):
+                    try:
+                        return await _run_request(request, handler(request))
+                    except Exception as e:
+                        if not deadline_exceeded():
+                            raise
+                        REQUESTS_ABANDONED.inc("deadline")
+                        logger.warning("Échéance dépassée: %s %s", request.method, request.url.path)
+                        raise HTTPException(
+                            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                            detail="Request deadline exceeded"
+                        ) from e
+            finally:
+                current_user_id.reset(token)
+        
+        return deadline_handler
+
+def _request_timeout(request: Request, timeout: Optional[float]) -> Optional[float]:
+    value = request.headers.get(TIMEOUT_HEADER)
+    if not value:
+        return timeout
+    try:
+        requested = float(value) / 1000
+    except ValueError:
+        return timeout
+    if requested <= 0:
+        return timeout
+    return requested if timeout is None else min(requested, timeout)
+
+async def _run_request(request: Request, handler) -> Response:
+    """
+    Exécute le traitement de la requête et l'interrompt si le client se déconnecte ou,
+    en dernier recours, peu après l'échéance (attente du pool, traitement hors SQL).
+    
+    Args:
+        request: La requête, dont le corps a déjà été lu
+        handler: La coroutine de traitement
+    
+    Returns:
+        Response: La réponse du traitement, ou une réponse 499 si le client est parti
+    
+    Raises:
+        asyncio.TimeoutError: Si le traitement a été interrompu après l'échéance
+    """
+    # La tâche copie le contexte : elle partage ce suivi des requêtes SQL
+    statement = RunningStatement()
+    token = current_statement.set(statement)
+    task = asyncio.ensure_future(handler)
+    current_statement.reset(token)
+    watcher = asyncio.ensure_future(_wait_for_disconnect(request))
+    # statement_timeout se déclenche à l'échéance ; ce délai ne sert que hors requête SQL
+    left = remaining()
+    timeout = None if left is None else max(left, 0) + CANCEL_GRACE
+    try:
+        done, _ = await asyncio.wait(
+            (task, watcher), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+        )
+    finally:
+        watcher.cancel()
+        if not task.done():
+            await _stop(task, statement)
+    if not done:
+        raise asyncio.TimeoutError()
+    if task not in done:
+        REQUESTS_ABANDONED.inc("disconnect")
+        logger.info("Client déconnecté, requête annulée: %s %s", request.method, request.url.path)
+        return Response(status_code=CLIENT_CLOSED_REQUEST)
+    return task.result()
+
+async def _stop(task: asyncio.Task, statement: RunningStatement) -> None:
+    # Requête SQL en cours : annulée par le serveur, le traitement échoue et libère sa
+    # connexion normalement. Sinon (attente du pool, calcul), la tâche est annulée.
+    if await cancel_statement(statement):
+        await asyncio.wait((task,), timeout=CANCEL_GRACE)
+    if not task.done():
+        task.cancel()
+    try:
+        await task
+    except (asyncio.CancelledError, Exception) as e:
+        logger.debug("Traitement interrompu: %s", type(e).__name__)
+
+async def _wait_for_disconnect(request: Request) -> None:
+    while (await request.receive())["type"] != "http.disconnect":
+        pass
+
+def _unit_of_work_endpoint(endpoint: Callable) -> Callable:
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+    
+    # functools.wraps conserve la signature : FastAPI en déduit toujours les dépendances
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        # Import différé : le container importe les repositories, qui importent ce module
+        from shared.container.container import get_container
+        
+        async with get_container().unit_of_work():
+            return await endpoint(*args, **kwargs)
+    return wrapper
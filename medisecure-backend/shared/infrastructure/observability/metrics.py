@@ -0,0 +1,316 @@
+# shared/infrastructure/observability/metrics.py
+"""
+Métriques applicatives au format d'exposition Prometheus (texte 0.0.4).
+
+Les compteurs et histogrammes sont de simples dictionnaires mis à jour depuis la boucle
+d'événements : aucun verrou n'est pris dans le chemin critique. Le code exécuté dans un
+pool de threads ne doit donc pas les modifier directement, mais après son `await`.
+Les valeurs sont propres au processus ; avec plusieurs workers, chaque processus expose
+les siennes et l'agrégation est faite par Prometheus.
+"""
+import bisect
+import math
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Bornes (en secondes) adaptées aux latences d'une API : de 1 ms à 10 s
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Metric:
+    """Base commune : nom, description et noms des labels"""
+    
+    type_name = "untyped"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+    
+    def samples(self) -> Iterable[Tuple[str, LabelValues, Tuple[str, ...], float]]:
+        """Retourne les échantillons (suffixe, noms de labels, valeurs de labels, valeur)"""
+        raise NotImplementedError
+    
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        for suffix, names, values, value in self.samples():
+            lines.append(f"{self.name}{suffix}{_format_labels(names, values)} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    """Compteur monotone, éventuellement découpé par labels"""
+    
+    type_name = "counter"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+    
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+    
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+    
+    def samples(self):
+        for labels, value in sorted(self._values.items()):
+            yield "_total", self.labelnames, labels, value
+
+class Gauge(Metric):
+    """
+    Valeur instantanée. Elle est soit mise à jour explicitement (inc/dec/set), soit lue
+    au moment de la collecte via une fonction (set_function).
+    """
+    
+    type_name = "gauge"
+    
+    def __init__(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._function: Optional[Callable[[], Dict[LabelValues, float]]] = None
+    
+    def set(self, value: float, *labels: str) -> None:
+        self._values[labels] = value
+    
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+    
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) - amount
+    
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+    
+    def set_function(self, function: Callable[[], Dict[LabelValues, float]]) -> None:
+        """
+        Calcule la jauge au moment de la collecte.
+        
+        Args:
+            function: Retourne les valeurs indexées par tuple de labels
+        """
+        self._function = function
+    
+    def samples(self):
+        values = self._function() if self._function is not None else self._values
+        for labels, value in sorted(values.items()):
+            yield "", self.labelnames, labels, value
+
+class Histogram(Metric):
+    """
+    Histogramme à bornes fixes. Une observation incrémente un seul seau ; les cumuls
+    attendus par Prometheus ne sont calculés qu'à la collecte.
+    """
+    
+    type_name = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Par tuple de labels : [comptes par seau (+Inf en dernier), somme]
+        self._series: Dict[LabelValues, list] = {}
+    
+    def observe(self, value: float, *labels: str) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        series[0][bisect.bisect_left(self.buckets, value)] += 1
+        series[1] += value
+    
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+    
+    def samples(self):
+        names = self.labelnames + ("le",)
+        for labels, (counts, total) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                yield "_bucket", names, labels + (_format_value(bound),), cumulative
+            yield "_sum", self.labelnames, labels, total
+            yield "_count", self.labelnames, labels, cumulative
+
+class MetricsRegistry:
+    """Ensemble des métriques exposées par le processus"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+    
+    def register(self, metric: Metric) -> Metric:
+        """
+        Enregistre une métrique, ou retourne celle déjà enregistrée sous ce nom.
+        
+        Raises:
+            ValueError: Si le nom est déjà utilisé par une métrique d'un autre type
+        """
+        existing = self._metrics.get(metric.name)
+        if existing is None:
+            self._metrics[metric.name] = metric
+            return metric
+        if type(existing) is not type(metric):
+            raise ValueError(f"La métrique {metric.name} est déjà enregistrée avec le type {existing.type_name}")
+        return existing
+    
+    def counter(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Tuple[str, ...] = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+    
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Tuple[str, ...] = (),
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+    
+    def render(self) -> str:
+        """Retourne toutes les métriques au format texte de Prometheus"""
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+# Registre du processus
+registry = MetricsRegistry()
+
+# Type MIME du format d'exposition texte
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Requêtes HTTP (la route est le gabarit, ex: /api/patients/{patient_id}, pour borner la cardinalité)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "medisecure_http_request_duration_seconds",
+    "Durée des requêtes HTTP par méthode, route et statut",
+    ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge(
+    "medisecure_http_requests_in_progress",
+    "Requêtes HTTP en cours de traitement"
+)
+
+# Pool de connexions à la base de données
+DB_POOL_WAIT = registry.histogram(
+    "medisecure_db_pool_wait_seconds",
+    "Temps d'obtention d'une connexion du pool (attente, ouverture et pre-ping)"
+)
+
+# Contrôle d'admission (requêtes en file et en cours par classe de trafic : booking, search, export)
+ADMISSION_QUEUE_DEPTH = registry.gauge(
+    "medisecure_admission_queue_depth",
+    "Requêtes en attente d'admission, par classe de trafic",
+    ("traffic_class",)
+)
+ADMISSION_IN_FLIGHT = registry.gauge(
+    "medisecure_admission_in_flight",
+    "Requêtes admises en cours de traitement, par classe de trafic",
+    ("traffic_class",)
+)
+ADMISSION_QUEUE_WAIT = registry.histogram(
+    "medisecure_admission_queue_wait_seconds",
+    "Temps passé en file d'admission, par classe de trafic",
+    ("traffic_class",)
+)
+ADMISSION_REJECTED = registry.counter(
+    "medisecure_admission_rejected",
+    "Requêtes rejetées (503) faute de place dans le budget d'attente, par classe de trafic",
+    ("traffic_class",)
+)
+
+# Requêtes interrompues : échéance dépassée (504) ou client déconnecté (499)
+REQUESTS_ABANDONED = registry.counter(
+    "medisecure_requests_abandoned",
+    "Requêtes interrompues avant la fin de leur traitement, par motif (deadline, disconnect)",
+    ("reason",)
+)
+
+# Regroupement des lectures identiques simultanées (single-flight)
+SINGLE_FLIGHT_CALLS = registry.counter(
+    "medisecure_single_flight_calls",
+    "Lectures de repository regroupables, par appel et résultat (executed, coalesced)",
+    ("call", "result")
+)
+
+# Réplicas en lecture : retard mesuré (+Inf s'il est inconnu) et choix du serveur des
+# lectures routables (replica, ou primary avec son motif : session_write, user_write, replica_lag)
+DB_REPLICA_LAG = registry.gauge(
+    "medisecure_db_replica_lag_seconds",
+    "Retard de réplication mesuré, par réplica",
+    ("replica",)
+)
+DB_REPLICA_READS = registry.counter(
+    "medisecure_db_replica_reads",
+    "Transactions dont les lectures routables ont été servies, par serveur et motif",
+    ("target", "reason")
+)
+
+# Repositories
+REPOSITORY_CALL_DURATION = registry.histogram(
+    "medisecure_repository_call_duration_seconds",
+    "Durée des appels de méthodes de repository",
+    ("repository", "method")
+)
+DB_QUERIES = registry.counter(
+    "medisecure_db_queries",
+    "Requêtes SQL exécutées, par méthode de repository (vide hors repository)",
+    ("repository", "method")
+)
+
+# Hachage des mots de passe (bcrypt), exécuté dans un pool de threads dédié
+PASSWORD_HASH_QUEUE = registry.gauge(
+    "medisecure_password_hash_queue_depth",
+    "Vérifications de mot de passe en attente ou en cours dans le pool bcrypt"
+)
+PASSWORD_HASH_DURATION = registry.histogram(
+    "medisecure_password_hash_duration_seconds",
+    "Durée d'une vérification de mot de passe, attente dans le pool comprise"
+)
+
+# Envoi d'emails
+MAILER_BACKLOG = registry.gauge(
+    "medisecure_mailer_backlog",
+    "Emails en cours d'envoi"
+)
+MAILER_SENT = registry.counter(
+    "medisecure_mailer_emails",
+    "Emails traités par résultat (sent, failed)",
+    ("result",)
+)
+
+# Caches : le taux de succès se calcule par rapport hit / (hit + miss)
+CACHE_REQUESTS = registry.counter(
+    "medisecure_cache_requests",
+    "Consultations de cache par cache et résultat (hit, miss)",
+    ("cache", "result")
+)
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    """
+    Comptabilise une consultation de cache.
+    
+    Args:
+        cache: Le nom du cache
+        hit: True si la valeur a été trouvée
+    """
+    CACHE_REQUESTS.inc(cache, "hit" if hit else "miss")
@@ -0,0 +1,50 @@
+# shared/infrastructure/observability/pool_metrics.py
+"""
+Instrumentation du pool de connexions SQLAlchemy.
+
+Le temps d'obtention d'une connexion est mesuré à chaque checkout ; l'occupation du pool
+(connexions ouvertes, empruntées, en débordement) n'est lue qu'au moment de la collecte.
+"""
+import time
+import weakref
+
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from shared.infrastructure.observability.metrics import DB_POOL_WAIT, registry
+
+# Pools vivants du processus, lus à la collecte
+_pools: "weakref.WeakSet[InstrumentedAsyncPool]" = weakref.WeakSet()
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Pool asyncpg standard qui mesure le temps d'obtention des connexions"""
+    
+    # Journalise sous "sqlalchemy.pool" (niveau WARNING par défaut), comme le pool d'origine
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _pools.add(self)
+    
+    def connect(self):
+        # _do_get() se rappelle lui-même : la mesure englobe tout le checkout
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            DB_POOL_WAIT.observe(time.perf_counter() - started)
+
+def _pool_state():
+    state = {("size",): 0, ("checked_out",): 0, ("overflow",): 0, ("capacity",): 0}
+    for pool in list(_pools):
+        state[("size",)] += pool.size()
+        state[("checked_out",)] += pool.checkedout()
+        # overflow() est négatif tant que le pool n'a pas atteint sa taille
+        state[("overflow",)] += max(pool.overflow(), 0)
+        state[("capacity",)] += pool.size() + max(pool._max_overflow, 0)
+    return state
+
+registry.gauge(
+    "medisecure_db_pool_connections",
+    "Connexions du pool : taille configurée, empruntées, en débordement et capacité maximale",
+    ("state",)
+).set_function(_pool_state)
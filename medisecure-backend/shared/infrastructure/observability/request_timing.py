@@ -0,0 +1,226 @@
+# shared/infrastructure/observability/request_timing.py
+"""
+Instrumentation du temps passé dans une requête.
+
+Un `RequestTimings` est attaché à la requête courante via une ContextVar (voir
+ServerTimingMiddleware) ; sans requête échantillonnée, chaque point de mesure se réduit
+à une lecture de ContextVar. Les appels de repository et les requêtes SQL alimentent en
+plus, pour toutes les requêtes, les métriques du module metrics.
+"""
+import functools
+import inspect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from fastapi.routing import APIRoute
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared.infrastructure.observability.metrics import DB_QUERIES, REPOSITORY_CALL_DURATION
+
+class RepositoryCall:
+    """Durée et requêtes SQL cumulées d'une méthode de repository"""
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.duration_ms = 0.0
+        self.sql_count = 0
+        self.sql_ms = 0.0
+
+class RequestTimings:
+    """Mesures d'une requête : phases nommées, appels de repositories et requêtes SQL"""
+    
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.repository_calls: Dict[str, RepositoryCall] = {}
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.handler_started: Optional[float] = None
+        self.handler_finished: Optional[float] = None
+    
+    def add(self, phase: str, duration_ms: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + duration_ms
+    
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.started) * 1000
+    
+    def server_timing(self, total_ms: float) -> str:
+        """
+        Construit la valeur de l'en-tête Server-Timing.
+        
+        Args:
+            total_ms: La durée totale de la requête
+        
+        Returns:
+            str: Les métriques séparées par des virgules
+        """
+        metrics = [f"{phase};dur={duration:.2f}" for phase, duration in self.phases.items()]
+        if self.sql_count:
+            metrics.append(f'db;dur={self.sql_ms:.2f};desc="{self.sql_count} SQL"')
+        for call in self.repository_calls.values():
+            metrics.append(
+                f'repo.{call.name};dur={call.duration_ms:.2f};desc="{call.calls} x, {call.sql_count} SQL"'
+            )
+        metrics.append(f"total;dur={total_ms:.2f}")
+        return ", ".join(metrics)
+    
+    def to_dict(self, total_ms: float) -> Dict[str, Any]:
+        return {
+            "total_ms": round(total_ms, 2),
+            "phases_ms": {phase: round(duration, 2) for phase, duration in self.phases.items()},
+            "sql_count": self.sql_count,
+            "sql_ms": round(self.sql_ms, 2),
+            "repositories": {
+                call.name: {
+                    "calls": call.calls,
+                    "ms": round(call.duration_ms, 2),
+                    "sql_count": call.sql_count,
+                    "sql_ms": round(call.sql_ms, 2),
+                }
+                for call in self.repository_calls.values()
+            },
+        }
+
+# Mesures de la requête en cours (None si elle n'est pas échantillonnée)
+current_timings: ContextVar[Optional[RequestTimings]] = ContextVar("current_timings", default=None)
+
+# Appel de repository en cours, auquel sont rattachées les requêtes SQL
+_current_repository_call: ContextVar[Optional[RepositoryCall]] = ContextVar("current_repository_call", default=None)
+
+# Labels (repository, méthode) de l'appel en cours, renseignés même sans échantillonnage
+_current_repository_labels: ContextVar[Tuple[str, str]] = ContextVar("current_repository_labels", default=("", ""))
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Ajoute la durée du bloc à la phase donnée de la requête en cours.
+    
+    Args:
+        phase: Le nom de la phase (ex: "auth")
+    """
+    timings = current_timings.get()
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(phase, (time.perf_counter() - started) * 1000)
+
+def timed_repository(cls):
+    """
+    Décorateur de classe : mesure chaque méthode publique asynchrone du repository.
+    
+    Les requêtes SQL exécutées pendant l'appel lui sont attribuées.
+    """
+    for name, method in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, name, _timed_method(cls.__name__, name, method))
+    return cls
+
+def current_repository_call_name() -> Optional[str]:
+    """Retourne "Repository.méthode" pour l'appel de repository en cours, ou None"""
+    repository, method_name = _current_repository_labels.get()
+    return f"{repository}.{method_name}" if repository else None
+
+def _timed_method(repository: str, method_name: str, method: Callable) -> Callable:
+    call_name = f"{repository}.{method_name}"
+    labels = (repository, method_name)
+    
+    @functools.wraps(method)
+    async def wrapper(*args, **kwargs):
+        labels_token = _current_repository_labels.set(labels)
+        timings = current_timings.get()
+        call = None
+        call_token = None
+        if timings is not None:
+            call = timings.repository_calls.get(call_name)
+            if call is None:
+                call = timings.repository_calls[call_name] = RepositoryCall(call_name)
+            call_token = _current_repository_call.set(call)
+        started = time.perf_counter()
+        try:
+            return await method(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - started
+            REPOSITORY_CALL_DURATION.observe(duration, *labels)
+            if call is not None:
+                call.calls += 1
+                call.duration_ms += duration * 1000
+                _current_repository_call.reset(call_token)
+            _current_repository_labels.reset(labels_token)
+    return wrapper
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if current_timings.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    DB_QUERIES.inc(*_current_repository_labels.get())
+    timings = current_timings.get()
+    if timings is None or not conn.info.get("query_started"):
+        return
+    duration_ms = (time.perf_counter() - conn.info["query_started"].pop()) * 1000
+    timings.sql_count += 1
+    timings.sql_ms += duration_ms
+    call = _current_repository_call.get()
+    if call is not None:
+        call.sql_count += 1
+        call.sql_ms += duration_ms
+
+def install_sql_timing() -> None:
+    """Enregistre (une seule fois) les événements SQLAlchemy qui mesurent et comptent les requêtes SQL"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+class TimedRoute(APIRoute):
+    """
+    Route FastAPI qui découpe la requête en trois phases : résolution des dépendances
+    (validation, authentification...), exécution de l'endpoint et sérialisation de la réponse.
+    """
+    
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        super().__init__(path, _timed_endpoint(endpoint), **kwargs)
+    
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+        
+        async def timed_handler(request):
+            timings = current_timings.get()
+            if timings is None:
+                return await handler(request)
+            
+            started = time.perf_counter()
+            response = await handler(request)
+            finished = time.perf_counter()
+            if timings.handler_started is not None and timings.handler_finished is not None:
+                timings.add("dependencies", (timings.handler_started - started) * 1000)
+                timings.add("handler", (timings.handler_finished - timings.handler_started) * 1000)
+                timings.add("serialization", (finished - timings.handler_finished) * 1000)
+            return response
+        
+        return timed_handler
+
+def _timed_endpoint(endpoint: Callable) -> Callable:
+    if not inspect.iscoroutinefunction(endpoint):
+        return endpoint
+    
+    # functools.wraps conserve la signature : FastAPI en déduit toujours les dépendances
+    @functools.wraps(endpoint)
+    async def wrapper(*args, **kwargs):
+        timings = current_timings.get()
+        if timings is None:
+            return await endpoint(*args, **kwargs)
+        timings.handler_started = time.perf_counter()
+        try:
+            return await endpoint(*args, **kwargs)
+        finally:
+            timings.handler_finished = time.perf_counter()
+    return wrapper
@@ -0,0 +1,283 @@
+# shared/infrastructure/observability/slow_queries.py
+"""
+Capture des requêtes SQL lentes.
+
+Chaque requête dont la durée dépasse un seuil est regroupée par empreinte (le texte SQL
+normalisé, sans littéraux) avec ses statistiques. Les paramètres ne sont jamais conservés
+ni journalisés : ils peuvent contenir des données de santé. Seuls leurs types sont gardés.
+
+Pour les SELECT exécutés via asyncpg, un plan `EXPLAIN` (sans ANALYZE : la requête n'est
+pas réexécutée) est capturé en tâche de fond, au plus une fois par empreinte et par
+intervalle ; les littéraux du plan sont masqués.
+"""
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from shared.config import get_settings
+from shared.infrastructure.observability.metrics import registry
+from shared.infrastructure.observability.request_timing import current_repository_call_name
+
+# Configuration du logging
+logger = logging.getLogger(__name__)
+
+# Délai maximal accordé à un EXPLAIN (connexion comprise)
+EXPLAIN_TIMEOUT_SECONDS = 5.0
+
+SLOW_QUERIES = registry.counter(
+    "medisecure_db_slow_queries",
+    "Requêtes SQL dont la durée dépasse le seuil SLOW_QUERY_THRESHOLD_MS"
+)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|(?<!:):\w+\b|\?")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:::\w+)?(?:\s*,\s*\?(?:::\w+)?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_statement(statement: str) -> str:
+    """
+    Normalise une requête SQL : littéraux et paramètres remplacés par `?`, listes de
+    valeurs réduites à `(...)`, espaces compactés.
+    
+    Args:
+        statement: La requête SQL telle qu'envoyée au driver
+    
+    Returns:
+        str: La requête normalisée, sans aucune valeur
+    """
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _VALUE_LIST.sub("(...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+def fingerprint(normalized_statement: str) -> str:
+    """Retourne l'empreinte courte d'une requête normalisée"""
+    return hashlib.sha1(normalized_statement.encode("utf-8")).hexdigest()[:16]
+
+def describe_parameters(parameters: Any) -> List[str]:
+    """
+    Décrit les paramètres d'une requête par leurs seuls types.
+    
+    Args:
+        parameters: Les paramètres passés au driver (séquence, dictionnaire ou lot)
+    
+    Returns:
+        List[str]: Les noms de types, ou la taille du lot pour un executemany
+    """
+    if not parameters:
+        return []
+    if isinstance(parameters, dict):
+        return [f"{name}: {type(value).__name__}" for name, value in parameters.items()]
+    if isinstance(parameters, (list, tuple)) and isinstance(parameters[0], (list, tuple, dict)):
+        return [f"{len(parameters)} lignes"]
+    return [type(value).__name__ for value in parameters]
+
+def redact_plan(plan: str) -> str:
+    """Masque les littéraux (chaînes, dates, UUID...) d'un plan EXPLAIN"""
+    return _STRING_LITERAL.sub("'?'", plan)
+
+@dataclass
+class SlowStatement:
+    """Statistiques cumulées d'une requête lente, identifiée par son empreinte"""
+    
+    fingerprint: str
+    statement: str
+    calls: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    last_ms: float = 0.0
+    last_seen: Optional[datetime] = None
+    repository_calls: Dict[str, int] = field(default_factory=dict)
+    parameter_types: List[str] = field(default_factory=list)
+    plan: Optional[str] = None
+    plan_captured_at: Optional[datetime] = None
+    explain_requested_at: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "calls": self.calls,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.calls, 2) if self.calls else 0.0,
+            "max_ms": round(self.max_ms, 2),
+            "last_ms": round(self.last_ms, 2),
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+            "repository_calls": dict(self.repository_calls),
+            "parameter_types": list(self.parameter_types),
+            "plan": self.plan,
+            "plan_captured_at": self.plan_captured_at.isoformat() if self.plan_captured_at else None,
+        }
+
+class SlowQueryLog:
+    """
+    Registre borné des requêtes lentes du processus.
+    
+    Comme les métriques, il n'est modifié que depuis la boucle d'événements et n'utilise
+    pas de verrou.
+    """
+    
+    def __init__(
+        self,
+        threshold_ms: Optional[float] = None,
+        max_statements: Optional[int] = None,
+        explain: Optional[bool] = None,
+        explain_interval_seconds: Optional[float] = None
+    ):
+        """
+        Initialise le registre.
+        
+        Args:
+            threshold_ms: Durée au-delà de laquelle une requête est lente (défaut: SLOW_QUERY_THRESHOLD_MS ou 200)
+            max_statements: Nombre d'empreintes conservées (défaut: SLOW_QUERY_MAX_STATEMENTS ou 100)
+            explain: Capturer les plans EXPLAIN (défaut: SLOW_QUERY_EXPLAIN ou true)
+            explain_interval_seconds: Délai minimal entre deux EXPLAIN d'une même empreinte
+                (défaut: SLOW_QUERY_EXPLAIN_INTERVAL ou 300)
+        """
+        settings = get_settings()
+        if threshold_ms is None:
+            threshold_ms = settings.slow_query_threshold_ms
+        if max_statements is None:
+            max_statements = settings.slow_query_max_statements
+        if explain is None:
+            explain = settings.slow_query_explain
+        if explain_interval_seconds is None:
+            explain_interval_seconds = settings.slow_query_explain_interval
+        self.threshold_ms = threshold_ms
+        self.max_statements = max_statements
+        self.explain = explain
+        self.explain_interval_seconds = explain_interval_seconds
+        self._statements: Dict[str, SlowStatement] = {}
+        self._explain_tasks = set()
+    
+    def record(self, statement: str, parameters: Any, duration_ms: float) -> SlowStatement:
+        """
+        Enregistre une requête lente.
+        
+        Args:
+            statement: La requête SQL
+            parameters: Ses paramètres (seuls leurs types sont conservés)
+            duration_ms: Sa durée d'exécution
+        
+        Returns:
+            SlowStatement: Les statistiques de son empreinte
+        """
+        normalized = normalize_statement(statement)
+        key = fingerprint(normalized)
+        stats = self._statements.get(key)
+        if stats is None:
+            if len(self._statements) >= self.max_statements:
+                # Évincer l'empreinte la moins coûteuse
+                del self._statements[min(self._statements.values(), key=lambda item: item.total_ms).fingerprint]
+            stats = self._statements[key] = SlowStatement(fingerprint=key, statement=normalized)
+        
+        stats.calls += 1
+        stats.total_ms += duration_ms
+        stats.max_ms = max(stats.max_ms, duration_ms)
+        stats.last_ms = duration_ms
+        stats.last_seen = datetime.utcnow()
+        stats.parameter_types = describe_parameters(parameters)
+        call_name = current_repository_call_name()
+        if call_name:
+            stats.repository_calls[call_name] = stats.repository_calls.get(call_name, 0) + 1
+        SLOW_QUERIES.inc()
+        
+        logger.warning(
+            "Requête lente %s (%.0fms, %s): %.300s", key, duration_ms, call_name or "hors repository", normalized
+        )
+        return stats
+    
+    def top(self, limit: int = 20, order_by: str = "total_ms") -> List[Dict[str, Any]]:
+        """
+        Retourne les requêtes lentes les plus coûteuses.
+        
+        Args:
+            limit: Le nombre d'empreintes retournées
+            order_by: Le critère de tri (total_ms, max_ms ou calls)
+        
+        Returns:
+            List[Dict[str, Any]]: Les statistiques, de la plus coûteuse à la moins coûteuse
+        """
+        statements = sorted(self._statements.values(), key=lambda item: getattr(item, order_by), reverse=True)
+        return [stats.to_dict() for stats in statements[:limit]]
+    
+    def reset(self) -> None:
+        self._statements.clear()
+    
+    def schedule_explain(self, stats: SlowStatement, dsn: str, statement: str, parameters: Sequence[Any]) -> None:
+        """
+        Programme la capture du plan d'une requête lente, si elle est due.
+        
+        Doit être appelé depuis la boucle d'événements ; sans boucle, rien n'est fait.
+        """
+        now = time.monotonic()
+        if stats.explain_requested_at and now - stats.explain_requested_at < self.explain_interval_seconds:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        stats.explain_requested_at = now
+        task = loop.create_task(self._explain(stats, dsn, statement, tuple(parameters)))
+        self._explain_tasks.add(task)
+        task.add_done_callback(self._explain_tasks.discard)
+    
+    async def _explain(self, stats: SlowStatement, dsn: str, statement: str, parameters: tuple) -> None:
+        import asyncpg
+        
+        try:
+            # Connexion dédiée : le pool de l'application n'est pas sollicité
+            connection = await asyncio.wait_for(asyncpg.connect(dsn), EXPLAIN_TIMEOUT_SECONDS)
+            try:
+                rows = await asyncio.wait_for(connection.fetch(f"EXPLAIN {statement}", *parameters), EXPLAIN_TIMEOUT_SECONDS)
+            finally:
+                await connection.close()
+        except Exception as e:
+            logger.warning("EXPLAIN impossible pour la requête lente %s: %s", stats.fingerprint, type(e).__name__)
+            return
+        stats.plan = redact_plan("\n".join(row[0] for row in rows))
+        stats.plan_captured_at = datetime.utcnow()
+
+# Registre du processus
+slow_query_log = SlowQueryLog()
+
+def _explain_dsn(conn) -> str:
+    return conn.engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+# Le début est porté par le contexte d'exécution : une requête en erreur ne laisse rien derrière elle
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context._slow_query_started = time.perf_counter()
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_slow_query_started", None)
+    if started is None:
+        return
+    duration_ms = (time.perf_counter() - started) * 1000
+    if duration_ms < slow_query_log.threshold_ms:
+        return
+    
+    stats = slow_query_log.record(statement, parameters, duration_ms)
+    if (
+        slow_query_log.explain
+        and not executemany
+        and conn.dialect.driver == "asyncpg"
+        and statement.lstrip()[:6].upper() == "SELECT"
+    ):
+        slow_query_log.schedule_explain(stats, _explain_dsn(conn), statement, parameters or ())
+
+def install_slow_query_log() -> None:
+    """Enregistre (une seule fois) les événements SQLAlchemy qui capturent les requêtes lentes"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
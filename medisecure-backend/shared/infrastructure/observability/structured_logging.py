@@ -0,0 +1,170 @@
+# shared/infrastructure/observability/structured_logging.py
+"""
+Configuration du logging de l'application.
+
+- Les appels utilisent le formatage paresseux du module logging
+  (`logger.debug("Patient %s", patient_id)`) : rien n'est formaté pour un niveau désactivé.
+- En mode asynchrone, un QueueHandler dépose les enregistrements dans une file, que
+  seul un thread dédié formate et écrit : la boucle d'événements ne fait ni formatage ni
+  entrée/sortie. Les arguments étant formatés plus tard, ils ne doivent pas être
+  modifiés après l'appel.
+- Les formateurs masquent les champs sensibles (données de santé, identité, secrets)
+  des arguments et des champs `extra`, ainsi que les adresses email du texte.
+"""
+import atexit
+import json
+import logging
+import queue
+import re
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+from typing import IO, Any, Optional
+
+from pydantic import BaseModel
+
+from shared.config import get_settings
+
+REDACTED = "[REDACTED]"
+
+# Champs masqués quelle que soit leur valeur (comparaison insensible à la casse)
+SENSITIVE_FIELDS = frozenset({
+    "password", "plain_password", "hashed_password", "token", "access_token", "refresh_token",
+    "authorization", "secret", "first_name", "last_name", "name", "email", "username",
+    "phone", "phone_number", "address", "postal_code", "date_of_birth", "insurance_id",
+    "blood_type", "allergies", "chronic_diseases", "current_medications", "notes", "reason",
+})
+
+# Domaine terminé par une extension alphabétique : `user@127.0.0.1` (URL de base) n'est pas une adresse email
+_EMAIL = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}\b")
+
+# Attributs standards d'un LogRecord : tout autre attribut vient de `extra`
+_RECORD_ATTRIBUTES = frozenset(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+def scrub_text(text: str) -> str:
+    """Masque les adresses email d'un texte libre (messages d'exception notamment)"""
+    return _EMAIL.sub("[EMAIL]", text)
+
+def redact(value: Any, key: Optional[str] = None) -> Any:
+    """
+    Masque récursivement les champs sensibles d'une valeur.
+    
+    Args:
+        value: La valeur à journaliser (DTO pydantic, dictionnaire, liste, scalaire)
+        key: Le nom du champ qui la contient, le cas échéant
+    
+    Returns:
+        Any: Une copie sans données sensibles
+    """
+    if key is not None and key.lower() in SENSITIVE_FIELDS:
+        return REDACTED
+    if isinstance(value, BaseModel):
+        value = value.dict()
+    if isinstance(value, dict):
+        return {item_key: redact(item, str(item_key)) for item_key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [redact(item) for item in value]
+    if isinstance(value, str):
+        return scrub_text(value)
+    return value
+
+def _redact_args(args):
+    if isinstance(args, dict):
+        return redact(args)
+    return tuple(redact(arg) if isinstance(arg, (BaseModel, dict, list, tuple, set)) else arg for arg in args)
+
+def _render_message(record: logging.LogRecord) -> str:
+    if record.args:
+        record.args = _redact_args(record.args)
+    return scrub_text(record.getMessage())
+
+class RedactingFormatter(logging.Formatter):
+    """Formateur texte qui masque les données sensibles des arguments et du message"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        record.msg, record.args = _render_message(record), None
+        # Les traces d'exception peuvent citer des valeurs : elles sont aussi nettoyées
+        return scrub_text(super().format(record))
+
+class JsonFormatter(logging.Formatter):
+    """Formateur JSON, une ligne par enregistrement ; les champs `extra` sont inclus et masqués"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": _render_message(record),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRIBUTES and not key.startswith("_"):
+                payload[key] = redact(value, key)
+        if record.exc_info:
+            payload["exception"] = scrub_text(self.formatException(record.exc_info))
+        elif record.exc_text:
+            payload["exception"] = scrub_text(record.exc_text)
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler qui ne formate pas l'enregistrement dans le thread appelant.
+    
+    Le QueueHandler standard formate le message avant de le mettre en file ; ici, le
+    formatage (et le masquage) sont laissés au thread du QueueListener.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+# Thread d'écriture des logs (None en mode synchrone)
+_listener: Optional[QueueListener] = None
+
+def configure_logging(
+    level: Optional[str] = None,
+    log_format: Optional[str] = None,
+    asynchronous: Optional[bool] = None,
+    stream: Optional[IO[str]] = None
+) -> None:
+    """
+    Configure le logger racine. Peut être rappelée : la configuration précédente est remplacée.
+    
+    Args:
+        level: Le niveau minimal (défaut: LOG_LEVEL ou INFO)
+        log_format: "json" ou "text" (défaut: LOG_FORMAT ou text)
+        asynchronous: Écrire depuis un thread dédié (défaut: LOG_ASYNC ou true)
+        stream: Le flux de sortie (défaut: sys.stderr)
+    """
+    global _listener
+    settings = get_settings()
+    level = (level or settings.log_level).upper()
+    log_format = (log_format or settings.log_format).lower()
+    if asynchronous is None:
+        asynchronous = settings.log_async
+    
+    stop_logging()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    
+    stream_handler = logging.StreamHandler(stream or sys.stderr)
+    stream_handler.setFormatter(JsonFormatter() if log_format == "json" else RedactingFormatter(TEXT_FORMAT))
+    
+    if asynchronous:
+        log_queue = queue.SimpleQueue()
+        root.addHandler(DeferredQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        root.addHandler(stream_handler)
+    root.setLevel(level)
+
+def stop_logging() -> None:
+    """Vide la file et arrête le thread d'écriture, s'il existe"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(stop_logging)
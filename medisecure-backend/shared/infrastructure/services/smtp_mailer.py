@@ -1,14 +1,13 @@
-import os
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import asyncio
+import logging
 from typing import List, Optional
-from dotenv import load_dotenv
 
+from shared.config import Settings, get_settings
 from shared.ports.secondary.mailer_protocol import MailerProtocol
+from shared.infrastructure.observability.metrics import MAILER_BACKLOG, MAILER_SENT
 
-# Charger les variables d'environnement
-load_dotenv()
+# Configuration du logging
+logger = logging.getLogger(__name__)
 
 class SmtpMailer(MailerProtocol):
     """
@@ -16,15 +15,20 @@ class SmtpMailer(MailerProtocol):
     Implémente le port MailerProtocol.
     """
     
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         """
-        Initialise le mailer avec les paramètres SMTP depuis les variables d'environnement.
+        Initialise le mailer avec les paramètres SMTP.
+        
+        Args:
+            settings: Les paramètres de l'application (défaut: get_settings())
         """
-        self.smtp_host = os.getenv("SMTP_HOST", "smtp.example.com")
-        self.smtp_port = int(os.getenv("SMTP_PORT", "587"))
-        self.smtp_user = os.getenv("SMTP_USER", "user@example.com")
-        self.smtp_password = os.getenv("SMTP_PASSWORD", "your_password_here")
-        self.email_from = os.getenv("EMAIL_FROM", "noreply@medisecure.com")
+        settings = settings or get_settings()
+        self.smtp_host = settings.smtp_host
+        self.smtp_port = settings.smtp_port
+        self.smtp_user = settings.smtp_user
+        self.smtp_password = settings.smtp_password
+        self.email_from = settings.email_from
+        self.frontend_url = settings.frontend_url
     
     async def send_email(
         self,
@@ -51,6 +55,11 @@ class SmtpMailer(MailerProtocol):
         Returns:
             bool: True si l'email a été envoyé avec succès, False sinon
         """
+        # Import différé : le module email n'est chargé qu'au premier envoi
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        
+        MAILER_BACKLOG.inc()
         try:
             message = MIMEMultipart("alternative")
             message["Subject"] = subject
@@ -70,29 +79,39 @@ class SmtpMailer(MailerProtocol):
                 part2 = MIMEText(html_body, "html")
                 message.attach(part2)
             
-            # Établir la connexion SMTP et envoyer l'email
-            with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
-                # Démarrer le chiffrement TLS
-                server.starttls()
-                
-                # Connexion au serveur SMTP
-                server.login(self.smtp_user, self.smtp_password)
-                
-                # Préparer la liste complète des destinataires
-                recipients = [to_email]
-                if cc:
-                    recipients.extend(cc)
-                if bcc:
-                    recipients.extend(bcc)
-                
-                # Envoyer l'email
-                server.sendmail(self.email_from, recipients, message.as_string())
+            # Préparer la liste complète des destinataires
+            recipients = [to_email]
+            if cc:
+                recipients.extend(cc)
+            if bcc:
+                recipients.extend(bcc)
+            
+            # smtplib est bloquant : l'envoi est exécuté hors de la boucle d'événements
+            await asyncio.to_thread(self._send, recipients, message.as_string())
             
+            MAILER_SENT.inc("sent")
             return True
         
         except Exception as e:
-            print(f"Erreur lors de l'envoi de l'email: {str(e)}")
+            MAILER_SENT.inc("failed")
+            logger.error("Erreur lors de l'envoi de l'email: %s", e)
             return False
+        finally:
+            MAILER_BACKLOG.dec()
+    
+    def _send(self, recipients: List[str], content: str) -> None:
+        import smtplib
+        
+        # Établir la connexion SMTP et envoyer l'email
+        with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
+            # Démarrer le chiffrement TLS
+            server.starttls()
+            
+            # Connexion au serveur SMTP
+            server.login(self.smtp_user, self.smtp_password)
+            
+            # Envoyer l'email
+            server.sendmail(self.email_from, recipients, content)
     
     async def send_password_reset(self, to_email: str, reset_token: str) -> bool:
         """
@@ -114,7 +133,7 @@ class SmtpMailer(MailerProtocol):
         Vous avez demandé la réinitialisation de votre mot de passe sur MediSecure.
         
         Veuillez cliquer sur le lien suivant pour réinitialiser votre mot de passe:
-        {os.getenv('FRONTEND_URL', 'https://medisecure.com')}/reset-password?token={reset_token}
+        {self.frontend_url}/reset-password?token={reset_token}
         
         Si vous n'avez pas fait cette demande, vous pouvez ignorer cet email.
         
@@ -145,7 +164,7 @@ class SmtpMailer(MailerProtocol):
                     <p>Vous avez demandé la réinitialisation de votre mot de passe sur MediSecure.</p>
                     <p>Veuillez cliquer sur le bouton ci-dessous pour réinitialiser votre mot de passe:</p>
                     <p style="text-align: center;">
-                        <a href="{os.getenv('FRONTEND_URL', 'https://medisecure.com')}/reset-password?token={reset_token}" class="button">Réinitialiser mon mot de passe</a>
+                        <a href="{self.frontend_url}/reset-password?token={reset_token}" class="button">Réinitialiser mon mot de passe</a>
                     </p>
                     <p>Si vous n'avez pas fait cette demande, vous pouvez ignorer cet email.</p>
                     <p>Cordialement,<br>L'équipe MediSecure</p>
@@ -185,7 +204,7 @@ class SmtpMailer(MailerProtocol):
         Merci de vous être inscrit sur MediSecure.
         
         Veuillez cliquer sur le lien suivant pour confirmer votre adresse email:
-        {os.getenv('FRONTEND_URL', 'https://medisecure.com')}/confirm-email?token={confirmation_token}
+        {self.frontend_url}/confirm-email?token={confirmation_token}
         
         Si vous n'avez pas fait cette demande, vous pouvez ignorer cet email.
         
@@ -216,7 +235,7 @@ class SmtpMailer(MailerProtocol):
                     <p>Merci de vous être inscrit sur MediSecure.</p>
                     <p>Veuillez cliquer sur le bouton ci-dessous pour confirmer votre adresse email:</p>
                     <p style="text-align: center;">
-                        <a href="{os.getenv('FRONTEND_URL', 'https://medisecure.com')}/confirm-email?token={confirmation_token}" class="button">Confirmer mon email</a>
+                        <a href="{self.frontend_url}/confirm-email?token={confirmation_token}" class="button">Confirmer mon email</a>
                     </p>
                     <p>Si vous n'avez pas fait cette demande, vous pouvez ignorer cet email.</p>
                     <p>Cordialement,<br>L'équipe MediSecure</p>
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, List
 
 class IdGeneratorProtocol(ABC):
     """
@@ -15,4 +15,16 @@ class IdGeneratorProtocol(ABC):
         Returns:
             Any: Un identifiant unique, généralement un UUID
         """
-        pass
\ No newline at end of file
+        pass
+    
+    def generate_ids(self, count: int) -> List[Any]:
+        """
+        Génère plusieurs identifiants uniques (insertions en masse).
+        
+        Args:
+            count: Le nombre d'identifiants à générer
+        
+        Returns:
+            List[Any]: Les identifiants générés
+        """
+        return [self.generate_id() for _ in range(count)]
\ No newline at end of file
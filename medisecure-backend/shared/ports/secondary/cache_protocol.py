@@ -0,0 +1,72 @@
+from abc import ABC, abstractmethod
+from typing import Callable, List, Optional, Sequence
+
+# Reçoit les clés invalidées par un autre processus, ou None si des invalidations ont pu
+# être perdues (reconnexion) et que tout le contenu local doit être écarté
+InvalidationCallback = Callable[[Optional[List[str]]], None]
+
+class CacheProtocol(ABC):
+    """
+    Port secondaire pour un cache de valeurs sérialisées (octets).
+    Cette interface définit comment les lectures des repositories sont mises en cache,
+    dans le processus ou partagées entre les workers.
+    """
+    
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """
+        Récupère une valeur.
+        
+        Args:
+            key: La clé de la valeur
+        
+        Returns:
+            Optional[bytes]: La valeur, ou None si elle est absente ou expirée
+        """
+        pass
+    
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        """
+        Enregistre une valeur.
+        
+        Args:
+            key: La clé de la valeur
+            value: La valeur sérialisée
+            ttl: La durée de vie de la valeur (secondes)
+        """
+        pass
+    
+    @abstractmethod
+    async def delete(self, keys: Sequence[str]) -> None:
+        """
+        Supprime des valeurs.
+        
+        Args:
+            keys: Les clés des valeurs à supprimer
+        """
+        pass
+    
+    async def publish_invalidation(self, keys: Sequence[str]) -> None:
+        """
+        Signale aux autres processus des clés invalidées.
+        Ne fait rien par défaut (cache sans copie locale dans les autres processus).
+        
+        Args:
+            keys: Les clés invalidées
+        """
+        pass
+    
+    async def listen_invalidations(self, callback: InvalidationCallback) -> None:
+        """
+        Reçoit les invalidations publiées par les autres processus, jusqu'à l'annulation.
+        Retourne immédiatement par défaut (pas de canal d'invalidation).
+        
+        Args:
+            callback: La fonction appelée pour chaque invalidation reçue
+        """
+        pass
+    
+    async def close(self) -> None:
+        """Libère les ressources du cache (connexions, mémoire partagée)"""
+        pass
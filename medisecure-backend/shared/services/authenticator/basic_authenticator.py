@@ -1,15 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-import os
-from dotenv import load_dotenv
-import traceback
+import logging
 
+from shared.config import Settings, get_settings
 from shared.ports.primary.authenticator_protocol import AuthenticatorProtocol
 
-# Charger les variables d'environnement
-load_dotenv()
+# Configuration du logging
+logger = logging.getLogger(__name__)
 
 class BasicAuthenticator(AuthenticatorProtocol):
     """
@@ -17,14 +14,21 @@ class BasicAuthenticator(AuthenticatorProtocol):
     Implémente le port AuthenticatorProtocol.
     """
     
-    def __init__(self):
+    def __init__(self, settings: Optional[Settings] = None):
         """
         Initialise l'authentificateur avec les clés et algorithmes de chiffrement.
+        
+        Args:
+            settings: Les paramètres de l'application (défaut: get_settings())
         """
+        settings = settings or get_settings()
+        # Import différé : passlib n'est chargé qu'à la première authentification
+        from passlib.context import CryptContext
+        
         self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        self.jwt_secret_key = os.getenv("JWT_SECRET_KEY", "default_secret_key")
-        self.algorithm = os.getenv("JWT_ALGORITHM", "HS256")
-        self.access_token_expire_minutes = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+        self.jwt_secret_key = settings.jwt_secret_key
+        self.algorithm = settings.jwt_algorithm
+        self.access_token_expire_minutes = settings.access_token_expire_minutes
     
     def create_access_token(self, data: Dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
         """
@@ -46,12 +50,14 @@ class BasicAuthenticator(AuthenticatorProtocol):
         
         to_encode.update({"exp": expire})
         
+        # Import différé : jose n'est chargé qu'à la première émission de token
+        from jose import jwt
+        
         try:
             encoded_jwt = jwt.encode(to_encode, self.jwt_secret_key, algorithm=self.algorithm)
             return encoded_jwt
-        except Exception as e:
-            print(f"Erreur lors de la création du token: {str(e)}")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Erreur lors de la création du token")
             raise
     
     def verify_password(self, plain_password: str, hashed_password: str) -> bool:
@@ -66,13 +72,10 @@ class BasicAuthenticator(AuthenticatorProtocol):
             bool: True si le mot de passe correspond, False sinon
         """
         try:
-            print(f"Vérification du mot de passe. Mot de passe en clair: {plain_password}, Hash: {hashed_password}")
-            result = self.pwd_context.verify(plain_password, hashed_password)
-            print(f"Résultat de la vérification: {result}")
-            return result
-        except Exception as e:
-            print(f"Erreur lors de la vérification du mot de passe: {str(e)}")
-            print(traceback.format_exc())
+            return self.pwd_context.verify(plain_password, hashed_password)
+        except Exception:
+            # Ni le mot de passe ni le hash ne sont journalisés
+            logger.exception("Erreur lors de la vérification du mot de passe")
             raise
     
     def get_password_hash(self, password: str) -> str:
@@ -87,7 +90,6 @@ class BasicAuthenticator(AuthenticatorProtocol):
         """
         try:
             return self.pwd_context.hash(password)
-        except Exception as e:
-            print(f"Erreur lors du hachage du mot de passe: {str(e)}")
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Erreur lors du hachage du mot de passe")
             raise
\ No newline at end of file
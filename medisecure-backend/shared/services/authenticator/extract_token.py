@@ -1,22 +1,24 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from jose import JWTError, jwt
 from typing import Dict, Any
-import os
-from dotenv import load_dotenv
 
-# Charger les variables d'environnement
-load_dotenv()
+from shared.config import get_settings
+from shared.infrastructure.observability.request_timing import timed
 
 security = HTTPBearer()
 
 async def extract_token_payload(
+    request: Request,
     credentials: HTTPAuthorizationCredentials = Depends(security)
 ) -> Dict[str, Any]:
     """
     Extrait et valide le payload du token JWT.
     
+    Le payload déjà validé par AuthenticationMiddleware pour la requête est réutilisé :
+    le token n'est décodé qu'une fois.
+    
     Args:
+        request: La requête HTTP
         credentials: Les informations d'authentification HTTP
         
     Returns:
@@ -25,24 +27,26 @@ async def extract_token_payload(
     Raises:
         HTTPException: Si le token est invalide ou expiré
     """
+    payload = request.scope.get("state", {}).get("user")
+    if payload is None:
+        payload = _decode(credentials.credentials)
+    
+    # Assurez-vous que le rôle est en majuscules pour la vérification ultérieure
+    # Mais ne modifiez pas le payload original
+    payload = dict(payload)
+    if "role" in payload and isinstance(payload["role"], str):
+        payload["role"] = payload["role"].upper()
+    
+    return payload
+
+def _decode(token: str) -> Dict[str, Any]:
+    # Import différé : jose et ses backends cryptographiques ne sont chargés qu'au premier token
+    from jose import JWTError, jwt
+    
     try:
-        # Récupérer le token
-        token = credentials.credentials
-        
-        # Décoder le token
-        payload = jwt.decode(
-            token, 
-            os.getenv("JWT_SECRET_KEY", "default_secret_key"), 
-            algorithms=[os.getenv("JWT_ALGORITHM", "HS256")]
-        )
-        
-        # Assurez-vous que le rôle est en majuscules pour la vérification ultérieure
-        # Mais ne modifiez pas le payload original
-        if "role" in payload and isinstance(payload["role"], str):
-            payload["role"] = payload["role"].upper()
-        
-        return payload
-        
+        settings = get_settings()
+        with timed("auth"):
+            return jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
     except JWTError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
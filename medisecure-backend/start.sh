@@ -51,12 +51,20 @@ fi
 export HOST=${HOST:-0.0.0.0}
 export PORT=${PORT:-8000}
 export ENVIRONMENT=${ENVIRONMENT:-development}
+export APP_MODE=${APP_MODE:-development}
 
 echo "=== Démarrage de MediSecure API ==="
 echo "Host: $HOST"
 echo "Port: $PORT"
 echo "Environment: $ENVIRONMENT"
+echo "Mode: $APP_MODE"
 
-# Démarrer l'API
+# Démarrer l'API (exec : le serveur reçoit directement SIGTERM)
 echo 'Démarrage de l API...'
-exec uvicorn api.main:app --host "$HOST" --port "$PORT" --reload
\ No newline at end of file
+if [ "$APP_MODE" = "production" ]; then
+    # Workers uvicorn (uvloop, httptools) gérés par gunicorn, voir gunicorn.conf.py
+    exec gunicorn api.main:app -c gunicorn.conf.py
+else
+    # Processus unique avec rechargement automatique
+    exec uvicorn api.main:app --host "$HOST" --port "$PORT" --reload
+fi
\ No newline at end of file
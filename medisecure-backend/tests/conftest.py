@@ -9,6 +9,9 @@ from typing import Generator, Any
 from shared.infrastructure.database.connection import Base
 from shared.container.container import Container
 
+# Tests de plans de requêtes (marqueur `performance`, options --perf-*)
+pytest_plugins = ["tests.performance.plugin"]
+
 # Charger les variables d'environnement
 load_dotenv()
 
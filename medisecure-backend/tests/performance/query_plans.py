@@ -0,0 +1,227 @@
+# tests/performance/query_plans.py
+import json
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+
+# Nœuds de tri : un ORDER BY servi par un index n'en produit pas
+SORT_NODES = {"Sort", "Incremental Sort"}
+
+# Nombre de lignes qu'un tri en mémoire peut traiter sans être signalé
+DEFAULT_MAX_SORT_ROWS = 100
+
+class SQLRecorder:
+    """
+    Capture les requêtes SQL envoyées au driver par un moteur SQLAlchemy.
+    
+    S'utilise comme gestionnaire de contexte autour d'un appel de repository ;
+    les requêtes sont capturées avec leurs paramètres déjà convertis pour le driver.
+    """
+    
+    def __init__(self, engine):
+        """
+        Initialise l'enregistreur.
+        
+        Args:
+            engine: Le moteur SQLAlchemy (synchrone ou asynchrone) à observer
+        """
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.statements: List[Tuple[str, Any]] = []
+    
+    def _capture(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append((statement, parameters))
+    
+    def __enter__(self) -> "SQLRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._capture)
+        return self
+    
+    def __exit__(self, *exc_info):
+        event.remove(self.engine, "before_cursor_execute", self._capture)
+
+def iter_nodes(plan: Dict[str, Any]):
+    """
+    Parcourt récursivement les nœuds d'un plan JSON.
+    
+    Args:
+        plan: Le nœud racine (clé "Plan" de la sortie EXPLAIN FORMAT JSON)
+    
+    Yields:
+        Dict[str, Any]: Chaque nœud du plan
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from iter_nodes(child)
+
+def _node_buffers(node: Dict[str, Any]) -> int:
+    return node.get("Shared Hit Blocks", 0) + node.get("Shared Read Blocks", 0)
+
+def _input_rows(node: Dict[str, Any]) -> int:
+    return sum(child.get("Actual Rows", 0) * child.get("Actual Loops", 1) for child in node.get("Plans", []))
+
+class PlanSummary:
+    """Résumé d'un plan EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON)"""
+    
+    def __init__(self, statement: str, explain_output: Dict[str, Any]):
+        """
+        Extrait les indicateurs utiles d'une sortie EXPLAIN.
+        
+        Args:
+            statement: La requête SQL expliquée
+            explain_output: Le premier élément de la sortie EXPLAIN FORMAT JSON
+        """
+        plan = explain_output["Plan"]
+        nodes = list(iter_nodes(plan))
+        
+        self.statement = statement
+        self.node_types = sorted({node["Node Type"] for node in nodes})
+        # Un parcours séquentiel sans aucun bloc lu porte sur une relation vide (partition par défaut)
+        self.seq_scans = sorted({
+            node["Relation Name"] for node in nodes
+            if node["Node Type"] == "Seq Scan" and _node_buffers(node) > 0
+        })
+        # (lignes triées, tri sur disque) de chaque nœud de tri
+        self.sorts = [
+            (_input_rows(node), node.get("Sort Space Type") == "Disk")
+            for node in nodes if node["Node Type"] in SORT_NODES
+        ]
+        # Les compteurs de buffers d'un nœud incluent ceux de ses enfants
+        self.shared_buffers = _node_buffers(plan)
+        self.execution_ms = explain_output.get("Execution Time", 0.0)
+    
+    def __repr__(self):
+        return (
+            f"<PlanSummary nodes={self.node_types} buffers={self.shared_buffers} "
+            f"time={self.execution_ms:.2f}ms>"
+        )
+
+async def explain_analyze(conn, statement: str, parameters: Any = None) -> PlanSummary:
+    """
+    Exécute une requête sous EXPLAIN (ANALYZE, BUFFERS) et résume son plan.
+    
+    La requête est réellement exécutée : les écritures doivent être expliquées
+    dans une transaction annulée ensuite.
+    
+    Args:
+        conn: La connexion SQLAlchemy asynchrone
+        statement: La requête SQL au format du driver
+        parameters: Les paramètres capturés avec la requête
+    
+    Returns:
+        PlanSummary: Le résumé du plan exécuté
+    """
+    result = await conn.exec_driver_sql(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters)
+    output = result.scalar_one()
+    if isinstance(output, str):
+        output = json.loads(output)
+    return PlanSummary(statement, output[0])
+
+def check_plan(summary: PlanSummary, budget: Optional[Dict[str, Any]], check_costs: bool = True) -> List[str]:
+    """
+    Compare un plan à son budget et retourne les écarts constatés.
+    
+    Args:
+        summary: Le résumé du plan
+        budget: Le budget de la requête (None si aucun budget n'est enregistré)
+        check_costs: Si False, seuls la forme du plan est vérifiée (buffers et durée ignorés)
+    
+    Returns:
+        List[str]: Les violations, vide si le plan respecte le budget
+    """
+    budget = budget or {}
+    violations = []
+    
+    if summary.seq_scans and not budget.get("allow_seq_scan", False):
+        violations.append(f"parcours séquentiel sur {', '.join(summary.seq_scans)}")
+    
+    max_sort_rows = budget.get("max_sort_rows", DEFAULT_MAX_SORT_ROWS)
+    for sorted_rows, on_disk in summary.sorts:
+        if on_disk or sorted_rows > max_sort_rows:
+            violations.append(f"tri de {sorted_rows} lignes{' sur disque' if on_disk else ''} (budget {max_sort_rows})")
+    
+    if check_costs and "max_shared_buffers" in budget and summary.shared_buffers > budget["max_shared_buffers"]:
+        violations.append(f"{summary.shared_buffers} buffers lus (budget {budget['max_shared_buffers']})")
+    
+    if check_costs and "max_execution_ms" in budget and summary.execution_ms > budget["max_execution_ms"]:
+        violations.append(f"{summary.execution_ms:.2f} ms (budget {budget['max_execution_ms']} ms)")
+    
+    return violations
+
+class QueryBudgets:
+    """
+    Budgets des requêtes des repositories, stockés dans un fichier JSON.
+    
+    Les budgets en buffers et en durée dépendent du volume de données : ils ne sont
+    vérifiés que si le jeu de données courant correspond à celui de la calibration.
+    """
+    
+    # Marges appliquées aux valeurs observées lors d'une recalibration
+    BUFFER_HEADROOM = 1.5
+    TIME_HEADROOM = 3.0
+    MIN_EXECUTION_MS = 5.0
+    
+    def __init__(self, path: str, dataset: Dict[str, int], update: bool = False):
+        """
+        Charge les budgets.
+        
+        Args:
+            path: Le chemin du fichier de budgets
+            dataset: Le volume du jeu de données courant
+            update: Si True, les mesures servent à recalibrer les budgets au lieu d'être vérifiées
+        """
+        self.path = path
+        self.dataset = dataset
+        self.update = update
+        self.observed: Dict[str, Dict[str, Any]] = {}
+        
+        content = {"dataset": {}, "queries": {}}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as budget_file:
+                content = json.load(budget_file)
+        
+        self.calibrated_dataset = content.get("dataset", {})
+        self.queries = content.get("queries", {})
+    
+    @property
+    def check_costs(self) -> bool:
+        """Indique si les budgets en buffers et en durée s'appliquent au jeu de données courant"""
+        return not self.update and self.calibrated_dataset == self.dataset
+    
+    def get(self, query_id: str) -> Optional[Dict[str, Any]]:
+        return self.queries.get(query_id)
+    
+    def record(self, query_id: str, summaries: List[PlanSummary]) -> None:
+        """
+        Enregistre les mesures d'une requête en vue d'une recalibration.
+        
+        Args:
+            query_id: L'identifiant de la requête (`Repository.methode[cas]`)
+            summaries: Les plans des requêtes émises par la méthode
+        """
+        self.observed[query_id] = {
+            "shared_buffers": max(summary.shared_buffers for summary in summaries),
+            "execution_ms": max(summary.execution_ms for summary in summaries),
+        }
+    
+    def save(self) -> None:
+        """
+        Réécrit le fichier de budgets à partir des mesures enregistrées.
+        
+        Les autorisations (`allow_seq_scan`, `max_sort_rows`) et les notes existantes
+        sont conservées ; elles ne sont jamais accordées automatiquement.
+        """
+        queries = {}
+        for query_id, observed in sorted(self.observed.items()):
+            budget = {
+                key: value for key, value in self.queries.get(query_id, {}).items()
+                if key in ("allow_seq_scan", "max_sort_rows", "note")
+            }
+            budget["max_shared_buffers"] = int(observed["shared_buffers"] * self.BUFFER_HEADROOM) + 10
+            budget["max_execution_ms"] = round(
+                max(observed["execution_ms"] * self.TIME_HEADROOM, self.MIN_EXECUTION_MS), 1
+            )
+            queries[query_id] = budget
+        
+        with open(self.path, "w", encoding="utf-8") as budget_file:
+            json.dump({"dataset": self.dataset, "queries": queries}, budget_file, indent=2, ensure_ascii=False)
+            budget_file.write("\n")
@@ -0,0 +1,97 @@
+# tests/performance/test_repository_query_plans.py
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from tests.performance.query_plans import SQLRecorder, check_plan, explain_analyze
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from patient_management.infrastructure.adapters.secondary.asyncpg_patient_repository import AsyncpgPatientRepository
+from appointment_management.infrastructure.adapters.secondary.postgres_appointment_repository import PostgresAppointmentRepository
+from appointment_management.infrastructure.adapters.secondary.asyncpg_appointment_repository import AsyncpgAppointmentRepository
+from shared.adapters.secondary.postgres_user_repository import PostgresUserRepository
+
+# (identifiant du budget, repository, méthode, arguments construits à partir du jeu de données)
+QUERY_CASES = [
+    ("PostgresPatientRepository.get_by_id", PostgresPatientRepository, "get_by_id",
+     lambda ds: (ds.sample_patient_id(),)),
+    ("PostgresPatientRepository.get_by_email", PostgresPatientRepository, "get_by_email",
+     lambda ds: (ds.sample_patient_email(),)),
+    ("PostgresPatientRepository.list_all", PostgresPatientRepository, "list_all",
+     lambda ds: (0, 100)),
+    ("PostgresPatientRepository.search[name]", PostgresPatientRepository, "search",
+     lambda ds: (ds.sample_patient()["last_name"],)),
+    ("PostgresPatientRepository.search[email]", PostgresPatientRepository, "search",
+     lambda ds: (None, None, ds.sample_patient_email())),
+    ("PostgresPatientRepository.count", PostgresPatientRepository, "count",
+     lambda ds: ()),
+    ("PostgresAppointmentRepository.get_by_id", PostgresAppointmentRepository, "get_by_id",
+     lambda ds: (ds.sample_appointment_id(),)),
+    ("PostgresAppointmentRepository.list_all", PostgresAppointmentRepository, "list_all",
+     lambda ds: (0, 100)),
+    ("PostgresAppointmentRepository.get_by_patient", PostgresAppointmentRepository, "get_by_patient",
+     lambda ds: (ds.sample_patient_id(), 0, 100)),
+    ("PostgresAppointmentRepository.get_by_doctor", PostgresAppointmentRepository, "get_by_doctor",
+     lambda ds: (ds.sample_doctor_id(), 0, 100)),
+    ("PostgresAppointmentRepository.get_by_doctor_between", PostgresAppointmentRepository, "get_by_doctor_between",
+     lambda ds: (ds.sample_doctor_id(), ds.sample_slot(), ds.sample_slot() + timedelta(hours=1))),
+    ("PostgresAppointmentRepository.get_by_date_range", PostgresAppointmentRepository, "get_by_date_range",
+     lambda ds: (ds.sample_day(), ds.sample_day() + timedelta(days=7), 0, 100)),
+    ("PostgresAppointmentRepository.count", PostgresAppointmentRepository, "count",
+     lambda ds: ()),
+    ("AsyncpgPatientRepository.get_by_id", AsyncpgPatientRepository, "get_by_id",
+     lambda ds: (ds.sample_patient_id(),)),
+    ("AsyncpgPatientRepository.get_by_email", AsyncpgPatientRepository, "get_by_email",
+     lambda ds: (ds.sample_patient_email(),)),
+    ("AsyncpgAppointmentRepository.get_by_id", AsyncpgAppointmentRepository, "get_by_id",
+     lambda ds: (ds.sample_appointment_id(),)),
+    ("AsyncpgAppointmentRepository.get_by_doctor", AsyncpgAppointmentRepository, "get_by_doctor",
+     lambda ds: (ds.sample_doctor_id(), 0, 100)),
+    ("PostgresUserRepository.get_by_id", PostgresUserRepository, "get_by_id",
+     lambda ds: (ds.sample_doctor_id(),)),
+    ("PostgresUserRepository.get_by_email", PostgresUserRepository, "get_by_email",
+     lambda ds: (ds.sample_doctor_email(),)),
+]
+
+async def _run_and_explain(database_url, repository_class, method_name, args):
+    """Exécute la méthode du repository puis rejoue ses requêtes sous EXPLAIN ANALYZE"""
+    engine = create_async_engine(database_url)
+    try:
+        repository = repository_class(sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False))
+        with SQLRecorder(engine) as recorder:
+            await getattr(repository, method_name)(*args)
+        
+        summaries = []
+        async with engine.connect() as conn:
+            for statement, parameters in recorder.statements:
+                # La première exécution charge le cache : seule la seconde est mesurée
+                await explain_analyze(conn, statement, parameters)
+                summaries.append(await explain_analyze(conn, statement, parameters))
+            await conn.rollback()
+        return summaries
+    finally:
+        await engine.dispose()
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "query_id, repository_class, method_name, make_args",
+    QUERY_CASES,
+    ids=[case[0] for case in QUERY_CASES]
+)
+def test_repository_query_plan(perf_dataset, query_budgets, query_id, repository_class, method_name, make_args):
+    """Test que les requêtes du repository respectent leur plan et leur budget"""
+    summaries = asyncio.run(
+        _run_and_explain(perf_dataset.database_url, repository_class, method_name, make_args(perf_dataset))
+    )
+    assert summaries, f"{query_id}: aucune requête émise"
+    query_budgets.record(query_id, summaries)
+    
+    violations = [
+        f"{violation}\n    {summary.statement}"
+        for summary in summaries
+        for violation in check_plan(summary, query_budgets.get(query_id), query_budgets.check_costs)
+    ]
+    assert not violations, f"{query_id}:\n" + "\n".join(violations)
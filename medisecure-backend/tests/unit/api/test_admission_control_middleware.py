@@ -0,0 +1,81 @@
+# tests/unit/api/test_admission_control_middleware.py
+
+import asyncio
+
+from api.middlewares.admission_control_middleware import (
+    AdmissionControlMiddleware, AdmissionController, TrafficClass
+)
+
+def test_released_slot_goes_to_the_highest_priority_waiter():
+    """Test qu'une place libérée revient à la classe la plus prioritaire en attente"""
+    booking = TrafficClass("booking", 0, 1.0, 1000)
+    export = TrafficClass("export", 2, 1.0, 1000)
+    controller = AdmissionController(1, [booking, export])
+    order = []
+    
+    async def request(traffic_class, name):
+        assert await controller.acquire(traffic_class)
+        order.append(name)
+        await asyncio.sleep(0)
+        controller.release(traffic_class)
+    
+    async def scenario():
+        assert await controller.acquire(export)
+        waiters = [asyncio.ensure_future(request(export, "export")), asyncio.ensure_future(request(booking, "booking"))]
+        await asyncio.sleep(0)
+        controller.release(export)
+        await asyncio.gather(*waiters)
+    
+    asyncio.run(scenario())
+    assert order == ["booking", "export"]
+    assert controller.in_flight == 0
+
+def test_request_waiting_beyond_its_budget_is_rejected_with_retry_after():
+    """Test le 503 rapide avec Retry-After lorsque la file dépasse le budget d'attente"""
+    started = asyncio.Event()
+    finish = asyncio.Event()
+    
+    async def slow_app(scope, receive, send):
+        started.set()
+        await finish.wait()
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+    
+    middleware = AdmissionControlMiddleware(slow_app, capacity=1, retry_after=2)
+    middleware.search.max_wait = 0.01
+    
+    def call(messages):
+        scope = {"type": "http", "method": "GET", "path": "/api/patients/", "query_string": b"limit=10", "headers": []}
+        
+        async def send(message):
+            messages.append(message)
+        return middleware(scope, None, send)
+    
+    async def scenario():
+        first, second = [], []
+        running = asyncio.ensure_future(call(first))
+        await started.wait()
+        await call(second)
+        finish.set()
+        await running
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    assert first[0]["status"] == 200
+    assert second[0]["status"] == 503
+    assert (b"retry-after", b"2") in second[0]["headers"]
+    assert middleware.controller.in_flight == 0
+
+def test_classification_by_method_path_and_page_size():
+    """Test l'affectation des requêtes aux classes booking, search et export"""
+    middleware = AdmissionControlMiddleware(None, capacity=10)
+    
+    def classify(method, path, query=b""):
+        traffic_class = middleware.classify({"method": method, "path": path, "query_string": query})
+        return traffic_class.name if traffic_class else None
+    
+    assert classify("POST", "/api/appointments/") == "booking"
+    assert classify("POST", "/api/patients/search") == "search"
+    assert classify("GET", "/api/patients/", b"skip=0&limit=50") == "search"
+    assert classify("GET", "/api/patients/", b"limit=5000") == "export"
+    assert classify("GET", "/api/health") is None
@@ -0,0 +1,70 @@
+# tests/unit/api/test_authentication_middleware.py
+
+import asyncio
+
+from fastapi import Depends, FastAPI
+
+from api.middlewares.authentication_middleware import AuthenticationMiddleware
+from shared.services.authenticator.basic_authenticator import BasicAuthenticator
+from shared.services.authenticator.extract_token import extract_token_payload
+
+def build_app() -> AuthenticationMiddleware:
+    app = FastAPI()
+    
+    @app.get("/api/patients/")
+    async def list_patients(token_payload: dict = Depends(extract_token_payload)):
+        return {"role": token_payload["role"]}
+    
+    @app.get("/api/health")
+    async def health():
+        return {"status": "healthy"}
+    
+    return AuthenticationMiddleware(app)
+
+def call(app, path: str, token: str = None, method: str = "GET"):
+    """Exécute une requête sur l'application ASGI et retourne (statut, en-têtes, scope)"""
+    messages = []
+    headers = [(b"authorization", f"Bearer {token}".encode())] if token else []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": method, "path": path, "raw_path": path.encode(),
+        "root_path": "", "scheme": "http", "query_string": b"", "headers": headers, "server": ("test", 80), "client": ("test", 1),
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    return start["status"], dict(start["headers"]), scope
+
+def test_valid_token_is_decoded_once_and_shared_with_routes():
+    """Test que le payload validé par le middleware est réutilisé par extract_token_payload"""
+    token = BasicAuthenticator().create_access_token({"sub": "doc@medisecure.com", "role": "doctor"})
+    
+    status, _, scope = call(build_app(), "/api/patients/", token)
+    
+    assert status == 200
+    assert scope["state"]["user"]["sub"] == "doc@medisecure.com"
+    assert scope["state"]["user"]["role"] == "doctor"
+
+def test_invalid_token_is_left_to_the_route():
+    """Test qu'un token invalide n'est pas attaché à la requête et que la route le refuse"""
+    status, _, scope = call(build_app(), "/api/patients/", "invalide")
+    
+    assert status == 401
+    assert "user" not in scope.get("state", {})
+
+def test_exempt_paths_and_preflight():
+    """Test les chemins exemptés (correspondance exacte) et les requêtes CORS preflight"""
+    app = build_app()
+    token = BasicAuthenticator().create_access_token({"sub": "doc@medisecure.com"})
+    
+    assert "state" not in call(app, "/api/health", token)[2]
+    status, headers, _ = call(app, "/api/patients/", method="OPTIONS")
+    assert status == 200
+    assert headers[b"access-control-allow-origin"] == b"*"
+    assert b"PATCH" in headers[b"access-control-allow-methods"].split(b", ")
+    assert b"X-Request-Timeout" in headers[b"access-control-allow-headers"].split(b", ")
@@ -0,0 +1,96 @@
+# tests/unit/appointment_management/test_calendar_cache.py
+
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import orjson
+
+from appointment_management.domain.entities.appointment import Appointment
+from appointment_management.infrastructure.adapters.primary.controllers import appointment_controller
+from appointment_management.infrastructure.adapters.secondary import calendar_cache as calendar_cache_module
+from appointment_management.infrastructure.adapters.secondary.calendar_cache import CalendarCache, months_between
+from appointment_management.infrastructure.adapters.secondary.in_memory_appointment_repository import InMemoryAppointmentRepository
+from shared.config import Settings
+
+def put(cache: CalendarCache, key, body: bytes) -> None:
+    cache.put(key, body, cache.generation(key))
+
+def test_invalidation_only_drops_the_affected_months():
+    """Test que l'écriture d'un rendez-vous n'invalide que les pages de son mois"""
+    cache = CalendarCache()
+    put(cache, (2024, 1, None, "all"), b"janvier")
+    put(cache, (2024, 1, "doctor", "all"), b"janvier-medecin")
+    put(cache, (2024, 2, None, "all"), b"fevrier")
+    
+    cache.invalidate_months({(2024, 1)})
+    
+    assert cache.get((2024, 1, None, "all")) is None
+    assert cache.get((2024, 1, "doctor", "all")) is None
+    assert cache.get((2024, 2, None, "all")) == b"fevrier"
+
+def test_page_read_during_an_invalidation_is_not_stored():
+    """Test qu'une page lue avant une invalidation de son mois n'entre pas en cache"""
+    cache = CalendarCache()
+    key = (2024, 1, None, "all")
+    generation = cache.generation(key)
+    
+    cache.invalidate_months({(2024, 1)})
+    cache.put(key, b"perime", generation)
+    
+    assert cache.get(key) is None
+
+def test_least_recently_used_page_is_evicted_and_pages_expire(monkeypatch):
+    """Test l'éviction LRU et l'expiration des pages"""
+    now = [1000.0]
+    monkeypatch.setattr(calendar_cache_module.time, "monotonic", lambda: now[0])
+    cache = CalendarCache(max_entries=2, ttl=10)
+    put(cache, (2024, 1, None, "all"), b"1")
+    put(cache, (2024, 2, None, "all"), b"2")
+    cache.get((2024, 1, None, "all"))
+    put(cache, (2024, 3, None, "all"), b"3")
+    
+    assert cache.get((2024, 2, None, "all")) is None
+    assert cache.get((2024, 1, None, "all")) == b"1"
+    now[0] += 10
+    assert cache.get((2024, 1, None, "all")) is None
+    assert len(cache) == 1
+
+def test_months_between_spans_year_boundaries():
+    """Test les mois couverts par un rendez-vous à cheval sur deux mois"""
+    assert months_between(datetime(2024, 3, 5, 9), datetime(2024, 3, 5, 10)) == {(2024, 3)}
+    assert months_between(datetime(2024, 12, 31, 23, 30), datetime(2025, 1, 1, 0, 30)) == {(2024, 12), (2025, 1)}
+
+def test_calendar_cache_needs_one_worker_or_shared_invalidations():
+    """Test que le cache de calendrier n'est actif que si les pages des workers ne peuvent diverger"""
+    assert Settings(app_mode="development").calendar_cache_entries == 512
+    assert Settings(app_mode="production", web_concurrency=1).calendar_cache_entries == 512
+    assert Settings(app_mode="production", cache_backend="redis").calendar_cache_entries == 512
+    assert Settings(app_mode="production", cache_backend="shared_memory").calendar_cache_entries == 0
+
+def test_truncated_calendar_page_is_marked_and_not_cached(monkeypatch):
+    """Test qu'un mois de plus de rendez-vous que la page est marqué tronqué et n'entre pas en cache"""
+    monkeypatch.setattr(appointment_controller, "get_settings", lambda: Settings(calendar_page_limit=3))
+    repository = InMemoryAppointmentRepository()
+    for i in range(4):
+        start_time = datetime(2024, 3, 4, 9) + timedelta(days=i)
+        appointment = Appointment(uuid.uuid4(), uuid.uuid4(), uuid.uuid4(), start_time, start_time + timedelta(minutes=30))
+        repository.appointments[appointment.id] = appointment
+    cache = CalendarCache()
+    container = SimpleNamespace(calendar_cache=lambda: cache, appointment_repository=lambda: repository)
+    
+    async def get_calendar():
+        return await appointment_controller.get_calendar(
+            year=2024, month=3, doctor_id=None, token_payload={"role": "admin"}, container=container
+        )
+    
+    page = orjson.loads(asyncio.run(get_calendar()).body)
+    
+    assert page["truncated"] is True
+    assert len(page["appointments"]) == page["limit"] == 3
+    assert len(cache) == 0
+    # Mois complet : page conservée
+    repository.appointments.popitem()
+    assert orjson.loads(asyncio.run(get_calendar()).body)["truncated"] is False
+    assert len(cache) == 1
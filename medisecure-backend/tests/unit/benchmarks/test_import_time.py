@@ -0,0 +1,25 @@
+# tests/unit/benchmarks/test_import_time.py
+
+import os
+
+from benchmarks.import_time import DEFERRED_MODULES, measure_import, parse_importtime
+
+# Budget large : la machine de CI peut être plus lente que la cible de production (1 s)
+IMPORT_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "2000"))
+
+def test_parse_importtime():
+    """Test l'analyse de la sortie de -X importtime"""
+    output = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   posix\n"
+        "import time:      3500 |      42000 | api.main\n"
+    )
+    
+    assert parse_importtime(output) == {"posix": (120, 120), "api.main": (3500, 42000)}
+
+def test_api_import_stays_within_budget():
+    """Test que l'import de l'API tient dans le budget sans charger les dépendances différées"""
+    modules = measure_import("api.main")
+    
+    assert not [name for name in DEFERRED_MODULES if name in modules]
+    assert modules["api.main"][1] / 1000 < IMPORT_BUDGET_MS
@@ -0,0 +1,41 @@
+# tests/unit/benchmarks/test_report.py
+
+from benchmarks.compare import compare_reports
+from benchmarks.report import EndpointStats, percentile
+
+def _report(p95: float):
+    return {"endpoints": {"GET /api/patients/{patient_id}": {
+        "rps": 10.0, "latency_ms": {"p50": 5.0, "p95": p95, "p99": p95 * 2}
+    }}}
+
+def test_percentile_interpolation():
+    """Test le calcul des percentiles par interpolation linéaire"""
+    values = [1.0, 2.0, 3.0, 4.0, 5.0]
+    
+    assert percentile(values, 50) == 3.0
+    assert percentile(values, 95) == 4.8
+    assert percentile([], 99) == 0.0
+
+def test_endpoint_stats_counts_server_errors():
+    """Test que seules les erreurs serveur et réseau sont comptées comme erreurs"""
+    stats = EndpointStats()
+    stats.record(0.010, 200)
+    stats.record(0.020, 400)
+    stats.record(0.030, 503)
+    stats.record(0.040, None)
+    
+    summary = stats.summary(elapsed=2.0)
+    
+    assert summary["requests"] == 4
+    assert summary["rps"] == 2.0
+    assert summary["errors"] == 2
+    assert summary["status_codes"] == {"200": 1, "400": 1, "503": 1, "error": 1}
+    assert summary["latency_ms"]["max"] == 40.0
+
+def test_compare_reports_flags_p95_regression():
+    """Test la détection d'une régression du p95 au-delà du seuil"""
+    _, regressions = compare_reports(_report(10.0), _report(10.5), max_regression=0.10)
+    assert regressions == []
+    
+    _, regressions = compare_reports(_report(10.0), _report(12.0), max_regression=0.10)
+    assert regressions == ["GET /api/patients/{patient_id}"]
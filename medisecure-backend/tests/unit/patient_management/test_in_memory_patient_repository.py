@@ -0,0 +1,57 @@
+# tests/unit/patient_management/test_in_memory_patient_repository.py
+
+import asyncio
+import pytest
+from datetime import date
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+def make_patient(email):
+    """Crée un patient de test"""
+    return Patient(
+        id=uuid4(),
+        first_name="John",
+        last_name="Doe",
+        date_of_birth=date(1980, 1, 1),
+        gender="male",
+        email=email
+    )
+
+def test_soft_delete_hides_patient_from_reads():
+    """Test qu'un patient supprimé logiquement n'apparaît plus dans les lectures"""
+    # Arrange
+    repository = InMemoryPatientRepository()
+    kept = asyncio.run(repository.create(make_patient("kept@example.com")))
+    deleted = asyncio.run(repository.create(make_patient("deleted@example.com")))
+    
+    # Act
+    result = asyncio.run(repository.delete(deleted.id))
+    
+    # Assert
+    assert result is True
+    assert deleted.id in repository.patients
+    assert repository.patients[deleted.id].is_active is False
+    assert asyncio.run(repository.get_by_id(deleted.id)) is None
+    assert asyncio.run(repository.get_by_email("deleted@example.com")) is None
+    assert [p.id for p in asyncio.run(repository.list_all())] == [kept.id]
+    assert [p.id for p in asyncio.run(repository.search(name="doe"))] == [kept.id]
+    assert asyncio.run(repository.count()) == 1
+    
+    # Une seconde suppression ne trouve plus le patient
+    assert asyncio.run(repository.delete(deleted.id)) is False
+
+def test_hard_delete_removes_patient():
+    """Test que la suppression physique retire le patient du stockage"""
+    # Arrange
+    repository = InMemoryPatientRepository(soft_delete=False)
+    patient = asyncio.run(repository.create(make_patient("john.doe@example.com")))
+    
+    # Act
+    result = asyncio.run(repository.delete(patient.id))
+    
+    # Assert
+    assert result is True
+    assert patient.id not in repository.patients
+    assert "john.doe@example.com" not in repository.email_index
@@ -0,0 +1,110 @@
+# tests/unit/patient_management/test_patch_patient_usecase.py
+
+import asyncio
+import pytest
+from datetime import date, datetime
+from uuid import uuid4
+
+from patient_management.domain.entities.patient import Patient
+from patient_management.domain.services.patient_service import PatientService
+from patient_management.domain.exceptions.patient_exceptions import (
+    PatientNotFoundException,
+    MissingRequiredFieldException
+)
+from patient_management.application.dtos.patient_dtos import PatientUpdateDTO
+from patient_management.application.usecases.patch_patient_usecase import PatchPatientUseCase
+from patient_management.infrastructure.adapters.secondary.in_memory_patient_repository import InMemoryPatientRepository
+
+class RecordingPatientRepository(InMemoryPatientRepository):
+    """Repository en mémoire qui enregistre les appels à patch"""
+    
+    def __init__(self):
+        super().__init__()
+        self.patch_calls = []
+    
+    async def patch(self, patient_id, changes, medical_changes=None):
+        self.patch_calls.append((changes, medical_changes))
+        return await super().patch(patient_id, changes, medical_changes)
+
+@pytest.fixture
+def repository():
+    """Fixture pour créer un repository contenant un patient de test"""
+    repository = RecordingPatientRepository()
+    patient = Patient(
+        id=uuid4(),
+        first_name="John",
+        last_name="Doe",
+        date_of_birth=date(1980, 1, 1),
+        gender="male",
+        email="john.doe@example.com",
+        allergies={"penicillin": "severe"},
+        has_consent=True,
+        gdpr_consent=True,
+        consent_date=datetime.utcnow()
+    )
+    asyncio.run(repository.create(patient))
+    return repository
+
+@pytest.fixture
+def patient_id(repository):
+    """Fixture pour récupérer l'ID du patient de test"""
+    return next(iter(repository.patients))
+
+@pytest.fixture
+def use_case(repository):
+    """Fixture pour créer le cas d'utilisation"""
+    return PatchPatientUseCase(patient_repository=repository, patient_service=PatientService())
+
+def test_patch_writes_only_changed_fields(use_case, repository, patient_id):
+    """Test que seuls les champs réellement modifiés sont écrits"""
+    # Arrange
+    data = PatientUpdateDTO(first_name="John", city="Lyon")
+    
+    # Act
+    result = asyncio.run(use_case.execute(patient_id, data))
+    
+    # Assert
+    assert repository.patch_calls == [({"city": "Lyon"}, {})]
+    assert result.city == "Lyon"
+    assert result.first_name == "John"
+
+def test_patch_merges_medical_sub_keys(use_case, repository, patient_id):
+    """Test que seules les sous-clés modifiées des documents médicaux sont envoyées"""
+    # Arrange
+    data = PatientUpdateDTO(allergies={"penicillin": "severe", "pollen": "mild"})
+    
+    # Act
+    result = asyncio.run(use_case.execute(patient_id, data))
+    
+    # Assert
+    assert repository.patch_calls == [({}, {"allergies": {"pollen": "mild"}})]
+    assert result.allergies == {"penicillin": "severe", "pollen": "mild"}
+
+def test_patch_without_changes_skips_write(use_case, repository, patient_id):
+    """Test qu'aucune écriture n'a lieu si rien n'a changé"""
+    # Arrange
+    data = PatientUpdateDTO(last_name="Doe")
+    
+    # Act
+    result = asyncio.run(use_case.execute(patient_id, data))
+    
+    # Assert
+    assert repository.patch_calls == []
+    assert result.last_name == "Doe"
+
+def test_patch_null_required_field(use_case, patient_id):
+    """Test qu'un champ obligatoire ne peut pas être remis à null"""
+    # Arrange
+    data = PatientUpdateDTO(last_name=None)
+    
+    # Act & Assert
+    with pytest.raises(MissingRequiredFieldException) as excinfo:
+        asyncio.run(use_case.execute(patient_id, data))
+    
+    assert "last_name" in str(excinfo.value)
+
+def test_patch_unknown_patient(use_case):
+    """Test la mise à jour partielle d'un patient inexistant"""
+    # Act & Assert
+    with pytest.raises(PatientNotFoundException):
+        asyncio.run(use_case.execute(uuid4(), PatientUpdateDTO(city="Lyon")))
@@ -0,0 +1,165 @@
+# tests/unit/shared/test_cache.py
+
+import asyncio
+from datetime import date, datetime
+from uuid import uuid4
+
+import pytest
+
+from appointment_management.domain.entities.appointment import Appointment, AppointmentStatus
+from patient_management.domain.entities.patient import Patient
+from shared.infrastructure.cache.memory_cache import InMemoryCache
+from shared.infrastructure.cache.redis_cache import RedisCache
+from shared.infrastructure.cache.repository_cache import RepositoryCache, cached_read
+from shared.infrastructure.cache.serialization import EntityCodec, MsgpackSerializer, OrjsonSerializer
+from shared.infrastructure.cache.shared_memory_cache import SharedMemoryCache
+from shared.infrastructure.cache.tiered_cache import TieredCache
+from shared.infrastructure.database.single_flight import WRITES_KEY
+from shared.infrastructure.database.unit_of_work import current_session
+
+PATIENT_CODEC = EntityCodec(Patient)
+
+def make_patient() -> Patient:
+    return Patient(
+        id=uuid4(),
+        first_name="Jean",
+        last_name="Dupont",
+        date_of_birth=date(1980, 5, 17),
+        gender="male",
+        allergies={"pollen": "sévère"},
+        consent_date=datetime(2024, 1, 2, 3, 4, 5),
+    )
+
+class FakeRepository:
+    """Repository factice comptant ses lectures en base"""
+    
+    def __init__(self, record_cache):
+        self.record_cache = record_cache
+        self.patients = {}
+        self.queries = 0
+    
+    @cached_read(PATIENT_CODEC)
+    async def get_by_id(self, patient_id):
+        self.queries += 1
+        await asyncio.sleep(0)
+        return self.patients.get(patient_id)
+
+class FakeSession:
+    def __init__(self, info):
+        self.info = info
+
+@pytest.mark.parametrize("serializer_class", [OrjsonSerializer, MsgpackSerializer])
+def test_entities_round_trip_through_serializers(serializer_class):
+    """Test que les entités relues du cache sont identiques aux entités mises en cache"""
+    if serializer_class is MsgpackSerializer:
+        pytest.importorskip("msgpack")
+    serializer = serializer_class()
+    patient = make_patient()
+    appointment = Appointment(
+        id=uuid4(), patient_id=patient.id, doctor_id=uuid4(),
+        start_time=datetime(2024, 3, 1, 9), end_time=datetime(2024, 3, 1, 9, 30),
+        status=AppointmentStatus.CONFIRMED,
+    )
+    appointment_codec = EntityCodec(Appointment)
+    
+    assert PATIENT_CODEC.decode(serializer.loads(serializer.dumps(PATIENT_CODEC.encode(patient)))) == patient
+    assert appointment_codec.decode(serializer.loads(serializer.dumps(appointment_codec.encode(appointment)))) == appointment
+
+def test_shared_memory_cache_is_shared_between_instances(tmp_path):
+    """Test que deux ouvertures du même fichier (deux workers) voient les mêmes valeurs"""
+    path = str(tmp_path / "cache")
+    
+    async def scenario():
+        worker_a = SharedMemoryCache(path, slots=64, slot_size=256)
+        worker_b = SharedMemoryCache(path, slots=64, slot_size=256)
+        await worker_a.set("patient:1", b"valeur", 30)
+        await worker_a.set("patient:2", b"x" * 300, 30)
+        await worker_a.set("patient:3", b"expire", -1)
+        seen = [await worker_b.get(key) for key in ("patient:1", "patient:2", "patient:3")]
+        await worker_b.delete(["patient:1"])
+        after_delete = await worker_a.get("patient:1")
+        await worker_a.close()
+        await worker_b.close()
+        return seen, after_delete
+    
+    seen, after_delete = asyncio.run(scenario())
+    
+    # Valeur trop grande pour un emplacement : pas mise en cache
+    assert seen == [b"valeur", None, None]
+    assert after_delete is None
+
+def test_redis_invalidation_reaches_the_near_tier_of_other_workers():
+    """Test le cache à deux niveaux sur Redis (fakeredis) et les invalidations par pub/sub"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    
+    def worker() -> RepositoryCache:
+        far = RedisCache(client=fakeredis.FakeAsyncRedis(server=server))
+        return RepositoryCache(TieredCache(InMemoryCache(), far, near_ttl=30), OrjsonSerializer(), ttl=30)
+    
+    async def scenario():
+        cache_a, cache_b = worker(), worker()
+        received = []
+        cache_b.subscribe("calendar", received.append)
+        cache_a.start()
+        cache_b.start()
+        await asyncio.sleep(0.1)
+        patient = make_patient()
+        key = cache_a.key(PATIENT_CODEC, patient.id)
+        await cache_a.put(key, patient, PATIENT_CODEC, cache_a.generation(key))
+        # Lu une fois dans Redis, puis conservé dans le niveau proche du worker B
+        assert await cache_b.get(key, PATIENT_CODEC) == patient
+        assert await cache_b.backend.near.get(key) is not None
+        generation = cache_b.generation(key)
+        
+        await cache_a.invalidate([key, "calendar:2024-03"])
+        for _ in range(100):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.02)
+        result = (
+            await cache_b.backend.near.get(key), await cache_b.get(key, PATIENT_CODEC),
+            cache_b.generation(key) != generation, received
+        )
+        await cache_a.close()
+        await cache_b.close()
+        return result
+    
+    near_value, value, generation_changed, received = asyncio.run(scenario())
+    
+    assert near_value is None and value is None
+    assert generation_changed
+    # Réabonnement initial (None), puis les clés du calendrier seulement
+    assert received == [None, ["calendar:2024-03"]]
+
+def test_cached_read_skips_the_database_and_respects_invalidations():
+    """Test les lectures à travers le cache, une écriture concurrente et une session qui a écrit"""
+    cache = RepositoryCache(InMemoryCache(), OrjsonSerializer(), ttl=30)
+    repository = FakeRepository(cache)
+    patient = make_patient()
+    repository.patients[patient.id] = patient
+    key = cache.key(PATIENT_CODEC, patient.id)
+    
+    async def scenario():
+        # Invalidation pendant la lecture en base : la valeur lue n'est pas conservée
+        read = asyncio.ensure_future(repository.get_by_id(patient.id))
+        await asyncio.sleep(0)
+        await cache.invalidate([key])
+        await read
+        assert await cache.backend.get(key) is None
+        
+        first = await repository.get_by_id(patient.id)
+        second = await repository.get_by_id(patient.id)
+        token = current_session.set(FakeSession({WRITES_KEY: True}))
+        try:
+            await repository.get_by_id(patient.id)
+        finally:
+            current_session.reset(token)
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    
+    assert first == second == patient
+    assert second is not first
+    # Lecture invalidée, lecture mise en cache, lecture de la session qui a écrit
+    assert repository.queries == 3
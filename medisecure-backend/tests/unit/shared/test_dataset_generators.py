@@ -0,0 +1,43 @@
+# tests/unit/shared/test_dataset_generators.py
+
+import json
+
+import pytest
+
+from shared.infrastructure.database.seeding.generators import (
+    APPOINTMENT_COLUMNS, PATIENT_COLUMNS, DatasetSpec, allocate_appointments, generate_appointments, generate_patients
+)
+
+def test_patients_are_deterministic():
+    """Test que la même graine produit les mêmes patients, et une autre graine des patients différents"""
+    spec = DatasetSpec(patients=50, appointments=0, doctors=1)
+    
+    assert generate_patients(spec, 0) == generate_patients(DatasetSpec(patients=50, appointments=0, doctors=1), 0)
+    assert generate_patients(spec, 0) != generate_patients(DatasetSpec(patients=50, appointments=0, doctors=1, seed=7), 0)
+    
+    patient = dict(zip(PATIENT_COLUMNS, generate_patients(spec, 0)[0]))
+    assert patient["gender"] in ("female", "male", "other")
+    assert isinstance(json.loads(patient["chronic_diseases"]), dict)
+
+def test_allocation_matches_total_and_capacity():
+    """Test la répartition des rendez-vous entre médecins"""
+    spec = DatasetSpec(patients=100, appointments=5000, doctors=10, months=3)
+    
+    counts = allocate_appointments(spec)
+    
+    assert sum(counts) == 5000
+    assert len(counts) == 10
+    with pytest.raises(ValueError):
+        allocate_appointments(DatasetSpec(patients=100, appointments=10 ** 6, doctors=2, months=1))
+
+def test_doctor_agenda_has_no_overlap():
+    """Test que l'agenda généré d'un médecin ne contient pas de créneaux qui se chevauchent"""
+    spec = DatasetSpec(patients=100, appointments=1000, doctors=2, months=2)
+    count = allocate_appointments(spec)[0]
+    
+    appointments = [dict(zip(APPOINTMENT_COLUMNS, row)) for row in generate_appointments(spec, 1, count, 1)]
+    
+    assert len(appointments) == count
+    for previous, current in zip(appointments, appointments[1:]):
+        assert previous["end_time"] <= current["start_time"]
+    assert all(spec.first_month.year == appointment["start_time"].year for appointment in appointments)
@@ -0,0 +1,109 @@
+# tests/unit/shared/test_deadline.py
+
+import asyncio
+import time
+from typing import Tuple
+
+from fastapi import APIRouter, FastAPI
+
+from shared.infrastructure.database import deadline as deadline_module
+from shared.infrastructure.database.deadline import current_deadline, deadline, remaining, request_timeout
+from shared.infrastructure.database.unit_of_work import UnitOfWorkRoute
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+    
+    def exec_driver_sql(self, statement):
+        self.statements.append(statement)
+
+def build_app(cancelled: list) -> FastAPI:
+    router = APIRouter(route_class=UnitOfWorkRoute)
+    
+    @router.get("/slow")
+    @request_timeout(50)
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return {}
+    
+    @router.get("/budget")
+    async def budget():
+        return {"remaining": remaining()}
+    
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+def call(app, path: str, headers=(), disconnect_after: float = None) -> Tuple[int, bytes]:
+    """Exécute une requête sur l'application ASGI et retourne (statut, corps)"""
+    messages = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "path": path, "raw_path": path.encode(),
+        "root_path": "", "scheme": "http", "query_string": b"", "headers": list(headers),
+        "server": ("test", 80), "client": ("test", 1),
+    }
+    pending = [{"type": "http.request", "body": b"", "more_body": False}]
+    
+    async def receive():
+        if pending:
+            return pending.pop()
+        await asyncio.sleep(10 if disconnect_after is None else disconnect_after)
+        return {"type": "http.disconnect"}
+    
+    async def send(message):
+        messages.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"], b"".join(m.get("body", b"") for m in messages[1:])
+
+def test_nested_deadline_keeps_the_nearest():
+    """Test qu'une échéance imbriquée ne repousse jamais l'échéance englobante"""
+    with deadline(1.0):
+        outer = current_deadline.get()
+        with deadline(60.0):
+            assert current_deadline.get() == outer
+        with deadline(0.1):
+            assert current_deadline.get() < outer
+    assert current_deadline.get() is None
+
+def test_transaction_gets_remaining_time_as_statement_timeout():
+    """Test le SET LOCAL statement_timeout émis à l'ouverture d'une transaction"""
+    connection = FakeConnection()
+    deadline_module._after_begin(None, None, connection)
+    with deadline(0.25):
+        deadline_module._after_begin(None, None, connection)
+    with deadline(-1):
+        deadline_module._after_begin(None, None, connection)
+    
+    assert len(connection.statements) == 2
+    timeout_ms = int(connection.statements[0].rsplit(" ", 1)[1])
+    assert 200 < timeout_ms <= 250
+    assert connection.statements[1] == "SET LOCAL statement_timeout = 1"
+
+def test_route_deadline_returns_504_and_header_can_only_shorten_it():
+    """Test l'échéance par défaut de la route et l'en-tête X-Request-Timeout"""
+    cancelled = []
+    app = build_app(cancelled)
+    
+    started = time.perf_counter()
+    status, body = call(app, "/slow", headers=[(b"x-request-timeout", b"60000")])
+    
+    assert status == 504
+    assert time.perf_counter() - started < 5
+    assert cancelled == [True]
+    status, body = call(app, "/budget", headers=[(b"x-request-timeout", b"200")])
+    assert status == 200 and 0 < float(body.split(b":")[1].rstrip(b"}")) <= 0.2
+
+def test_client_disconnect_cancels_the_request():
+    """Test qu'une déconnexion du client interrompt le traitement"""
+    cancelled = []
+    app = build_app(cancelled)
+    
+    status, _ = call(app, "/slow", headers=[(b"x-request-timeout", b"5000")], disconnect_after=0.01)
+    
+    assert status == 499
+    assert cancelled == [True]
@@ -0,0 +1,78 @@
+# tests/unit/shared/test_metrics.py
+
+import asyncio
+
+from fastapi import FastAPI
+
+from api.middlewares.metrics_middleware import MetricsMiddleware
+from shared.infrastructure.observability.metrics import HTTP_REQUEST_DURATION, MetricsRegistry, REPOSITORY_CALL_DURATION
+from shared.infrastructure.observability.request_timing import timed_repository
+
+@timed_repository
+class FakeRepository:
+    async def get_by_id(self, item_id: int):
+        return {"id": item_id}
+
+def call(app, path: str) -> int:
+    """Exécute une requête GET sur l'application ASGI et retourne le statut"""
+    messages = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "path": path, "raw_path": path.encode(),
+        "root_path": "", "scheme": "http", "query_string": b"", "headers": [], "server": ("test", 80), "client": ("test", 1),
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    return messages[0]["status"]
+
+def test_histogram_exposition_is_cumulative():
+    """Test le format d'exposition d'un histogramme : seaux cumulés, somme et nombre"""
+    registry = MetricsRegistry()
+    histogram = registry.histogram("test_duration_seconds", "Durée", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(2.0, "/a")
+    
+    lines = registry.render().splitlines()
+    
+    assert "# TYPE test_duration_seconds histogram" in lines
+    assert 'test_duration_seconds_bucket{route="/a",le="0.1"} 1' in lines
+    assert 'test_duration_seconds_bucket{route="/a",le="1"} 2' in lines
+    assert 'test_duration_seconds_bucket{route="/a",le="+Inf"} 3' in lines
+    assert 'test_duration_seconds_sum{route="/a"} 2.55' in lines
+    assert 'test_duration_seconds_count{route="/a"} 3' in lines
+
+def test_counter_and_gauge_exposition():
+    """Test les compteurs (suffixe _total), les jauges calculées et l'échappement des labels"""
+    registry = MetricsRegistry()
+    registry.counter("test_lookups", "Consultations", ("cache",)).inc('say "hi"', amount=2)
+    registry.gauge("test_pool", "Pool", ("state",)).set_function(lambda: {("size",): 10})
+    
+    lines = registry.render().splitlines()
+    
+    assert 'test_lookups_total{cache="say \\"hi\\""} 2' in lines
+    assert 'test_pool{state="size"} 10' in lines
+
+def test_request_duration_is_labelled_with_route_template():
+    """Test que la latence HTTP est indexée par gabarit de route et non par chemin"""
+    app = FastAPI()
+    
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return await FakeRepository().get_by_id(item_id)
+    
+    before = HTTP_REQUEST_DURATION.count("GET", "/items/{item_id}", "200")
+    calls_before = REPOSITORY_CALL_DURATION.count("FakeRepository", "get_by_id")
+    
+    assert call(MetricsMiddleware(app), "/items/1") == 200
+    assert call(MetricsMiddleware(app), "/items/2") == 200
+    assert call(MetricsMiddleware(app), "/missing") == 404
+    
+    assert HTTP_REQUEST_DURATION.count("GET", "/items/{item_id}", "200") == before + 2
+    assert HTTP_REQUEST_DURATION.count("GET", "<unmatched>", "404") >= 1
+    assert REPOSITORY_CALL_DURATION.count("FakeRepository", "get_by_id") == calls_before + 2
@@ -0,0 +1,23 @@
+# tests/unit/shared/test_partition_manager.py
+
+from datetime import date
+
+from shared.infrastructure.database.partition_manager import PartitionManager, add_months, month_start
+
+def test_month_start():
+    """Test le calcul du premier jour du mois"""
+    assert month_start(date(2025, 7, 15)) == date(2025, 7, 1)
+
+def test_add_months_across_years():
+    """Test le décalage de mois à cheval sur deux années"""
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 2, 1), -3) == date(2024, 11, 1)
+    assert add_months(date(2025, 1, 31), 0) == date(2025, 1, 1)
+
+def test_partition_name():
+    """Test le nommage des partitions mensuelles"""
+    manager = PartitionManager(session_factory=None)
+    
+    assert manager.partition_name(date(2025, 7, 15)) == "appointments_y2025m07"
+    assert manager._partition_pattern.match("appointments_y2025m07")
+    assert not manager._partition_pattern.match("appointments_default")
@@ -0,0 +1,67 @@
+# tests/unit/shared/test_read_replicas.py
+
+import asyncio
+import time
+
+from sqlalchemy import column, create_engine, select, table, update
+
+from shared.infrastructure.database.read_replicas import ReplicaRouter, RoutingSession, replica_read
+from shared.infrastructure.database.unit_of_work import current_user_id
+
+PATIENTS = table("patients", column("id"), column("first_name"))
+
+class FakeEngine:
+    """Moteur asynchrone factice : seul le moteur synchrone sous-jacent est utilisé"""
+    
+    def __init__(self, name):
+        self.sync_engine = create_engine("sqlite://")
+        self.url = self.sync_engine.url.set(host=name)
+
+def make_router():
+    primary, replica = FakeEngine("primary"), FakeEngine("replica")
+    router = ReplicaRouter(primary, [replica], max_lag=1.0, sticky_seconds=60)
+    router.replicas[0].lag = 0.01
+    router.replicas[0].checked_at = time.monotonic()
+    return router, primary, replica
+
+@replica_read
+async def routed_bind(session, clause):
+    return session.get_bind(clause=clause)
+
+def test_routable_reads_go_to_a_fresh_replica_until_the_session_writes():
+    """Test le routage des lectures : réplica à jour, puis primaire après une écriture"""
+    router, primary, replica = make_router()
+    session = RoutingSession(bind=primary.sync_engine, replica_router=router)
+    query = select(PATIENTS)
+    
+    assert session.get_bind(clause=query) is primary.sync_engine
+    assert asyncio.run(routed_bind(session, query)) is replica.sync_engine
+    session.get_bind(clause=update(PATIENTS).values(first_name="Jean"))
+    assert asyncio.run(routed_bind(session, query)) is primary.sync_engine
+    
+    # Réplica en retard : lectures sur le primaire
+    other = RoutingSession(bind=primary.sync_engine, replica_router=router)
+    router.replicas[0].lag = 5.0
+    assert asyncio.run(routed_bind(other, query)) is primary.sync_engine
+
+def test_user_reads_stay_on_the_primary_after_a_committed_write():
+    """Test la lecture de ses propres écritures par un utilisateur après validation"""
+    router, primary, replica = make_router()
+    query = select(PATIENTS)
+    
+    token = current_user_id.set("user-1")
+    try:
+        session = RoutingSession(bind=primary.sync_engine, replica_router=router)
+        session.get_bind(clause=update(PATIENTS).values(first_name="Jean"))
+        session.commit()
+        next_session = RoutingSession(bind=primary.sync_engine, replica_router=router)
+        assert asyncio.run(routed_bind(next_session, query)) is primary.sync_engine
+    finally:
+        current_user_id.reset(token)
+    
+    token = current_user_id.set("user-2")
+    try:
+        session = RoutingSession(bind=primary.sync_engine, replica_router=router)
+        assert asyncio.run(routed_bind(session, query)) is replica.sync_engine
+    finally:
+        current_user_id.reset(token)
@@ -0,0 +1,79 @@
+# tests/unit/shared/test_request_timing.py
+
+import asyncio
+
+from fastapi import APIRouter, FastAPI
+from sqlalchemy import create_engine, text
+
+from api.middlewares.server_timing_middleware import ServerTimingMiddleware
+from shared.infrastructure.observability.request_timing import (
+    RequestTimings, TimedRoute, current_timings, install_sql_timing, timed, timed_repository
+)
+
+@timed_repository
+class FakeRepository:
+    async def get_by_id(self, item_id: int):
+        return {"id": item_id}
+
+def build_app(sample_rate: float) -> ServerTimingMiddleware:
+    router = APIRouter(route_class=TimedRoute)
+    
+    @router.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        with timed("auth"):
+            pass
+        return await FakeRepository().get_by_id(item_id)
+    
+    app = FastAPI()
+    app.include_router(router)
+    return ServerTimingMiddleware(app, sample_rate=sample_rate)
+
+def call(app, path: str):
+    """Exécute une requête GET sur l'application ASGI et retourne (statut, en-têtes)"""
+    messages = []
+    scope = {
+        "type": "http", "http_version": "1.1", "method": "GET", "path": path, "raw_path": path.encode(),
+        "root_path": "", "scheme": "http", "query_string": b"", "headers": [], "server": ("test", 80), "client": ("test", 1),
+    }
+    
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+    
+    async def send(message):
+        messages.append(message)
+    
+    asyncio.run(app(scope, receive, send))
+    start = messages[0]
+    return start["status"], {name.decode(): value.decode() for name, value in start["headers"]}
+
+def test_sampled_request_has_server_timing_header():
+    """Test que l'en-tête Server-Timing décrit les phases et les appels de repository"""
+    status, headers = call(build_app(sample_rate=1.0), "/items/42")
+    
+    assert status == 200
+    metrics = [metric.split(";")[0] for metric in headers["server-timing"].split(", ")]
+    for expected in ("auth", "dependencies", "handler", "serialization", "repo.FakeRepository.get_by_id", "total"):
+        assert expected in metrics
+
+def test_unsampled_request_has_no_header():
+    """Test qu'une requête non échantillonnée n'est pas instrumentée"""
+    status, headers = call(build_app(sample_rate=0.0), "/items/42")
+    
+    assert status == 200
+    assert "server-timing" not in headers
+
+def test_sql_statements_are_counted():
+    """Test le comptage des requêtes SQL de la requête en cours"""
+    install_sql_timing()
+    engine = create_engine("sqlite://")
+    timings = RequestTimings()
+    token = current_timings.set(timings)
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+    finally:
+        current_timings.reset(token)
+    
+    assert timings.sql_count == 2
+    assert "db;dur=" in timings.server_timing(timings.elapsed_ms())
@@ -0,0 +1,64 @@
+# tests/unit/shared/test_settings.py
+
+import pytest
+from jose import jwt
+from pydantic import ValidationError
+
+from appointment_management.infrastructure.adapters.secondary.asyncpg_appointment_repository import AsyncpgAppointmentRepository
+from patient_management.infrastructure.adapters.secondary.asyncpg_patient_repository import AsyncpgPatientRepository
+from patient_management.infrastructure.adapters.secondary.postgres_patient_repository import PostgresPatientRepository
+from shared.config import Settings, get_settings
+from shared.container.container import Container
+from shared.infrastructure.database.connection import engine_options
+from shared.services.authenticator.basic_authenticator import BasicAuthenticator
+
+def test_settings_are_read_from_environment(monkeypatch):
+    """Test la lecture et la validation des variables d'environnement"""
+    monkeypatch.setenv("DATABASE_URL", "postgresql://user@db:5432/medisecure")
+    monkeypatch.setenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "5")
+    monkeypatch.setenv("SLOW_QUERY_EXPLAIN", "false")
+    monkeypatch.setenv("LOG_FORMAT", "JSON")
+    
+    settings = Settings()
+    
+    assert settings.database_url == "postgresql+asyncpg://user@db:5432/medisecure"
+    assert settings.access_token_expire_minutes == 5
+    assert settings.slow_query_explain is False
+    assert settings.log_format == "json"
+    
+    monkeypatch.setenv("DB_POOL_SIZE", "0")
+    with pytest.raises(ValidationError):
+        Settings()
+
+def test_pgbouncer_transaction_mode_disables_statement_caches():
+    """Test que les requêtes préparées ne sont pas conservées derrière PgBouncer en mode transaction"""
+    default = engine_options(Settings(db_prepared_statement_cache_size=256, db_compiled_cache_size=1000))
+    pgbouncer = engine_options(Settings(db_pgbouncer_transaction_mode=True))["connect_args"]
+    
+    assert default["query_cache_size"] == 1000
+    assert default["connect_args"] == {"prepared_statement_cache_size": 256}
+    assert pgbouncer["prepared_statement_cache_size"] == 0 and pgbouncer["statement_cache_size"] == 0
+    # Noms uniques : un processus serveur peut servir plusieurs connexions de l'application
+    assert pgbouncer["prepared_statement_name_func"]() != pgbouncer["prepared_statement_name_func"]()
+
+def test_settings_are_loaded_once():
+    """Test que get_settings retourne la même instance à chaque appel"""
+    assert get_settings() is get_settings()
+
+def test_settings_are_injected_into_authenticator():
+    """Test que l'authentificateur utilise les paramètres qui lui sont fournis"""
+    settings = Settings(jwt_secret_key="secret-de-test", access_token_expire_minutes=1)
+    
+    token = BasicAuthenticator(settings).create_access_token({"sub": "user"})
+    
+    assert jwt.decode(token, "secret-de-test", algorithms=["HS256"])["sub"] == "user"
+
+def test_repository_adapter_is_selected_by_settings():
+    """Test le choix des adaptateurs des repositories (REPOSITORY_ADAPTER)"""
+    container = Container()
+    
+    assert isinstance(container.patient_repository(), PostgresPatientRepository)
+    container.config.repository_adapter.override("asyncpg")
+    assert isinstance(container.patient_repository(), AsyncpgPatientRepository)
+    assert isinstance(container.appointment_repository(), AsyncpgAppointmentRepository)
+    assert Settings(repository_adapter="ASYNCPG").repository_adapter == "asyncpg"
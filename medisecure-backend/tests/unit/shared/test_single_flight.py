@@ -0,0 +1,82 @@
+# tests/unit/shared/test_single_flight.py
+
+import asyncio
+
+import pytest
+
+from shared.infrastructure.database import single_flight as single_flight_module
+from shared.infrastructure.database.single_flight import WRITES_KEY, single_flight
+from shared.infrastructure.database.unit_of_work import current_session
+
+class Record:
+    def __init__(self, value):
+        self.value = value
+
+class FakeRepository:
+    """Repository factice dont chaque lecture dure 10 ms"""
+    
+    def __init__(self):
+        self.queries = 0
+    
+    @single_flight
+    async def get_by_date_range(self, start, end):
+        self.queries += 1
+        await asyncio.sleep(0.01)
+        return [Record(start), Record(end)]
+
+class FakeSession:
+    def __init__(self, info):
+        self.info = info
+
+@pytest.fixture(autouse=True)
+def enabled(monkeypatch):
+    monkeypatch.setattr(single_flight_module, "_installed", True)
+
+def test_concurrent_identical_reads_share_one_query():
+    """Test que les lectures simultanées de mêmes arguments n'exécutent qu'une requête"""
+    repository = FakeRepository()
+    
+    async def scenario():
+        return await asyncio.gather(*(
+            repository.get_by_date_range(1, 31) for _ in range(10)
+        ), repository.get_by_date_range(1, 30))
+    
+    results = asyncio.run(scenario())
+    
+    assert repository.queries == 2
+    assert [record.value for record in results[0]] == [1, 31]
+    # Chaque appelant reçoit ses propres entités
+    assert results[0][0] is not results[1][0]
+    assert [record.value for record in results[1]] == [1, 31]
+
+def test_cancelled_leader_hands_the_read_to_a_waiting_caller():
+    """Test qu'un appel partagé interrompu est relancé par un appelant en attente"""
+    repository = FakeRepository()
+    
+    async def scenario():
+        leader = asyncio.ensure_future(repository.get_by_date_range(1, 31))
+        await asyncio.sleep(0.005)
+        follower = asyncio.ensure_future(repository.get_by_date_range(1, 31))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+    
+    result = asyncio.run(scenario())
+    
+    assert repository.queries == 2
+    assert [record.value for record in result] == [1, 31]
+
+def test_session_with_writes_is_never_coalesced():
+    """Test qu'une session ayant écrit relit ses propres données"""
+    repository = FakeRepository()
+    
+    async def scenario():
+        token = current_session.set(FakeSession({WRITES_KEY: True}))
+        try:
+            return await asyncio.gather(*(repository.get_by_date_range(1, 31) for _ in range(3)))
+        finally:
+            current_session.reset(token)
+    
+    asyncio.run(scenario())
+    
+    assert repository.queries == 3
@@ -0,0 +1,52 @@
+# tests/unit/shared/test_slow_queries.py
+
+from sqlalchemy import create_engine, text
+
+from shared.infrastructure.observability import slow_queries
+from shared.infrastructure.observability.slow_queries import (
+    SlowQueryLog, describe_parameters, fingerprint, install_slow_query_log, normalize_statement, redact_plan
+)
+
+def test_normalize_statement_removes_values():
+    """Test que la normalisation retire littéraux et paramètres et regroupe les listes"""
+    first = normalize_statement(
+        "SELECT * FROM patients WHERE last_name ILIKE '%dupont%' AND id IN ($1::UUID, $2::UUID) LIMIT 20"
+    )
+    second = normalize_statement(
+        "SELECT *  FROM patients\nWHERE last_name ILIKE '%martin%' AND id IN ($1::UUID, $2::UUID, $3::UUID) LIMIT 50"
+    )
+    
+    assert first == "SELECT * FROM patients WHERE last_name ILIKE ? AND id IN (...) LIMIT ?"
+    assert fingerprint(first) == fingerprint(second)
+    assert "appointments_2024_01" in normalize_statement("SELECT 1 FROM appointments_2024_01")
+
+def test_parameters_and_plans_are_redacted():
+    """Test que seuls les types des paramètres sont conservés et que les plans sont masqués"""
+    assert describe_parameters(("Dupont", 42)) == ["str", "int"]
+    assert describe_parameters([("a",), ("b",)]) == ["2 lignes"]
+    assert redact_plan("Filter: ((last_name)::text ~~* '%dupont%'::text)") == "Filter: ((last_name)::text ~~* '?'::text)"
+
+def test_slow_statements_are_recorded_without_parameters(monkeypatch):
+    """Test la capture d'une requête lente via les événements SQLAlchemy"""
+    log = SlowQueryLog(threshold_ms=0, explain=False)
+    monkeypatch.setattr(slow_queries, "slow_query_log", log)
+    install_slow_query_log()
+    engine = create_engine("sqlite://")
+    
+    with engine.connect() as conn:
+        conn.execute(text("SELECT :name"), {"name": "Jeanne Dupont"})
+        conn.execute(text("SELECT :name"), {"name": "Marie Martin"})
+    
+    top = log.top(limit=5)
+    assert top[0]["calls"] == 2
+    assert top[0]["statement"] == "SELECT ?"
+    assert "Dupont" not in str(top) and "Martin" not in str(top)
+
+def test_log_is_bounded():
+    """Test que le registre évince l'empreinte la moins coûteuse lorsqu'il est plein"""
+    log = SlowQueryLog(threshold_ms=0, max_statements=2, explain=False)
+    log.record("SELECT a FROM t", (), 10)
+    log.record("SELECT b FROM t", (), 50)
+    log.record("SELECT c FROM t", (), 30)
+    
+    assert [item["statement"] for item in log.top()] == ["SELECT b FROM t", "SELECT c FROM t"]
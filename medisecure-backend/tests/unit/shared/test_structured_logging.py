@@ -0,0 +1,59 @@
+# tests/unit/shared/test_structured_logging.py
+
+import io
+import json
+import logging
+from datetime import date
+
+from patient_management.application.dtos.patient_dtos import PatientCreateDTO
+from shared.infrastructure.observability.structured_logging import (
+    REDACTED, JsonFormatter, RedactingFormatter, configure_logging, redact, scrub_text, stop_logging
+)
+
+def make_record(msg, *args, **extra):
+    record = logging.LogRecord("tests", logging.INFO, __file__, 1, msg, args, None)
+    record.__dict__.update(extra)
+    return record
+
+def test_redact_masks_sensitive_fields():
+    """Test que les champs sensibles d'un DTO ou d'un dictionnaire sont masqués"""
+    dto = PatientCreateDTO(
+        first_name="Jeanne", last_name="Dupont", date_of_birth=date(1978, 4, 12),
+        gender="female", email="jeanne.dupont@example.com", allergies={"pénicilline": "urticaire"}
+    )
+    
+    redacted = redact(dto)
+    
+    assert redacted["first_name"] == REDACTED
+    assert redacted["allergies"] == REDACTED
+    assert redacted["gender"] == "female"
+    assert redact({"user": {"password": "secret", "role": "admin"}}) == {"user": {"password": REDACTED, "role": "admin"}}
+    assert scrub_text("Utilisateur jeanne.dupont@example.com introuvable") == "Utilisateur [EMAIL] introuvable"
+
+def test_formatters_redact_arguments_and_extras():
+    """Test que les formateurs texte et JSON masquent arguments, extras et emails"""
+    record = make_record("Connexion de %s avec %s", "jeanne@example.com", {"password": "secret"}, patient_id=7, email="x@y.fr")
+    
+    payload = json.loads(JsonFormatter().format(record))
+    
+    assert payload["message"] == "Connexion de [EMAIL] avec {'password': '[REDACTED]'}"
+    assert payload["patient_id"] == 7
+    assert payload["email"] == REDACTED
+    
+    text = RedactingFormatter("%(message)s").format(make_record("Patient %s", {"last_name": "Dupont"}))
+    assert text == "Patient {'last_name': '[REDACTED]'}"
+
+def test_asynchronous_logging_formats_in_listener_thread():
+    """Test que le mode asynchrone écrit les enregistrements masqués à l'arrêt du thread d'écriture"""
+    stream = io.StringIO()
+    configure_logging(level="INFO", log_format="json", asynchronous=True, stream=stream)
+    try:
+        logging.getLogger("tests").info("Patient créé: %s", {"email": "jeanne@example.com"})
+        logging.getLogger("tests").debug("ignoré")
+    finally:
+        stop_logging()
+        logging.getLogger().handlers.clear()
+    
+    lines = stream.getvalue().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["message"] == "Patient créé: {'email': '[REDACTED]'}"
@@ -0,0 +1,62 @@
+# tests/unit/shared/test_unit_of_work.py
+
+import asyncio
+
+import pytest
+
+from shared.infrastructure.database.unit_of_work import UnitOfWork, current_session, repository_session
+
+class FakeSession:
+    """Session factice qui enregistre les appels reçus"""
+    
+    def __init__(self):
+        self.calls = []
+        self.info = {}
+    
+    async def commit(self):
+        self.calls.append("commit")
+    
+    async def rollback(self):
+        self.calls.append("rollback")
+    
+    async def close(self):
+        self.calls.append("close")
+
+class FakeSessionFactory:
+    def __init__(self):
+        self.sessions = []
+    
+    def __call__(self):
+        session = FakeSession()
+        self.sessions.append(session)
+        return session
+
+def test_repositories_share_the_unit_of_work_session():
+    """Test qu'une unité de travail ne crée qu'une session, validée une seule fois"""
+    factory = FakeSessionFactory()
+    
+    async def scenario():
+        async with UnitOfWork(factory) as uow:
+            async with repository_session(factory) as first:
+                pass
+            async with UnitOfWork(factory):
+                async with repository_session(factory) as second:
+                    pass
+            assert first is second is uow.session
+        return current_session.get()
+    
+    assert asyncio.run(scenario()) is None
+    assert len(factory.sessions) == 1
+    assert factory.sessions[0].calls == ["commit", "close"]
+
+def test_unit_of_work_rolls_back_on_error():
+    """Test l'annulation de la transaction lorsqu'une erreur interrompt l'unité de travail"""
+    factory = FakeSessionFactory()
+    
+    async def scenario():
+        async with UnitOfWork(factory):
+            raise ValueError("Créneau déjà occupé")
+    
+    with pytest.raises(ValueError):
+        asyncio.run(scenario())
+    assert factory.sessions[0].calls == ["rollback", "close"]
@@ -0,0 +1,40 @@
+# tests/unit/shared/test_uuid7_generator.py
+
+import time
+import uuid
+
+from shared.adapters.primary import uuid7_generator
+from shared.adapters.primary.uuid7_generator import Uuid7Generator
+
+def test_generate_id_is_a_uuid7_with_current_timestamp():
+    """Test le format RFC 9562 et l'horodatage de l'identifiant"""
+    before_ms = time.time_ns() // 1_000_000
+    generated = Uuid7Generator().generate_id()
+    after_ms = time.time_ns() // 1_000_000
+    
+    assert generated.version == 7
+    assert generated.variant == uuid.RFC_4122
+    assert before_ms <= generated.int >> 80 <= after_ms
+
+def test_generate_ids_are_strictly_increasing():
+    """Test la croissance stricte des identifiants, y compris dans une même milliseconde"""
+    generator = Uuid7Generator()
+    
+    ids = generator.generate_ids(10000) + [generator.generate_id()]
+    
+    assert len(set(ids)) == len(ids)
+    assert ids == sorted(ids)
+
+def test_generate_ids_stay_increasing_when_clock_goes_back(monkeypatch):
+    """Test qu'un recul de l'horloge ne casse pas l'ordre des identifiants"""
+    generator = Uuid7Generator()
+    first = generator.generate_id()
+    
+    monkeypatch.setattr(uuid7_generator.time, "time_ns", lambda: (first.int >> 80) * 1_000_000 - 10**9)
+    second = generator.generate_id()
+    
+    generator._counter = uuid7_generator._COUNTER_MAX
+    third = generator.generate_id()
+    
+    assert first < second < third
+    assert third.int >> 80 == (first.int >> 80) + 1